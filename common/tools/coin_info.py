@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import pickle
 import re
 from collections import OrderedDict, defaultdict
 from pathlib import Path
@@ -30,6 +32,16 @@ if os.environ.get("DEFS_DIR"):
 else:
     DEFS_DIR = ROOT / "defs"
 
+# Parsed coin definitions, reused while none of the source files changes.
+# Set COIN_INFO_CACHE to an empty string to disable the cache.
+CACHE_FILE: Path | None
+if "COIN_INFO_CACHE" not in os.environ:
+    CACHE_FILE = Path(__file__).resolve().parent / ".coin_info.cache"
+elif os.environ["COIN_INFO_CACHE"]:
+    CACHE_FILE = Path(os.environ["COIN_INFO_CACHE"]).resolve()
+else:
+    CACHE_FILE = None
+
 
 class SupportItemBool(TypedDict):
     supported: dict[str, bool]
@@ -412,14 +424,18 @@ EVM_ICON_NAME_OVERRIDE = {
 }
 
 
-def _load_ethereum_networks() -> Coins:
-    """Load ethereum networks from `ethereum/networks.json`"""
+def _chain_files() -> list[Path]:
     chains_path = DEFS_DIR / "ethereum" / "chains" / "_data" / "chains"
-    networks: Coins = []
-    for chain in sorted(
+    return sorted(
         chains_path.glob("eip155-*.json"),
         key=lambda x: int(x.stem.replace("eip155-", "")),
-    ):
+    )
+
+
+def _load_ethereum_networks() -> Coins:
+    """Load ethereum networks from `ethereum/networks.json`"""
+    networks: Coins = []
+    for chain in _chain_files():
         chain_data = load_json(chain)
         shortcut = chain_data["nativeCurrency"]["symbol"]
         name = chain_data["name"]
@@ -871,21 +887,15 @@ def deduplicate_erc20(buckets: CoinBuckets, networks: Coins) -> None:
             continue
 
         # protected categories:
+        addresses = {coin.get("address") for coin in bucket}
         testnets = [coin for coin in bucket if coin["chain"] in testnet_networks]
         deprecated_by_same = [
             coin
             for coin in bucket
-            if "deprecation" in coin
-            and any(
-                other["address"] == coin["deprecation"]["new_address"]
-                for other in bucket
-            )
-        ]
-        remaining = [
-            coin
-            for coin in bucket
-            if coin not in testnets and coin not in deprecated_by_same
+            if "deprecation" in coin and coin["deprecation"]["new_address"] in addresses
         ]
+        protected = {id(coin) for coin in testnets + deprecated_by_same}
+        remaining = [coin for coin in bucket if id(coin) not in protected]
         if len(remaining) <= 1:
             for coin in deprecated_by_same:
                 deprecated_symbol = "[deprecated] " + coin["symbol"]
@@ -931,6 +941,33 @@ def _btc_sort_key(coin: Coin) -> str:
         return coin["name"]
 
 
+def _source_files() -> list[Path]:
+    """All files that `_collect_coin_info` depends on."""
+    files = [Path(__file__)]
+    files += sorted(DEFS_DIR.glob("bitcoin/*.json"))
+    files += _chain_files()
+    files += sorted((DEFS_DIR / "evm_tokens").glob("*.json"))
+    for name in (
+        "nem/nem_mosaics.json",
+        "tron/tron_tokens.json",
+        "conflux/crc20.json",
+        "algo/tokens.json",
+        "misc/misc.json",
+        "solana/spl_tokens.json",
+        "blockchain_link.json",
+    ):
+        files.append(DEFS_DIR / name)
+    return files
+
+
+def _source_digest() -> str:
+    hasher = hashlib.sha256()
+    for file in _source_files():
+        hasher.update(str(file).encode() + b"\0")
+        hasher.update(file.read_bytes() if file.exists() else b"\0")
+    return hasher.hexdigest()
+
+
 def collect_coin_info() -> CoinsInfo:
     """Returns all definition as dict organized by coin type.
     `coins` for btc-like coins,
@@ -939,7 +976,31 @@ def collect_coin_info() -> CoinsInfo:
     `nem` for NEM mosaics,
     `spl` for solana SPL tokens,
     `misc` for other networks.
+
+    The result is cached in `CACHE_FILE`, keyed by the contents of all source files.
+    Every call returns a fresh copy, so callers are free to modify it.
     """
+    if CACHE_FILE is None:
+        return _collect_coin_info()
+
+    digest = _source_digest()
+    try:
+        cached = pickle.loads(CACHE_FILE.read_bytes())
+        if cached["digest"] == digest:
+            return cached["coins"]
+    except Exception:
+        pass
+
+    all_coins = _collect_coin_info()
+    try:
+        data = dict(digest=digest, coins=all_coins)
+        CACHE_FILE.write_bytes(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        log.warning(f"Could not write coin info cache: {e}")
+    return all_coins
+
+
+def _collect_coin_info() -> CoinsInfo:
     all_coins = CoinsInfo(
         bitcoin=_load_btc_coins(),
         eth=_load_ethereum_networks(),
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+import difflib
 import fnmatch
 import glob
 import json
@@ -9,8 +10,11 @@ import logging
 import os
 import re
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from hashlib import sha256
+from pathlib import Path
 from typing import Any, Callable, Iterator, TextIO, cast
 
 import click
@@ -130,26 +134,46 @@ MAKO_FILTERS = {
 }
 
 
-def render_file(
-    src: str, dst: TextIO, coins: CoinsInfo, support_info: SupportInfo
-) -> None:
-    """Renders `src` template into `dst`.
-
-    `src` is a filename, `dst` is an open file object.
-    """
+def render_template(src: str, coins: CoinsInfo, support_info: SupportInfo) -> str:
+    """Renders `src` template and returns the result."""
     template = mako.template.Template(filename=src)
     eth_defs_date = datetime.datetime.fromisoformat(
         DEFINITIONS_TIMESTAMP_PATH.read_text().strip()
     )
 
-    result = template.render(
+    return template.render(
         support_info=support_info,
         supported_on=make_support_filter(support_info),
         ethereum_defs_timestamp=int(eth_defs_date.timestamp()),
         **coins,
         **MAKO_FILTERS,
     )
-    dst.write(result)
+
+
+def render_file(
+    src: str, dst: TextIO, coins: CoinsInfo, support_info: SupportInfo
+) -> None:
+    """Renders `src` template into `dst`.
+
+    `src` is a filename, `dst` is an open file object.
+    """
+    dst.write(render_template(src, coins, support_info))
+
+
+# coin data of a render worker process, see `render`
+_RENDER_DATA: tuple[CoinsInfo, SupportInfo] | None = None
+
+
+def _init_render_worker(coins: CoinsInfo, support_info: SupportInfo) -> None:
+    global _RENDER_DATA
+    _RENDER_DATA = coins, support_info
+
+
+def _render_timed(src: str) -> tuple[str, float]:
+    assert _RENDER_DATA is not None
+    start = time.perf_counter()
+    result = render_template(src, *_RENDER_DATA)
+    return result, time.perf_counter() - start
 
 
 # ====== validation functions ======
@@ -886,9 +910,16 @@ def dump(
 @click.option("-o", "--outfile", type=click.File("w"), help="Alternate output file")
 @click.option("-v", "--verbose", is_flag=True, help="Print rendered file names")
 @click.option("-b", "--bitcoin-only", is_flag=True, help="Accept only Bitcoin coins")
+@click.option("-c", "--check", is_flag=True, help="Only check that the files are up to date")
+@click.option("-j", "--jobs", type=int, default=0, help="Parallel renders (default: CPU count)")
 # fmt: on
 def render(
-    paths: tuple[str, ...], outfile: TextIO, verbose: bool, bitcoin_only: bool
+    paths: tuple[str, ...],
+    outfile: TextIO,
+    verbose: bool,
+    bitcoin_only: bool,
+    check: bool,
+    jobs: int,
 ) -> None:
     """Generate source code from Mako templates.
 
@@ -896,6 +927,10 @@ def render(
     saves the result as "foo.bar". For every directory name passed,
     processes all ".mako" files found in that directory.
 
+    Templates are rendered in parallel, and only files whose content
+    changed are written. With `-c`, nothing is written and the command
+    fails if any file is not up to date.
+
     If `-o` is specified, renders a single file into the specified outfile.
 
     If no arguments are given, processes the current directory.
@@ -947,14 +982,46 @@ def render(
         else:
             files.append(path)
 
-    # render each file
+    templates: list[str] = []
     for file in files:
         if not file.endswith(".mako"):
             click.echo(f"File {file} does not end with .mako")
         else:
+            templates.append(file)
+
+    # render all files, coin data is sent to every worker only once
+    with ProcessPoolExecutor(
+        max_workers=jobs or None,
+        initializer=_init_render_worker,
+        initargs=(defs, support_info),
+    ) as executor:
+        results = executor.map(_render_timed, templates)
+        outdated = False
+        for file, (result, elapsed) in zip(templates, results):
             target = file[: -len(".mako")]
-            with open(target, "w") as dst:
-                do_render(file, dst)
+            current = Path(target).read_text() if Path(target).exists() else None
+            changed = current != result
+
+            if verbose:
+                status = "changed" if changed else "unchanged"
+                click.echo(f"Rendered {file} => {target} in {elapsed:.3f} s, {status}")
+            if not changed:
+                continue
+            if check:
+                diff = difflib.unified_diff(
+                    (current or "").splitlines(keepends=True),
+                    result.splitlines(keepends=True),
+                    target,
+                    target,
+                )
+                click.echo("".join(diff), nl=False)
+                outdated = True
+            else:
+                with open(target, "w") as dst:
+                    dst.write(result)
+
+    if outdated:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
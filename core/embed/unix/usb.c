@@ -69,6 +69,31 @@ void usb_init(const usb_dev_info_t *dev_info) {
 
 void usb_deinit(void) {}
 
+// notify the host that started the emulator that the interfaces are bound
+// and incoming packets will be queued
+static void usb_notify_ready(void) {
+  const char *port = getenv("TREZOR_UDP_READY_PORT");
+  if (!port) {
+    return;
+  }
+
+  int sock = socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP);
+  if (sock < 0) {
+    return;
+  }
+
+  struct sockaddr_in si_host;
+  memzero(&si_host, sizeof(struct sockaddr_in));
+  si_host.sin_family = AF_INET;
+  si_host.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+  si_host.sin_port = htons(atoi(port));
+
+  static const char *ready_msg = "READY";
+  sendto(sock, ready_msg, strlen(ready_msg), MSG_DONTWAIT,
+         (const struct sockaddr *)&si_host, sizeof(struct sockaddr_in));
+  close(sock);
+}
+
 void usb_start(void) {
   const char *ip = getenv("TREZOR_UDP_IP");
 
@@ -98,6 +123,8 @@ void usb_start(void) {
                                 sizeof(struct sockaddr_in))),
            NULL);
   }
+
+  usb_notify_ready();
 }
 
 void usb_stop(void) {}
@@ -497,6 +497,8 @@ apps.bitcoin.common
 import apps.bitcoin.common
 apps.bitcoin.get_address
 import apps.bitcoin.get_address
+apps.bitcoin.get_address_batch
+import apps.bitcoin.get_address_batch
 apps.bitcoin.get_ownership_id
 import apps.bitcoin.get_ownership_id
 apps.bitcoin.get_ownership_proof
@@ -575,6 +577,8 @@ apps.common.helpers
 import apps.common.helpers
 apps.common.keychain
 import apps.common.keychain
+apps.common.packed_table
+import apps.common.packed_table
 apps.common.passphrase
 import apps.common.passphrase
 apps.common.paths
@@ -821,6 +825,8 @@ apps.solana.constents
 import apps.solana.constents
 apps.solana.get_address
 import apps.solana.get_address
+apps.solana.get_address_batch
+import apps.solana.get_address_batch
 apps.solana.message
 import apps.solana.message
 apps.solana.publickey
@@ -1241,6 +1247,8 @@ if not utils.BITCOIN_ONLY:
     import apps.ethereum.definitions_constants
     apps.ethereum.get_address
     import apps.ethereum.get_address
+    apps.ethereum.get_address_batch
+    import apps.ethereum.get_address_batch
     apps.ethereum.get_public_key
     import apps.ethereum.get_public_key
     apps.ethereum.helpers
@@ -572,6 +572,7 @@ def lock_device() -> None:
         from trezor.lvglui.scrs import fingerprints
 
         se_thd89.clear_session()
+        storage.cache.clear_nodes()
 
         if fingerprints.is_available():
             fingerprints.lock()
@@ -0,0 +1,48 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+from trezor import wire
+from trezor.messages import AddressBatch
+
+from . import addresses
+from .keychain import get_coin_by_name, get_keychain_for_coin
+
+if TYPE_CHECKING:
+    from trezor.messages import GetAddressBatch
+    from apps.common.keychain import Keychain
+
+# Limit on the number of addresses of a single request
+_MAX_BATCH_SIZE = const(64)
+
+
+async def get_address_batch(ctx: wire.Context, msg: GetAddressBatch) -> AddressBatch:
+    if not msg.ranges:
+        raise wire.DataError("No address ranges")
+    if sum(r.count for r in msg.ranges) > _MAX_BATCH_SIZE:
+        raise wire.DataError(f"At most {_MAX_BATCH_SIZE} addresses per request")
+
+    # one keychain per coin, shared by all ranges of that coin
+    keychains: dict[str, Keychain] = {}
+    result_addresses: list[str] = []
+    public_keys: list[bytes] = []
+    try:
+        for r in msg.ranges:
+            coin = get_coin_by_name(r.coin_name)
+            keychain = keychains.get(coin.coin_name)
+            if keychain is None:
+                keychain = await get_keychain_for_coin(ctx, coin)
+                keychains[coin.coin_name] = keychain
+
+            indexes = range(r.start, r.start + r.count)
+            for node in keychain.derive_children(r.address_n, indexes):
+                result_addresses.append(
+                    addresses.get_address(r.script_type, coin, node)
+                )
+                if msg.include_public_keys:
+                    public_keys.append(node.public_key())
+                node.__del__()
+    finally:
+        for keychain in keychains.values():
+            keychain.__del__()
+
+    return AddressBatch(addresses=result_addresses, public_keys=public_keys)
@@ -84,6 +84,7 @@ async def sign_tx(
     else:
         signer = signer_class(msg, keychain, coin, approver).signer()
 
+    batcher = helpers.TxAckBatcher(msg)
     res: TxAckType | bool | None = None
     ctx.primary_color, ctx.icon_path = (
         lv.color_hex(coin.primary_color),
@@ -99,7 +100,7 @@ async def sign_tx(
 
                 await confirm_final(ctx, coin.coin_name)
                 return req
-            res = await ctx.call(req, request_class)
+            res = await batcher.call(ctx, req, request_class)
         elif isinstance(req, helpers.UiConfirm):
             res = await req.confirm_dialog(ctx)
             progress.progress.report_init()
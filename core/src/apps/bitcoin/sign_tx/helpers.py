@@ -1,3 +1,4 @@
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor import utils, wire
@@ -8,12 +9,20 @@ from trezor.messages import (
     PrevTx,
     SignTx,
     TxAckInput,
+    TxAckInputBatch,
+    TxAckInputWrapper,
     TxAckOutput,
+    TxAckOutputBatch,
+    TxAckOutputWrapper,
     TxAckPaymentRequest,
     TxAckPrevExtraData,
     TxAckPrevInput,
+    TxAckPrevInputBatch,
+    TxAckPrevInputWrapper,
     TxAckPrevMeta,
     TxAckPrevOutput,
+    TxAckPrevOutputBatch,
+    TxAckPrevOutputWrapper,
     TxInput,
     TxOutput,
     TxRequest,
@@ -29,6 +38,15 @@ from . import layout
 if TYPE_CHECKING:
     from typing import Any, Awaitable
     from trezor.enums import AmountUnit
+    from trezor.protobuf import MessageType
+
+# Maximum number of inputs or outputs requested at once. The items of a batch
+# are kept decoded in memory until the signer asks for them. The encoded size
+# of a batch is bounded separately, see `TxAckBatcher`.
+_MAX_BATCH_SIZE = const(8)
+
+# Maximum number of batches cached at the same time, one per kind of request.
+_MAX_BATCHES = const(4)
 
 
 # Machine instructions
@@ -373,6 +391,124 @@ def _clear_tx_request(tx_req: TxRequest) -> None:
     tx_req.serialized.serialized_tx[:] = bytes()  # type: ignore ["__setitem__" method not defined on type "bytes"]
 
 
+class TxAckBatcher:
+    """Fetches consecutive inputs and outputs from the host in batches.
+
+    The signer keeps requesting one item at a time. If the host announced
+    `SignTx.batch_size`, a request for an item asks for the following items as
+    well, and requests for those are then answered without a round trip.
+
+    The host may return fewer items than requested, so that the answer fits
+    into the wire buffer, whose size is sent in `request_max_size`.
+    """
+
+    def __init__(self, tx: SignTx) -> None:
+        self.batch_size = min(tx.batch_size or 1, _MAX_BATCH_SIZE)
+        # input and output counts of the current (None), previous and original txs
+        self.counts: dict[bytes | None, tuple[int, int]] = {
+            None: (tx.inputs_count, tx.outputs_count)
+        }
+        # first index and items of the last batch of every (request_type, tx_hash),
+        # so that streaming a previous transaction between two inputs of the
+        # current one does not drop the batch of current inputs
+        self.batches: dict[tuple[int | None, bytes | None], tuple[int, list[Any]]] = {}
+
+    async def call(
+        self, ctx: wire.Context, tx_req: TxRequest, request_class: type[MessageType]
+    ) -> Any:
+        assert tx_req.details is not None
+        assert tx_req.serialized is not None
+        tx_hash = tx_req.details.tx_hash
+        index = tx_req.details.request_index
+        key = (tx_req.request_type, tx_hash)
+        batch_class = _batch_class(request_class)
+
+        if batch_class is None or index is None or self.batch_size <= 1:
+            ack = await ctx.call(tx_req, request_class)
+            if request_class is TxAckPrevMeta:
+                self.counts[tx_hash] = (ack.tx.inputs_count, ack.tx.outputs_count)
+            return ack
+
+        # Serialized data and signatures must reach the host, they are only
+        # sent with a request.
+        pending = (
+            bool(tx_req.serialized.serialized_tx)
+            or tx_req.serialized.signature is not None
+        )
+        batch = self.batches.pop(key, None)
+        if batch is not None and not pending:
+            start, items = batch
+            offset = index - start
+            if 0 <= offset < len(items) and items[offset] is not None:
+                item = items[offset]
+                # the signer may modify the item, so it is served only once
+                items[offset] = None
+                for i in items:
+                    if i is not None:
+                        self.batches[key] = batch
+                        break
+                return _wrap_batch_item(request_class, item)
+
+        counts = self.counts.get(tx_hash)
+        if counts is None:
+            return await ctx.call(tx_req, request_class)
+        if tx_req.request_type in (RequestType.TXINPUT, RequestType.TXORIGINPUT):
+            total = counts[0]
+        else:
+            total = counts[1]
+        count = min(self.batch_size, total - index)
+        if count <= 1:
+            return await ctx.call(tx_req, request_class)
+
+        tx_req.details.request_count = count
+        tx_req.details.request_max_size = wire.PROTOBUF_BUFFER_SIZE
+        try:
+            ack = await ctx.call(tx_req, batch_class)
+        finally:
+            tx_req.details.request_count = None
+            tx_req.details.request_max_size = None
+        items = _batch_items(ack)
+        if not 1 <= len(items) <= count:
+            raise wire.DataError("Invalid number of items in batch.")
+        item = items[0]
+        if len(items) > 1:
+            items[0] = None
+            if len(self.batches) >= _MAX_BATCHES:
+                self.batches.clear()
+            self.batches[key] = (index, items)
+        return _wrap_batch_item(request_class, item)
+
+
+def _batch_class(request_class: type[MessageType]) -> type[MessageType] | None:
+    if request_class is TxAckInput:
+        return TxAckInputBatch
+    if request_class is TxAckOutput:
+        return TxAckOutputBatch
+    if request_class is TxAckPrevInput:
+        return TxAckPrevInputBatch
+    if request_class is TxAckPrevOutput:
+        return TxAckPrevOutputBatch
+    return None
+
+
+def _batch_items(ack: Any) -> list[Any]:
+    if TxAckOutputBatch.is_type_of(ack):
+        return ack.tx.outputs
+    if TxAckPrevOutputBatch.is_type_of(ack):
+        return ack.tx.bin_outputs
+    return ack.tx.inputs
+
+
+def _wrap_batch_item(request_class: type[MessageType], item: Any) -> Any:
+    if request_class is TxAckInput:
+        return TxAckInput(tx=TxAckInputWrapper(input=item))
+    if request_class is TxAckOutput:
+        return TxAckOutput(tx=TxAckOutputWrapper(output=item))
+    if request_class is TxAckPrevInput:
+        return TxAckPrevInput(tx=TxAckPrevInputWrapper(input=item))
+    return TxAckPrevOutput(tx=TxAckPrevOutputWrapper(output=item))
+
+
 # Data sanitizers
 # ===
 
@@ -1,6 +1,7 @@
 import sys
 from typing import TYPE_CHECKING
 
+import storage.cache
 from trezor import utils, wire
 from trezor.crypto import bip32
 
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
         Awaitable,
         Callable,
         Iterable,
+        Iterator,
         TypeVar,
     )
     from typing_extensions import Protocol
@@ -87,11 +89,15 @@ class Keychain:
         curve: str,
         schemas: Iterable[paths.PathSchemaType],
         slip21_namespaces: Iterable[paths.Slip21Path] = (),
+        session_cache: bool = False,
     ) -> None:
         self.seed = seed
         self.curve = curve
         self.schemas = tuple(schemas)
         self.slip21_namespaces = tuple(slip21_namespaces)
+        # share derived prefix nodes with other keychains of the active session,
+        # only valid when `seed` is the seed of that session
+        self.session_cache = session_cache
 
         self._cache = LRUCache(10)
         self._root_fingerprint: int | None = None
@@ -126,8 +132,14 @@ class Keychain:
             cached_prefix = tuple(path[:prefix_len])
             cached_root: NodeType | None = self._cache.get(cached_prefix)
             if cached_root is None:
-                cached_root = new_root()
-                cached_root.derive_path(cached_prefix)
+                session_key = (self.curve, cached_prefix)
+                if self.session_cache:
+                    cached_root = storage.cache.get_node(session_key)
+                if cached_root is None:
+                    cached_root = new_root()
+                    cached_root.derive_path(cached_prefix)
+                    if self.session_cache:
+                        storage.cache.set_node(session_key, cached_root)
                 self._cache.insert(cached_prefix, cached_root)
 
             node = cached_root.clone()
@@ -163,6 +175,35 @@ class Keychain:
             new_root=lambda: bip32.from_seed(self.seed, self.curve),  # type: ignore[Argument of type "() -> HDNode" cannot be assigned to parameter "new_root" of type "() -> NodeType@_derive_with_cache" in function "_derive_with_cache"]
         )
 
+    def derive_children(
+        self,
+        path: paths.Bip32Path,
+        indexes: Iterable[int],
+        force_strict: bool = True,
+    ) -> Iterator[bip32.HDNode]:
+        """Derive the child `path/i` for every `i` in `indexes`.
+
+        Every child path is verified, but the parent node is derived only once.
+        """
+        parent: bip32.HDNode | None = None
+        try:
+            for i in indexes:
+                child_path = list(path)
+                child_path.append(i)
+                self.verify_path(child_path, force_strict)
+                if parent is None:
+                    parent = self._derive_with_cache(  # type: ignore[Expression of type "NodeType@_derive_with_cache" cannot be assigned to declared type "HDNode | None"]
+                        prefix_len=3,
+                        path=path,
+                        new_root=lambda: bip32.from_seed(self.seed, self.curve),  # type: ignore[Argument of type "() -> HDNode" cannot be assigned to parameter "new_root" of type "() -> NodeType@_derive_with_cache" in function "_derive_with_cache"]
+                    )
+                node = parent.clone()
+                node.derive(i)
+                yield node
+        finally:
+            if parent is not None:
+                parent.__del__()
+
     def derive_slip21(self, path: paths.Slip21Path) -> Slip21Node:
         if safety_checks.is_strict() and not any(
             ns == path[: len(ns)] for ns in self.slip21_namespaces
@@ -197,7 +238,7 @@ async def get_keychain(
         keychain = Keychain(b"", curve, schemas, slip21_namespaces)
     else:
         seed = await get_seed(ctx)
-        keychain = Keychain(seed, curve, schemas, slip21_namespaces)
+        keychain = Keychain(seed, curve, schemas, slip21_namespaces, session_cache=True)
     return keychain
 
 
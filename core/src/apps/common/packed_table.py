@@ -0,0 +1,53 @@
+"""
+Lookups in tables of fixed-size records packed into a single bytes object.
+
+Generated data tables (e.g. Ethereum networks and tokens) are stored this way so that
+they stay in flash as one constant. A table starts with the number of records as
+a big-endian uint16, followed by the records and possibly other data referenced by
+them. Lookups read the table by indexing, so they do not allocate.
+"""
+
+from micropython import const
+
+HEADER_SIZE = const(2)
+
+
+def count(table: bytes) -> int:
+    return (table[0] << 8) | table[1]
+
+
+def read_uint(table: bytes, offset: int, size: int) -> int:
+    """Read a big-endian unsigned integer of `size` bytes at `offset`."""
+    n = 0
+    for i in range(offset, offset + size):
+        n = (n << 8) | table[i]
+    return n
+
+
+def compare(table: bytes, offset: int, key: bytes) -> int:
+    """Compare the bytes at `offset` with `key`, with the sign of `table - key`."""
+    for i in range(len(key)):
+        diff = table[offset + i] - key[i]
+        if diff:
+            return diff
+    return 0
+
+
+def find(table: bytes, record_size: int, key: bytes, key_offset: int = 0) -> int:
+    """Find the first record whose field at `key_offset` equals `key`.
+
+    The records must be sorted by that field, compared as unsigned big-endian bytes.
+    Returns the offset of the record in `table`, or -1 if there is none.
+    """
+    lo = 0
+    hi = count(table)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if compare(table, HEADER_SIZE + mid * record_size + key_offset, key) < 0:
+            lo = mid + 1
+        else:
+            hi = mid
+    offset = HEADER_SIZE + lo * record_size
+    if lo < count(table) and compare(table, offset + key_offset, key) == 0:
+        return offset
+    return -1
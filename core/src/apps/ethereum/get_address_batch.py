@@ -0,0 +1,44 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+from trezor import wire
+from trezor.messages import EthereumAddressBatch
+
+from .helpers import address_from_bytes
+from .keychain import with_keychain_from_ranges
+
+if TYPE_CHECKING:
+    from trezor.messages import EthereumGetAddressBatch
+
+    from apps.common.keychain import Keychain
+    from .definitions import Definitions
+
+# Limit on the number of addresses of a single request
+_MAX_BATCH_SIZE = const(64)
+
+
+@with_keychain_from_ranges
+async def get_address_batch(
+    ctx: wire.Context,
+    msg: EthereumGetAddressBatch,
+    keychain: Keychain,
+    defs: Definitions,
+) -> EthereumAddressBatch:
+    if not msg.ranges:
+        raise wire.DataError("No address ranges")
+    if sum(r.count for r in msg.ranges) > _MAX_BATCH_SIZE:
+        raise wire.DataError(f"At most {_MAX_BATCH_SIZE} addresses per request")
+
+    result_addresses: list[str] = []
+    public_keys: list[bytes] = []
+    for r in msg.ranges:
+        indexes = range(r.start, r.start + r.count)
+        for node in keychain.derive_children(r.address_n, indexes):
+            result_addresses.append(
+                address_from_bytes(node.ethereum_pubkeyhash(), defs.network)
+            )
+            if msg.include_public_keys:
+                public_keys.append(node.public_key())
+            node.__del__()
+
+    return EthereumAddressBatch(addresses=result_addresses, public_keys=public_keys)
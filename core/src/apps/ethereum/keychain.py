@@ -15,7 +15,9 @@ if TYPE_CHECKING:
     from trezor.wire import Context
 
     from trezor.messages import (
+        EthereumAddressBatch,
         EthereumGetAddress,
+        EthereumGetAddressBatch,
         EthereumSignMessage,
         EthereumSignTx,
         EthereumSignTxEIP1559,
@@ -54,6 +56,11 @@ if TYPE_CHECKING:
         Awaitable[MsgOut],
     ]
 
+    HandlerRanges = Callable[
+        [Context, EthereumGetAddressBatch, Keychain, definitions.Definitions],
+        Awaitable[EthereumAddressBatch],
+    ]
+
     EthereumSignTxAny = EthereumSignTx | EthereumSignTxEIP1559
 
 # We believe Ethereum should use 44'/60'/a' for everything, because it is
@@ -150,3 +157,22 @@ def with_keychain_from_chain_id(
             return await func(ctx, msg, keychain, defs)
 
     return wrapper
+
+
+def with_keychain_from_ranges(
+    func: HandlerRanges,
+) -> Handler[EthereumGetAddressBatch, EthereumAddressBatch]:
+    # the network is determined by the first range, like by the path of GetAddress
+    async def wrapper(
+        ctx: Context, msg: EthereumGetAddressBatch
+    ) -> EthereumAddressBatch:
+        slip44 = None
+        if msg.ranges:
+            slip44 = _slip44_from_address_n(msg.ranges[0].address_n)
+        defs = _defs_from_message(msg, slip44=slip44)
+        schemas = _schemas_from_network(PATTERNS_ADDRESS, defs.network)
+        keychain = await get_keychain(ctx, CURVE, schemas)
+        with keychain:
+            return await func(ctx, msg, keychain, defs)
+
+    return wrapper
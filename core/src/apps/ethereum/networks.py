@@ -2,29 +2,33 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
+# NOTE: the networks are packed into bytes constants, which stay in flash,
+# see `apps.common.packed_table`. Looking a network up by chain ID or SLIP-44 ID
+# is a binary search, so nothing is allocated until a network is found.
+#
+# _NETWORKS record layout (big endian), sorted by chain ID:
+#   chain_id (_CHAIN_ID_SIZE), slip44 (4), primary_color (3),
+#   offset of the strings (2), length of the symbol (1), length of the name (1),
+#   length of the icon (1)
+# The symbol, the name and the icon of every network follow the records, in UTF-8.
+#
+# _SLIP44_INDEX record layout (big endian), sorted by SLIP-44 ID:
+#   slip44 (4), offset of the first network with that ID in _NETWORKS (2)
 
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
 
+from apps.common import packed_table
 from apps.common.paths import HARDENED
 
 if TYPE_CHECKING:
     from typing import Iterator
 
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
-    ]
-    # fmt: on
+_CHAIN_ID_SIZE = const(6)
+_RECORD_SIZE = const(18)
+_INDEX_RECORD_SIZE = const(6)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -40,1823 +44,553 @@ def shortcut_by_chain_id(chain_id: int) -> str:
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for i in range(packed_table.count(_SLIP44_INDEX)):
+        offset = packed_table.HEADER_SIZE + i * _INDEX_RECORD_SIZE
+        yield packed_table.read_uint(_SLIP44_INDEX, offset, 4) | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if chain_id < 0 or chain_id >> (_CHAIN_ID_SIZE * 8):
+        return UNKNOWN_NETWORK
+    key = chain_id.to_bytes(_CHAIN_ID_SIZE, "big")
+    offset = packed_table.find(_NETWORKS, _RECORD_SIZE, key)
+    if offset < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(offset)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if slip44 < 0 or slip44 >> 32:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(4, "big")
+    offset = packed_table.find(_SLIP44_INDEX, _INDEX_RECORD_SIZE, key)
+    if offset < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(packed_table.read_uint(_SLIP44_INDEX, offset + 4, 2))
 
 
-# fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-    yield (
-        1,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Ethereum",  # name
-        "evm-eth.png",  # name
-        0x637FFF,  # primary_color
-    )
-    yield (
-        2,  # chain_id
-        40,  # slip44
-        "EXP",  # symbol
-        "Expanse Network",  # name
-        "evm-exp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Ropsten",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        4,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Rinkeby",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        5,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Goerli",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        6,  # chain_id
-        1,  # slip44
-        "tKOT",  # symbol
-        "Kotti Testnet",  # name
-        "evm-tkot.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        7,  # chain_id
-        60,  # slip44
-        "TCH",  # symbol
-        "ThaiChain",  # name
-        "evm-tch.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8,  # chain_id
-        108,  # slip44
-        "UBQ",  # symbol
-        "Ubiq",  # name
-        "evm-ubq.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9,  # chain_id
-        1,  # slip44
-        "TUBQ",  # symbol
-        "Ubiq Network Testnet",  # name
-        "evm-tubq.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        10,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "OP",  # name
-        "evm-oeth.png",  # name
-        0xFF0420,  # primary_color
-    )
-    yield (
-        11,  # chain_id
-        916,  # slip44
-        "META",  # symbol
-        "Metadium",  # name
-        "evm-meta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12,  # chain_id
-        1,  # slip44
-        "tKAL",  # symbol
-        "Metadium Testnet",  # name
-        "evm-tkal.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13,  # chain_id
-        1,  # slip44
-        "tsDIODE",  # symbol
-        "Diode Testnet Staging",  # name
-        "evm-tsdiode.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        14,  # chain_id
-        60,  # slip44
-        "FLR",  # symbol
-        "Flare",  # name
-        "evm-flr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        15,  # chain_id
-        60,  # slip44
-        "DIODE",  # symbol
-        "Diode Prenet",  # name
-        "evm-diode.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16,  # chain_id
-        1,  # slip44
-        "tCFLR",  # symbol
-        "Songbird Testnet Coston",  # name
-        "evm-tcflr.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        17,  # chain_id
-        60,  # slip44
-        "TFI",  # symbol
-        "ThaiChain 2.0 ThaiFi",  # name
-        "evm-tfi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18,  # chain_id
-        1,  # slip44
-        "TST",  # symbol
-        "ThunderCore Testnet",  # name
-        "evm-tst.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19,  # chain_id
-        60,  # slip44
-        "SGB",  # symbol
-        "Songbird Canary-Network",  # name
-        "evm-sgb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20,  # chain_id
-        60,  # slip44
-        "ELA",  # symbol
-        "Elastos Smart Chain",  # name
-        "evm-ela.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        25,  # chain_id
-        60,  # slip44
-        "CRO",  # symbol
-        "Cronos",  # name
-        "evm-cro.png",  # name
-        0x1199FA,  # primary_color
-    )
-    yield (
-        27,  # chain_id
-        60,  # slip44
-        "SHIB",  # symbol
-        "ShibaChain",  # name
-        "evm-shib.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        29,  # chain_id
-        60,  # slip44
-        "L1",  # symbol
-        "Genesis L1",  # name
-        "evm-l1.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        30,  # chain_id
-        137,  # slip44
-        "RBTC",  # symbol
-        "Rootstock",  # name
-        "evm-rbtc.png",  # name
-        0xFF9100,  # primary_color
-    )
-    yield (
-        31,  # chain_id
-        1,  # slip44
-        "tRBTC",  # symbol
-        "Rootstock Testnet",  # name
-        "evm-trbtc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        33,  # chain_id
-        60,  # slip44
-        "GooD",  # symbol
-        "GoodData",  # name
-        "evm-good.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35,  # chain_id
-        60,  # slip44
-        "TBG",  # symbol
-        "TBWG Chain",  # name
-        "evm-tbg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        38,  # chain_id
-        538,  # slip44
-        "VAL",  # symbol
-        "Valorbit",  # name
-        "evm-val.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        40,  # chain_id
-        60,  # slip44
-        "TLOS",  # symbol
-        "Telos EVM",  # name
-        "evm-tlos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        44,  # chain_id
-        60,  # slip44
-        "CRAB",  # symbol
-        "Crab Network",  # name
-        "evm-crab.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        50,  # chain_id
-        60,  # slip44
-        "XDC",  # symbol
-        "XDC Network",  # name
-        "evm-xdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        51,  # chain_id
-        60,  # slip44
-        "TXDC",  # symbol
-        "XDC Apothem Network",  # name
-        "evm-txdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        52,  # chain_id
-        60,  # slip44
-        "cet",  # symbol
-        "CoinEx Smart Chain",  # name
-        "evm-cet.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        55,  # chain_id
-        60,  # slip44
-        "ZYX",  # symbol
-        "Zyx",  # name
-        "evm-zyx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        56,  # chain_id
-        714,  # slip44
-        "BNB",  # symbol
-        "BNB Smart Chain",  # name
-        "evm-bnb.png",  # name
-        0xF0B90B,  # primary_color
-    )
-    yield (
-        58,  # chain_id
-        60,  # slip44
-        "ONG",  # symbol
-        "Ontology",  # name
-        "evm-ong.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        60,  # chain_id
-        6060,  # slip44
-        "GO",  # symbol
-        "GoChain",  # name
-        "evm-go.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61,  # chain_id
-        61,  # slip44
-        "ETC",  # symbol
-        "Ethereum Classic",  # name
-        "evm-etc.png",  # name
-        0x328332,  # primary_color
-    )
-    yield (
-        62,  # chain_id
-        1,  # slip44
-        "TETC",  # symbol
-        "Morden Testnet",  # name
-        "evm-tetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63,  # chain_id
-        1,  # slip44
-        "tMETC",  # symbol
-        "Mordor Testnet",  # name
-        "evm-tmetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        64,  # chain_id
-        163,  # slip44
-        "ELLA",  # symbol
-        "Ellaism",  # name
-        "evm-ella.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        66,  # chain_id
-        60,  # slip44
-        "OKT",  # symbol
-        "OKXChain",  # name
-        "evm-okt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        67,  # chain_id
-        1,  # slip44
-        "tDBM",  # symbol
-        "DBChain Testnet",  # name
-        "evm-tdbm.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        74,  # chain_id
-        60,  # slip44
-        "EIDI",  # symbol
-        "IDChain",  # name
-        "evm-eidi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        76,  # chain_id
-        76,  # slip44
-        "MIX",  # symbol
-        "Mix",  # name
-        "evm-mix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        77,  # chain_id
-        60,  # slip44
-        "SPOA",  # symbol
-        "POA Network Sokol",  # name
-        "evm-spoa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        78,  # chain_id
-        60,  # slip44
-        "PETH",  # symbol
-        "PrimusChain",  # name
-        "evm-peth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80,  # chain_id
-        60,  # slip44
-        "RNA",  # symbol
-        "GeneChain",  # name
-        "evm-rna.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        82,  # chain_id
-        60,  # slip44
-        "MTR",  # symbol
-        "Meter",  # name
-        "evm-mtr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        87,  # chain_id
-        60,  # slip44
-        "SNT",  # symbol
-        "Nova Network",  # name
-        "evm-snt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        88,  # chain_id
-        889,  # slip44
-        "VIC",  # symbol
-        "Viction",  # name
-        "evm-vic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        90,  # chain_id
-        60,  # slip44
-        "GAR",  # symbol
-        "Garizon Stage0",  # name
-        "evm-gar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        97,  # chain_id
-        1,  # slip44
-        "tBNB",  # symbol
-        "BNB Smart Chain Testnet",  # name
-        "evm-tbnb.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99,  # chain_id
-        178,  # slip44
-        "POA",  # symbol
-        "POA Network Core",  # name
-        "evm-poa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100,  # chain_id
-        700,  # slip44
-        "XDAI",  # symbol
-        "Gnosis",  # name
-        "evm-xdai.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        101,  # chain_id
-        464,  # slip44
-        "ETI",  # symbol
-        "EtherInc",  # name
-        "evm-eti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        105,  # chain_id
-        60,  # slip44
-        "W3G",  # symbol
-        "Web3Games Devnet",  # name
-        "evm-w3g.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        106,  # chain_id
-        60,  # slip44
-        "VLX",  # symbol
-        "Velas EVM",  # name
-        "evm-vlx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        108,  # chain_id
-        1001,  # slip44
-        "TT",  # symbol
-        "ThunderCore",  # name
-        "evm-tt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        111,  # chain_id
-        60,  # slip44
-        "ETL",  # symbol
-        "EtherLite Chain",  # name
-        "evm-etl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        122,  # chain_id
-        60,  # slip44
-        "FUSE",  # symbol
-        "Fuse",  # name
-        "evm-fuse.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        123,  # chain_id
-        60,  # slip44
-        "SPARK",  # symbol
-        "Fuse Sparknet",  # name
-        "evm-spark.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        124,  # chain_id
-        60,  # slip44
-        "DWU",  # symbol
-        "Decentralized Web",  # name
-        "evm-dwu.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        126,  # chain_id
-        126,  # slip44
-        "OY",  # symbol
-        "OYchain",  # name
-        "evm-oy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        127,  # chain_id
-        127,  # slip44
-        "FETH",  # symbol
-        "Factory 127",  # name
-        "evm-feth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        128,  # chain_id
-        1010,  # slip44
-        "HT",  # symbol
-        "Huobi ECO Chain",  # name
-        "evm-ht.png",  # name
-        0x01943F,  # primary_color
-    )
-    yield (
-        137,  # chain_id
-        966,  # slip44
-        "POL",  # symbol
-        "Polygon",  # name
-        "evm-matic.png",  # name
-        0x8247E5,  # primary_color
-    )
-    yield (
-        142,  # chain_id
-        60,  # slip44
-        "DAX",  # symbol
-        "DAX CHAIN",  # name
-        "evm-dax.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        146,  # chain_id
-        60,  # slip44
-        "S",  # symbol
-        "Sonic",  # name
-        "evm-s.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        162,  # chain_id
-        1,  # slip44
-        "tPHT",  # symbol
-        "Lightstreams Testnet",  # name
-        "evm-tpht.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        163,  # chain_id
-        60,  # slip44
-        "PHT",  # symbol
-        "Lightstreams",  # name
-        "evm-pht.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        177,  # chain_id
-        60,  # slip44
-        "HSK",  # symbol
-        "HashKey Chain",  # name
-        "evm-hsk.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        186,  # chain_id
-        60,  # slip44
-        "Seele",  # symbol
-        "Seele",  # name
-        "evm-seele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        188,  # chain_id
-        60,  # slip44
-        "BTM",  # symbol
-        "BMC",  # name
-        "evm-btm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        199,  # chain_id
-        60,  # slip44
-        "BTT",  # symbol
-        "BitTorrent Chain",  # name
-        "evm-btt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        211,  # chain_id
-        60,  # slip44
-        "0xF",  # symbol
-        "Freight Trust Network",  # name
-        "evm-0xf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        222,  # chain_id
-        2221,  # slip44
-        "ASK",  # symbol
-        "Permission",  # name
-        "evm-ask.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        225,  # chain_id
-        60,  # slip44
-        "LA",  # symbol
-        "LACHAIN",  # name
-        "evm-la.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246,  # chain_id
-        246,  # slip44
-        "EWT",  # symbol
-        "Energy Web Chain",  # name
-        "evm-ewt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        250,  # chain_id
-        60,  # slip44
-        "FTM",  # symbol
-        "Fantom Opera",  # name
-        "evm-ftm.png",  # name
-        0x1969FF,  # primary_color
-    )
-    yield (
-        256,  # chain_id
-        1,  # slip44
-        "thtt",  # symbol
-        "Huobi ECO Chain Testnet",  # name
-        "evm-thtt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        258,  # chain_id
-        60,  # slip44
-        "SETM",  # symbol
-        "Setheum",  # name
-        "evm-setm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        262,  # chain_id
-        60,  # slip44
-        "SRN",  # symbol
-        "SUR Blockchain Network",  # name
-        "evm-srn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        269,  # chain_id
-        269,  # slip44
-        "HPB",  # symbol
-        "High Performance Blockchain",  # name
-        "evm-hpb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        288,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Boba Network",  # name
-        "evm-boba.png",  # name
-        0xCCFF00,  # primary_color
-    )
-    yield (
-        314,  # chain_id
-        461,  # slip44
-        "FIL",  # symbol
-        "Filecoin",  # name
-        "evm-filecoin.png",  # name
-        0x0090FF,  # primary_color
-    )
-    yield (
-        321,  # chain_id
-        641,  # slip44
-        "KCS",  # symbol
-        "KCC",  # name
-        "evm-kcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        324,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "zkSync",  # name
-        "evm-zksync-era.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        333,  # chain_id
-        60,  # slip44
-        "W3Q",  # symbol
-        "Web3Q",  # name
-        "evm-w3q.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        336,  # chain_id
-        60,  # slip44
-        "SDN",  # symbol
-        "Shiden",  # name
-        "evm-sdn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        369,  # chain_id
-        60,  # slip44
-        "PLS",  # symbol
-        "PulseChain",  # name
-        "evm-pls.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        420,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Optimism Goerli Testnet",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        499,  # chain_id
-        499,  # slip44
-        "RUPX",  # symbol
-        "Rupaya",  # name
-        "evm-rupx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        512,  # chain_id
-        1512,  # slip44
-        "AAC",  # symbol
-        "Double-A Chain",  # name
-        "evm-aac.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        555,  # chain_id
-        60,  # slip44
-        "CLASS",  # symbol
-        "Vela1 Chain",  # name
-        "evm-class.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        558,  # chain_id
-        60,  # slip44
-        "TAO",  # symbol
-        "Tao Network",  # name
-        "evm-tao.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        595,  # chain_id
-        1,  # slip44
-        "tmACA",  # symbol
-        "Acala Mandala Testnet TC9",  # name
-        "evm-tmaca.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        686,  # chain_id
-        686,  # slip44
-        "KAR",  # symbol
-        "Karura Network",  # name
-        "evm-kar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        707,  # chain_id
-        60,  # slip44
-        "BCS",  # symbol
-        "BlockChain Station",  # name
-        "evm-bcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        777,  # chain_id
-        60,  # slip44
-        "cTH",  # symbol
-        "cheapETH",  # name
-        "evm-cth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        787,  # chain_id
-        787,  # slip44
-        "ACA",  # symbol
-        "Acala Network",  # name
-        "evm-aca.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        803,  # chain_id
-        60,  # slip44
-        "HAIC",  # symbol
-        "Haic",  # name
-        "evm-haic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        820,  # chain_id
-        820,  # slip44
-        "CLO",  # symbol
-        "Callisto",  # name
-        "evm-clo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        821,  # chain_id
-        1,  # slip44
-        "TCLO",  # symbol
-        "Callisto Testnet Deprecated",  # name
-        "evm-tclo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        888,  # chain_id
-        5718350,  # slip44
-        "WAN",  # symbol
-        "Wanchain",  # name
-        "evm-wan.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        977,  # chain_id
-        60,  # slip44
-        "YETI",  # symbol
-        "Nepal Blockchain Network",  # name
-        "evm-yeti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        998,  # chain_id
-        60,  # slip44
-        "L99",  # symbol
-        "Lucky Network",  # name
-        "evm-l99.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1001,  # chain_id
-        1,  # slip44
-        "tKAIA",  # symbol
-        "Kaia Kairos Testnet",  # name
-        "evm-tkaia.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1007,  # chain_id
-        1,  # slip44
-        "tNEW",  # symbol
-        "Newton Testnet",  # name
-        "evm-tnew.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1010,  # chain_id
-        1020,  # slip44
-        "EVC",  # symbol
-        "Evrice Network",  # name
-        "evm-evc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1012,  # chain_id
-        60,  # slip44
-        "NEW",  # symbol
-        "Newton",  # name
-        "evm-new.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1022,  # chain_id
-        60,  # slip44
-        "SKU",  # symbol
-        "Sakura",  # name
-        "evm-sku.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1024,  # chain_id
-        60,  # slip44
-        "CLV",  # symbol
-        "CLV Parachain",  # name
-        "evm-clv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1030,  # chain_id
-        60,  # slip44
-        "CFX",  # symbol
-        "Conflux eSpace",  # name
-        "evm-cfx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1088,  # chain_id
-        60,  # slip44
-        "METIS",  # symbol
-        "Metis Andromeda",  # name
-        "evm-metis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1139,  # chain_id
-        60,  # slip44
-        "MATH",  # symbol
-        "MathChain",  # name
-        "evm-math.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1140,  # chain_id
-        1,  # slip44
-        "tMATH",  # symbol
-        "MathChain Testnet",  # name
-        "evm-tmath.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1197,  # chain_id
-        60,  # slip44
-        "IORA",  # symbol
-        "Iora Chain",  # name
-        "evm-iora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1202,  # chain_id
-        60,  # slip44
-        "WTT",  # symbol
-        "World Trade Technical Chain",  # name
-        "evm-wtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1213,  # chain_id
-        60,  # slip44
-        "POP",  # symbol
-        "Popcateum",  # name
-        "evm-pop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1214,  # chain_id
-        60,  # slip44
-        "ENTER",  # symbol
-        "EnterChain",  # name
-        "evm-enter.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1280,  # chain_id
-        60,  # slip44
-        "HO",  # symbol
-        "HALO",  # name
-        "evm-ho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1284,  # chain_id
-        60,  # slip44
-        "GLMR",  # symbol
-        "Moonbeam",  # name
-        "evm-glmr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1285,  # chain_id
-        60,  # slip44
-        "MOVR",  # symbol
-        "Moonriver",  # name
-        "evm-movr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1287,  # chain_id
-        1,  # slip44
-        "DEV",  # symbol
-        "Moonbase Alpha",  # name
-        "evm-dev.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1618,  # chain_id
-        60,  # slip44
-        "CATE",  # symbol
-        "Catecoin Chain",  # name
-        "evm-cate.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1657,  # chain_id
-        60,  # slip44
-        "BTA",  # symbol
-        "Btachain",  # name
-        "evm-bta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1856,  # chain_id
-        60,  # slip44
-        "TSF",  # symbol
-        "Teslafunds",  # name
-        "evm-tsf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1898,  # chain_id
-        60,  # slip44
-        "BOY",  # symbol
-        "BON Network",  # name
-        "evm-boy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1987,  # chain_id
-        1987,  # slip44
-        "EGEM",  # symbol
-        "EtherGem",  # name
-        "evm-egem.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021,  # chain_id
-        523,  # slip44
-        "EDG",  # symbol
-        "Edgeware EdgeEVM",  # name
-        "evm-edg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2025,  # chain_id
-        1008,  # slip44
-        "RPG",  # symbol
-        "Rangers Protocol",  # name
-        "evm-rpg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2100,  # chain_id
-        60,  # slip44
-        "ECO",  # symbol
-        "Ecoball",  # name
-        "evm-eco.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2213,  # chain_id
-        60,  # slip44
-        "EVA",  # symbol
-        "Evanesco",  # name
-        "evm-eva.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2559,  # chain_id
-        60,  # slip44
-        "KTO",  # symbol
-        "Kortho",  # name
-        "evm-kto.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3400,  # chain_id
-        60,  # slip44
-        "PRB",  # symbol
-        "Paribu Net",  # name
-        "evm-prb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3966,  # chain_id
-        60,  # slip44
-        "DYNO",  # symbol
-        "DYNO",  # name
-        "evm-dyno.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        4689,  # chain_id
-        60,  # slip44
-        "IOTX",  # symbol
-        "IoTeX Network",  # name
-        "evm-iotx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5000,  # chain_id
-        60,  # slip44
-        "MNT",  # symbol
-        "Mantle",  # name
-        "evm-mnt.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        5197,  # chain_id
-        60,  # slip44
-        "ES",  # symbol
-        "EraSwap",  # name
-        "evm-es.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5315,  # chain_id
-        60,  # slip44
-        "UZMI",  # symbol
-        "Uzmi Network",  # name
-        "evm-uzmi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5869,  # chain_id
-        60,  # slip44
-        "RBD",  # symbol
-        "Wegochain Rubidium",  # name
-        "evm-rbd.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6626,  # chain_id
-        60,  # slip44
-        "PIX",  # symbol
-        "Pixie Chain",  # name
-        "evm-pix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8000,  # chain_id
-        60,  # slip44
-        "TELE",  # symbol
-        "Teleport",  # name
-        "evm-tele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8217,  # chain_id
-        8217,  # slip44
-        "KAIA",  # symbol
-        "Kaia",  # name
-        "evm-kaia.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8453,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Base",  # name
-        "evm-base.png",  # name
-        0x0052FF,  # primary_color
-    )
-    yield (
-        8723,  # chain_id
-        479,  # slip44
-        "OLO",  # symbol
-        "TOOL Global",  # name
-        "evm-olo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8995,  # chain_id
-        60,  # slip44
-        "U+25B3",  # symbol
-        "bloxberg",  # name
-        "evm-u+25b3.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9001,  # chain_id
-        60,  # slip44
-        "EVMOS",  # symbol
-        "Evmos",  # name
-        "evm-evmos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9100,  # chain_id
-        60,  # slip44
-        "GNC",  # symbol
-        "Genesis Coin",  # name
-        "evm-gnc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10101,  # chain_id
-        60,  # slip44
-        "GEN",  # symbol
-        "Blockchain Genesis",  # name
-        "evm-gen.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10823,  # chain_id
-        60,  # slip44
-        "CCP",  # symbol
-        "CryptoCoinPay",  # name
-        "evm-ccp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11111,  # chain_id
-        60,  # slip44
-        "WGM",  # symbol
-        "WAGMI",  # name
-        "evm-wgm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12052,  # chain_id
-        621,  # slip44
-        "ZERO",  # symbol
-        "Singularity ZERO",  # name
-        "evm-zero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        13381,  # chain_id
-        60,  # slip44
-        "PHX",  # symbol
-        "Phoenix",  # name
-        "evm-phx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16000,  # chain_id
-        60,  # slip44
-        "MTT",  # symbol
-        "MetaDot",  # name
-        "evm-mtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        19515,  # chain_id
-        1,  # slip44
-        "tSEP",  # symbol
-        "SEC Testnet",  # name
-        "evm-tsep.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19845,  # chain_id
-        60,  # slip44
-        "BTCIX",  # symbol
-        "BTCIX Network",  # name
-        "evm-btcix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24484,  # chain_id
-        227,  # slip44
-        "WEB",  # symbol
-        "Webchain",  # name
-        "evm-web.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24734,  # chain_id
-        60,  # slip44
-        "MINTME",  # symbol
-        "MintMe.com Coin",  # name
-        "evm-mintme.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        31102,  # chain_id
-        31102,  # slip44
-        "ESN",  # symbol
-        "Ethersocial Network",  # name
-        "evm-esn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        32659,  # chain_id
-        288,  # slip44
-        "FSN",  # symbol
-        "Fusion",  # name
-        "evm-fsn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        39797,  # chain_id
-        39797,  # slip44
-        "NRG",  # symbol
-        "Energi",  # name
-        "evm-nrg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42069,  # chain_id
-        60,  # slip44
-        "peggle",  # symbol
-        "pegglecoin",  # name
-        "evm-peggle.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42161,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Arbitrum One",  # name
-        "evm-arb1.png",  # name
-        0x28A0F0,  # primary_color
-    )
-    yield (
-        42220,  # chain_id
-        60,  # slip44
-        "CELO",  # symbol
-        "Celo",  # name
-        "evm-celo.png",  # name
-        0x35D07F,  # primary_color
-    )
-    yield (
-        43113,  # chain_id
-        1,  # slip44
-        "tAVAX",  # symbol
-        "Avalanche Fuji Testnet",  # name
-        "evm-tavax.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        43114,  # chain_id
-        9005,  # slip44
-        "AVAX",  # symbol
-        "Avalanche C-Chain",  # name
-        "evm-avax.png",  # name
-        0xE84142,  # primary_color
-    )
-    yield (
-        44787,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Alfajores Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        47805,  # chain_id
-        60,  # slip44
-        "REI",  # symbol
-        "REI Network",  # name
-        "evm-rei.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        49797,  # chain_id
-        1,  # slip44
-        "tNRG",  # symbol
-        "Energi Testnet",  # name
-        "evm-tnrg.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        53935,  # chain_id
-        60,  # slip44
-        "JEWEL",  # symbol
-        "DFK Chain",  # name
-        "evm-jewel.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        59144,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Linea",  # name
-        "evm-linea.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        62320,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Baklava Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63000,  # chain_id
-        60,  # slip44
-        "ECS",  # symbol
-        "eSync Network",  # name
-        "evm-ecs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        73799,  # chain_id
-        1,  # slip44
-        "tVT",  # symbol
-        "Energy Web Volta Testnet",  # name
-        "evm-tvt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        73927,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Mixin Virtual Machine",  # name
-        "evm-mixin.png",  # name
-        0x5959D8,  # primary_color
-    )
-    yield (
-        78110,  # chain_id
-        1,  # slip44
-        "FIN",  # symbol
-        "Firenze test network",  # name
-        "evm-fin.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80001,  # chain_id
-        1,  # slip44
-        "tMATIC",  # symbol
-        "Mumbai",  # name
-        "evm-tmatic.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99999,  # chain_id
-        60,  # slip44
-        "UBC",  # symbol
-        "UB Smart Chain",  # name
-        "evm-ubc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100000,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100001,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100002,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100003,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100004,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100005,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100006,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100007,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100008,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        200625,  # chain_id
-        200625,  # slip44
-        "AKA",  # symbol
-        "Akroma",  # name
-        "evm-aka.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        201018,  # chain_id
-        60,  # slip44
-        "atp",  # symbol
-        "Alaya",  # name
-        "evm-atp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        210425,  # chain_id
-        60,  # slip44
-        "lat",  # symbol
-        "PlatON",  # name
-        "evm-lat.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246529,  # chain_id
-        246529,  # slip44
-        "ATS",  # symbol
-        "ARTIS sigma1",  # name
-        "evm-ats.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246785,  # chain_id
-        1,  # slip44
-        "tATS",  # symbol
-        "ARTIS Testnet tau1",  # name
-        "evm-tats.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        281121,  # chain_id
-        60,  # slip44
-        "$OC",  # symbol
-        "Social Smart Chain",  # name
-        "evm-$oc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        333999,  # chain_id
-        60,  # slip44
-        "POLIS",  # symbol
-        "Polis",  # name
-        "evm-polis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        888888,  # chain_id
-        60,  # slip44
-        "VS",  # symbol
-        "Vision",  # name
-        "evm-vs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        955305,  # chain_id
-        1011,  # slip44
-        "ELV",  # symbol
-        "Eluvio Content Fabric",  # name
-        "evm-elv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313114,  # chain_id
-        1313114,  # slip44
-        "ETHO",  # symbol
-        "Etho Protocol",  # name
-        "evm-etho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313500,  # chain_id
-        60,  # slip44
-        "XERO",  # symbol
-        "Xerom",  # name
-        "evm-xero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        7762959,  # chain_id
-        184,  # slip44
-        "MUSIC",  # symbol
-        "Musicoin",  # name
-        "evm-music.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11155111,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Sepolia",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13371337,  # chain_id
-        60,  # slip44
-        "TPEP",  # symbol
-        "PepChain Churchill",  # name
-        "evm-tpep.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18289463,  # chain_id
-        60,  # slip44
-        "ILT",  # symbol
-        "IOLite",  # name
-        "evm-ilt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20181205,  # chain_id
-        60,  # slip44
-        "QKI",  # symbol
-        "quarkblockchain",  # name
-        "evm-qki.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        28945486,  # chain_id
-        344,  # slip44
-        "AUX",  # symbol
-        "Auxilium Network",  # name
-        "evm-aux.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35855456,  # chain_id
-        60,  # slip44
-        "JOYS",  # symbol
-        "Joys Digital",  # name
-        "evm-joys.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61717561,  # chain_id
-        61717561,  # slip44
-        "AQUA",  # symbol
-        "Aquachain",  # name
-        "evm-aqua.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        99415706,  # chain_id
-        1,  # slip44
-        "TOYS",  # symbol
-        "Joys Digital TestNet",  # name
-        "evm-toys.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        245022934,  # chain_id
-        60,  # slip44
-        "NEON",  # symbol
-        "Neon EVM",  # name
-        "evm-neon.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        311752642,  # chain_id
-        60,  # slip44
-        "OLT",  # symbol
-        "OneLedger",  # name
-        "evm-olt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1122334455,  # chain_id
-        60,  # slip44
-        "IPOS",  # symbol
-        "IPOS Network",  # name
-        "evm-ipos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313161554,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Aurora",  # name
-        "evm-aurora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600000,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0x33D3D5,  # primary_color
-    )
-    yield (
-        1666600001,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600002,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600003,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021121117,  # chain_id
-        60,  # slip44
-        "HOP",  # symbol
-        "DataHopper",  # name
-        "evm-hop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3125659152,  # chain_id
-        164,  # slip44
-        "PIRL",  # symbol
-        "Pirl",  # name
-        "evm-pirl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11297108109,  # chain_id
-        60,  # slip44
-        "PALM",  # symbol
-        "Palm",  # name
-        "evm-palm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        197710212030,  # chain_id
-        60,  # slip44
-        "NTT",  # symbol
-        "Ntity",  # name
-        "evm-ntt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6022140761023,  # chain_id
-        60,  # slip44
-        "MOLE",  # symbol
-        "Molereum Network",  # name
-        "evm-mole.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
+def _network_info(offset: int) -> EthereumNetworkInfo:
+    table = _NETWORKS
+    # skip the chain ID
+    fields = offset + _CHAIN_ID_SIZE
+    symbol_start = packed_table.read_uint(table, fields + 7, 2)
+    name_start = symbol_start + table[fields + 9]
+    icon_start = name_start + table[fields + 10]
+    return EthereumNetworkInfo(
+        chain_id=packed_table.read_uint(table, offset, _CHAIN_ID_SIZE),
+        slip44=packed_table.read_uint(table, fields, 4),
+        symbol=table[symbol_start:name_start].decode(),
+        name=table[name_start:icon_start].decode(),
+        icon=table[icon_start : icon_start + table[fields + 11]].decode(),
+        primary_color=packed_table.read_uint(table, fields + 4, 3),
     )
+
+
+# fmt: off
+_NETWORKS = (
+    b"\x00\xdf"
+    b"\x00\x00\x00\x00\x00\x01\x00\x00\x00\x3c\x63\x7f\xff\x0f\xb0\x03\x08\x0b"  # Ethereum
+    b"\x00\x00\x00\x00\x00\x02\x00\x00\x00\x28\xd2\xd2\xd2\x0f\xc6\x03\x0f\x0b"  # Expanse Network
+    b"\x00\x00\x00\x00\x00\x03\x00\x00\x00\x01\x96\x96\x96\x0f\xe3\x04\x07\x0c"  # Ropsten
+    b"\x00\x00\x00\x00\x00\x04\x00\x00\x00\x01\x96\x96\x96\x0f\xfa\x04\x07\x0c"  # Rinkeby
+    b"\x00\x00\x00\x00\x00\x05\x00\x00\x00\x01\x96\x96\x96\x10\x11\x04\x06\x0c"  # Goerli
+    b"\x00\x00\x00\x00\x00\x06\x00\x00\x00\x01\x96\x96\x96\x10\x27\x04\x0d\x0c"  # Kotti Testnet
+    b"\x00\x00\x00\x00\x00\x07\x00\x00\x00\x3c\xd2\xd2\xd2\x10\x44\x03\x09\x0b"  # ThaiChain
+    b"\x00\x00\x00\x00\x00\x08\x00\x00\x00\x6c\xd2\xd2\xd2\x10\x5b\x03\x04\x0b"  # Ubiq
+    b"\x00\x00\x00\x00\x00\x09\x00\x00\x00\x01\x96\x96\x96\x10\x6d\x04\x14\x0c"  # Ubiq Network Testnet
+    b"\x00\x00\x00\x00\x00\x0a\x00\x00\x00\x3c\xff\x04\x20\x10\x91\x03\x02\x0c"  # OP
+    b"\x00\x00\x00\x00\x00\x0b\x00\x00\x03\x94\xd2\xd2\xd2\x10\xa2\x04\x08\x0c"  # Metadium
+    b"\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x01\x96\x96\x96\x10\xba\x04\x10\x0c"  # Metadium Testnet
+    b"\x00\x00\x00\x00\x00\x0d\x00\x00\x00\x01\x96\x96\x96\x10\xda\x07\x15\x0f"  # Diode Testnet Staging
+    b"\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x3c\xd2\xd2\xd2\x11\x05\x03\x05\x0b"  # Flare
+    b"\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x3c\xd2\xd2\xd2\x11\x18\x05\x0c\x0d"  # Diode Prenet
+    b"\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x96\x96\x96\x11\x36\x05\x17\x0d"  # Songbird Testnet Coston
+    b"\x00\x00\x00\x00\x00\x11\x00\x00\x00\x3c\xd2\xd2\xd2\x11\x5f\x03\x14\x0b"  # ThaiChain 2.0 ThaiFi
+    b"\x00\x00\x00\x00\x00\x12\x00\x00\x00\x01\x96\x96\x96\x11\x81\x03\x13\x0b"  # ThunderCore Testnet
+    b"\x00\x00\x00\x00\x00\x13\x00\x00\x00\x3c\xd2\xd2\xd2\x11\xa2\x03\x17\x0b"  # Songbird Canary-Network
+    b"\x00\x00\x00\x00\x00\x14\x00\x00\x00\x3c\xd2\xd2\xd2\x11\xc7\x03\x13\x0b"  # Elastos Smart Chain
+    b"\x00\x00\x00\x00\x00\x19\x00\x00\x00\x3c\x11\x99\xfa\x11\xe8\x03\x06\x0b"  # Cronos
+    b"\x00\x00\x00\x00\x00\x1b\x00\x00\x00\x3c\xd2\xd2\xd2\x11\xfc\x04\x0a\x0c"  # ShibaChain
+    b"\x00\x00\x00\x00\x00\x1d\x00\x00\x00\x3c\xd2\xd2\xd2\x12\x16\x02\x0a\x0a"  # Genesis L1
+    b"\x00\x00\x00\x00\x00\x1e\x00\x00\x00\x89\xff\x91\x00\x12\x2c\x04\x09\x0c"  # Rootstock
+    b"\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x01\x96\x96\x96\x12\x45\x05\x11\x0d"  # Rootstock Testnet
+    b"\x00\x00\x00\x00\x00\x21\x00\x00\x00\x3c\xd2\xd2\xd2\x12\x68\x04\x08\x0c"  # GoodData
+    b"\x00\x00\x00\x00\x00\x23\x00\x00\x00\x3c\xd2\xd2\xd2\x12\x80\x03\x0a\x0b"  # TBWG Chain
+    b"\x00\x00\x00\x00\x00\x26\x00\x00\x02\x1a\xd2\xd2\xd2\x12\x98\x03\x08\x0b"  # Valorbit
+    b"\x00\x00\x00\x00\x00\x28\x00\x00\x00\x3c\xd2\xd2\xd2\x12\xae\x04\x09\x0c"  # Telos EVM
+    b"\x00\x00\x00\x00\x00\x2c\x00\x00\x00\x3c\xd2\xd2\xd2\x12\xc7\x04\x0c\x0c"  # Crab Network
+    b"\x00\x00\x00\x00\x00\x32\x00\x00\x00\x3c\xd2\xd2\xd2\x12\xe3\x03\x0b\x0b"  # XDC Network
+    b"\x00\x00\x00\x00\x00\x33\x00\x00\x00\x3c\xd2\xd2\xd2\x12\xfc\x04\x13\x0c"  # XDC Apothem Network
+    b"\x00\x00\x00\x00\x00\x34\x00\x00\x00\x3c\xd2\xd2\xd2\x13\x1f\x03\x12\x0b"  # CoinEx Smart Chain
+    b"\x00\x00\x00\x00\x00\x37\x00\x00\x00\x3c\xd2\xd2\xd2\x13\x3f\x03\x03\x0b"  # Zyx
+    b"\x00\x00\x00\x00\x00\x38\x00\x00\x02\xca\xf0\xb9\x0b\x13\x50\x03\x0f\x0b"  # BNB Smart Chain
+    b"\x00\x00\x00\x00\x00\x3a\x00\x00\x00\x3c\xd2\xd2\xd2\x13\x6d\x03\x08\x0b"  # Ontology
+    b"\x00\x00\x00\x00\x00\x3c\x00\x00\x17\xac\xd2\xd2\xd2\x13\x83\x02\x07\x0a"  # GoChain
+    b"\x00\x00\x00\x00\x00\x3d\x00\x00\x00\x3d\x32\x83\x32\x13\x96\x03\x10\x0b"  # Ethereum Classic
+    b"\x00\x00\x00\x00\x00\x3e\x00\x00\x00\x01\x96\x96\x96\x13\xb4\x04\x0e\x0c"  # Morden Testnet
+    b"\x00\x00\x00\x00\x00\x3f\x00\x00\x00\x01\x96\x96\x96\x13\xd2\x05\x0e\x0d"  # Mordor Testnet
+    b"\x00\x00\x00\x00\x00\x40\x00\x00\x00\xa3\xd2\xd2\xd2\x13\xf2\x04\x07\x0c"  # Ellaism
+    b"\x00\x00\x00\x00\x00\x42\x00\x00\x00\x3c\xd2\xd2\xd2\x14\x09\x03\x08\x0b"  # OKXChain
+    b"\x00\x00\x00\x00\x00\x43\x00\x00\x00\x01\x96\x96\x96\x14\x1f\x04\x0f\x0c"  # DBChain Testnet
+    b"\x00\x00\x00\x00\x00\x4a\x00\x00\x00\x3c\xd2\xd2\xd2\x14\x3e\x04\x07\x0c"  # IDChain
+    b"\x00\x00\x00\x00\x00\x4c\x00\x00\x00\x4c\xd2\xd2\xd2\x14\x55\x03\x03\x0b"  # Mix
+    b"\x00\x00\x00\x00\x00\x4d\x00\x00\x00\x3c\xd2\xd2\xd2\x14\x66\x04\x11\x0c"  # POA Network Sokol
+    b"\x00\x00\x00\x00\x00\x4e\x00\x00\x00\x3c\xd2\xd2\xd2\x14\x87\x04\x0b\x0c"  # PrimusChain
+    b"\x00\x00\x00\x00\x00\x50\x00\x00\x00\x3c\xd2\xd2\xd2\x14\xa2\x03\x09\x0b"  # GeneChain
+    b"\x00\x00\x00\x00\x00\x52\x00\x00\x00\x3c\xd2\xd2\xd2\x14\xb9\x03\x05\x0b"  # Meter
+    b"\x00\x00\x00\x00\x00\x57\x00\x00\x00\x3c\xd2\xd2\xd2\x14\xcc\x03\x0c\x0b"  # Nova Network
+    b"\x00\x00\x00\x00\x00\x58\x00\x00\x03\x79\xd2\xd2\xd2\x14\xe6\x03\x07\x0b"  # Viction
+    b"\x00\x00\x00\x00\x00\x5a\x00\x00\x00\x3c\xd2\xd2\xd2\x14\xfb\x03\x0e\x0b"  # Garizon Stage0
+    b"\x00\x00\x00\x00\x00\x61\x00\x00\x00\x01\x96\x96\x96\x15\x17\x04\x17\x0c"  # BNB Smart Chain Testnet
+    b"\x00\x00\x00\x00\x00\x63\x00\x00\x00\xb2\xd2\xd2\xd2\x15\x3e\x03\x10\x0b"  # POA Network Core
+    b"\x00\x00\x00\x00\x00\x64\x00\x00\x02\xbc\xd2\xd2\xd2\x15\x5c\x04\x06\x0c"  # Gnosis
+    b"\x00\x00\x00\x00\x00\x65\x00\x00\x01\xd0\xd2\xd2\xd2\x15\x72\x03\x08\x0b"  # EtherInc
+    b"\x00\x00\x00\x00\x00\x69\x00\x00\x00\x3c\xd2\xd2\xd2\x15\x88\x03\x10\x0b"  # Web3Games Devnet
+    b"\x00\x00\x00\x00\x00\x6a\x00\x00\x00\x3c\xd2\xd2\xd2\x15\xa6\x03\x09\x0b"  # Velas EVM
+    b"\x00\x00\x00\x00\x00\x6c\x00\x00\x03\xe9\xd2\xd2\xd2\x15\xbd\x02\x0b\x0a"  # ThunderCore
+    b"\x00\x00\x00\x00\x00\x6f\x00\x00\x00\x3c\xd2\xd2\xd2\x15\xd4\x03\x0f\x0b"  # EtherLite Chain
+    b"\x00\x00\x00\x00\x00\x7a\x00\x00\x00\x3c\xd2\xd2\xd2\x15\xf1\x04\x04\x0c"  # Fuse
+    b"\x00\x00\x00\x00\x00\x7b\x00\x00\x00\x3c\xd2\xd2\xd2\x16\x05\x05\x0d\x0d"  # Fuse Sparknet
+    b"\x00\x00\x00\x00\x00\x7c\x00\x00\x00\x3c\xd2\xd2\xd2\x16\x24\x03\x11\x0b"  # Decentralized Web
+    b"\x00\x00\x00\x00\x00\x7e\x00\x00\x00\x7e\xd2\xd2\xd2\x16\x43\x02\x07\x0a"  # OYchain
+    b"\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x7f\xd2\xd2\xd2\x16\x56\x04\x0b\x0c"  # Factory 127
+    b"\x00\x00\x00\x00\x00\x80\x00\x00\x03\xf2\x01\x94\x3f\x16\x71\x02\x0f\x0a"  # Huobi ECO Chain
+    b"\x00\x00\x00\x00\x00\x89\x00\x00\x03\xc6\x82\x47\xe5\x16\x8c\x03\x07\x0d"  # Polygon
+    b"\x00\x00\x00\x00\x00\x8e\x00\x00\x00\x3c\xd2\xd2\xd2\x16\xa3\x03\x09\x0b"  # DAX CHAIN
+    b"\x00\x00\x00\x00\x00\x92\x00\x00\x00\x3c\xff\xff\xff\x16\xba\x01\x05\x09"  # Sonic
+    b"\x00\x00\x00\x00\x00\xa2\x00\x00\x00\x01\x96\x96\x96\x16\xc9\x04\x14\x0c"  # Lightstreams Testnet
+    b"\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x3c\xd2\xd2\xd2\x16\xed\x03\x0c\x0b"  # Lightstreams
+    b"\x00\x00\x00\x00\x00\xb1\x00\x00\x00\x3c\xff\xff\xff\x17\x07\x03\x0d\x0b"  # HashKey Chain
+    b"\x00\x00\x00\x00\x00\xba\x00\x00\x00\x3c\xd2\xd2\xd2\x17\x22\x05\x05\x0d"  # Seele
+    b"\x00\x00\x00\x00\x00\xbc\x00\x00\x00\x3c\xd2\xd2\xd2\x17\x39\x03\x03\x0b"  # BMC
+    b"\x00\x00\x00\x00\x00\xc7\x00\x00\x00\x3c\xd2\xd2\xd2\x17\x4a\x03\x10\x0b"  # BitTorrent Chain
+    b"\x00\x00\x00\x00\x00\xd3\x00\x00\x00\x3c\xd2\xd2\xd2\x17\x68\x03\x15\x0b"  # Freight Trust Network
+    b"\x00\x00\x00\x00\x00\xde\x00\x00\x08\xad\xd2\xd2\xd2\x17\x8b\x03\x0a\x0b"  # Permission
+    b"\x00\x00\x00\x00\x00\xe1\x00\x00\x00\x3c\xd2\xd2\xd2\x17\xa3\x02\x07\x0a"  # LACHAIN
+    b"\x00\x00\x00\x00\x00\xf6\x00\x00\x00\xf6\xd2\xd2\xd2\x17\xb6\x03\x10\x0b"  # Energy Web Chain
+    b"\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x3c\x19\x69\xff\x17\xd4\x03\x0c\x0b"  # Fantom Opera
+    b"\x00\x00\x00\x00\x01\x00\x00\x00\x00\x01\x96\x96\x96\x17\xee\x04\x17\x0c"  # Huobi ECO Chain Testnet
+    b"\x00\x00\x00\x00\x01\x02\x00\x00\x00\x3c\xd2\xd2\xd2\x18\x15\x04\x07\x0c"  # Setheum
+    b"\x00\x00\x00\x00\x01\x06\x00\x00\x00\x3c\xd2\xd2\xd2\x18\x2c\x03\x16\x0b"  # SUR Blockchain Network
+    b"\x00\x00\x00\x00\x01\x0d\x00\x00\x01\x0d\xd2\xd2\xd2\x18\x50\x03\x1b\x0b"  # High Performance Blockchain
+    b"\x00\x00\x00\x00\x01\x20\x00\x00\x00\x3c\xcc\xff\x00\x18\x79\x03\x0c\x0c"  # Boba Network
+    b"\x00\x00\x00\x00\x01\x3a\x00\x00\x01\xcd\x00\x90\xff\x18\x94\x03\x08\x10"  # Filecoin
+    b"\x00\x00\x00\x00\x01\x41\x00\x00\x02\x81\xd2\xd2\xd2\x18\xaf\x03\x03\x0b"  # KCC
+    b"\x00\x00\x00\x00\x01\x44\x00\x00\x00\x3c\xff\xff\xff\x18\xc0\x03\x06\x12"  # zkSync
+    b"\x00\x00\x00\x00\x01\x4d\x00\x00\x00\x3c\xd2\xd2\xd2\x18\xdb\x03\x05\x0b"  # Web3Q
+    b"\x00\x00\x00\x00\x01\x50\x00\x00\x00\x3c\xd2\xd2\xd2\x18\xee\x03\x06\x0b"  # Shiden
+    b"\x00\x00\x00\x00\x01\x71\x00\x00\x00\x3c\xd2\xd2\xd2\x19\x02\x03\x0a\x0b"  # PulseChain
+    b"\x00\x00\x00\x00\x01\xa4\x00\x00\x00\x01\x96\x96\x96\x19\x1a\x04\x17\x0c"  # Optimism Goerli Testnet
+    b"\x00\x00\x00\x00\x01\xf3\x00\x00\x01\xf3\xd2\xd2\xd2\x19\x41\x04\x06\x0c"  # Rupaya
+    b"\x00\x00\x00\x00\x02\x00\x00\x00\x05\xe8\xd2\xd2\xd2\x19\x57\x03\x0e\x0b"  # Double-A Chain
+    b"\x00\x00\x00\x00\x02\x2b\x00\x00\x00\x3c\xd2\xd2\xd2\x19\x73\x05\x0b\x0d"  # Vela1 Chain
+    b"\x00\x00\x00\x00\x02\x2e\x00\x00\x00\x3c\xd2\xd2\xd2\x19\x90\x03\x0b\x0b"  # Tao Network
+    b"\x00\x00\x00\x00\x02\x53\x00\x00\x00\x01\x96\x96\x96\x19\xa9\x05\x19\x0d"  # Acala Mandala Testnet TC9
+    b"\x00\x00\x00\x00\x02\xae\x00\x00\x02\xae\xd2\xd2\xd2\x19\xd4\x03\x0e\x0b"  # Karura Network
+    b"\x00\x00\x00\x00\x02\xc3\x00\x00\x00\x3c\xd2\xd2\xd2\x19\xf0\x03\x12\x0b"  # BlockChain Station
+    b"\x00\x00\x00\x00\x03\x09\x00\x00\x00\x3c\xd2\xd2\xd2\x1a\x10\x03\x08\x0b"  # cheapETH
+    b"\x00\x00\x00\x00\x03\x13\x00\x00\x03\x13\xd2\xd2\xd2\x1a\x26\x03\x0d\x0b"  # Acala Network
+    b"\x00\x00\x00\x00\x03\x23\x00\x00\x00\x3c\xd2\xd2\xd2\x1a\x41\x04\x04\x0c"  # Haic
+    b"\x00\x00\x00\x00\x03\x34\x00\x00\x03\x34\xd2\xd2\xd2\x1a\x55\x03\x08\x0b"  # Callisto
+    b"\x00\x00\x00\x00\x03\x35\x00\x00\x00\x01\x96\x96\x96\x1a\x6b\x04\x1b\x0c"  # Callisto Testnet Deprecated
+    b"\x00\x00\x00\x00\x03\x78\x00\x57\x41\x4e\xd2\xd2\xd2\x1a\x96\x03\x08\x0b"  # Wanchain
+    b"\x00\x00\x00\x00\x03\xd1\x00\x00\x00\x3c\xd2\xd2\xd2\x1a\xac\x04\x18\x0c"  # Nepal Blockchain Network
+    b"\x00\x00\x00\x00\x03\xe6\x00\x00\x00\x3c\xd2\xd2\xd2\x1a\xd4\x03\x0d\x0b"  # Lucky Network
+    b"\x00\x00\x00\x00\x03\xe9\x00\x00\x00\x01\x96\x96\x96\x1a\xef\x05\x13\x0d"  # Kaia Kairos Testnet
+    b"\x00\x00\x00\x00\x03\xef\x00\x00\x00\x01\x96\x96\x96\x1b\x14\x04\x0e\x0c"  # Newton Testnet
+    b"\x00\x00\x00\x00\x03\xf2\x00\x00\x03\xfc\xd2\xd2\xd2\x1b\x32\x03\x0e\x0b"  # Evrice Network
+    b"\x00\x00\x00\x00\x03\xf4\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\x4e\x03\x06\x0b"  # Newton
+    b"\x00\x00\x00\x00\x03\xfe\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\x62\x03\x06\x0b"  # Sakura
+    b"\x00\x00\x00\x00\x04\x00\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\x76\x03\x0d\x0b"  # CLV Parachain
+    b"\x00\x00\x00\x00\x04\x06\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\x91\x03\x0e\x0b"  # Conflux eSpace
+    b"\x00\x00\x00\x00\x04\x40\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\xad\x05\x0f\x0d"  # Metis Andromeda
+    b"\x00\x00\x00\x00\x04\x73\x00\x00\x00\x3c\xd2\xd2\xd2\x1b\xce\x04\x09\x0c"  # MathChain
+    b"\x00\x00\x00\x00\x04\x74\x00\x00\x00\x01\x96\x96\x96\x1b\xe7\x05\x11\x0d"  # MathChain Testnet
+    b"\x00\x00\x00\x00\x04\xad\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x0a\x04\x0a\x0c"  # Iora Chain
+    b"\x00\x00\x00\x00\x04\xb2\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x24\x03\x1b\x0b"  # World Trade Technical Chain
+    b"\x00\x00\x00\x00\x04\xbd\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x4d\x03\x09\x0b"  # Popcateum
+    b"\x00\x00\x00\x00\x04\xbe\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x64\x05\x0a\x0d"  # EnterChain
+    b"\x00\x00\x00\x00\x05\x00\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x80\x02\x04\x0a"  # HALO
+    b"\x00\x00\x00\x00\x05\x04\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\x90\x04\x08\x0c"  # Moonbeam
+    b"\x00\x00\x00\x00\x05\x05\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\xa8\x04\x09\x0c"  # Moonriver
+    b"\x00\x00\x00\x00\x05\x07\x00\x00\x00\x01\xd2\xd2\xd2\x1c\xc1\x03\x0e\x0b"  # Moonbase Alpha
+    b"\x00\x00\x00\x00\x06\x52\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\xdd\x04\x0e\x0c"  # Catecoin Chain
+    b"\x00\x00\x00\x00\x06\x79\x00\x00\x00\x3c\xd2\xd2\xd2\x1c\xfb\x03\x08\x0b"  # Btachain
+    b"\x00\x00\x00\x00\x07\x40\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\x11\x03\x0a\x0b"  # Teslafunds
+    b"\x00\x00\x00\x00\x07\x6a\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\x29\x03\x0b\x0b"  # BON Network
+    b"\x00\x00\x00\x00\x07\xc3\x00\x00\x07\xc3\xd2\xd2\xd2\x1d\x42\x04\x08\x0c"  # EtherGem
+    b"\x00\x00\x00\x00\x07\xe5\x00\x00\x02\x0b\xd2\xd2\xd2\x1d\x5a\x03\x10\x0b"  # Edgeware EdgeEVM
+    b"\x00\x00\x00\x00\x07\xe9\x00\x00\x03\xf0\xd2\xd2\xd2\x1d\x78\x03\x10\x0b"  # Rangers Protocol
+    b"\x00\x00\x00\x00\x08\x34\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\x96\x03\x07\x0b"  # Ecoball
+    b"\x00\x00\x00\x00\x08\xa5\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\xab\x03\x08\x0b"  # Evanesco
+    b"\x00\x00\x00\x00\x09\xff\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\xc1\x03\x06\x0b"  # Kortho
+    b"\x00\x00\x00\x00\x0d\x48\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\xd5\x03\x0a\x0b"  # Paribu Net
+    b"\x00\x00\x00\x00\x0f\x7e\x00\x00\x00\x3c\xd2\xd2\xd2\x1d\xed\x04\x04\x0c"  # DYNO
+    b"\x00\x00\x00\x00\x12\x51\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x01\x04\x0d\x0c"  # IoTeX Network
+    b"\x00\x00\x00\x00\x13\x88\x00\x00\x00\x3c\xff\xff\xff\x1e\x1e\x03\x06\x0b"  # Mantle
+    b"\x00\x00\x00\x00\x14\x4d\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x32\x02\x07\x0a"  # EraSwap
+    b"\x00\x00\x00\x00\x14\xc3\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x45\x04\x0c\x0c"  # Uzmi Network
+    b"\x00\x00\x00\x00\x16\xed\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x61\x03\x12\x0b"  # Wegochain Rubidium
+    b"\x00\x00\x00\x00\x19\xe2\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x81\x03\x0b\x0b"  # Pixie Chain
+    b"\x00\x00\x00\x00\x1f\x40\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\x9a\x04\x08\x0c"  # Teleport
+    b"\x00\x00\x00\x00\x20\x19\x00\x00\x20\x19\xd2\xd2\xd2\x1e\xb2\x04\x04\x0c"  # Kaia
+    b"\x00\x00\x00\x00\x21\x05\x00\x00\x00\x3c\x00\x52\xff\x1e\xc6\x03\x04\x0c"  # Base
+    b"\x00\x00\x00\x00\x22\x13\x00\x00\x01\xdf\xd2\xd2\xd2\x1e\xd9\x03\x0b\x0b"  # TOOL Global
+    b"\x00\x00\x00\x00\x23\x23\x00\x00\x00\x3c\xd2\xd2\xd2\x1e\xf2\x06\x08\x0e"  # bloxberg
+    b"\x00\x00\x00\x00\x23\x29\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\x0e\x05\x05\x0d"  # Evmos
+    b"\x00\x00\x00\x00\x23\x8c\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\x25\x03\x0c\x0b"  # Genesis Coin
+    b"\x00\x00\x00\x00\x26\x46\x00\x00\x26\x46\x1a\x2a\x5f\x1f\x3f\x03\x10\x0b"  # Data Trade Chain
+    b"\x00\x00\x00\x00\x27\x75\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\x5d\x03\x12\x0b"  # Blockchain Genesis
+    b"\x00\x00\x00\x00\x2a\x47\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\x7d\x03\x0d\x0b"  # CryptoCoinPay
+    b"\x00\x00\x00\x00\x2b\x67\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\x98\x03\x05\x0b"  # WAGMI
+    b"\x00\x00\x00\x00\x2f\x14\x00\x00\x02\x6d\xd2\xd2\xd2\x1f\xab\x04\x10\x0c"  # Singularity ZERO
+    b"\x00\x00\x00\x00\x34\x45\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\xcb\x03\x07\x0b"  # Phoenix
+    b"\x00\x00\x00\x00\x3e\x80\x00\x00\x00\x3c\xd2\xd2\xd2\x1f\xe0\x03\x07\x0b"  # MetaDot
+    b"\x00\x00\x00\x00\x4c\x3b\x00\x00\x00\x01\x96\x96\x96\x1f\xf5\x04\x0b\x0c"  # SEC Testnet
+    b"\x00\x00\x00\x00\x4d\x85\x00\x00\x00\x3c\xd2\xd2\xd2\x20\x10\x05\x0d\x0d"  # BTCIX Network
+    b"\x00\x00\x00\x00\x5f\xa4\x00\x00\x00\xe3\xd2\xd2\xd2\x20\x2f\x03\x08\x0b"  # Webchain
+    b"\x00\x00\x00\x00\x60\x9e\x00\x00\x00\x3c\xd2\xd2\xd2\x20\x45\x06\x0f\x0e"  # MintMe.com Coin
+    b"\x00\x00\x00\x00\x79\x7e\x00\x00\x79\x7e\xd2\xd2\xd2\x20\x68\x03\x13\x0b"  # Ethersocial Network
+    b"\x00\x00\x00\x00\x7f\x93\x00\x00\x01\x20\xd2\xd2\xd2\x20\x89\x03\x06\x0b"  # Fusion
+    b"\x00\x00\x00\x00\x9b\x75\x00\x00\x9b\x75\xd2\xd2\xd2\x20\x9d\x03\x06\x0b"  # Energi
+    b"\x00\x00\x00\x00\xa4\x55\x00\x00\x00\x3c\xd2\xd2\xd2\x20\xb1\x06\x0a\x0e"  # pegglecoin
+    b"\x00\x00\x00\x00\xa4\xb1\x00\x00\x00\x3c\x28\xa0\xf0\x20\xcf\x03\x0c\x0c"  # Arbitrum One
+    b"\x00\x00\x00\x00\xa4\xec\x00\x00\x00\x3c\x35\xd0\x7f\x20\xea\x04\x04\x0c"  # Celo
+    b"\x00\x00\x00\x00\xa8\x69\x00\x00\x00\x01\x96\x96\x96\x20\xfe\x05\x16\x0d"  # Avalanche Fuji Testnet
+    b"\x00\x00\x00\x00\xa8\x6a\x00\x00\x23\x2d\xe8\x41\x42\x21\x26\x04\x11\x0c"  # Avalanche C-Chain
+    b"\x00\x00\x00\x00\xae\xf3\x00\x00\x00\x01\x96\x96\x96\x21\x47\x05\x16\x0d"  # Celo Alfajores Testnet
+    b"\x00\x00\x00\x00\xba\xbd\x00\x00\x00\x3c\xd2\xd2\xd2\x21\x6f\x03\x0b\x0b"  # REI Network
+    b"\x00\x00\x00\x00\xc2\x85\x00\x00\x00\x01\x96\x96\x96\x21\x88\x04\x0e\x0c"  # Energi Testnet
+    b"\x00\x00\x00\x00\xd2\xaf\x00\x00\x00\x3c\xd2\xd2\xd2\x21\xa6\x05\x09\x0d"  # DFK Chain
+    b"\x00\x00\x00\x00\xe7\x08\x00\x00\x00\x3c\xff\xff\xff\x21\xc1\x03\x05\x0d"  # Linea
+    b"\x00\x00\x00\x00\xf3\x70\x00\x00\x00\x01\x96\x96\x96\x21\xd6\x05\x14\x0d"  # Celo Baklava Testnet
+    b"\x00\x00\x00\x00\xf6\x18\x00\x00\x00\x3c\xd2\xd2\xd2\x21\xfc\x03\x0d\x0b"  # eSync Network
+    b"\x00\x00\x00\x01\x20\x47\x00\x00\x00\x01\x96\x96\x96\x22\x17\x03\x18\x0b"  # Energy Web Volta Testnet
+    b"\x00\x00\x00\x01\x20\xc7\x00\x00\x00\x3c\x59\x59\xd8\x22\x3d\x03\x15\x0d"  # Mixin Virtual Machine
+    b"\x00\x00\x00\x01\x31\x1e\x00\x00\x00\x01\xd2\xd2\xd2\x22\x62\x03\x14\x0b"  # Firenze test network
+    b"\x00\x00\x00\x01\x38\x81\x00\x00\x00\x01\x96\x96\x96\x22\x84\x06\x06\x0e"  # Mumbai
+    b"\x00\x00\x00\x01\x86\x9f\x00\x00\x00\x3c\xd2\xd2\xd2\x22\x9e\x03\x0e\x0b"  # UB Smart Chain
+    b"\x00\x00\x00\x01\x86\xa0\x00\x00\x00\x3c\xd2\xd2\xd2\x22\xba\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa1\x00\x00\x00\x3c\xd2\xd2\xd2\x22\xd2\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa2\x00\x00\x00\x3c\xd2\xd2\xd2\x22\xea\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa3\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x02\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa4\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x1a\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa5\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x32\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa6\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x4a\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa7\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x62\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x01\x86\xa8\x00\x00\x00\x3c\xd2\xd2\xd2\x23\x7a\x03\x0a\x0b"  # QuarkChain
+    b"\x00\x00\x00\x03\x0f\xb1\x00\x03\x0f\xb1\xd2\xd2\xd2\x23\x92\x03\x06\x0b"  # Akroma
+    b"\x00\x00\x00\x03\x11\x3a\x00\x00\x00\x3c\xd2\xd2\xd2\x23\xa6\x03\x05\x0b"  # Alaya
+    b"\x00\x00\x00\x03\x35\xf9\x00\x00\x00\x3c\xd2\xd2\xd2\x23\xb9\x03\x06\x0b"  # PlatON
+    b"\x00\x00\x00\x03\xc3\x01\x00\x03\xc3\x01\xd2\xd2\xd2\x23\xcd\x03\x0c\x0b"  # ARTIS sigma1
+    b"\x00\x00\x00\x03\xc4\x01\x00\x00\x00\x01\x96\x96\x96\x23\xe7\x04\x12\x0c"  # ARTIS Testnet tau1
+    b"\x00\x00\x00\x04\x4a\x21\x00\x00\x00\x3c\xd2\xd2\xd2\x24\x09\x03\x12\x0b"  # Social Smart Chain
+    b"\x00\x00\x00\x05\x18\xaf\x00\x00\x00\x3c\xd2\xd2\xd2\x24\x29\x05\x05\x0d"  # Polis
+    b"\x00\x00\x00\x0d\x90\x38\x00\x00\x00\x3c\xd2\xd2\xd2\x24\x40\x02\x06\x0a"  # Vision
+    b"\x00\x00\x00\x0e\x93\xa9\x00\x00\x03\xf3\xd2\xd2\xd2\x24\x52\x03\x15\x0b"  # Eluvio Content Fabric
+    b"\x00\x00\x00\x14\x09\x5a\x00\x14\x09\x5a\xd2\xd2\xd2\x24\x75\x04\x0d\x0c"  # Etho Protocol
+    b"\x00\x00\x00\x14\x0a\xdc\x00\x00\x00\x3c\xd2\xd2\xd2\x24\x92\x04\x05\x0c"  # Xerom
+    b"\x00\x00\x00\x76\x74\x0f\x00\x00\x00\xb8\xd2\xd2\xd2\x24\xa7\x05\x08\x0d"  # Musicoin
+    b"\x00\x00\x00\xaa\x36\xa7\x00\x00\x00\x01\x96\x96\x96\x24\xc1\x04\x07\x0c"  # Sepolia
+    b"\x00\x00\x00\xcc\x07\xc9\x00\x00\x00\x3c\xd2\xd2\xd2\x24\xd8\x04\x12\x0c"  # PepChain Churchill
+    b"\x00\x00\x01\x17\x13\x37\x00\x00\x00\x3c\xd2\xd2\xd2\x24\xfa\x03\x06\x0b"  # IOLite
+    b"\x00\x00\x01\x33\xf0\xd5\x00\x00\x00\x3c\xd2\xd2\xd2\x25\x0e\x03\x0f\x0b"  # quarkblockchain
+    b"\x00\x00\x01\xb9\xac\x4e\x00\x00\x01\x58\xd2\xd2\xd2\x25\x2b\x03\x10\x0b"  # Auxilium Network
+    b"\x00\x00\x02\x23\x1c\x60\x00\x00\x00\x3c\xd2\xd2\xd2\x25\x49\x04\x0c\x0c"  # Joys Digital
+    b"\x00\x00\x03\xad\xbc\x39\x03\xad\xbc\x39\xd2\xd2\xd2\x25\x65\x04\x09\x0c"  # Aquachain
+    b"\x00\x00\x05\xec\xf6\x9a\x00\x00\x00\x01\x96\x96\x96\x25\x7e\x04\x14\x0c"  # Joys Digital TestNet
+    b"\x00\x00\x0e\x9a\xc0\xd6\x00\x00\x00\x3c\xd2\xd2\xd2\x25\xa2\x04\x08\x0c"  # Neon EVM
+    b"\x00\x00\x12\x94\xf7\xc2\x00\x00\x00\x3c\xd2\xd2\xd2\x25\xba\x03\x09\x0b"  # OneLedger
+    b"\x00\x00\x42\xe5\x76\xf7\x00\x00\x00\x3c\xd2\xd2\xd2\x25\xd1\x04\x0c\x0c"  # IPOS Network
+    b"\x00\x00\x4e\x45\x41\x52\x00\x00\x00\x3c\xd2\xd2\xd2\x25\xed\x03\x06\x0e"  # Aurora
+    b"\x00\x00\x63\x56\x4c\x40\x00\x00\x03\xff\x33\xd3\xd5\x26\x04\x03\x07\x0b"  # Harmony
+    b"\x00\x00\x63\x56\x4c\x41\x00\x00\x03\xff\xd2\xd2\xd2\x26\x19\x03\x07\x0b"  # Harmony
+    b"\x00\x00\x63\x56\x4c\x42\x00\x00\x03\xff\xd2\xd2\xd2\x26\x2e\x03\x07\x0b"  # Harmony
+    b"\x00\x00\x63\x56\x4c\x43\x00\x00\x03\xff\xd2\xd2\xd2\x26\x43\x03\x07\x0b"  # Harmony
+    b"\x00\x00\x78\x77\xdc\x5d\x00\x00\x00\x3c\xd2\xd2\xd2\x26\x58\x03\x0a\x0b"  # DataHopper
+    b"\x00\x00\xba\x4d\xc6\x10\x00\x00\x00\xa4\xd2\xd2\xd2\x26\x70\x04\x04\x0c"  # Pirl
+    b"\x00\x02\xa1\x5c\x30\x8d\x00\x00\x00\x3c\xd2\xd2\xd2\x26\x84\x04\x04\x0c"  # Palm
+    b"\x00\x2e\x08\x72\x6b\xbe\x00\x00\x00\x3c\xd2\xd2\xd2\x26\x98\x03\x05\x0b"  # Ntity
+    b"\x05\x7a\x23\x8f\x93\xbf\x00\x00\x00\x3c\xd2\xd2\xd2\x26\xab\x04\x10\x0c"  # Molereum Network
+    b"\x45\x54\x48\x45\x74\x68\x65\x72\x65\x75\x6d\x65\x76\x6d\x2d\x65\x74\x68\x2e\x70\x6e\x67"  # ETH
+    b"\x45\x58\x50\x45\x78\x70\x61\x6e\x73\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x78\x70\x2e\x70\x6e\x67"  # EXP
+    b"\x74\x45\x54\x48\x52\x6f\x70\x73\x74\x65\x6e\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # tETH
+    b"\x74\x45\x54\x48\x52\x69\x6e\x6b\x65\x62\x79\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # tETH
+    b"\x74\x45\x54\x48\x47\x6f\x65\x72\x6c\x69\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # tETH
+    b"\x74\x4b\x4f\x54\x4b\x6f\x74\x74\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x6f\x74\x2e\x70\x6e\x67"  # tKOT
+    b"\x54\x43\x48\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x74\x63\x68\x2e\x70\x6e\x67"  # TCH
+    b"\x55\x42\x51\x55\x62\x69\x71\x65\x76\x6d\x2d\x75\x62\x71\x2e\x70\x6e\x67"  # UBQ
+    b"\x54\x55\x42\x51\x55\x62\x69\x71\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x75\x62\x71\x2e\x70\x6e\x67"  # TUBQ
+    b"\x45\x54\x48\x4f\x50\x65\x76\x6d\x2d\x6f\x65\x74\x68\x2e\x70\x6e\x67"  # ETH
+    b"\x4d\x45\x54\x41\x4d\x65\x74\x61\x64\x69\x75\x6d\x65\x76\x6d\x2d\x6d\x65\x74\x61\x2e\x70\x6e\x67"  # META
+    b"\x74\x4b\x41\x4c\x4d\x65\x74\x61\x64\x69\x75\x6d\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x61\x6c\x2e\x70\x6e\x67"  # tKAL
+    b"\x74\x73\x44\x49\x4f\x44\x45\x44\x69\x6f\x64\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x53\x74\x61\x67\x69\x6e\x67\x65\x76\x6d\x2d\x74\x73\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"  # tsDIODE
+    b"\x46\x4c\x52\x46\x6c\x61\x72\x65\x65\x76\x6d\x2d\x66\x6c\x72\x2e\x70\x6e\x67"  # FLR
+    b"\x44\x49\x4f\x44\x45\x44\x69\x6f\x64\x65\x20\x50\x72\x65\x6e\x65\x74\x65\x76\x6d\x2d\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"  # DIODE
+    b"\x74\x43\x46\x4c\x52\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x43\x6f\x73\x74\x6f\x6e\x65\x76\x6d\x2d\x74\x63\x66\x6c\x72\x2e\x70\x6e\x67"  # tCFLR
+    b"\x54\x46\x49\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x20\x32\x2e\x30\x20\x54\x68\x61\x69\x46\x69\x65\x76\x6d\x2d\x74\x66\x69\x2e\x70\x6e\x67"  # TFI
+    b"\x54\x53\x54\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x73\x74\x2e\x70\x6e\x67"  # TST
+    b"\x53\x47\x42\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x43\x61\x6e\x61\x72\x79\x2d\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x67\x62\x2e\x70\x6e\x67"  # SGB
+    b"\x45\x4c\x41\x45\x6c\x61\x73\x74\x6f\x73\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x6c\x61\x2e\x70\x6e\x67"  # ELA
+    b"\x43\x52\x4f\x43\x72\x6f\x6e\x6f\x73\x65\x76\x6d\x2d\x63\x72\x6f\x2e\x70\x6e\x67"  # CRO
+    b"\x53\x48\x49\x42\x53\x68\x69\x62\x61\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x73\x68\x69\x62\x2e\x70\x6e\x67"  # SHIB
+    b"\x4c\x31\x47\x65\x6e\x65\x73\x69\x73\x20\x4c\x31\x65\x76\x6d\x2d\x6c\x31\x2e\x70\x6e\x67"  # L1
+    b"\x52\x42\x54\x43\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x65\x76\x6d\x2d\x72\x62\x74\x63\x2e\x70\x6e\x67"  # RBTC
+    b"\x74\x52\x42\x54\x43\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x72\x62\x74\x63\x2e\x70\x6e\x67"  # tRBTC
+    b"\x47\x6f\x6f\x44\x47\x6f\x6f\x64\x44\x61\x74\x61\x65\x76\x6d\x2d\x67\x6f\x6f\x64\x2e\x70\x6e\x67"  # GooD
+    b"\x54\x42\x47\x54\x42\x57\x47\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x74\x62\x67\x2e\x70\x6e\x67"  # TBG
+    b"\x56\x41\x4c\x56\x61\x6c\x6f\x72\x62\x69\x74\x65\x76\x6d\x2d\x76\x61\x6c\x2e\x70\x6e\x67"  # VAL
+    b"\x54\x4c\x4f\x53\x54\x65\x6c\x6f\x73\x20\x45\x56\x4d\x65\x76\x6d\x2d\x74\x6c\x6f\x73\x2e\x70\x6e\x67"  # TLOS
+    b"\x43\x52\x41\x42\x43\x72\x61\x62\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x63\x72\x61\x62\x2e\x70\x6e\x67"  # CRAB
+    b"\x58\x44\x43\x58\x44\x43\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x78\x64\x63\x2e\x70\x6e\x67"  # XDC
+    b"\x54\x58\x44\x43\x58\x44\x43\x20\x41\x70\x6f\x74\x68\x65\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x74\x78\x64\x63\x2e\x70\x6e\x67"  # TXDC
+    b"\x63\x65\x74\x43\x6f\x69\x6e\x45\x78\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x65\x74\x2e\x70\x6e\x67"  # cet
+    b"\x5a\x59\x58\x5a\x79\x78\x65\x76\x6d\x2d\x7a\x79\x78\x2e\x70\x6e\x67"  # ZYX
+    b"\x42\x4e\x42\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x6e\x62\x2e\x70\x6e\x67"  # BNB
+    b"\x4f\x4e\x47\x4f\x6e\x74\x6f\x6c\x6f\x67\x79\x65\x76\x6d\x2d\x6f\x6e\x67\x2e\x70\x6e\x67"  # ONG
+    b"\x47\x4f\x47\x6f\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x67\x6f\x2e\x70\x6e\x67"  # GO
+    b"\x45\x54\x43\x45\x74\x68\x65\x72\x65\x75\x6d\x20\x43\x6c\x61\x73\x73\x69\x63\x65\x76\x6d\x2d\x65\x74\x63\x2e\x70\x6e\x67"  # ETC
+    b"\x54\x45\x54\x43\x4d\x6f\x72\x64\x65\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x65\x74\x63\x2e\x70\x6e\x67"  # TETC
+    b"\x74\x4d\x45\x54\x43\x4d\x6f\x72\x64\x6f\x72\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6d\x65\x74\x63\x2e\x70\x6e\x67"  # tMETC
+    b"\x45\x4c\x4c\x41\x45\x6c\x6c\x61\x69\x73\x6d\x65\x76\x6d\x2d\x65\x6c\x6c\x61\x2e\x70\x6e\x67"  # ELLA
+    b"\x4f\x4b\x54\x4f\x4b\x58\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6f\x6b\x74\x2e\x70\x6e\x67"  # OKT
+    b"\x74\x44\x42\x4d\x44\x42\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x64\x62\x6d\x2e\x70\x6e\x67"  # tDBM
+    b"\x45\x49\x44\x49\x49\x44\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x69\x64\x69\x2e\x70\x6e\x67"  # EIDI
+    b"\x4d\x49\x58\x4d\x69\x78\x65\x76\x6d\x2d\x6d\x69\x78\x2e\x70\x6e\x67"  # MIX
+    b"\x53\x50\x4f\x41\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x53\x6f\x6b\x6f\x6c\x65\x76\x6d\x2d\x73\x70\x6f\x61\x2e\x70\x6e\x67"  # SPOA
+    b"\x50\x45\x54\x48\x50\x72\x69\x6d\x75\x73\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x65\x74\x68\x2e\x70\x6e\x67"  # PETH
+    b"\x52\x4e\x41\x47\x65\x6e\x65\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x72\x6e\x61\x2e\x70\x6e\x67"  # RNA
+    b"\x4d\x54\x52\x4d\x65\x74\x65\x72\x65\x76\x6d\x2d\x6d\x74\x72\x2e\x70\x6e\x67"  # MTR
+    b"\x53\x4e\x54\x4e\x6f\x76\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x6e\x74\x2e\x70\x6e\x67"  # SNT
+    b"\x56\x49\x43\x56\x69\x63\x74\x69\x6f\x6e\x65\x76\x6d\x2d\x76\x69\x63\x2e\x70\x6e\x67"  # VIC
+    b"\x47\x41\x52\x47\x61\x72\x69\x7a\x6f\x6e\x20\x53\x74\x61\x67\x65\x30\x65\x76\x6d\x2d\x67\x61\x72\x2e\x70\x6e\x67"  # GAR
+    b"\x74\x42\x4e\x42\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x62\x6e\x62\x2e\x70\x6e\x67"  # tBNB
+    b"\x50\x4f\x41\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x43\x6f\x72\x65\x65\x76\x6d\x2d\x70\x6f\x61\x2e\x70\x6e\x67"  # POA
+    b"\x58\x44\x41\x49\x47\x6e\x6f\x73\x69\x73\x65\x76\x6d\x2d\x78\x64\x61\x69\x2e\x70\x6e\x67"  # XDAI
+    b"\x45\x54\x49\x45\x74\x68\x65\x72\x49\x6e\x63\x65\x76\x6d\x2d\x65\x74\x69\x2e\x70\x6e\x67"  # ETI
+    b"\x57\x33\x47\x57\x65\x62\x33\x47\x61\x6d\x65\x73\x20\x44\x65\x76\x6e\x65\x74\x65\x76\x6d\x2d\x77\x33\x67\x2e\x70\x6e\x67"  # W3G
+    b"\x56\x4c\x58\x56\x65\x6c\x61\x73\x20\x45\x56\x4d\x65\x76\x6d\x2d\x76\x6c\x78\x2e\x70\x6e\x67"  # VLX
+    b"\x54\x54\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x65\x76\x6d\x2d\x74\x74\x2e\x70\x6e\x67"  # TT
+    b"\x45\x54\x4c\x45\x74\x68\x65\x72\x4c\x69\x74\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x74\x6c\x2e\x70\x6e\x67"  # ETL
+    b"\x46\x55\x53\x45\x46\x75\x73\x65\x65\x76\x6d\x2d\x66\x75\x73\x65\x2e\x70\x6e\x67"  # FUSE
+    b"\x53\x50\x41\x52\x4b\x46\x75\x73\x65\x20\x53\x70\x61\x72\x6b\x6e\x65\x74\x65\x76\x6d\x2d\x73\x70\x61\x72\x6b\x2e\x70\x6e\x67"  # SPARK
+    b"\x44\x57\x55\x44\x65\x63\x65\x6e\x74\x72\x61\x6c\x69\x7a\x65\x64\x20\x57\x65\x62\x65\x76\x6d\x2d\x64\x77\x75\x2e\x70\x6e\x67"  # DWU
+    b"\x4f\x59\x4f\x59\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6f\x79\x2e\x70\x6e\x67"  # OY
+    b"\x46\x45\x54\x48\x46\x61\x63\x74\x6f\x72\x79\x20\x31\x32\x37\x65\x76\x6d\x2d\x66\x65\x74\x68\x2e\x70\x6e\x67"  # FETH
+    b"\x48\x54\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x74\x2e\x70\x6e\x67"  # HT
+    b"\x50\x4f\x4c\x50\x6f\x6c\x79\x67\x6f\x6e\x65\x76\x6d\x2d\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"  # POL
+    b"\x44\x41\x58\x44\x41\x58\x20\x43\x48\x41\x49\x4e\x65\x76\x6d\x2d\x64\x61\x78\x2e\x70\x6e\x67"  # DAX
+    b"\x53\x53\x6f\x6e\x69\x63\x65\x76\x6d\x2d\x73\x2e\x70\x6e\x67"  # S
+    b"\x74\x50\x48\x54\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x70\x68\x74\x2e\x70\x6e\x67"  # tPHT
+    b"\x50\x48\x54\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x65\x76\x6d\x2d\x70\x68\x74\x2e\x70\x6e\x67"  # PHT
+    b"\x48\x53\x4b\x48\x61\x73\x68\x4b\x65\x79\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x73\x6b\x2e\x70\x6e\x67"  # HSK
+    b"\x53\x65\x65\x6c\x65\x53\x65\x65\x6c\x65\x65\x76\x6d\x2d\x73\x65\x65\x6c\x65\x2e\x70\x6e\x67"  # Seele
+    b"\x42\x54\x4d\x42\x4d\x43\x65\x76\x6d\x2d\x62\x74\x6d\x2e\x70\x6e\x67"  # BTM
+    b"\x42\x54\x54\x42\x69\x74\x54\x6f\x72\x72\x65\x6e\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x74\x74\x2e\x70\x6e\x67"  # BTT
+    b"\x30\x78\x46\x46\x72\x65\x69\x67\x68\x74\x20\x54\x72\x75\x73\x74\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x30\x78\x66\x2e\x70\x6e\x67"  # 0xF
+    b"\x41\x53\x4b\x50\x65\x72\x6d\x69\x73\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x61\x73\x6b\x2e\x70\x6e\x67"  # ASK
+    b"\x4c\x41\x4c\x41\x43\x48\x41\x49\x4e\x65\x76\x6d\x2d\x6c\x61\x2e\x70\x6e\x67"  # LA
+    b"\x45\x57\x54\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x77\x74\x2e\x70\x6e\x67"  # EWT
+    b"\x46\x54\x4d\x46\x61\x6e\x74\x6f\x6d\x20\x4f\x70\x65\x72\x61\x65\x76\x6d\x2d\x66\x74\x6d\x2e\x70\x6e\x67"  # FTM
+    b"\x74\x68\x74\x74\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x68\x74\x74\x2e\x70\x6e\x67"  # thtt
+    b"\x53\x45\x54\x4d\x53\x65\x74\x68\x65\x75\x6d\x65\x76\x6d\x2d\x73\x65\x74\x6d\x2e\x70\x6e\x67"  # SETM
+    b"\x53\x52\x4e\x53\x55\x52\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x72\x6e\x2e\x70\x6e\x67"  # SRN
+    b"\x48\x50\x42\x48\x69\x67\x68\x20\x50\x65\x72\x66\x6f\x72\x6d\x61\x6e\x63\x65\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x70\x62\x2e\x70\x6e\x67"  # HPB
+    b"\x45\x54\x48\x42\x6f\x62\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x6f\x62\x61\x2e\x70\x6e\x67"  # ETH
+    b"\x46\x49\x4c\x46\x69\x6c\x65\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x66\x69\x6c\x65\x63\x6f\x69\x6e\x2e\x70\x6e\x67"  # FIL
+    b"\x4b\x43\x53\x4b\x43\x43\x65\x76\x6d\x2d\x6b\x63\x73\x2e\x70\x6e\x67"  # KCS
+    b"\x45\x54\x48\x7a\x6b\x53\x79\x6e\x63\x65\x76\x6d\x2d\x7a\x6b\x73\x79\x6e\x63\x2d\x65\x72\x61\x2e\x70\x6e\x67"  # ETH
+    b"\x57\x33\x51\x57\x65\x62\x33\x51\x65\x76\x6d\x2d\x77\x33\x71\x2e\x70\x6e\x67"  # W3Q
+    b"\x53\x44\x4e\x53\x68\x69\x64\x65\x6e\x65\x76\x6d\x2d\x73\x64\x6e\x2e\x70\x6e\x67"  # SDN
+    b"\x50\x4c\x53\x50\x75\x6c\x73\x65\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x6c\x73\x2e\x70\x6e\x67"  # PLS
+    b"\x74\x45\x54\x48\x4f\x70\x74\x69\x6d\x69\x73\x6d\x20\x47\x6f\x65\x72\x6c\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # tETH
+    b"\x52\x55\x50\x58\x52\x75\x70\x61\x79\x61\x65\x76\x6d\x2d\x72\x75\x70\x78\x2e\x70\x6e\x67"  # RUPX
+    b"\x41\x41\x43\x44\x6f\x75\x62\x6c\x65\x2d\x41\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x61\x63\x2e\x70\x6e\x67"  # AAC
+    b"\x43\x4c\x41\x53\x53\x56\x65\x6c\x61\x31\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x6c\x61\x73\x73\x2e\x70\x6e\x67"  # CLASS
+    b"\x54\x41\x4f\x54\x61\x6f\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x74\x61\x6f\x2e\x70\x6e\x67"  # TAO
+    b"\x74\x6d\x41\x43\x41\x41\x63\x61\x6c\x61\x20\x4d\x61\x6e\x64\x61\x6c\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x54\x43\x39\x65\x76\x6d\x2d\x74\x6d\x61\x63\x61\x2e\x70\x6e\x67"  # tmACA
+    b"\x4b\x41\x52\x4b\x61\x72\x75\x72\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6b\x61\x72\x2e\x70\x6e\x67"  # KAR
+    b"\x42\x43\x53\x42\x6c\x6f\x63\x6b\x43\x68\x61\x69\x6e\x20\x53\x74\x61\x74\x69\x6f\x6e\x65\x76\x6d\x2d\x62\x63\x73\x2e\x70\x6e\x67"  # BCS
+    b"\x63\x54\x48\x63\x68\x65\x61\x70\x45\x54\x48\x65\x76\x6d\x2d\x63\x74\x68\x2e\x70\x6e\x67"  # cTH
+    b"\x41\x43\x41\x41\x63\x61\x6c\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x61\x63\x61\x2e\x70\x6e\x67"  # ACA
+    b"\x48\x41\x49\x43\x48\x61\x69\x63\x65\x76\x6d\x2d\x68\x61\x69\x63\x2e\x70\x6e\x67"  # HAIC
+    b"\x43\x4c\x4f\x43\x61\x6c\x6c\x69\x73\x74\x6f\x65\x76\x6d\x2d\x63\x6c\x6f\x2e\x70\x6e\x67"  # CLO
+    b"\x54\x43\x4c\x4f\x43\x61\x6c\x6c\x69\x73\x74\x6f\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x44\x65\x70\x72\x65\x63\x61\x74\x65\x64\x65\x76\x6d\x2d\x74\x63\x6c\x6f\x2e\x70\x6e\x67"  # TCLO
+    b"\x57\x41\x4e\x57\x61\x6e\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x61\x6e\x2e\x70\x6e\x67"  # WAN
+    b"\x59\x45\x54\x49\x4e\x65\x70\x61\x6c\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x79\x65\x74\x69\x2e\x70\x6e\x67"  # YETI
+    b"\x4c\x39\x39\x4c\x75\x63\x6b\x79\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6c\x39\x39\x2e\x70\x6e\x67"  # L99
+    b"\x74\x4b\x41\x49\x41\x4b\x61\x69\x61\x20\x4b\x61\x69\x72\x6f\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x61\x69\x61\x2e\x70\x6e\x67"  # tKAIA
+    b"\x74\x4e\x45\x57\x4e\x65\x77\x74\x6f\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6e\x65\x77\x2e\x70\x6e\x67"  # tNEW
+    b"\x45\x56\x43\x45\x76\x72\x69\x63\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x76\x63\x2e\x70\x6e\x67"  # EVC
+    b"\x4e\x45\x57\x4e\x65\x77\x74\x6f\x6e\x65\x76\x6d\x2d\x6e\x65\x77\x2e\x70\x6e\x67"  # NEW
+    b"\x53\x4b\x55\x53\x61\x6b\x75\x72\x61\x65\x76\x6d\x2d\x73\x6b\x75\x2e\x70\x6e\x67"  # SKU
+    b"\x43\x4c\x56\x43\x4c\x56\x20\x50\x61\x72\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x6c\x76\x2e\x70\x6e\x67"  # CLV
+    b"\x43\x46\x58\x43\x6f\x6e\x66\x6c\x75\x78\x20\x65\x53\x70\x61\x63\x65\x65\x76\x6d\x2d\x63\x66\x78\x2e\x70\x6e\x67"  # CFX
+    b"\x4d\x45\x54\x49\x53\x4d\x65\x74\x69\x73\x20\x41\x6e\x64\x72\x6f\x6d\x65\x64\x61\x65\x76\x6d\x2d\x6d\x65\x74\x69\x73\x2e\x70\x6e\x67"  # METIS
+    b"\x4d\x41\x54\x48\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6d\x61\x74\x68\x2e\x70\x6e\x67"  # MATH
+    b"\x74\x4d\x41\x54\x48\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6d\x61\x74\x68\x2e\x70\x6e\x67"  # tMATH
+    b"\x49\x4f\x52\x41\x49\x6f\x72\x61\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x69\x6f\x72\x61\x2e\x70\x6e\x67"  # IORA
+    b"\x57\x54\x54\x57\x6f\x72\x6c\x64\x20\x54\x72\x61\x64\x65\x20\x54\x65\x63\x68\x6e\x69\x63\x61\x6c\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x74\x74\x2e\x70\x6e\x67"  # WTT
+    b"\x50\x4f\x50\x50\x6f\x70\x63\x61\x74\x65\x75\x6d\x65\x76\x6d\x2d\x70\x6f\x70\x2e\x70\x6e\x67"  # POP
+    b"\x45\x4e\x54\x45\x52\x45\x6e\x74\x65\x72\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x6e\x74\x65\x72\x2e\x70\x6e\x67"  # ENTER
+    b"\x48\x4f\x48\x41\x4c\x4f\x65\x76\x6d\x2d\x68\x6f\x2e\x70\x6e\x67"  # HO
+    b"\x47\x4c\x4d\x52\x4d\x6f\x6f\x6e\x62\x65\x61\x6d\x65\x76\x6d\x2d\x67\x6c\x6d\x72\x2e\x70\x6e\x67"  # GLMR
+    b"\x4d\x4f\x56\x52\x4d\x6f\x6f\x6e\x72\x69\x76\x65\x72\x65\x76\x6d\x2d\x6d\x6f\x76\x72\x2e\x70\x6e\x67"  # MOVR
+    b"\x44\x45\x56\x4d\x6f\x6f\x6e\x62\x61\x73\x65\x20\x41\x6c\x70\x68\x61\x65\x76\x6d\x2d\x64\x65\x76\x2e\x70\x6e\x67"  # DEV
+    b"\x43\x41\x54\x45\x43\x61\x74\x65\x63\x6f\x69\x6e\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x61\x74\x65\x2e\x70\x6e\x67"  # CATE
+    b"\x42\x54\x41\x42\x74\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x74\x61\x2e\x70\x6e\x67"  # BTA
+    b"\x54\x53\x46\x54\x65\x73\x6c\x61\x66\x75\x6e\x64\x73\x65\x76\x6d\x2d\x74\x73\x66\x2e\x70\x6e\x67"  # TSF
+    b"\x42\x4f\x59\x42\x4f\x4e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x6f\x79\x2e\x70\x6e\x67"  # BOY
+    b"\x45\x47\x45\x4d\x45\x74\x68\x65\x72\x47\x65\x6d\x65\x76\x6d\x2d\x65\x67\x65\x6d\x2e\x70\x6e\x67"  # EGEM
+    b"\x45\x44\x47\x45\x64\x67\x65\x77\x61\x72\x65\x20\x45\x64\x67\x65\x45\x56\x4d\x65\x76\x6d\x2d\x65\x64\x67\x2e\x70\x6e\x67"  # EDG
+    b"\x52\x50\x47\x52\x61\x6e\x67\x65\x72\x73\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x65\x76\x6d\x2d\x72\x70\x67\x2e\x70\x6e\x67"  # RPG
+    b"\x45\x43\x4f\x45\x63\x6f\x62\x61\x6c\x6c\x65\x76\x6d\x2d\x65\x63\x6f\x2e\x70\x6e\x67"  # ECO
+    b"\x45\x56\x41\x45\x76\x61\x6e\x65\x73\x63\x6f\x65\x76\x6d\x2d\x65\x76\x61\x2e\x70\x6e\x67"  # EVA
+    b"\x4b\x54\x4f\x4b\x6f\x72\x74\x68\x6f\x65\x76\x6d\x2d\x6b\x74\x6f\x2e\x70\x6e\x67"  # KTO
+    b"\x50\x52\x42\x50\x61\x72\x69\x62\x75\x20\x4e\x65\x74\x65\x76\x6d\x2d\x70\x72\x62\x2e\x70\x6e\x67"  # PRB
+    b"\x44\x59\x4e\x4f\x44\x59\x4e\x4f\x65\x76\x6d\x2d\x64\x79\x6e\x6f\x2e\x70\x6e\x67"  # DYNO
+    b"\x49\x4f\x54\x58\x49\x6f\x54\x65\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x69\x6f\x74\x78\x2e\x70\x6e\x67"  # IOTX
+    b"\x4d\x4e\x54\x4d\x61\x6e\x74\x6c\x65\x65\x76\x6d\x2d\x6d\x6e\x74\x2e\x70\x6e\x67"  # MNT
+    b"\x45\x53\x45\x72\x61\x53\x77\x61\x70\x65\x76\x6d\x2d\x65\x73\x2e\x70\x6e\x67"  # ES
+    b"\x55\x5a\x4d\x49\x55\x7a\x6d\x69\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x75\x7a\x6d\x69\x2e\x70\x6e\x67"  # UZMI
+    b"\x52\x42\x44\x57\x65\x67\x6f\x63\x68\x61\x69\x6e\x20\x52\x75\x62\x69\x64\x69\x75\x6d\x65\x76\x6d\x2d\x72\x62\x64\x2e\x70\x6e\x67"  # RBD
+    b"\x50\x49\x58\x50\x69\x78\x69\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x69\x78\x2e\x70\x6e\x67"  # PIX
+    b"\x54\x45\x4c\x45\x54\x65\x6c\x65\x70\x6f\x72\x74\x65\x76\x6d\x2d\x74\x65\x6c\x65\x2e\x70\x6e\x67"  # TELE
+    b"\x4b\x41\x49\x41\x4b\x61\x69\x61\x65\x76\x6d\x2d\x6b\x61\x69\x61\x2e\x70\x6e\x67"  # KAIA
+    b"\x45\x54\x48\x42\x61\x73\x65\x65\x76\x6d\x2d\x62\x61\x73\x65\x2e\x70\x6e\x67"  # ETH
+    b"\x4f\x4c\x4f\x54\x4f\x4f\x4c\x20\x47\x6c\x6f\x62\x61\x6c\x65\x76\x6d\x2d\x6f\x6c\x6f\x2e\x70\x6e\x67"  # OLO
+    b"\x55\x2b\x32\x35\x42\x33\x62\x6c\x6f\x78\x62\x65\x72\x67\x65\x76\x6d\x2d\x75\x2b\x32\x35\x62\x33\x2e\x70\x6e\x67"  # U+25B3
+    b"\x45\x56\x4d\x4f\x53\x45\x76\x6d\x6f\x73\x65\x76\x6d\x2d\x65\x76\x6d\x6f\x73\x2e\x70\x6e\x67"  # EVMOS
+    b"\x47\x4e\x43\x47\x65\x6e\x65\x73\x69\x73\x20\x43\x6f\x69\x6e\x65\x76\x6d\x2d\x67\x6e\x63\x2e\x70\x6e\x67"  # GNC
+    b"\x44\x54\x54\x44\x61\x74\x61\x20\x54\x72\x61\x64\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x64\x74\x74\x2e\x70\x6e\x67"  # DTT
+    b"\x47\x45\x4e\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x47\x65\x6e\x65\x73\x69\x73\x65\x76\x6d\x2d\x67\x65\x6e\x2e\x70\x6e\x67"  # GEN
+    b"\x43\x43\x50\x43\x72\x79\x70\x74\x6f\x43\x6f\x69\x6e\x50\x61\x79\x65\x76\x6d\x2d\x63\x63\x70\x2e\x70\x6e\x67"  # CCP
+    b"\x57\x47\x4d\x57\x41\x47\x4d\x49\x65\x76\x6d\x2d\x77\x67\x6d\x2e\x70\x6e\x67"  # WGM
+    b"\x5a\x45\x52\x4f\x53\x69\x6e\x67\x75\x6c\x61\x72\x69\x74\x79\x20\x5a\x45\x52\x4f\x65\x76\x6d\x2d\x7a\x65\x72\x6f\x2e\x70\x6e\x67"  # ZERO
+    b"\x50\x48\x58\x50\x68\x6f\x65\x6e\x69\x78\x65\x76\x6d\x2d\x70\x68\x78\x2e\x70\x6e\x67"  # PHX
+    b"\x4d\x54\x54\x4d\x65\x74\x61\x44\x6f\x74\x65\x76\x6d\x2d\x6d\x74\x74\x2e\x70\x6e\x67"  # MTT
+    b"\x74\x53\x45\x50\x53\x45\x43\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x73\x65\x70\x2e\x70\x6e\x67"  # tSEP
+    b"\x42\x54\x43\x49\x58\x42\x54\x43\x49\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x74\x63\x69\x78\x2e\x70\x6e\x67"  # BTCIX
+    b"\x57\x45\x42\x57\x65\x62\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x65\x62\x2e\x70\x6e\x67"  # WEB
+    b"\x4d\x49\x4e\x54\x4d\x45\x4d\x69\x6e\x74\x4d\x65\x2e\x63\x6f\x6d\x20\x43\x6f\x69\x6e\x65\x76\x6d\x2d\x6d\x69\x6e\x74\x6d\x65\x2e\x70\x6e\x67"  # MINTME
+    b"\x45\x53\x4e\x45\x74\x68\x65\x72\x73\x6f\x63\x69\x61\x6c\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x73\x6e\x2e\x70\x6e\x67"  # ESN
+    b"\x46\x53\x4e\x46\x75\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x66\x73\x6e\x2e\x70\x6e\x67"  # FSN
+    b"\x4e\x52\x47\x45\x6e\x65\x72\x67\x69\x65\x76\x6d\x2d\x6e\x72\x67\x2e\x70\x6e\x67"  # NRG
+    b"\x70\x65\x67\x67\x6c\x65\x70\x65\x67\x67\x6c\x65\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x70\x65\x67\x67\x6c\x65\x2e\x70\x6e\x67"  # peggle
+    b"\x45\x54\x48\x41\x72\x62\x69\x74\x72\x75\x6d\x20\x4f\x6e\x65\x65\x76\x6d\x2d\x61\x72\x62\x31\x2e\x70\x6e\x67"  # ETH
+    b"\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x65\x76\x6d\x2d\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # CELO
+    b"\x74\x41\x56\x41\x58\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x46\x75\x6a\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x61\x76\x61\x78\x2e\x70\x6e\x67"  # tAVAX
+    b"\x41\x56\x41\x58\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x43\x2d\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x76\x61\x78\x2e\x70\x6e\x67"  # AVAX
+    b"\x74\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x20\x41\x6c\x66\x61\x6a\x6f\x72\x65\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # tCELO
+    b"\x52\x45\x49\x52\x45\x49\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x72\x65\x69\x2e\x70\x6e\x67"  # REI
+    b"\x74\x4e\x52\x47\x45\x6e\x65\x72\x67\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6e\x72\x67\x2e\x70\x6e\x67"  # tNRG
+    b"\x4a\x45\x57\x45\x4c\x44\x46\x4b\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6a\x65\x77\x65\x6c\x2e\x70\x6e\x67"  # JEWEL
+    b"\x45\x54\x48\x4c\x69\x6e\x65\x61\x65\x76\x6d\x2d\x6c\x69\x6e\x65\x61\x2e\x70\x6e\x67"  # ETH
+    b"\x74\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x20\x42\x61\x6b\x6c\x61\x76\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # tCELO
+    b"\x45\x43\x53\x65\x53\x79\x6e\x63\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x63\x73\x2e\x70\x6e\x67"  # ECS
+    b"\x74\x56\x54\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x56\x6f\x6c\x74\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x76\x74\x2e\x70\x6e\x67"  # tVT
+    b"\x45\x54\x48\x4d\x69\x78\x69\x6e\x20\x56\x69\x72\x74\x75\x61\x6c\x20\x4d\x61\x63\x68\x69\x6e\x65\x65\x76\x6d\x2d\x6d\x69\x78\x69\x6e\x2e\x70\x6e\x67"  # ETH
+    b"\x46\x49\x4e\x46\x69\x72\x65\x6e\x7a\x65\x20\x74\x65\x73\x74\x20\x6e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x66\x69\x6e\x2e\x70\x6e\x67"  # FIN
+    b"\x74\x4d\x41\x54\x49\x43\x4d\x75\x6d\x62\x61\x69\x65\x76\x6d\x2d\x74\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"  # tMATIC
+    b"\x55\x42\x43\x55\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x75\x62\x63\x2e\x70\x6e\x67"  # UBC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # QKC
+    b"\x41\x4b\x41\x41\x6b\x72\x6f\x6d\x61\x65\x76\x6d\x2d\x61\x6b\x61\x2e\x70\x6e\x67"  # AKA
+    b"\x61\x74\x70\x41\x6c\x61\x79\x61\x65\x76\x6d\x2d\x61\x74\x70\x2e\x70\x6e\x67"  # atp
+    b"\x6c\x61\x74\x50\x6c\x61\x74\x4f\x4e\x65\x76\x6d\x2d\x6c\x61\x74\x2e\x70\x6e\x67"  # lat
+    b"\x41\x54\x53\x41\x52\x54\x49\x53\x20\x73\x69\x67\x6d\x61\x31\x65\x76\x6d\x2d\x61\x74\x73\x2e\x70\x6e\x67"  # ATS
+    b"\x74\x41\x54\x53\x41\x52\x54\x49\x53\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x74\x61\x75\x31\x65\x76\x6d\x2d\x74\x61\x74\x73\x2e\x70\x6e\x67"  # tATS
+    b"\x24\x4f\x43\x53\x6f\x63\x69\x61\x6c\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x24\x6f\x63\x2e\x70\x6e\x67"  # $OC
+    b"\x50\x4f\x4c\x49\x53\x50\x6f\x6c\x69\x73\x65\x76\x6d\x2d\x70\x6f\x6c\x69\x73\x2e\x70\x6e\x67"  # POLIS
+    b"\x56\x53\x56\x69\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x76\x73\x2e\x70\x6e\x67"  # VS
+    b"\x45\x4c\x56\x45\x6c\x75\x76\x69\x6f\x20\x43\x6f\x6e\x74\x65\x6e\x74\x20\x46\x61\x62\x72\x69\x63\x65\x76\x6d\x2d\x65\x6c\x76\x2e\x70\x6e\x67"  # ELV
+    b"\x45\x54\x48\x4f\x45\x74\x68\x6f\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x65\x76\x6d\x2d\x65\x74\x68\x6f\x2e\x70\x6e\x67"  # ETHO
+    b"\x58\x45\x52\x4f\x58\x65\x72\x6f\x6d\x65\x76\x6d\x2d\x78\x65\x72\x6f\x2e\x70\x6e\x67"  # XERO
+    b"\x4d\x55\x53\x49\x43\x4d\x75\x73\x69\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x6d\x75\x73\x69\x63\x2e\x70\x6e\x67"  # MUSIC
+    b"\x74\x45\x54\x48\x53\x65\x70\x6f\x6c\x69\x61\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # tETH
+    b"\x54\x50\x45\x50\x50\x65\x70\x43\x68\x61\x69\x6e\x20\x43\x68\x75\x72\x63\x68\x69\x6c\x6c\x65\x76\x6d\x2d\x74\x70\x65\x70\x2e\x70\x6e\x67"  # TPEP
+    b"\x49\x4c\x54\x49\x4f\x4c\x69\x74\x65\x65\x76\x6d\x2d\x69\x6c\x74\x2e\x70\x6e\x67"  # ILT
+    b"\x51\x4b\x49\x71\x75\x61\x72\x6b\x62\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x69\x2e\x70\x6e\x67"  # QKI
+    b"\x41\x55\x58\x41\x75\x78\x69\x6c\x69\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x61\x75\x78\x2e\x70\x6e\x67"  # AUX
+    b"\x4a\x4f\x59\x53\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x65\x76\x6d\x2d\x6a\x6f\x79\x73\x2e\x70\x6e\x67"  # JOYS
+    b"\x41\x51\x55\x41\x41\x71\x75\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x71\x75\x61\x2e\x70\x6e\x67"  # AQUA
+    b"\x54\x4f\x59\x53\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x20\x54\x65\x73\x74\x4e\x65\x74\x65\x76\x6d\x2d\x74\x6f\x79\x73\x2e\x70\x6e\x67"  # TOYS
+    b"\x4e\x45\x4f\x4e\x4e\x65\x6f\x6e\x20\x45\x56\x4d\x65\x76\x6d\x2d\x6e\x65\x6f\x6e\x2e\x70\x6e\x67"  # NEON
+    b"\x4f\x4c\x54\x4f\x6e\x65\x4c\x65\x64\x67\x65\x72\x65\x76\x6d\x2d\x6f\x6c\x74\x2e\x70\x6e\x67"  # OLT
+    b"\x49\x50\x4f\x53\x49\x50\x4f\x53\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x69\x70\x6f\x73\x2e\x70\x6e\x67"  # IPOS
+    b"\x45\x54\x48\x41\x75\x72\x6f\x72\x61\x65\x76\x6d\x2d\x61\x75\x72\x6f\x72\x61\x2e\x70\x6e\x67"  # ETH
+    b"\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # ONE
+    b"\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # ONE
+    b"\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # ONE
+    b"\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # ONE
+    b"\x48\x4f\x50\x44\x61\x74\x61\x48\x6f\x70\x70\x65\x72\x65\x76\x6d\x2d\x68\x6f\x70\x2e\x70\x6e\x67"  # HOP
+    b"\x50\x49\x52\x4c\x50\x69\x72\x6c\x65\x76\x6d\x2d\x70\x69\x72\x6c\x2e\x70\x6e\x67"  # PIRL
+    b"\x50\x41\x4c\x4d\x50\x61\x6c\x6d\x65\x76\x6d\x2d\x70\x61\x6c\x6d\x2e\x70\x6e\x67"  # PALM
+    b"\x4e\x54\x54\x4e\x74\x69\x74\x79\x65\x76\x6d\x2d\x6e\x74\x74\x2e\x70\x6e\x67"  # NTT
+    b"\x4d\x4f\x4c\x45\x4d\x6f\x6c\x65\x72\x65\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6d\x6f\x6c\x65\x2e\x70\x6e\x67"  # MOLE
+)
+
+_SLIP44_INDEX = (
+    b"\x00\x36"
+    b"\x00\x00\x00\x01\x00\x26"
+    b"\x00\x00\x00\x28\x00\x14"
+    b"\x00\x00\x00\x3c\x00\x02"
+    b"\x00\x00\x00\x3d\x02\x9c"
+    b"\x00\x00\x00\x4c\x03\x1a"
+    b"\x00\x00\x00\x6c\x00\x80"
+    b"\x00\x00\x00\x7e\x04\x70"
+    b"\x00\x00\x00\x7f\x04\x82"
+    b"\x00\x00\x00\x89\x01\xa0"
+    b"\x00\x00\x00\xa3\x02\xd2"
+    b"\x00\x00\x00\xa4\x0f\x68"
+    b"\x00\x00\x00\xb2\x03\xbc"
+    b"\x00\x00\x00\xb8\x0e\x24"
+    b"\x00\x00\x00\xe3\x0b\x30"
+    b"\x00\x00\x00\xf6\x05\x7e"
+    b"\x00\x00\x01\x0d\x05\xd8"
+    b"\x00\x00\x01\x20\x0b\x66"
+    b"\x00\x00\x01\x58\x0e\x7e"
+    b"\x00\x00\x01\xcd\x05\xfc"
+    b"\x00\x00\x01\xd0\x03\xe0"
+    b"\x00\x00\x01\xdf\x0a\x46"
+    b"\x00\x00\x01\xf3\x06\x7a"
+    b"\x00\x00\x02\x0b\x09\x26"
+    b"\x00\x00\x02\x1a\x01\xe8"
+    b"\x00\x00\x02\x6d\x0a\xd6"
+    b"\x00\x00\x02\x81\x06\x0e"
+    b"\x00\x00\x02\xae\x06\xd4"
+    b"\x00\x00\x02\xbc\x03\xce"
+    b"\x00\x00\x02\xca\x02\x66"
+    b"\x00\x00\x03\x13\x07\x0a"
+    b"\x00\x00\x03\x34\x07\x2e"
+    b"\x00\x00\x03\x79\x03\x86"
+    b"\x00\x00\x03\x94\x00\xb6"
+    b"\x00\x00\x03\xc6\x04\xa6"
+    b"\x00\x00\x03\xe9\x04\x16"
+    b"\x00\x00\x03\xf0\x09\x38"
+    b"\x00\x00\x03\xf2\x04\x94"
+    b"\x00\x00\x03\xf3\x0d\xee"
+    b"\x00\x00\x03\xfc\x07\xac"
+    b"\x00\x00\x03\xff\x0f\x0e"
+    b"\x00\x00\x05\xe8\x06\x8c"
+    b"\x00\x00\x07\xc3\x09\x14"
+    b"\x00\x00\x08\xad\x05\x5a"
+    b"\x00\x00\x17\xac\x02\x8a"
+    b"\x00\x00\x20\x19\x0a\x22"
+    b"\x00\x00\x23\x2d\x0b\xd2"
+    b"\x00\x00\x26\x46\x0a\x8e"
+    b"\x00\x00\x79\x7e\x0b\x54"
+    b"\x00\x00\x9b\x75\x0b\x78"
+    b"\x00\x03\x0f\xb1\x0d\x5e"
+    b"\x00\x03\xc3\x01\x0d\x94"
+    b"\x00\x14\x09\x5a\x0e\x00"
+    b"\x00\x57\x41\x4e\x07\x52"
+    b"\x03\xad\xbc\x39\x0e\xa2"
+)
@@ -2,29 +2,103 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
-
+# NOTE: the networks are packed into bytes constants, which stay in flash,
+# see `apps.common.packed_table`. Looking a network up by chain ID or SLIP-44 ID
+# is a binary search, so nothing is allocated until a network is found.
+#
+# _NETWORKS record layout (big endian), sorted by chain ID:
+#   chain_id (_CHAIN_ID_SIZE), slip44 (4), primary_color (3),
+#   offset of the strings (2), length of the symbol (1), length of the name (1),
+#   length of the icon (1)
+# The symbol, the name and the icon of every network follow the records, in UTF-8.
+#
+# _SLIP44_INDEX record layout (big endian), sorted by SLIP-44 ID:
+#   slip44 (4), offset of the first network with that ID in _NETWORKS (2)
+
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
 
+from apps.common import packed_table
 from apps.common.paths import HARDENED
 
 if TYPE_CHECKING:
     from typing import Iterator
+<%
+
+DTT = dict(
+    chain_id=9798,
+    slip44=9798,
+    shortcut="DTT",
+    name="Data Trade Chain",
+    icon="evm-dtt.png",
+    primary_color=0x1A2A5F,
+)
 
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
+def pack_networks(networks):
+    networks = [
+        dict(
+            chain_id=int(n.chain_id),
+            slip44=int(n.slip44),
+            shortcut=n.shortcut,
+            name=n.name,
+            icon=n.icon,
+            primary_color=int(n.primary_color, 16),
+        )
+        for n in sorted(networks, key=lambda n: (int(n.chain_id), n.name))
     ]
-    # fmt: on
+    # sorted() is stable, so DTT comes after any other network with its chain ID
+    networks = sorted(networks + [DTT], key=lambda n: n["chain_id"])
+
+    chain_id_size = (max(n["chain_id"] for n in networks).bit_length() + 7) // 8
+    record_size = chain_id_size + 12
+
+    records = []
+    strings = []
+    slip44_index = {}
+    offset = 2 + len(networks) * record_size
+    for i, n in enumerate(networks):
+        slip44_index.setdefault(n["slip44"], 2 + i * record_size)
+        symbol, name, icon = (n[k].encode() for k in ("shortcut", "name", "icon"))
+        assert len(symbol) < 256 and len(name) < 256 and len(icon) < 256
+        assert offset < 0x1_0000
+        record = (
+            n["chain_id"].to_bytes(chain_id_size, "big")
+            + n["slip44"].to_bytes(4, "big")
+            + n["primary_color"].to_bytes(3, "big")
+            + offset.to_bytes(2, "big")
+            + bytes([len(symbol), len(name), len(icon)])
+        )
+        records.append((record, n["name"]))
+        strings.append((symbol + name + icon, n["shortcut"]))
+        offset += len(symbol) + len(name) + len(icon)
+    index = [
+        slip44.to_bytes(4, "big") + offset.to_bytes(2, "big")
+        for slip44, offset in sorted(slip44_index.items())
+    ]
+    return (
+        chain_id_size,
+        len(networks).to_bytes(2, "big"),
+        records,
+        strings,
+        len(index).to_bytes(2, "big"),
+        index,
+    )
+
+(
+    chain_id_size,
+    count,
+    records,
+    strings,
+    index_count,
+    index,
+) = pack_networks(supported_on("trezor2", eth))
+%>\
+
+_CHAIN_ID_SIZE = const(${chain_id_size})
+_RECORD_SIZE = const(${chain_id_size + 12})
+_INDEX_RECORD_SIZE = const(6)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -40,57 +114,62 @@ def shortcut_by_chain_id(chain_id: int) -> str:
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for i in range(packed_table.count(_SLIP44_INDEX)):
+        offset = packed_table.HEADER_SIZE + i * _INDEX_RECORD_SIZE
+        yield packed_table.read_uint(_SLIP44_INDEX, offset, 4) | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if chain_id < 0 or chain_id >> (_CHAIN_ID_SIZE * 8):
+        return UNKNOWN_NETWORK
+    key = chain_id.to_bytes(_CHAIN_ID_SIZE, "big")
+    offset = packed_table.find(_NETWORKS, _RECORD_SIZE, key)
+    if offset < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(offset)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if slip44 < 0 or slip44 >> 32:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(4, "big")
+    offset = packed_table.find(_SLIP44_INDEX, _INDEX_RECORD_SIZE, key)
+    if offset < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(packed_table.read_uint(_SLIP44_INDEX, offset + 4, 2))
+
+
+def _network_info(offset: int) -> EthereumNetworkInfo:
+    table = _NETWORKS
+    # skip the chain ID
+    fields = offset + _CHAIN_ID_SIZE
+    symbol_start = packed_table.read_uint(table, fields + 7, 2)
+    name_start = symbol_start + table[fields + 9]
+    icon_start = name_start + table[fields + 10]
+    return EthereumNetworkInfo(
+        chain_id=packed_table.read_uint(table, offset, _CHAIN_ID_SIZE),
+        slip44=packed_table.read_uint(table, fields, 4),
+        symbol=table[symbol_start:name_start].decode(),
+        name=table[name_start:icon_start].decode(),
+        icon=table[icon_start : icon_start + table[fields + 11]].decode(),
+        primary_color=packed_table.read_uint(table, fields + 4, 3),
+    )
 
 
 # fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-% for n in sorted(supported_on("trezor2", eth), key=lambda network: (int(network.chain_id), network.name)):
-    yield (
-        ${n.chain_id},  # chain_id
-        ${n.slip44},  # slip44
-        "${n.shortcut}",  # symbol
-        "${n.name}",  # name
-        "${n.icon}",  # name
-        ${n.primary_color},  # primary_color
-    )
+_NETWORKS = (
+    ${black_repr(count)}
+% for record, name in records:
+    ${black_repr(record)}  # ${name}
 % endfor
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
-    )
+% for s, symbol in strings:
+    ${black_repr(s)}  # ${symbol}
+% endfor
+)
+
+_SLIP44_INDEX = (
+    ${black_repr(index_count)}
+% for record in index:
+    ${black_repr(record)}
+% endfor
+)
@@ -3,30 +3,55 @@
 # do not edit manually!
 # fmt: off
 
-# NOTE: returning a tuple instead of `TokenInfo` from the "data" function
-# saves 5600 bytes of flash size. Implementing the `_token_iterator`
-# instead of if-tree approach saves another 5600 bytes.
+# NOTE: the tokens of every chain are packed into a single bytes constant, which
+# stays in flash, see `apps.common.packed_table`. A lookup is a binary search over
+# the records sorted by address, so nothing is allocated until a token is found.
+#
+# Record layout (big endian, 25 bytes):
+#   address (20), decimals (1), offset of the strings (2),
+#   length of the symbol (1), length of the name (1)
+# The symbol and the name of every token follow the records, in UTF-8.
 
-# NOTE: interestingly, it did not save much flash size to use smaller
-# parts of the address, for example address length of 10 bytes saves
-# 1 byte per entry, so 1887 bytes overall (and further decrease does not help).
-# (The idea was not having to store the whole address, even a smaller part
-# of it has enough collision-resistance.)
-# (In the if-tree approach the address length did not have any effect whatsoever.)
-
-from typing import Iterator
+from micropython import const
 
 from trezor.messages import EthereumTokenInfo
+
+from apps.common import packed_table
 <%
 from collections import defaultdict
 
+RECORD_SIZE = 25
+
 def group_tokens(tokens):
     r = defaultdict(list)
     for t in sorted(tokens, key=lambda t: t.chain_id):
         r[t.chain_id].append(t)
     return r
+
+def pack_tokens(tokens):
+    # sorted() is stable, so the first of several tokens with the same address wins
+    unique = []
+    for t in sorted(tokens, key=lambda t: t.address_bytes):
+        if not unique or unique[-1].address_bytes != t.address_bytes:
+            unique.append(t)
+
+    records = []
+    strings = []
+    offset = 2 + len(unique) * RECORD_SIZE
+    for t in unique:
+        symbol = t.symbol.encode()
+        name = t.name.strip().encode()
+        assert len(t.address_bytes) == 20
+        assert len(symbol) < 256 and len(name) < 256 and offset < 0x1_0000
+        record = t.address_bytes + bytes([int(t.decimals), offset >> 8, offset & 0xFF, len(symbol), len(name)])
+        records.append((record, t.symbol))
+        strings.append((symbol + name, t.name.strip()))
+        offset += len(symbol) + len(name)
+    return len(unique).to_bytes(2, "big"), records, strings
 %>\
 
+_RECORD_SIZE = const(${RECORD_SIZE})
+
 UNKNOWN_TOKEN = EthereumTokenInfo(
     symbol="Token",
     decimals=0,
@@ -37,27 +62,35 @@ UNKNOWN_TOKEN = EthereumTokenInfo(
 
 
 def token_by_chain_address(chain_id: int, address: bytes) -> EthereumTokenInfo:
-    for addr, symbol, decimal, name in _token_iterator(chain_id):
-        if address == addr:
-            return EthereumTokenInfo(
-                symbol=symbol,
-                decimals=decimal,
-                address=address,
-                chain_id=chain_id,
-                name=name,
-            )
-    return UNKNOWN_TOKEN
-
-
-def _token_iterator(chain_id: int) -> Iterator[tuple[bytes, str, int, str]]:
+    table = _token_table(chain_id)
+    if table is None or len(address) != 20:
+        return UNKNOWN_TOKEN
+    offset = packed_table.find(table, _RECORD_SIZE, address)
+    if offset < 0:
+        return UNKNOWN_TOKEN
+    symbol_start = packed_table.read_uint(table, offset + 21, 2)
+    name_start = symbol_start + table[offset + 23]
+    return EthereumTokenInfo(
+        symbol=table[symbol_start:name_start].decode(),
+        decimals=table[offset + 20],
+        address=address,
+        chain_id=chain_id,
+        name=table[name_start : name_start + table[offset + 24]].decode(),
+    )
+
+
+def _token_table(chain_id: int) -> bytes | None:
 % for token_chain_id, tokens in group_tokens(erc20).items():
+<% count, records, strings = pack_tokens(tokens) %>\
     if chain_id == ${token_chain_id}:  # ${tokens[0].chain}
-        % for t in tokens:
-        yield (  # address, symbol, decimals, name
-            ${black_repr(t.address_bytes)},
-            ${black_repr(t.symbol)},
-            ${t.decimals},
-            ${black_repr(t.name.strip())},
+        return (
+            ${black_repr(count)}
+            % for record, symbol in records:
+            ${black_repr(record)}  # ${symbol}
+            % endfor
+            % for s, name in strings:
+            ${black_repr(s)}  # ${name}
+            % endfor
         )
-        % endfor
 % endfor
+    return None
@@ -0,0 +1,41 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+from trezor import wire
+from trezor.messages import SolanaAddressBatch
+
+from apps.common import seed
+from apps.common.keychain import auto_keychain
+
+from .publickey import PublicKey
+
+if TYPE_CHECKING:
+    from trezor.messages import SolanaGetAddressBatch
+
+    from apps.common.keychain import Keychain
+
+# Limit on the number of addresses of a single request
+_MAX_BATCH_SIZE = const(64)
+
+
+@auto_keychain(__name__)
+async def get_address_batch(
+    ctx: wire.Context, msg: SolanaGetAddressBatch, keychain: Keychain
+) -> SolanaAddressBatch:
+    if not msg.ranges:
+        raise wire.DataError("No address ranges")
+    if sum(r.count for r in msg.ranges) > _MAX_BATCH_SIZE:
+        raise wire.DataError(f"At most {_MAX_BATCH_SIZE} addresses per request")
+
+    result_addresses: list[str] = []
+    public_keys: list[bytes] = []
+    for r in msg.ranges:
+        indexes = range(r.start, r.start + r.count)
+        for node in keychain.derive_children(r.address_n, indexes):
+            pub_key_bytes = seed.remove_ed25519_prefix(node.public_key())
+            result_addresses.append(str(PublicKey(pub_key_bytes)))
+            if msg.include_public_keys:
+                public_keys.append(pub_key_bytes)
+            node.__del__()
+
+    return SolanaAddressBatch(addresses=result_addresses, public_keys=public_keys)
@@ -76,19 +76,13 @@ class BitString:
                 raise Exception(f"Incorrect TopUppedArray {array}, {fullfilled_bytes}")
 
     def get_top_upped_array(self) -> bytearray:
-        ret = BitString(self.length)
-        ret.array = self.array[:]
-        ret.cursor = self.cursor
-
-        tu = math.ceil(ret.cursor / 8) * 8 - ret.cursor
-        if tu > 0:
-            tu -= 1
-            ret.write_bit(1)
-            while tu > 0:
-                tu -= 1
-                ret.write_bit(0)
-        ret.array = ret.array[: math.ceil(ret.cursor / 8)]
-        return ret.array
+        """Returns the used bytes, with the unused bits of the last byte set to 100..0."""
+        cursor = self.cursor
+        ret = self.array[: (cursor + 7) // 8]
+        used = cursor % 8
+        if used:
+            ret[-1] = (ret[-1] & (0xFF00 >> used) & 0xFF) | (0x80 >> used)
+        return ret
 
     def get_free_bits(self) -> int:
         """Returns the number of not used bits in the BitString."""
@@ -113,6 +107,27 @@ class BitString:
 
         self.cursor += 1
 
+    def write_bits(self, value: int, bit_length: int):
+        """Writes the lowest bit_length bits of value, most significant first.
+
+        Whole bytes of the array are updated at once instead of bit by bit.
+        """
+        cursor = self.cursor
+        if cursor + bit_length > self.length:
+            raise Exception("BitString overflow")
+        array = self.array
+        while bit_length > 0:
+            free = 8 - cursor % 8
+            n = free if bit_length >= free else bit_length
+            bit_length -= n
+            shift = free - n
+            mask = ((1 << n) - 1) << shift
+            chunk = ((value >> bit_length) << shift) & mask
+            i = cursor // 8
+            array[i] = (array[i] & ~mask & 0xFF) | chunk
+            cursor += n
+        self.cursor = cursor
+
     def write_uint(self, number: int, bit_length: int):
         if bit_length == 0 or number >= 2**bit_length:
             if number == 0:
@@ -121,14 +136,10 @@ class BitString:
             raise Exception(
                 f"bitLength is too small for number, got number={number},bitLength={bit_length}"
             )
+        if number < 0:
+            raise Exception(f"Negative number {number} is not an uint")
 
-        for i in range(bit_length, 0, -1):
-            k = 2 ** (i - 1)
-            if number // k == 1:
-                self.write_bit(1)
-                number -= k
-            else:
-                self.write_bit(0)
+        self.write_bits(number, bit_length)
 
     def write_uint8(self, ui8: int):
         """Just as write_uint(n, 8), but only write_uint8(n) (?)."""
@@ -158,12 +169,25 @@ class BitString:
         self.write_bytes(value.encode("utf-8"))
 
     def write_bytes(self, ui8_array: bytes):
-        for ui8 in ui8_array:
-            self.write_uint8(ui8)
+        cursor = self.cursor
+        if cursor % 8:
+            for ui8 in ui8_array:
+                self.write_bits(ui8, 8)
+            return
+
+        if cursor + len(ui8_array) * 8 > self.length:
+            raise Exception("BitString overflow")
+        start = cursor // 8
+        self.array[start : start + len(ui8_array)] = ui8_array
+        self.cursor = cursor + len(ui8_array) * 8
 
     def write_bit_string(self, another_bit_string: "BitString"):
-        for bit in another_bit_string:
-            self.write_bit(bit)
+        used = another_bit_string.cursor
+        full = used // 8
+        self.write_bytes(another_bit_string.array[:full])
+        if used % 8:
+            tail = another_bit_string.array[full] >> (8 - used % 8)
+            self.write_bits(tail, used % 8)
 
     def write_address(self, address: Address | None):
         """Writes an address, maybe zero-address (None) to the BitString."""
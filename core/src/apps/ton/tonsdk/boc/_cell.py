@@ -30,17 +30,30 @@ class Cell:
     def __bool__(self):
         return bool(self.bits.cursor) or bool(self.refs)
 
-    def bytes_hash(self):
-        return sha256(self.bytes_repr()).digest()
-
-    def bytes_repr(self):
+    def bytes_hash(self, cache=None):
+        """Returns the representation hash of the cell.
+
+        `cache` maps cells to their [max depth, max level, hash], so that a cell
+        shared by several parents in the tree is processed only once. Cells are
+        mutable, so a cache must not outlive the computation it was created for.
+        """
+        if cache is None:
+            cache = {}
+        info = self._info(cache)
+        if info[2] is None:
+            info[2] = sha256(self.bytes_repr(cache)).digest()
+        return info[2]
+
+    def bytes_repr(self, cache=None):
+        if cache is None:
+            cache = {}
         repr_array = []
-        repr_array.append(self.get_data_with_descriptors())
+        repr_array.append(self.get_data_with_descriptors(cache))
         for r in self.refs:
-            q = r.get_max_depth_as_array()
+            q = r.get_max_depth_as_array(cache)
             repr_array.append(q)
         for r in self.refs:
-            q = r.bytes_hash()
+            q = r.bytes_hash(cache)
             repr_array.append(q)
         x = bytes()
         for r in repr_array:
@@ -51,8 +64,8 @@ class Cell:
         self.bits.write_bit_string(another_cell.bits)
         self.refs += another_cell.refs
 
-    def get_data_with_descriptors(self):
-        d1 = self.get_refs_descriptor()
+    def get_data_with_descriptors(self, cache=None):
+        d1 = self.get_refs_descriptor(cache)
         d2 = self.get_bits_descriptor()
         tuBits = self.bits.get_top_upped_array()
 
@@ -63,52 +76,68 @@ class Cell:
         d2[0] = math.ceil(self.bits.cursor / 8) + math.floor(self.bits.cursor / 8)
         return d2
 
-    def get_refs_descriptor(self):
+    def get_refs_descriptor(self, cache=None):
         d1 = bytearray([0])
-        d1[0] = len(self.refs) + self.is_exotic * 8 + self.get_max_level() * 32
+        d1[0] = len(self.refs) + self.is_exotic * 8 + self.get_max_level(cache) * 32
         return d1
 
-    def get_max_level(self):
+    def _info(self, cache):
+        info = cache.get(self)
+        if info is None:
+            info = cache[self] = [None, None, None]
+        return info
+
+    def get_max_level(self, cache=None):
         if self.is_exotic:
             raise NotImplementedError(
                 "Calculating max level for exotic cells is not implemented"
             )
-        max_level = 0
-        for r in self.refs:
-            r_max_level = r.get_max_level()
-            if r_max_level > max_level:
-                max_level = r_max_level
-        return max_level
-
-    def get_max_depth_as_array(self):
-        max_depth = self.get_max_depth()
-        return bytearray([max_depth // 256, max_depth % 256])
-
-    def get_max_depth(self):
-        max_depth = 0
-        if len(self.refs) > 0:
+        if cache is None:
+            cache = {}
+        info = self._info(cache)
+        if info[1] is None:
+            max_level = 0
             for r in self.refs:
-                r_max_depth = r.get_max_depth()
-                if r_max_depth > max_depth:
-                    max_depth = r_max_depth
-            max_depth += 1
-        return max_depth
+                r_max_level = r.get_max_level(cache)
+                if r_max_level > max_level:
+                    max_level = r_max_level
+            info[1] = max_level
+        return info[1]
+
+    def get_max_depth_as_array(self, cache=None):
+        max_depth = self.get_max_depth(cache)
+        return bytearray([max_depth // 256, max_depth % 256])
 
-    def tree_walk(self):
-        return tree_walk(self, [], {})
+    def get_max_depth(self, cache=None):
+        if cache is None:
+            cache = {}
+        info = self._info(cache)
+        if info[0] is None:
+            max_depth = 0
+            if len(self.refs) > 0:
+                for r in self.refs:
+                    r_max_depth = r.get_max_depth(cache)
+                    if r_max_depth > max_depth:
+                        max_depth = r_max_depth
+                max_depth += 1
+            info[0] = max_depth
+        return info[0]
+
+    def tree_walk(self, cache=None):
+        return tree_walk(self, [], {}, cache=cache)
 
     def is_explicitly_stored_hashes(self):
         return 0
 
-    def serialize_for_boc(self, cells_index, ref_size):
+    def serialize_for_boc(self, cells_index, ref_size, cache=None):
         repr_arr = []
 
-        repr_arr.append(self.get_data_with_descriptors())
+        repr_arr.append(self.get_data_with_descriptors(cache))
         if self.is_explicitly_stored_hashes():
             raise NotImplementedError("Cell hashes explicit storing is not implemented")
 
         for ref in self.refs:
-            ref_hash = ref.bytes_hash()
+            ref_hash = ref.bytes_hash(cache)
             ref_index_int = cells_index[ref_hash]
             ref_index_hex = int_to_hex(ref_index_int)
             if len(ref_index_hex) % 2:
@@ -126,7 +155,9 @@ class Cell:
         root_cell = Cell()
         root_cell.write_cell(self)
 
-        all_cells = root_cell.tree_walk()
+        # hashes of all cells, shared by the tree walk and the serialization
+        cache = {}
+        all_cells = root_cell.tree_walk(cache)
         topological_order = all_cells[0]
         cells_index = all_cells[1]
 
@@ -137,7 +168,9 @@ class Cell:
         full_size = 0
         cell_sizes = {}
         for (_hash, subcell) in topological_order:
-            cell_sizes[_hash] = subcell.boc_serialization_size(cells_index, s_bytes)
+            cell_sizes[_hash] = subcell.boc_serialization_size(
+                cells_index, s_bytes, cache
+            )
             full_size += cell_sizes[_hash]
 
         offset_bits = len(f"{full_size:b}")
@@ -164,7 +197,7 @@ class Cell:
                 serialization.write_uint(cell_sizes[_hash], offset_bytes * 8)
 
         for cell_info in topological_order:
-            ref_cell_ser = cell_info[1].serialize_for_boc(cells_index, s_bytes)
+            ref_cell_ser = cell_info[1].serialize_for_boc(cells_index, s_bytes, cache)
             serialization.write_bytes(ref_cell_ser)
 
         ser_arr = serialization.get_top_upped_array()
@@ -173,8 +206,8 @@ class Cell:
 
         return ser_arr
 
-    def boc_serialization_size(self, cells_index, ref_size):
-        return len(self.serialize_for_boc(cells_index, ref_size))
+    def boc_serialization_size(self, cells_index, ref_size, cache=None):
+        return len(self.serialize_for_boc(cells_index, ref_size, cache))
 
     @staticmethod
     def one_from_boc(serialized_boc):
@@ -6,7 +6,7 @@ def concat_bytes(a, b):
     return a + b  # ?
 
 
-def move_to_end(index_hashmap, topological_order_arr, target):
+def move_to_end(index_hashmap, topological_order_arr, target, cache=None):
     target_index = index_hashmap[target]
     for _hash in index_hashmap:
         if index_hashmap[_hash] > target_index:
@@ -16,18 +16,18 @@ def move_to_end(index_hashmap, topological_order_arr, target):
     topological_order_arr.append(data)
     for sub_cell in data[1].refs:
         topological_order_arr, index_hashmap = move_to_end(
-            index_hashmap, topological_order_arr, sub_cell.bytes_hash()
+            index_hashmap, topological_order_arr, sub_cell.bytes_hash(cache), cache
         )
     return [topological_order_arr, index_hashmap]
 
 
-def tree_walk(cell, topological_order_arr, index_hashmap, parent_hash=None):
-    cell_hash = cell.bytes_hash()
+def tree_walk(cell, topological_order_arr, index_hashmap, parent_hash=None, cache=None):
+    cell_hash = cell.bytes_hash(cache)
     if cell_hash in index_hashmap:
         if parent_hash:
             if index_hashmap[parent_hash] > index_hashmap[cell_hash]:
                 topological_order_arr, index_hashmap = move_to_end(
-                    index_hashmap, topological_order_arr, cell_hash
+                    index_hashmap, topological_order_arr, cell_hash, cache
                 )
         return [topological_order_arr, index_hashmap]
 
@@ -35,7 +35,7 @@ def tree_walk(cell, topological_order_arr, index_hashmap, parent_hash=None):
     topological_order_arr.append([cell_hash, cell])
     for sub_cell in cell.refs:
         topological_order_arr, index_hashmap = tree_walk(
-            sub_cell, topological_order_arr, index_hashmap, cell_hash
+            sub_cell, topological_order_arr, index_hashmap, cell_hash, cache
         )
     return [topological_order_arr, index_hashmap]
 
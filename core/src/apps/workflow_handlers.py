@@ -81,6 +81,8 @@ def find_message_handler_module(msg_type: int) -> str:
         return "apps.bitcoin.get_public_key"
     if msg_type == MessageType.GetAddress:
         return "apps.bitcoin.get_address"
+    if msg_type == MessageType.GetAddressBatch:
+        return "apps.bitcoin.get_address_batch"
     if msg_type == MessageType.GetOwnershipId:
         return "apps.bitcoin.get_ownership_id"
     if msg_type == MessageType.GetOwnershipProof:
@@ -125,6 +127,8 @@ def find_message_handler_module(msg_type: int) -> str:
         # ethereum
         if msg_type == MessageType.EthereumGetAddress:
             return "apps.ethereum.get_address"
+        if msg_type == MessageType.EthereumGetAddressBatch:
+            return "apps.ethereum.get_address_batch"
         if msg_type == MessageType.EthereumGetPublicKey:
             return "apps.ethereum.get_public_key"
         if msg_type == MessageType.EthereumSignTx:
@@ -262,6 +266,8 @@ def find_message_handler_module(msg_type: int) -> str:
         # solana
         if msg_type == MessageType.SolanaGetAddress:
             return "apps.solana.get_address"
+        if msg_type == MessageType.SolanaGetAddressBatch:
+            return "apps.solana.get_address_batch"
         if msg_type == MessageType.SolanaSignTx:
             return "apps.solana.sign_tx"
         if msg_type == MessageType.SolanaSignUnsafeMessage:
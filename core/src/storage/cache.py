@@ -6,7 +6,7 @@ from trezor import utils
 from trezor.crypto import se_thd89
 
 if TYPE_CHECKING:
-    from typing import Sequence, TypeVar, overload
+    from typing import Any, Sequence, TypeVar, overload
 
     T = TypeVar("T")
 
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 _MAX_SESSIONS_COUNT = 10
 _SESSIONLESS_FLAG = 128
 _SESSION_ID_LENGTH = 32
+# Derived nodes kept per session, see `get_node()`
+_MAX_SESSION_NODES = 8
 
 # Traditional cache keys
 APP_COMMON_SEED = 0
@@ -121,6 +123,8 @@ class SessionCache(DataCache):
                 1,  # APP_MONERO_LIVE_REFRESH
             )
         self.last_usage = 0
+        # (key, node) pairs, most recently used first
+        self.nodes: list[tuple[Any, Any]] = []
         super().__init__()
 
     def export_session_id(self) -> bytes:
@@ -130,8 +134,31 @@ class SessionCache(DataCache):
         # export it as immutable bytes
         return bytes(self.session_id)
 
+    def get_node(self, key: Any) -> Any:
+        for i in range(len(self.nodes)):
+            if self.nodes[i][0] == key:
+                entry = self.nodes.pop(i)
+                self.nodes.insert(0, entry)
+                return entry[1].clone()
+        return None
+
+    def set_node(self, key: Any, node: Any) -> None:
+        for i in range(len(self.nodes)):
+            if self.nodes[i][0] == key:
+                self.nodes.pop(i)[1].__del__()
+                break
+        self.nodes.insert(0, (key, node.clone()))
+        if len(self.nodes) > _MAX_SESSION_NODES:
+            self.nodes.pop()[1].__del__()
+
+    def clear_nodes(self) -> None:
+        for _, node in self.nodes:
+            node.__del__()
+        self.nodes.clear()
+
     def clear(self) -> None:
         super().clear()
+        self.clear_nodes()
         self.last_usage = 0
         self.session_id[:] = b""
 
@@ -340,6 +367,33 @@ if TYPE_CHECKING:
     AsyncByteFunc = Callable[P, Awaitable[bytes]]
 
 
+def get_node(key: Any) -> Any:
+    """Return a copy of the node cached in the active session under `key`.
+
+    Returns None if there is no such node or no active session.
+    """
+    if _active_session_idx is None:
+        return None
+    return _SESSIONS[_active_session_idx].get_node(key)
+
+
+def set_node(key: Any, node: Any) -> None:
+    """Cache a copy of a derived node in the active session.
+
+    Nodes live until the session is ended or reallocated, or until `clear_nodes()`.
+    Only the `_MAX_SESSION_NODES` most recently used nodes are kept.
+    """
+    if _active_session_idx is None:
+        return
+    _SESSIONS[_active_session_idx].set_node(key, node)
+
+
+def clear_nodes() -> None:
+    """Wipe the cached nodes of all sessions."""
+    for session in _SESSIONS:
+        session.clear_nodes()
+
+
 def stored(key: int) -> Callable[[ByteFunc[P]], ByteFunc[P]]:
     def decorator(func: ByteFunc[P]) -> ByteFunc[P]:
         def wrapper(*args: P.args, **kwargs: P.kwargs):
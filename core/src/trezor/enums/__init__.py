@@ -97,6 +97,8 @@ if TYPE_CHECKING:
         AuthorizeCoinJoin = 51
         SignPsbt = 10052
         SignedPsbt = 10053
+        GetAddressBatch = 10054
+        AddressBatch = 10055
         CipherKeyValue = 23
         CipheredKeyValue = 48
         SignIdentity = 53
@@ -173,6 +175,8 @@ if TYPE_CHECKING:
         EthereumGnosisSafeTxAck = 20118
         EthereumGnosisSafeTxRequest = 20119
         EthereumSignTxEIP7702OneKey = 20120
+        EthereumGetAddressBatch = 20121
+        EthereumAddressBatch = 20122
         NEMGetAddress = 67
         NEMAddress = 68
         NEMSignTx = 69
@@ -335,6 +339,8 @@ if TYPE_CHECKING:
         SolanaSignOffChainMessage = 10104
         SolanaMessageSignature = 10105
         SolanaSignUnsafeMessage = 10106
+        SolanaGetAddressBatch = 10107
+        SolanaAddressBatch = 10108
         CosmosGetAddress = 10800
         CosmosAddress = 10801
         CosmosSignTx = 10802
@@ -1012,6 +1012,38 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["Address"]:
             return isinstance(msg, cls)
 
+    class GetAddressBatch(protobuf.MessageType):
+        ranges: "list[AddressRange]"
+        include_public_keys: "bool | None"
+
+        def __init__(
+            self,
+            *,
+            ranges: "list[AddressRange] | None" = None,
+            include_public_keys: "bool | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["GetAddressBatch"]:
+            return isinstance(msg, cls)
+
+    class AddressBatch(protobuf.MessageType):
+        addresses: "list[str]"
+        public_keys: "list[bytes]"
+
+        def __init__(
+            self,
+            *,
+            addresses: "list[str] | None" = None,
+            public_keys: "list[bytes] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["AddressBatch"]:
+            return isinstance(msg, cls)
+
     class GetOwnershipId(protobuf.MessageType):
         address_n: "list[int]"
         coin_name: "str"
@@ -1120,6 +1152,7 @@ if TYPE_CHECKING:
         decred_staking_ticket: "bool"
         serialize: "bool"
         coinjoin_request: "CoinJoinRequest | None"
+        batch_size: "int | None"
 
         def __init__(
             self,
@@ -1137,6 +1170,7 @@ if TYPE_CHECKING:
             decred_staking_ticket: "bool | None" = None,
             serialize: "bool | None" = None,
             coinjoin_request: "CoinJoinRequest | None" = None,
+            batch_size: "int | None" = None,
         ) -> None:
             pass
 
@@ -1414,6 +1448,62 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevExtraData"]:
             return isinstance(msg, cls)
 
+    class TxAckInputBatch(protobuf.MessageType):
+        tx: "TxAckInputBatchWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckInputBatchWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckInputBatch"]:
+            return isinstance(msg, cls)
+
+    class TxAckOutputBatch(protobuf.MessageType):
+        tx: "TxAckOutputBatchWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckOutputBatchWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckOutputBatch"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevInputBatch(protobuf.MessageType):
+        tx: "TxAckPrevInputBatchWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckPrevInputBatchWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevInputBatch"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevOutputBatch(protobuf.MessageType):
+        tx: "TxAckPrevOutputBatchWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckPrevOutputBatchWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevOutputBatch"]:
+            return isinstance(msg, cls)
+
     class GetOwnershipProof(protobuf.MessageType):
         address_n: "list[int]"
         coin_name: "str"
@@ -1530,6 +1620,28 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["HDNodePathType"]:
             return isinstance(msg, cls)
 
+    class AddressRange(protobuf.MessageType):
+        address_n: "list[int]"
+        coin_name: "str"
+        script_type: "InputScriptType"
+        start: "int"
+        count: "int"
+
+        def __init__(
+            self,
+            *,
+            start: "int",
+            count: "int",
+            address_n: "list[int] | None" = None,
+            coin_name: "str | None" = None,
+            script_type: "InputScriptType | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["AddressRange"]:
+            return isinstance(msg, cls)
+
     class CoinJoinRequest(protobuf.MessageType):
         fee_rate: "int"
         no_fee_threshold: "int"
@@ -1557,6 +1669,8 @@ if TYPE_CHECKING:
         tx_hash: "bytes | None"
         extra_data_len: "int | None"
         extra_data_offset: "int | None"
+        request_count: "int | None"
+        request_max_size: "int | None"
 
         def __init__(
             self,
@@ -1565,6 +1679,8 @@ if TYPE_CHECKING:
             tx_hash: "bytes | None" = None,
             extra_data_len: "int | None" = None,
             extra_data_offset: "int | None" = None,
+            request_count: "int | None" = None,
+            request_max_size: "int | None" = None,
         ) -> None:
             pass
 
@@ -1728,6 +1844,62 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevExtraDataWrapper"]:
             return isinstance(msg, cls)
 
+    class TxAckInputBatchWrapper(protobuf.MessageType):
+        inputs: "list[TxInput]"
+
+        def __init__(
+            self,
+            *,
+            inputs: "list[TxInput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckInputBatchWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckOutputBatchWrapper(protobuf.MessageType):
+        outputs: "list[TxOutput]"
+
+        def __init__(
+            self,
+            *,
+            outputs: "list[TxOutput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckOutputBatchWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevInputBatchWrapper(protobuf.MessageType):
+        inputs: "list[PrevInput]"
+
+        def __init__(
+            self,
+            *,
+            inputs: "list[PrevInput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevInputBatchWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevOutputBatchWrapper(protobuf.MessageType):
+        bin_outputs: "list[PrevOutput]"
+
+        def __init__(
+            self,
+            *,
+            bin_outputs: "list[PrevOutput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevOutputBatchWrapper"]:
+            return isinstance(msg, cls)
+
     class CardanoBlockchainPointerType(protobuf.MessageType):
         block_index: "int"
         tx_index: "int"
@@ -5752,6 +5924,40 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["EthereumAddress"]:
             return isinstance(msg, cls)
 
+    class EthereumGetAddressBatch(protobuf.MessageType):
+        ranges: "list[EthereumAddressRange]"
+        encoded_network: "bytes | None"
+        include_public_keys: "bool | None"
+
+        def __init__(
+            self,
+            *,
+            ranges: "list[EthereumAddressRange] | None" = None,
+            encoded_network: "bytes | None" = None,
+            include_public_keys: "bool | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["EthereumGetAddressBatch"]:
+            return isinstance(msg, cls)
+
+    class EthereumAddressBatch(protobuf.MessageType):
+        addresses: "list[str]"
+        public_keys: "list[bytes]"
+
+        def __init__(
+            self,
+            *,
+            addresses: "list[str] | None" = None,
+            public_keys: "list[bytes] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["EthereumAddressBatch"]:
+            return isinstance(msg, cls)
+
     class EthereumSignTx(protobuf.MessageType):
         address_n: "list[int]"
         nonce: "bytes"
@@ -5944,6 +6150,24 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["EthereumTypedDataSignature"]:
             return isinstance(msg, cls)
 
+    class EthereumAddressRange(protobuf.MessageType):
+        address_n: "list[int]"
+        start: "int"
+        count: "int"
+
+        def __init__(
+            self,
+            *,
+            start: "int",
+            count: "int",
+            address_n: "list[int] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["EthereumAddressRange"]:
+            return isinstance(msg, cls)
+
     class EthereumAccessList(protobuf.MessageType):
         address: "str"
         storage_keys: "list[bytes]"
@@ -8136,6 +8360,38 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["SolanaAddress"]:
             return isinstance(msg, cls)
 
+    class SolanaGetAddressBatch(protobuf.MessageType):
+        ranges: "list[SolanaAddressRange]"
+        include_public_keys: "bool | None"
+
+        def __init__(
+            self,
+            *,
+            ranges: "list[SolanaAddressRange] | None" = None,
+            include_public_keys: "bool | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["SolanaGetAddressBatch"]:
+            return isinstance(msg, cls)
+
+    class SolanaAddressBatch(protobuf.MessageType):
+        addresses: "list[str]"
+        public_keys: "list[bytes]"
+
+        def __init__(
+            self,
+            *,
+            addresses: "list[str] | None" = None,
+            public_keys: "list[bytes] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["SolanaAddressBatch"]:
+            return isinstance(msg, cls)
+
     class SolanaSignTx(protobuf.MessageType):
         address_n: "list[int]"
         raw_tx: "bytes"
@@ -8220,6 +8476,24 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["SolanaMessageSignature"]:
             return isinstance(msg, cls)
 
+    class SolanaAddressRange(protobuf.MessageType):
+        address_n: "list[int]"
+        start: "int"
+        count: "int"
+
+        def __init__(
+            self,
+            *,
+            start: "int",
+            count: "int",
+            address_n: "list[int] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["SolanaAddressRange"]:
+            return isinstance(msg, cls)
+
     class StarcoinGetAddress(protobuf.MessageType):
         address_n: "list[int]"
         show_display: "bool | None"
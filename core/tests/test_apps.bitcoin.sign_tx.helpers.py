@@ -0,0 +1,189 @@
+from common import *
+
+from trezor import wire
+from trezor.enums import RequestType
+from trezor.messages import (
+    PrevInput,
+    PrevTx,
+    SignTx,
+    TxAckInput,
+    TxAckInputBatch,
+    TxAckInputBatchWrapper,
+    TxAckInputWrapper,
+    TxAckPrevInput,
+    TxAckPrevInputBatch,
+    TxAckPrevInputBatchWrapper,
+    TxAckPrevInputWrapper,
+    TxAckPrevMeta,
+    TxInput,
+    TxRequest,
+    TxRequestDetailsType,
+    TxRequestSerializedType,
+)
+
+from apps.bitcoin.sign_tx.helpers import TxAckBatcher
+
+PREV_HASH = b"\x01" * 32
+
+
+class FakeContext:
+    """Answers calls with the given acks and records the requests."""
+
+    def __init__(self, *acks):
+        self.acks = list(acks)
+        self.requests = []
+
+    async def call(self, msg, expected_type):
+        # the batcher resets the details after the call, so copy them now
+        details = msg.details
+        self.requests.append(
+            (
+                msg.request_type,
+                details.tx_hash,
+                details.request_index,
+                details.request_count,
+                details.request_max_size,
+            )
+        )
+        return self.acks.pop(0)
+
+
+def tx_input(i):
+    return TxInput(prev_hash=PREV_HASH, prev_index=i, amount=i)
+
+
+def input_batch(*indexes):
+    return TxAckInputBatch(
+        tx=TxAckInputBatchWrapper(inputs=[tx_input(i) for i in indexes])
+    )
+
+
+def single_input(i):
+    return TxAckInput(tx=TxAckInputWrapper(input=tx_input(i)))
+
+
+def request(request_type, index=None, tx_hash=None, signature=None):
+    return TxRequest(
+        request_type=request_type,
+        details=TxRequestDetailsType(request_index=index, tx_hash=tx_hash),
+        serialized=TxRequestSerializedType(signature=signature, serialized_tx=b""),
+    )
+
+
+def get_input(batcher, ctx, index, **kwargs):
+    req = request(RequestType.TXINPUT, index, **kwargs)
+    ack = await_result(batcher.call(ctx, req, TxAckInput))
+    return ack.tx.input.prev_index
+
+
+def sign_tx(inputs_count, batch_size=8):
+    return SignTx(
+        inputs_count=inputs_count,
+        outputs_count=1,
+        coin_name="Bitcoin",
+        batch_size=batch_size,
+    )
+
+
+class TestTxAckBatcher(unittest.TestCase):
+    def test_unbatched(self):
+        batcher = TxAckBatcher(sign_tx(3, batch_size=None))
+        ctx = FakeContext(single_input(0))
+        req = request(RequestType.TXINPUT, 0)
+        await_result(batcher.call(ctx, req, TxAckInput))
+        self.assertEqual(ctx.requests, [(RequestType.TXINPUT, None, 0, None, None)])
+
+    def test_served_once(self):
+        batcher = TxAckBatcher(sign_tx(3))
+        ctx = FakeContext(input_batch(0, 1, 2), input_batch(1, 2))
+
+        self.assertEqual([get_input(batcher, ctx, i) for i in range(3)], [0, 1, 2])
+        self.assertEqual(
+            ctx.requests,
+            [(RequestType.TXINPUT, None, 0, 3, wire.PROTOBUF_BUFFER_SIZE)],
+        )
+
+        # the signer may have modified the served item, so it is requested again
+        self.assertEqual(get_input(batcher, ctx, 1), 1)
+        self.assertEqual(len(ctx.requests), 2)
+        self.assertEqual(ctx.requests[1][2:4], (1, 2))
+
+    def test_limited_by_batch_size(self):
+        batcher = TxAckBatcher(sign_tx(30, batch_size=100))
+        ctx = FakeContext(input_batch(*range(8)))
+        get_input(batcher, ctx, 0)
+        self.assertEqual(ctx.requests[0][3], 8)
+
+    def test_pending_bypasses_cache(self):
+        batcher = TxAckBatcher(sign_tx(3))
+        ctx = FakeContext(input_batch(0, 1, 2), input_batch(1, 2))
+        get_input(batcher, ctx, 0)
+
+        # the signature must reach the host, even if input 1 is cached
+        self.assertEqual(get_input(batcher, ctx, 1, signature=b"sig"), 1)
+        self.assertEqual(len(ctx.requests), 2)
+        self.assertEqual(ctx.requests[1][2:4], (1, 2))
+        # the new batch is served
+        self.assertEqual(get_input(batcher, ctx, 2), 2)
+        self.assertEqual(len(ctx.requests), 2)
+
+    def test_invalid_count(self):
+        for ack in (input_batch(), input_batch(0, 1, 2, 3)):
+            batcher = TxAckBatcher(sign_tx(3))
+            ctx = FakeContext(ack)
+            with self.assertRaises(wire.DataError):
+                get_input(batcher, ctx, 0)
+
+    def test_fewer_items(self):
+        # the host may send fewer items to fit into request_max_size
+        batcher = TxAckBatcher(sign_tx(3))
+        ctx = FakeContext(input_batch(0, 1), single_input(2))
+        self.assertEqual([get_input(batcher, ctx, i) for i in range(3)], [0, 1, 2])
+        # the last input is requested alone
+        self.assertEqual([r[2:4] for r in ctx.requests], [(0, 3), (2, None)])
+
+    def test_prev_tx_counts(self):
+        batcher = TxAckBatcher(sign_tx(3))
+        prev_input = PrevInput(
+            prev_hash=PREV_HASH, prev_index=0, script_sig=b"", sequence=0
+        )
+        prev_inputs = TxAckPrevInputBatch(
+            tx=TxAckPrevInputBatchWrapper(inputs=[prev_input] * 5)
+        )
+        meta = TxAckPrevMeta(
+            tx=PrevTx(version=1, lock_time=0, inputs_count=5, outputs_count=2)
+        )
+        ctx = FakeContext(input_batch(0, 1, 2), meta, prev_inputs)
+
+        get_input(batcher, ctx, 0)
+        req = request(RequestType.TXMETA, tx_hash=PREV_HASH)
+        await_result(batcher.call(ctx, req, TxAckPrevMeta))
+        for i in range(5):
+            req = request(RequestType.TXINPUT, i, tx_hash=PREV_HASH)
+            await_result(batcher.call(ctx, req, TxAckPrevInput))
+        # streaming the previous transaction keeps the batch of current inputs
+        self.assertEqual(get_input(batcher, ctx, 1), 1)
+
+        self.assertEqual(
+            [r[:4] for r in ctx.requests],
+            [
+                (RequestType.TXINPUT, None, 0, 3),
+                (RequestType.TXMETA, PREV_HASH, None, None),
+                (RequestType.TXINPUT, PREV_HASH, 0, 5),
+            ],
+        )
+
+    def test_unknown_prev_tx(self):
+        # without TXMETA, the number of items is unknown and only one is requested
+        batcher = TxAckBatcher(sign_tx(3))
+        prev_input = PrevInput(
+            prev_hash=PREV_HASH, prev_index=0, script_sig=b"", sequence=0
+        )
+        ctx = FakeContext(TxAckPrevInput(tx=TxAckPrevInputWrapper(input=prev_input)))
+        req = request(RequestType.TXINPUT, 0, tx_hash=PREV_HASH)
+        await_result(batcher.call(ctx, req, TxAckPrevInput))
+        self.assertEqual(ctx.requests[0][3], None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ from mock_storage import mock_storage
 
 from storage import cache
 from apps.common import safety_checks
-from apps.common.paths import PATTERN_SEP5, PathSchema
+from apps.common.paths import PATTERN_BIP44, PATTERN_SEP5, PathSchema
 from apps.common.keychain import LRUCache, Keychain, with_slip44_keychain, get_keychain
 from trezor import wire
 from trezor.crypto import bip39
@@ -122,6 +122,31 @@ class TestKeychain(unittest.TestCase):
         await_result(func_disallow_testnet(wire.DUMMY_CONTEXT, None))
         await_result(func_with_curve(wire.DUMMY_CONTEXT, None))
 
+    def test_derive_children(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        schema = PathSchema.parse(PATTERN_BIP44, slip44_id=0)
+        keychain = Keychain(seed, "secp256k1", [schema])
+        parent = [H_(44), H_(0), H_(0), 0]
+
+        nodes = list(keychain.derive_children(parent, range(3, 6)))
+        self.assertEqual(len(nodes), 3)
+        for i, node in zip(range(3, 6), nodes):
+            expected = keychain.derive(parent + [i])
+            self.assertEqual(node.depth(), 5)
+            self.assertEqual(node.child_num(), i)
+            self.assertEqual(node.chain_code(), expected.chain_code())
+            self.assertEqual(node.public_key(), expected.public_key())
+
+        self.assertEqual(list(keychain.derive_children(parent, [])), [])
+
+        # every child path is verified, not only the parent
+        with self.assertRaises(wire.DataError):
+            list(keychain.derive_children([H_(44), H_(1), H_(0), 0], [0]))
+        children = keychain.derive_children(parent, [0, H_(1)])
+        self.assertEqual(next(children).child_num(), 0)
+        with self.assertRaises(wire.DataError):
+            next(children)
+
     def test_lru_cache(self):
         class Deletable:
             def __init__(self):
@@ -0,0 +1,33 @@
+from common import *
+
+from apps.common import packed_table
+
+# records of (key 2 bytes, value 1 byte), sorted by key, with a duplicate key
+TABLE = b"\x00\x04" b"\x00\x01\x0a" b"\x01\x00\x0b" b"\x01\x00\x0c" b"\xff\x00\x0d"
+
+
+class TestPackedTable(unittest.TestCase):
+    def test_count(self):
+        self.assertEqual(packed_table.count(TABLE), 4)
+        self.assertEqual(packed_table.count(b"\x00\x00"), 0)
+
+    def test_read_uint(self):
+        self.assertEqual(packed_table.read_uint(TABLE, 5, 2), 0x0100)
+        self.assertEqual(packed_table.read_uint(TABLE, 11, 3), 0xFF000D)
+
+    def test_find(self):
+        self.assertEqual(packed_table.find(TABLE, 3, b"\x00\x01"), 2)
+        self.assertEqual(packed_table.find(TABLE, 3, b"\xff\x00"), 11)
+        # the first of equal keys is found
+        self.assertEqual(packed_table.find(TABLE, 3, b"\x01\x00"), 5)
+        # by the value instead of the key
+        self.assertEqual(packed_table.find(TABLE, 3, b"\x0c", key_offset=2), 8)
+
+        self.assertEqual(packed_table.find(TABLE, 3, b"\x00\x00"), -1)
+        self.assertEqual(packed_table.find(TABLE, 3, b"\x01\x01"), -1)
+        self.assertEqual(packed_table.find(TABLE, 3, b"\xff\xff"), -1)
+        self.assertEqual(packed_table.find(b"\x00\x00", 3, b"\x00\x01"), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+from common import *
+
+if not utils.BITCOIN_ONLY:
+    from apps.ton.tonsdk.boc import Cell
+    from apps.ton.tonsdk.boc._bit_string import BitString
+
+
+def top_upped(bits):
+    return bytes(bits.get_top_upped_array())
+
+
+def build_dag(depth):
+    # every cell references the previous one twice
+    cell = Cell()
+    cell.bits.write_uint(0, 32)
+    for i in range(depth):
+        parent = Cell()
+        parent.bits.write_uint(i, 32)
+        parent.bits.write_bytes(bytes(range(5)))
+        parent.bits.write_uint(1, 3)
+        parent.refs.append(cell)
+        parent.refs.append(cell)
+        cell = parent
+    return cell
+
+
+@unittest.skipUnless(not utils.BITCOIN_ONLY, "altcoin")
+class TestTonBitString(unittest.TestCase):
+    def test_write_uint_unaligned(self):
+        bits = BitString(32)
+        bits.write_uint(5, 3)
+        bits.write_uint(0x1ABC, 13)
+        bits.write_uint(0x3F, 7)
+        self.assertEqual(bits.cursor, 23)
+        self.assertEqual(top_upped(bits), unhexlify("babc7f"))
+
+    def test_write_uint_zero_length(self):
+        bits = BitString(8)
+        bits.write_uint(0, 0)
+        self.assertEqual(bits.cursor, 0)
+        with self.assertRaises(Exception):
+            bits.write_uint(1, 0)
+
+    def test_write_uint_negative(self):
+        bits = BitString(8)
+        with self.assertRaises(Exception):
+            bits.write_uint(-1, 4)
+        self.assertEqual(bits.cursor, 0)
+
+    def test_write_uint_overflow(self):
+        bits = BitString(8)
+        bits.write_uint(1, 3)
+        with self.assertRaises(Exception):
+            bits.write_uint(4, 2)
+        with self.assertRaises(Exception):
+            bits.write_uint(0, 6)
+
+    def test_write_bytes(self):
+        bits = BitString(48)
+        bits.write_uint(5, 3)
+        bits.write_bytes(b"\xde\xad\xbe\xef")
+        self.assertEqual(bits.cursor, 35)
+        self.assertEqual(top_upped(bits), unhexlify("bbd5b7ddf0"))
+
+        bits = BitString(16)
+        bits.write_bytes(b"\xde\xad")
+        self.assertEqual(top_upped(bits), b"\xde\xad")
+        with self.assertRaises(Exception):
+            bits.write_bytes(b"\x00")
+
+    def test_write_bit_string(self):
+        source = BitString(16)
+        source.write_uint(0x5A5, 11)
+
+        bits = BitString(32)
+        bits.write_uint(0x13, 5)
+        bits.write_bit_string(source)
+        self.assertEqual(bits.cursor, 16)
+        self.assertEqual(top_upped(bits), unhexlify("9da5"))
+
+        bits = BitString(48)
+        bits.write_bytes(b"\xde\xad")
+        bits.write_bit_string(source)
+        self.assertEqual(bits.cursor, 27)
+        self.assertEqual(top_upped(bits), unhexlify("deadb4b0"))
+
+    def test_top_upped_array(self):
+        for bit_length, expected in (
+            (0, b""),
+            (1, b"\xc0"),
+            (7, b"\xff"),
+            (8, b"\xff"),
+            (13, b"\xff\xfc"),
+        ):
+            bits = BitString(16)
+            bits.write_uint((1 << bit_length) - 1, bit_length)
+            self.assertEqual(top_upped(bits), expected)
+            # padding does not change the stored bits
+            self.assertEqual(bits.cursor, bit_length)
+            self.assertEqual(list(bits), [1] * bit_length)
+
+    def test_set_top_upped_array(self):
+        bits = BitString(0)
+        bits.set_top_upped_array(bytearray(b"\xff\xfc"), False)
+        self.assertEqual(bits.cursor, 13)
+        self.assertEqual(top_upped(bits), b"\xff\xfc")
+
+
+@unittest.skipUnless(not utils.BITCOIN_ONLY, "altcoin")
+class TestTonCell(unittest.TestCase):
+    DAG_HASH = unhexlify(
+        "b61807348b2c7977ac9cd86b441b23f26aee594ec6557cabc47c11b7520ae459"
+    )
+    DAG_BOC = unhexlify(
+        "b5ee9c7241010701005a0002130000000500010203043001010213000000040001020304"
+        "300202021300000003000102030430030302130000000200010203043004040213000000"
+        "0100010203043005050213000000000001020304300606000800000000508973fa"
+    )
+
+    def test_dag_hash(self):
+        cell = build_dag(6)
+        self.assertEqual(cell.bytes_hash(), self.DAG_HASH)
+        # hashing again, without a shared cache, gives the same result
+        self.assertEqual(cell.bytes_hash(), self.DAG_HASH)
+        self.assertEqual(cell.get_max_depth(), 6)
+
+    def test_dag_boc(self):
+        cell = build_dag(6)
+        boc = bytes(cell.to_boc(False))
+        # shared cells are serialized once
+        self.assertEqual(boc, self.DAG_BOC)
+
+        parsed = Cell.one_from_boc(boc)
+        self.assertEqual(parsed.bytes_hash(), self.DAG_HASH)
+
+    def test_modified_cell(self):
+        # a cache from a previous computation must not be reused
+        cell = build_dag(2)
+        before = cell.bytes_hash()
+        cell.refs[0].bits.write_uint(1, 1)
+        self.assertNotEqual(cell.bytes_hash(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
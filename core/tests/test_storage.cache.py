@@ -2,6 +2,7 @@ from common import *
 from mock_storage import mock_storage
 
 from storage import cache
+from trezor.crypto import bip32
 from trezor.messages import Initialize
 from trezor.messages import EndSession
 from trezor.wire import DUMMY_CONTEXT
@@ -181,6 +182,39 @@ class TestStorageCache(unittest.TestCase):
         # function is not called for a second time
         self.assertEqual(run_count, 1)
 
+    def test_nodes(self):
+        node = bip32.from_seed(b"\x00" * 32, "secp256k1")
+        node_key = ("secp256k1", (0x8000002C,))
+        self.assertIsNone(cache.get_node(node_key))
+
+        session_id = cache.start_session()
+        cache.set_node(node_key, node)
+        cached = cache.get_node(node_key)
+        self.assertEqual(cached.public_key(), node.public_key())
+        # a copy is returned, the cached node is not affected
+        cached.derive(0)
+        self.assertEqual(cache.get_node(node_key).public_key(), node.public_key())
+
+        # other sessions do not see the node
+        cache.start_session()
+        self.assertIsNone(cache.get_node(node_key))
+        cache.start_session(session_id)
+        self.assertIsNotNone(cache.get_node(node_key))
+
+        # only the most recently used nodes are kept
+        for i in range(cache._MAX_SESSION_NODES):
+            cache.set_node(i, node)
+        self.assertIsNone(cache.get_node(node_key))
+        self.assertIsNotNone(cache.get_node(0))
+
+        cache.clear_nodes()
+        self.assertIsNone(cache.get_node(0))
+        cache.set_node(node_key, node)
+        cache.end_current_session()
+        self.assertIsNone(cache.get_node(node_key))
+        cache.start_session(session_id)
+        self.assertIsNone(cache.get_node(node_key))
+
     @mock_storage
     def test_Initialize(self):
         def call_Initialize(**kwargs):
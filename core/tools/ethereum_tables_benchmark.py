@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Time lookups in the generated Ethereum network and token tables.
+
+The generated modules are pure Python, so they run on the host. The MicroPython-only
+modules they import are replaced by minimal stand-ins. Besides the time, the number
+of allocated blocks per lookup is reported, as the firmware cares about both.
+Run it on two revisions of networks.py and tokens.py to compare them. Note that
+CPython keeps constant tuples, which MicroPython builds whenever they are evaluated,
+so tuple-based tables look cheaper on the host than they are on the device.
+
+The lookups are:
+- "chain_id": `networks.by_chain_id` of every chain ID below 2000, found or not;
+- "slip44": `networks.by_slip44` of every SLIP-44 ID below 2000, found or not;
+- "token": `tokens.token_by_chain_address` of unknown addresses on Ethereum,
+  the chain with the most tokens.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import click
+
+CORE_SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+class _Info:
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+
+def load_module(name: str) -> Any:
+    """Load a firmware module, leaving its annotations unevaluated like MicroPython."""
+    path = CORE_SRC / (name.replace(".", "/") + ".py")
+    source = "from __future__ import annotations\n" + path.read_text()
+    module = types.ModuleType(name)
+    exec(compile(source, str(path), "exec"), module.__dict__)
+    sys.modules[name] = module
+    return module
+
+
+def import_tables() -> tuple[Any, Any]:
+    micropython = types.ModuleType("micropython")
+    micropython.const = lambda x: x  # type: ignore
+    messages = types.ModuleType("trezor.messages")
+    messages.EthereumNetworkInfo = _Info  # type: ignore
+    messages.EthereumTokenInfo = _Info  # type: ignore
+    paths = types.ModuleType("apps.common.paths")
+    paths.HARDENED = 0x8000_0000  # type: ignore
+    apps_common = types.ModuleType("apps.common")
+    apps_common.__path__ = []  # type: ignore
+    sys.modules["micropython"] = micropython
+    sys.modules["trezor"] = types.ModuleType("trezor")
+    sys.modules["trezor.messages"] = messages
+    sys.modules["apps"] = types.ModuleType("apps")
+    sys.modules["apps.common"] = apps_common
+    sys.modules["apps.common.paths"] = paths
+    if (CORE_SRC / "apps" / "common" / "packed_table.py").exists():
+        apps_common.packed_table = load_module("apps.common.packed_table")  # type: ignore
+
+    return load_module("apps.ethereum.networks"), load_module("apps.ethereum.tokens")
+
+
+def measure(func: Callable[[Any], Any], keys: Iterable[Any], repeat: int = 5) -> float:
+    """Best time of several runs over all the keys."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for key in keys:
+            func(key)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def count_allocations(func: Callable[[Any], Any], keys: Iterable[Any]) -> int:
+    """Number of blocks allocated by all the lookups, including freed ones."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [func(key) for key in keys]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del results
+    return sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+
+
+@click.command()
+@click.option("-n", "--tokens", "token_count", type=int, default=200, show_default=True)
+def cli(token_count: int) -> None:
+    """Print the time and allocations per lookup in each table."""
+    networks, tokens = import_tables()
+    chain_ids = list(range(2000))
+    slip44_ids = list(range(2000))
+    addresses = [os.urandom(20) for _ in range(token_count)]
+
+    click.echo(f"{'lookup':>8} {'count':>6} {'us/lookup':>10} {'blocks/lookup':>14}")
+    for name, func, keys in (
+        ("chain_id", networks.by_chain_id, chain_ids),
+        ("slip44", networks.by_slip44, slip44_ids),
+        ("token", lambda a: tokens.token_by_chain_address(1, a), addresses),
+    ):
+        elapsed = measure(func, keys)
+        blocks = count_allocations(func, keys)
+        click.echo(
+            f"{name:>8} {len(keys):6} {elapsed / len(keys) * 1e6:10.2f} "
+            f"{blocks / len(keys):14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
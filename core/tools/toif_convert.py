@@ -1,38 +1,94 @@
 #!/usr/bin/env python3
 
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 import click
 from PIL import Image
 
 from trezorlib import toif
 
 
+def convert(infile: str, outfile: str) -> None:
+    if infile.endswith(".toif") or infile == "-":
+        with click.open_file(infile, "rb") as f:
+            toi = toif.from_bytes(f.read())
+        im = toi.to_image()
+        with click.open_file(outfile, "wb") as f:
+            im.save(f)
+
+    elif outfile.endswith(".toif") or outfile == "-":
+        with click.open_file(infile, "rb") as f:
+            im = Image.open(f)
+            toi = toif.from_image(im)
+        with click.open_file(outfile, "wb") as f:
+            f.write(toi.to_bytes())
+
+    else:
+        raise click.ClickException("At least one of the arguments must end with .toif")
+
+
+def convert_dir(indir: Path, outdir: Path, image_format: str, jobs: int) -> None:
+    image_suffixes = Image.registered_extensions()
+    jobs_list = []
+    for infile in sorted(indir.iterdir()):
+        if infile.suffix == ".toif":
+            outfile = outdir / infile.with_suffix("." + image_format).name
+        elif infile.suffix.lower() in image_suffixes:
+            outfile = outdir / infile.with_suffix(".toif").name
+        else:
+            continue
+        jobs_list.append((str(infile), str(outfile)))
+
+    outdir.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+        futures = [executor.submit(convert, i, o) for i, o in jobs_list]
+        for (infile, outfile), future in zip(jobs_list, futures):
+            try:
+                future.result()
+            except Exception as e:
+                click.echo(f"{infile}: {e}", err=True)
+            else:
+                click.echo(f"{infile} -> {outfile}")
+
+
 @click.command()
-@click.argument("infile", type=click.File("rb"))
-@click.argument("outfile", type=click.File("wb"))
-def toif_convert(infile, outfile):
+@click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=0,
+    help="Parallel conversions (default: CPU count)",
+)
+@click.option(
+    "-f",
+    "--format",
+    "image_format",
+    default="png",
+    help="Output format for .toif files in directory mode",
+)
+@click.argument("infile", type=click.Path(allow_dash=True))
+@click.argument("outfile", type=click.Path(allow_dash=True))
+def toif_convert(infile, outfile, jobs, image_format):
     """Convert any image format to/from TOIF or vice-versa.
 
+    If INFILE is a directory, every file in it is converted into the OUTFILE
+    directory in parallel: .toif files to images, everything else to TOIF.
+
     \b
     Examples:
       toif_convert.py somefile.jpg outfile.toif
       toif_convert.py infile.toif outfile.png
+      toif_convert.py -j 8 icons/ toif_icons/
 
       # ensure gray-scale output TOIF
       mogrify -colorspace gray icon.png
       toif_convert.py icon.png icon.toif
     """
-    if infile.name.endswith(".toif") or infile.name == "-":
-        toi = toif.from_bytes(infile.read())
-        im = toi.to_image()
-        im.save(outfile)
-
-    elif outfile.name.endswith(".toif") or outfile.name == "-":
-        im = Image.open(infile)
-        toi = toif.from_image(im)
-        outfile.write(toi.to_bytes())
-
+    if Path(infile).is_dir():
+        convert_dir(Path(infile), Path(outfile), image_format, jobs)
     else:
-        raise click.ClickException("At least one of the arguments must end with .toif")
+        convert(infile, outfile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Time hashing and serialization of large TON BOCs by the firmware's tonsdk.
+
+The tonsdk package in core/src/apps/ton is pure Python, so it runs on the host.
+The MicroPython-only modules it imports are mapped to their CPython counterparts.
+Absolute numbers differ from the device, the ratios between builds do not.
+
+Two kinds of cell trees are measured:
+- "dag": a chain of cells where every cell references the previous one twice, like
+  deeply nested payloads with shared subtrees;
+- "wide": a tree of full cells without sharing, which is dominated by bit writes.
+"""
+
+import hashlib
+import struct
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable
+
+import click
+
+TON_APP = Path(__file__).resolve().parent.parent / "src" / "apps" / "ton"
+
+
+def import_tonsdk() -> Any:
+    crypto = types.ModuleType("trezor.crypto")
+    crypto_hashlib = types.ModuleType("trezor.crypto.hashlib")
+    crypto_hashlib.sha256 = hashlib.sha256  # type: ignore
+    sys.modules.setdefault("trezor", types.ModuleType("trezor"))
+    sys.modules.setdefault("trezor.crypto", crypto)
+    sys.modules.setdefault("trezor.crypto.hashlib", crypto_hashlib)
+    sys.modules.setdefault("ustruct", struct)
+    sys.path.insert(0, str(TON_APP))
+    from tonsdk import boc
+
+    return boc
+
+
+def build_dag(boc: Any, depth: int) -> Any:
+    cell = boc.Cell()
+    cell.bits.write_uint(0, 32)
+    for i in range(depth):
+        parent = boc.Cell()
+        parent.bits.write_uint(i, 32)
+        parent.bits.write_bytes(bytes(range(64)))
+        parent.refs.append(cell)
+        parent.refs.append(cell)
+        cell = parent
+    return cell
+
+
+def build_wide(boc: Any, levels: int) -> Any:
+    cell = boc.Cell()
+    # 1023 bits, so that writes are not byte-aligned
+    cell.bits.write_uint(1, 7)
+    cell.bits.write_bytes(bytes(range(127)))
+    if levels:
+        for _ in range(4):
+            cell.refs.append(build_wide(boc, levels - 1))
+    return cell
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Best time of several runs. Nothing is cached between runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("-d", "--depth", type=int, default=18, show_default=True)
+@click.option("-l", "--levels", type=int, default=4, show_default=True)
+def cli(depth: int, levels: int) -> None:
+    """Print the time of building, hashing and serializing each cell tree."""
+    boc = import_tonsdk()
+
+    click.echo(f"{'tree':>5} {'build ms':>10} {'hash ms':>10} {'to_boc ms':>10}")
+    for name, build in (
+        ("dag", lambda: build_dag(boc, depth)),
+        ("wide", lambda: build_wide(boc, levels)),
+    ):
+        build_time = measure(build)
+        root = build()
+        hash_time = measure(root.bytes_hash)
+        boc_time = measure(root.to_boc)
+        click.echo(
+            f"{name:>5} {build_time * 1000:10.1f} {hash_time * 1000:10.1f} "
+            f"{boc_time * 1000:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
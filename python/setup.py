@@ -29,7 +29,7 @@ extras_require = {
     "hidapi": ["hidapi>=0.7.99.post20"],
     "ethereum": ["rlp>=1.1.0 ; python_version<'3.7'", "web3>=4.8"],
     "qt-widgets": ["PyQt5"],
-    "extra": ["Pillow"],
+    "extra": ["Pillow", "numpy"],
     "stellar": ["stellar-sdk>=4.0.0,<6.0.0"],
 }
 
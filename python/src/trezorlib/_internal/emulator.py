@@ -16,6 +16,8 @@
 
 import logging
 import os
+import select
+import socket
 import subprocess
 import time
 from pathlib import Path
@@ -27,6 +29,8 @@ from ..transport.udp import UdpTransport
 LOG = logging.getLogger(__name__)
 
 EMULATOR_WAIT_TIME = 60
+# Interval of pings while waiting for the emulator, unless it notifies readiness
+PING_INTERVAL = 0.1
 
 
 def _rm_f(path: Path) -> None:
@@ -74,6 +78,10 @@ class Emulator:
 
         self.client: Optional[TrezorClientDebugLink] = None
         self.process: Optional[subprocess.Popen] = None
+        # socket the emulator notifies when it starts listening, see `make_env`
+        self.ready_socket: Optional[socket.socket] = None
+        # time from launching the process until it answered a ping
+        self.boot_latency: Optional[float] = None
 
         self.port = 54935
         self.headless = headless
@@ -90,6 +98,17 @@ class Emulator:
     def _get_transport(self) -> UdpTransport:
         return UdpTransport(f"127.0.0.1:{self.port}")
 
+    def _wait_for_notification(self, timeout: float) -> None:
+        """Sleep until the emulator notifies readiness, at most `timeout` seconds."""
+        if self.ready_socket is None:
+            time.sleep(timeout)
+            return
+        readable, _, _ = select.select([self.ready_socket], [], [], timeout)
+        if readable:
+            self.ready_socket.recv(16)
+            # the emulator has bound its port, the next ping is queued until answered
+            LOG.debug("Emulator notified readiness")
+
     def wait_until_ready(self, timeout: float = EMULATOR_WAIT_TIME) -> None:
         assert self.process is not None, "Emulator not started"
         transport = self._get_transport()
@@ -107,7 +126,7 @@ class Emulator:
                 if elapsed >= timeout:
                     raise TimeoutError("Can't connect to emulator")
 
-                time.sleep(0.1)
+                self._wait_for_notification(PING_INTERVAL)
         finally:
             transport.close()
 
@@ -149,6 +168,9 @@ class Emulator:
                 # process is running, no need to start again
                 return
 
+        self.ready_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.ready_socket.bind(("127.0.0.1", 0))
+        start = time.monotonic()
         self.process = self.launch_process()
         try:
             self.wait_until_ready()
@@ -157,6 +179,11 @@ class Emulator:
             LOG.warning(f"Emulator did not come up after {EMULATOR_WAIT_TIME} seconds")
             self.process.kill()
             raise
+        finally:
+            self.ready_socket.close()
+            self.ready_socket = None
+        self.boot_latency = time.monotonic() - start
+        LOG.info(f"Emulator booted in {self.boot_latency:.3f} seconds")
 
         (self.profile_dir / "onekey.pid").write_text(str(self.process.pid) + "\n")
         (self.profile_dir / "onekey.port").write_text(str(self.port) + "\n")
@@ -200,6 +227,16 @@ class Emulator:
     def get_storage(self) -> bytes:
         return self.storage.read_bytes()
 
+    def restore_storage(self, storage: bytes) -> None:
+        """Restart the emulator with the given storage image.
+
+        The emulator is restarted even if its storage already matches, so that no
+        state kept in RAM (session seed, safety checks, caches) survives.
+        """
+        self.stop()
+        self.storage.write_bytes(storage)
+        self.start()
+
 
 class CoreEmulator(Emulator):
     STORAGE_FILENAME = "onekey.flash"
@@ -236,6 +273,8 @@ class CoreEmulator(Emulator):
             TREZOR_PROFILE=str(self.profile_dir),
             TREZOR_UDP_PORT=str(self.port),
         )
+        if self.ready_socket is not None:
+            env["TREZOR_UDP_READY_PORT"] = str(self.ready_socket.getsockname()[1])
         if self.headless:
             env["SDL_VIDEODRIVER"] = "dummy"
         if self.headless or self.disable_animation:
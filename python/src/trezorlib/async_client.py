@@ -0,0 +1,369 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar, Union
+
+from mnemonic import Mnemonic
+
+from . import exceptions, mapping, messages, models
+from .client import (
+    MAX_PASSPHRASE_LENGTH,
+    MAX_PIN_LENGTH,
+    OUTDATED_FIRMWARE_ERROR,
+    PASSPHRASE_ON_DEVICE,
+)
+from .log import DUMP_BYTES
+from .messages import Capability, PinMatrixRequestType
+
+if TYPE_CHECKING:
+    from typing_extensions import Protocol
+
+    from .protobuf import MessageType
+    from .transport.aio import AsyncTransport
+
+    T = TypeVar("T", bound="AsyncTrezorClient")
+
+    class AsyncTrezorClientUI(Protocol):
+        """UI for `AsyncTrezorClient`.
+
+        The methods may be coroutines. Plain methods are accepted too, so every
+        `TrezorClientUI` also works with the async client.
+        """
+
+        async def button_request(self, br: messages.ButtonRequest) -> None:
+            ...
+
+        async def get_pin(self, code: Optional[PinMatrixRequestType]) -> str:
+            ...
+
+        async def get_passphrase(self, available_on_device: bool) -> Union[str, object]:
+            ...
+
+
+LOG = logging.getLogger(__name__)
+
+
+async def _resolve(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncTrezorClient:
+    """Trezor client for asyncio applications.
+
+    Mirrors the message flow of `TrezorClient`, including PIN, passphrase and button
+    callbacks, but every round trip to the device is awaited instead of blocking the
+    thread. Many devices can therefore be driven from a single event loop.
+
+    Use `AsyncTrezorClient.create()` to get an initialized instance:
+
+    >>> transport = AsyncUdpTransport("127.0.0.1:21324")
+    >>> client = await AsyncTrezorClient.create(transport, ui)
+    >>> async with client:
+    >>>     await client.ping("hello")
+    """
+
+    def __init__(
+        self,
+        transport: "AsyncTransport",
+        ui: "AsyncTrezorClientUI",
+        session_id: Optional[bytes] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> None:
+        LOG.info(f"creating async client instance for device: {transport.get_path()}")
+        self.model = model
+        if self.model:
+            self.mapping = self.model.default_mapping
+        else:
+            self.mapping = mapping.DEFAULT_MAPPING
+        self.transport = transport
+        self.ui = ui
+        self.session_counter = 0
+        self.session_id = session_id
+        self.features: messages.Features
+        self.version = (0, 0, 0)
+        # only one message exchange can be in flight on a transport
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def create(
+        cls: Type["T"],
+        transport: "AsyncTransport",
+        ui: "AsyncTrezorClientUI",
+        session_id: Optional[bytes] = None,
+        derive_cardano: Optional[bool] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> "T":
+        """Create a client and initialize the device."""
+        client = cls(transport, ui, session_id=session_id, model=model)
+        await client.init_device(session_id=session_id, derive_cardano=derive_cardano)
+        return client
+
+    async def open(self) -> None:
+        if self.session_counter == 0:
+            await self.transport.begin_session()
+        self.session_counter += 1
+
+    async def close(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            await self.transport.end_session()
+
+    async def __aenter__(self: "T") -> "T":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def cancel(self) -> None:
+        await self._raw_write(messages.Cancel())
+
+    async def call_raw(self, msg: "MessageType") -> "MessageType":
+        await self._raw_write(msg)
+        return await self._raw_read()
+
+    async def _raw_write(self, msg: "MessageType") -> None:
+        LOG.debug(
+            f"sending message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        msg_type, msg_bytes = self.mapping.encode(msg)
+        LOG.log(
+            DUMP_BYTES,
+            f"encoded as type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        await self.transport.write(msg_type, msg_bytes)
+
+    async def _raw_read(self) -> "MessageType":
+        msg_type, msg_bytes = await self.transport.read()
+        LOG.log(
+            DUMP_BYTES,
+            f"received type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        msg = self.mapping.decode(msg_type, msg_bytes)
+        LOG.debug(
+            f"received message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        return msg
+
+    async def _callback_pin(self, msg: messages.PinMatrixRequest) -> "MessageType":
+        try:
+            pin = await _resolve(self.ui.get_pin(msg.type))
+        except exceptions.Cancelled:
+            await self.call_raw(messages.Cancel())
+            raise
+
+        if any(d not in "1234567890" for d in pin) or not (
+            1 <= len(pin) <= MAX_PIN_LENGTH
+        ):
+            await self.call_raw(messages.Cancel())
+            raise ValueError("Invalid PIN provided")
+
+        resp = await self.call_raw(messages.PinMatrixAck(pin=pin))
+        if isinstance(resp, messages.Failure) and resp.code in (
+            messages.FailureType.PinInvalid,
+            messages.FailureType.PinCancelled,
+            messages.FailureType.PinExpected,
+        ):
+            raise exceptions.PinException(resp.code, resp.message)
+        else:
+            return resp
+
+    async def _callback_passphrase(
+        self, msg: messages.PassphraseRequest
+    ) -> "MessageType":
+        available_on_device = Capability.PassphraseEntry in self.features.capabilities
+
+        async def send_passphrase(
+            passphrase: Optional[str] = None, on_device: Optional[bool] = None
+        ) -> "MessageType":
+            msg = messages.PassphraseAck(passphrase=passphrase, on_device=on_device)
+            resp = await self.call_raw(msg)
+            if isinstance(resp, messages.Deprecated_PassphraseStateRequest):
+                self.session_id = resp.state
+                resp = await self.call_raw(messages.Deprecated_PassphraseStateAck())
+            return resp
+
+        # short-circuit old style entry
+        if msg._on_device is True:
+            return await send_passphrase(None, None)
+
+        try:
+            passphrase = await _resolve(
+                self.ui.get_passphrase(available_on_device=available_on_device)
+            )
+        except exceptions.Cancelled:
+            await self.call_raw(messages.Cancel())
+            raise
+
+        if passphrase is PASSPHRASE_ON_DEVICE:
+            if not available_on_device:
+                await self.call_raw(messages.Cancel())
+                raise RuntimeError("Device is not capable of entering passphrase")
+            else:
+                return await send_passphrase(on_device=True)
+
+        # else process host-entered passphrase
+        if not isinstance(passphrase, str):
+            raise RuntimeError("Passphrase must be a str")
+        passphrase = Mnemonic.normalize_string(passphrase)
+        if len(passphrase) > MAX_PASSPHRASE_LENGTH:
+            await self.call_raw(messages.Cancel())
+            raise ValueError("Passphrase too long")
+
+        return await send_passphrase(passphrase, on_device=False)
+
+    async def _callback_button(self, msg: messages.ButtonRequest) -> "MessageType":
+        # do this raw - send ButtonAck first, notify UI later
+        await self._raw_write(messages.ButtonAck())
+        await _resolve(self.ui.button_request(msg))
+        return await self._raw_read()
+
+    async def call(self, msg: "MessageType") -> "MessageType":
+        self.check_firmware_version()
+        async with self._lock, self:
+            resp = await self.call_raw(msg)
+            while True:
+                if isinstance(resp, messages.PinMatrixRequest):
+                    resp = await self._callback_pin(resp)
+                elif isinstance(resp, messages.PassphraseRequest):
+                    resp = await self._callback_passphrase(resp)
+                elif isinstance(resp, messages.ButtonRequest):
+                    resp = await self._callback_button(resp)
+                elif isinstance(resp, messages.Failure):
+                    if resp.code == messages.FailureType.ActionCancelled:
+                        raise exceptions.Cancelled
+                    raise exceptions.TrezorFailure(resp)
+                else:
+                    return resp
+
+    def _refresh_features(self, features: messages.Features) -> None:
+        """Update internal fields based on passed-in Features message."""
+
+        if not self.model:
+            # Trezor Model One bootloader 1.8.0 or older does not send model name
+            self.model = models.by_name(features.model or "1")
+            if self.model is None:
+                raise RuntimeError("Unsupported Trezor model")
+
+        if features.vendor not in self.model.vendors:
+            raise RuntimeError("Unsupported device")
+
+        self.features = features
+        self.version = (
+            self.features.major_version,
+            self.features.minor_version,
+            self.features.patch_version,
+        )
+        self.check_firmware_version(warn_only=True)
+        if self.features.session_id is not None:
+            self.session_id = self.features.session_id
+            self.features.session_id = None
+
+    async def refresh_features(self) -> messages.Features:
+        """Reload features from the device."""
+        async with self._lock, self:
+            resp = await self.call_raw(messages.GetFeatures())
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to GetFeatures")
+        self._refresh_features(resp)
+        return resp
+
+    async def init_device(
+        self,
+        *,
+        session_id: Optional[bytes] = None,
+        new_session: bool = False,
+        derive_cardano: Optional[bool] = None,
+    ) -> Optional[bytes]:
+        """Initialize the device and return a session ID.
+
+        See `TrezorClient.init_device` for details.
+        """
+        if new_session:
+            self.session_id = None
+        elif session_id is not None:
+            self.session_id = session_id
+
+        async with self._lock, self:
+            resp = await self.call_raw(
+                messages.Initialize(
+                    session_id=self.session_id,
+                    derive_cardano=derive_cardano,
+                )
+            )
+        if isinstance(resp, messages.Failure):
+            # can happen if `derive_cardano` does not match the current session
+            raise exceptions.TrezorFailure(resp)
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to Initialize")
+
+        if self.session_id is not None and resp.session_id == self.session_id:
+            LOG.info("Successfully resumed session")
+        elif session_id is not None:
+            LOG.info("Failed to resume session")
+
+        reported_session_id = resp.session_id
+        self._refresh_features(resp)
+        return reported_session_id
+
+    def is_outdated(self) -> bool:
+        if self.features.bootloader_mode:
+            return False
+
+        assert self.model is not None  # should happen in _refresh_features
+        return self.version < self.model.minimum_version
+
+    def check_firmware_version(self, warn_only: bool = False) -> None:
+        if self.is_outdated():
+            if warn_only:
+                LOG.warning("Firmware is out of date")
+            else:
+                raise exceptions.OutdatedFirmwareError(OUTDATED_FIRMWARE_ERROR)
+
+    async def ping(self, msg: str, button_protection: bool = False) -> str:
+        if not button_protection:
+            # see TrezorClient.ping for why this skips the firmware version check
+            async with self._lock, self:
+                resp = await self.call_raw(messages.Ping(message=msg))
+                if isinstance(resp, messages.ButtonRequest):
+                    # device is PIN-locked.
+                    # respond and hope for the best
+                    resp = await self._callback_button(resp)
+        else:
+            resp = await self.call(
+                messages.Ping(message=msg, button_protection=button_protection)
+            )
+
+        if not isinstance(resp, messages.Success):
+            raise exceptions.TrezorException(f"Unexpected response to Ping: {resp}")
+        assert resp.message is not None
+        return resp.message
+
+    async def end_session(self) -> None:
+        """Close the current session and clear cached passphrase."""
+        try:
+            if not self.features.bootloader_mode:
+                await self.call(messages.EndSession())
+        except exceptions.TrezorFailure:
+            pass
+        self.session_id = None
@@ -17,13 +17,22 @@
 import warnings
 from copy import copy
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AnyStr, List, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 # TypedDict is not available in typing for python < 3.8
 from typing_extensions import Protocol, TypedDict
 
 from . import exceptions, messages
-from .tools import expect, prepare_message_bytes, session
+from .tools import expect, prepare_message_bytes, session, split_ranges
 
 if TYPE_CHECKING:
     from .client import TrezorClient
@@ -73,6 +82,10 @@ if TYPE_CHECKING:
             ...
 
 
+# Maximum number of addresses in a single GetAddressBatch request
+MAX_ADDRESS_BATCH = 64
+
+
 def from_json(json_dict: "Transaction") -> messages.TransactionType:
     def make_input(vin: "Vin") -> messages.TxInputType:
         if "coinbase" in vin:
@@ -172,6 +185,35 @@ def get_authenticated_address(
     )
 
 
+def get_addresses_batch(
+    client: "TrezorClient",
+    ranges: Sequence[messages.AddressRange],
+    include_public_keys: bool = False,
+    chunk_size: int = MAX_ADDRESS_BATCH,
+) -> Iterator[messages.AddressBatch]:
+    """Get the addresses of the given ranges without showing them on the device.
+
+    The ranges are split into requests of at most `chunk_size` addresses and the
+    response to every request is yielded as soon as it arrives. Together, the
+    responses list the addresses of all ranges in order.
+    """
+    if not 0 < chunk_size <= MAX_ADDRESS_BATCH:
+        raise ValueError(f"Chunk size must be between 1 and {MAX_ADDRESS_BATCH}")
+
+    def request(chunk: List[messages.AddressRange]) -> messages.AddressBatch:
+        res = client.call(
+            messages.GetAddressBatch(
+                ranges=chunk, include_public_keys=include_public_keys
+            )
+        )
+        if not isinstance(res, messages.AddressBatch):
+            raise exceptions.TrezorException("Unexpected message")
+        return res
+
+    for chunk in split_ranges(ranges, chunk_size):
+        yield request(chunk)
+
+
 @expect(messages.OwnershipId, field="ownership_id", ret_type=bytes)
 def get_ownership_id(
     client: "TrezorClient",
@@ -291,6 +333,9 @@ def sign_tx(
     must correspond to a field in the `SignTx` data type. Note that some fields
     (`inputs_count`, `outputs_count`, `coin_name`) will be inferred from the arguments
     and cannot be overriden by kwargs.
+
+    With `batch_size=N`, the device may request up to N consecutive inputs or outputs
+    in one `TxRequest`, which saves round trips for transactions with many inputs.
     """
     if prev_txes is None:
         prev_txes = {}
@@ -389,22 +434,23 @@ def sign_tx(
             res = client.call(msg)
         else:
             msg = messages.TransactionType()
+            # in batched mode, several items from request_index on are requested
+            first = res.details.request_index
+            last = (first or 0) + (res.details.request_count or 1)
             if res.request_type == R.TXMETA:
                 msg = copy_tx_meta(current_tx)
             elif res.request_type in (R.TXINPUT, R.TXORIGINPUT):
                 assert res.details.request_index is not None
-                msg.inputs = [current_tx.inputs[res.details.request_index]]
+                msg.inputs = list(current_tx.inputs[first:last])
             elif res.request_type == R.TXOUTPUT:
                 assert res.details.request_index is not None
                 if res.details.tx_hash:
-                    msg.bin_outputs = [
-                        current_tx.bin_outputs[res.details.request_index]
-                    ]
+                    msg.bin_outputs = list(current_tx.bin_outputs[first:last])
                 else:
-                    msg.outputs = [current_tx.outputs[res.details.request_index]]
+                    msg.outputs = list(current_tx.outputs[first:last])
             elif res.request_type == R.TXORIGOUTPUT:
                 assert res.details.request_index is not None
-                msg.outputs = [current_tx.outputs[res.details.request_index]]
+                msg.outputs = list(current_tx.outputs[first:last])
             elif res.request_type == R.TXEXTRADATA:
                 assert res.details.extra_data_offset is not None
                 assert res.details.extra_data_len is not None
@@ -416,7 +462,10 @@ def sign_tx(
                     f"Unknown request type - {res.request_type}."
                 )
 
-            res = client.call(messages.TxAck(tx=msg))
+            ack = messages.TxAck(tx=msg)
+            if res.details.request_count and res.details.request_max_size:
+                _fit_batch(ack, res.details.request_max_size)
+            res = client.call(ack)
 
     if not isinstance(res, messages.TxRequest):
         raise exceptions.TrezorException("Unexpected message")
@@ -428,6 +477,16 @@ def sign_tx(
     return signatures, serialized_tx
 
 
+def _fit_batch(ack: messages.TxAck, max_size: int) -> None:
+    """Drop items from the end of a batched TxAck until it is at most `max_size` bytes.
+
+    The first item is always kept, the device cannot continue without it.
+    """
+    items = ack.tx.inputs or ack.tx.outputs or ack.tx.bin_outputs
+    while len(items) > 1 and ack.ByteSize() > max_size:
+        items.pop()
+
+
 @expect(messages.Success, field="message", ret_type=str)
 def authorize_coinjoin(
     client: "TrezorClient",
@@ -239,7 +239,7 @@ def cli(
     \b
     - HTTP or HTTPS URL
     - path to local directory
-    - path to local tar archive
+    - path to local tar archive (indexed into a cache on first use)
     \b
 
     For debugging purposes, it is possible to force use a specific network and token
@@ -257,7 +257,7 @@ def cli(
         if path.is_dir():
             DEFINITIONS_SOURCE.delegate = definitions.FilesystemSource(path)
         elif path.is_file() and tarfile.is_tarfile(path):
-            DEFINITIONS_SOURCE.delegate = definitions.TarSource(path)
+            DEFINITIONS_SOURCE.delegate = definitions.cached_tar_source(path)
         elif defs.startswith("http"):
             DEFINITIONS_SOURCE.delegate = definitions.UrlSource(defs)
         else:
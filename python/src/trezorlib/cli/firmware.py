@@ -16,11 +16,21 @@
 
 import os
 import sys
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from urllib.parse import urlparse
 
 import click
-import requests
 
 from .. import exceptions, firmware
 from . import with_client
@@ -166,6 +176,8 @@ def get_all_firmware_releases(
     bitcoin_only: bool, beta: bool, major_version: int
 ) -> List[Dict[str, Any]]:
     """Get sorted list of all releases suitable for inputted parameters"""
+    import requests
+
     url = f"https://data.trezor.io/firmware/{major_version}/releases.json"
     releases = requests.get(url).json()
     if not releases:
@@ -325,6 +337,8 @@ def find_best_firmware_version(
 
 
 def download_firmware_data(url: str) -> bytes:
+    import requests
+
     try:
         click.echo(f"Downloading from {url}")
         r = requests.get(url)
@@ -414,26 +428,70 @@ def cli() -> None:
     """Firmware commands."""
 
 
+def _validate_file(filename: str) -> Tuple[bool, str]:
+    """Validate a single file in a worker process of `verify --jobs`."""
+    try:
+        version, fingerprint = firmware.validate_file(filename)
+    except (ValueError, firmware.FirmwareIntegrityError) as e:
+        return False, str(e) or e.__class__.__name__
+    return True, f"{version.name} firmware, fingerprint {fingerprint.hex()}"
+
+
+def validate_firmware_files(filenames: Sequence[str], jobs: int) -> None:
+    """Validate firmware files in parallel.
+
+    Prints one line per file.
+    Exits if the validation of any file fails.
+    """
+    with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+        results = executor.map(_validate_file, filenames)
+        failed = 0
+        for filename, (valid, message) in zip(filenames, results):
+            click.echo(f"{filename}: {'OK' if valid else 'FAILED'}: {message}")
+            failed += not valid
+
+    if failed:
+        click.echo(f"Validation failed for {failed} of {len(filenames)} files.")
+        sys.exit(4)
+
+
 @cli.command()
 # fmt: off
-@click.argument("filename", type=click.File("rb"))
+@click.argument("filenames", nargs=-1, required=True, type=click.Path(allow_dash=True, dir_okay=False))
 @click.option("-c", "--check-device", is_flag=True, help="Validate device compatibility")
 @click.option("--fingerprint", help="Expected firmware fingerprint in hex")
+@click.option("-j", "--jobs", type=int, help="Validate multiple files in N processes")
 @click.pass_obj
 # fmt: on
 def verify(
     obj: "TrezorConnection",
-    filename: BinaryIO,
+    filenames: Tuple[str, ...],
     check_device: bool,
     fingerprint: Optional[str],
+    jobs: Optional[int],
 ) -> None:
     """Verify the integrity of the firmware data stored in a file.
 
     By default the device is not checked and does not need to be connected.
     Its validation must be specified.
 
+    With multiple files, or with --jobs, the files are validated in parallel and only
+    a summary line is printed for each of them.
+
     In case of validation failure exits with the appropriate exit code.
     """
+    if len(filenames) > 1 or jobs is not None:
+        if check_device or fingerprint:
+            raise click.ClickException(
+                "--check-device and --fingerprint can only be used with a single file"
+            )
+        if "-" in filenames:
+            raise click.ClickException(
+                "Cannot read from stdin when verifying in parallel"
+            )
+        validate_firmware_files(filenames, jobs or 0)
+        return
+
     # Deciding if to take the device into account
     bootloader_onev2: Optional[bool]
     trezor_major_version: Optional[int]
@@ -445,7 +503,8 @@ def verify(
         bootloader_onev2 = None
         trezor_major_version = None
 
-    firmware_data = filename.read()
+    with click.open_file(filenames[0], "rb") as f:
+        firmware_data = f.read()
     validate_firmware(
         firmware_data=firmware_data,
         fingerprint=fingerprint,
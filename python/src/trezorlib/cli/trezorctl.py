@@ -16,11 +16,21 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import importlib
 import json
 import logging
 import os
 import time
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 import click
 
@@ -31,44 +41,13 @@ from ..transport.udp import UdpTransport
 from . import (
     AliasedGroup,
     TrezorConnection,
-    algorand,
-    aptos,
-    binance,
     btc,
-    cardano,
-    conflux,
-    cosi,
     crypto,
     debug,
     device,
-    eos,
-    ethereum,
-    ethereum_onekey,
-    fido,
     firmware,
-    monero,
-    near,
-    nem,
-    ripple,
     settings,
-    sol,
-    starcoin,
-    stellar,
-    tezos,
-    tron,
-    sui,
-    filecoin,
-    cosmos,
-    polkadot,
     with_client,
-    kaspa,
-    nexa,
-    nervos,
-    ton,
-    scdo,
-    alephium,
-    benfen,
-    neo,
 )
 
 F = TypeVar("F", bound=Callable)
@@ -92,33 +71,6 @@ COMMAND_ALIASES = {
     "get-entropy": crypto.get_entropy,
     "encrypt-keyvalue": crypto.encrypt_keyvalue,
     "decrypt-keyvalue": crypto.decrypt_keyvalue,
-    # currency name aliases:
-    "bnb": binance.cli,
-    "cfx": conflux.cli,
-    "eth": ethereum.cli,
-    "ada": cardano.cli,
-    "xmr": monero.cli,
-    "xrp": ripple.cli,
-    "xlm": stellar.cli,
-    "xtz": tezos.cli,
-    "trx": tron.cli,
-    "algorand": algorand.cli,
-    "sol": sol.cli,
-    "starcoin": starcoin.cli,
-    "near": near.cli,
-    "aptos": aptos.cli,
-    "sui": sui.cli,
-    "filecoin": filecoin.cli,
-    "cosmos": cosmos.cli,
-    "polkadot": polkadot.cli,
-    "kaspa": kaspa.cli,
-    "nervos": nervos.cli,
-    "nexa": nexa.cli,
-    "ton": ton.cli,
-    "scdo": scdo.cli,
-    "alephium": alephium.cli,
-    "benfen": benfen.cli,
-    "neo": neo.cli,
     # firmware aliases:
     "fw": firmware.cli,
     "update-firmware": firmware.update,
@@ -127,6 +79,55 @@ COMMAND_ALIASES = {
     "firmware-update": firmware.update,
 }
 
+# Coin command groups are only imported when invoked, so that every trezorctl call
+# does not pay for importing all of them and their dependencies.
+LAZY_COMMANDS = {
+    "alephium": "alephium",
+    "algorand": "algorand",
+    "aptos": "aptos",
+    "benfen": "benfen",
+    "binance": "binance",
+    "cardano": "cardano",
+    "conflux": "conflux",
+    "cosi": "cosi",
+    "cosmos": "cosmos",
+    "eos": "eos",
+    "ethereum": "ethereum",
+    "ethereum-onekey": "ethereum_onekey",
+    "fido": "fido",
+    "filecoin": "filecoin",
+    "kaspa": "kaspa",
+    "monero": "monero",
+    "near": "near",
+    "nem": "nem",
+    "neo": "neo",
+    "nervos": "nervos",
+    "nexa": "nexa",
+    "polkadot": "polkadot",
+    "ripple": "ripple",
+    "scdo": "scdo",
+    "sol": "sol",
+    "starcoin": "starcoin",
+    "stellar": "stellar",
+    "sui": "sui",
+    "tezos": "tezos",
+    "ton": "ton",
+    "tron": "tron",
+}
+
+# currency name aliases:
+LAZY_ALIASES = {
+    "bnb": "binance",
+    "cfx": "conflux",
+    "eth": "ethereum",
+    "ada": "cardano",
+    "xmr": "monero",
+    "xrp": "ripple",
+    "xlm": "stellar",
+    "xtz": "tezos",
+    "trx": "tron",
+}
+
 
 class TrezorctlGroup(AliasedGroup):
     """Command group that handles compatibility for trezorctl.
@@ -139,6 +140,9 @@ class TrezorctlGroup(AliasedGroup):
 
     """
 
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(LAZY_COMMANDS))
+
     def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
         cmd = super().get_command(ctx, cmd_name)
         if cmd:
@@ -146,6 +150,10 @@ class TrezorctlGroup(AliasedGroup):
 
         # the subsequent lookups rely on dash-separated command names
         cmd_name = cmd_name.replace("_", "-")
+        cmd = self.load_lazy_command(LAZY_ALIASES.get(cmd_name, cmd_name))
+        if cmd:
+            return cmd
+
         # look for subcommand in btc - "sign-tx" is now "btc sign-tx"
         cmd = btc.cli.get_command(ctx, cmd_name)
         if cmd:
@@ -157,12 +165,23 @@ class TrezorctlGroup(AliasedGroup):
             command, subcommand = cmd_name.split("-", maxsplit=1)
             # get_command can return None and the following line will fail.
             # We don't care, we ignore the exception anyway.
-            return super().get_command(ctx, command).get_command(ctx, subcommand)  # type: ignore ["get_command" is not a known member of "None";;Cannot access member "get_command" for type "Command"]
+            return self.get_command(ctx, command).get_command(ctx, subcommand)  # type: ignore ["get_command" is not a known member of "None";;Cannot access member "get_command" for type "Command"]
         except Exception:
             pass
 
         return None
 
+    def load_lazy_command(self, cmd_name: str) -> Optional[click.Command]:
+        """Import a coin command group on first use and register it."""
+        module_name = LAZY_COMMANDS.get(cmd_name)
+        if module_name is None:
+            return None
+
+        module = importlib.import_module(f".{module_name}", __package__)
+        cmd = module.cli
+        self.add_command(cmd)
+        return cmd
+
     def set_result_callback(self) -> Callable[[F], F]:
         """Set a function called to format the return value of a command.
 
@@ -444,42 +463,12 @@ def wait_for_emulator(obj: TrezorConnection, timeout: float) -> None:
 # Basic coin functions
 #
 
-cli.add_command(binance.cli)
-cli.add_command(conflux.cli)
 cli.add_command(btc.cli)
-cli.add_command(cardano.cli)
-cli.add_command(cosi.cli)
 cli.add_command(crypto.cli)
 cli.add_command(device.cli)
-cli.add_command(eos.cli)
-cli.add_command(ethereum.cli)
-cli.add_command(ethereum_onekey.cli)
-cli.add_command(fido.cli)
-cli.add_command(monero.cli)
-cli.add_command(nem.cli)
-cli.add_command(ripple.cli)
 cli.add_command(settings.cli)
-cli.add_command(stellar.cli)
-cli.add_command(sol.cli)
-cli.add_command(tron.cli)
-cli.add_command(algorand.cli)
-cli.add_command(tezos.cli)
-cli.add_command(aptos.cli)
-cli.add_command(starcoin.cli)
 cli.add_command(firmware.cli)
 cli.add_command(debug.cli)
-cli.add_command(near.cli)
-cli.add_command(sui.cli)
-cli.add_command(cosmos.cli)
-cli.add_command(polkadot.cli)
-cli.add_command(kaspa.cli)
-cli.add_command(nexa.cli)
-cli.add_command(nervos.cli)
-cli.add_command(ton.cli)
-cli.add_command(scdo.cli)
-cli.add_command(alephium.cli)
-cli.add_command(benfen.cli)
-cli.add_command(neo.cli)
 
 #
 # Main
@@ -17,6 +17,7 @@
 import logging
 import textwrap
 from collections import namedtuple
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
 from enum import IntEnum
@@ -79,6 +80,9 @@ class DebugLink:
         self.t1_screenshot_directory: Optional[Path] = None
         self.t1_screenshot_counter = 0
 
+        # Decisions collected inside `with debug.batch()`
+        self._batch: Optional[List[messages.DebugLinkDecision]] = None
+
     def open(self) -> None:
         self.transport.begin_session()
 
@@ -174,12 +178,61 @@ class DebugLink:
         decision = messages.DebugLinkDecision(
             button=button, swipe=swipe, input=word, x=x, y=y, wait=wait, hold_ms=hold_ms
         )
+        if self._batch is not None:
+            if wait:
+                raise ValueError("Cannot wait for layout inside a batch")
+            self._batch.append(decision)
+            return None
+
         ret = self._call(decision, nowait=not wait)
         if ret is not None:
             return layout_lines(ret.lines)
 
         return None
 
+    def input_batch(
+        self, decisions: Sequence[messages.DebugLinkDecision], wait: bool = False
+    ) -> Optional[LayoutLines]:
+        """Send a sequence of decisions without waiting for the device in between.
+
+        The device processes them in order. With `wait`, only the layout after the
+        last decision is read back, instead of one round trip per decision.
+        """
+        if not self.allow_interactions or not decisions:
+            return None
+
+        decisions = [deepcopy(decision) for decision in decisions]
+        for decision in decisions[:-1]:
+            decision.wait = None
+            self._call(decision, nowait=True)
+
+        last = decisions[-1]
+        last.wait = wait or None
+        ret = self._call(last, nowait=not wait)
+        if ret is not None:
+            return layout_lines(ret.lines)
+
+        return None
+
+    @contextmanager
+    def batch(self) -> Iterator[List[messages.DebugLinkDecision]]:
+        """Collect inputs made in the with-block and send them together at its end.
+
+        >>> with client.debug.batch():
+        >>>     client.debug.swipe_up()
+        >>>     client.debug.swipe_up()
+        >>>     client.debug.press_yes()
+        """
+        if self._batch is not None:
+            raise RuntimeError("Do not nest!")
+        self._batch = []
+        try:
+            yield self._batch
+            decisions = self._batch
+        finally:
+            self._batch = None
+        self.input_batch(decisions)
+
     def click(
         self, click: Tuple[int, int], wait: bool = False
     ) -> Optional[LayoutLines]:
@@ -302,6 +355,14 @@ class NullDebugLink(DebugLink):
         return None
 
 
+def _batched_input_flow(
+    debug: DebugLink, batches: Iterable[Sequence[messages.DebugLinkDecision]]
+) -> Generator[None, Optional[messages.ButtonRequest], None]:
+    for batch in batches:
+        yield
+        debug.input_batch(batch)
+
+
 class DebugUI:
     INPUT_FLOW_DONE = object()
 
@@ -527,7 +588,12 @@ class TrezorClientDebugLink(TrezorClient):
             return msg
 
     def set_input_flow(
-        self, input_flow: Generator[None, Optional[messages.ButtonRequest], None]
+        self,
+        input_flow: Union[
+            Generator[None, Optional[messages.ButtonRequest], None],
+            Callable[[], Generator[None, Optional[messages.ButtonRequest], None]],
+            Sequence[Sequence[messages.DebugLinkDecision]],
+        ],
     ) -> None:
         """Configure a sequence of input events for the current with-block.
 
@@ -552,10 +618,21 @@ class TrezorClientDebugLink(TrezorClient):
         >>> with client:
         >>>     client.set_input_flow(input_flow)
         >>>     some_call(client)
+
+        Instead of a generator, `input_flow` can be a list with one list of decisions
+        for every ButtonRequest. Each list is sent in one go with `debug.input_batch`:
+
+        >>> yes = messages.DebugLinkDecision(button=messages.DebugButton.YES)
+        >>> swipe = messages.DebugLinkDecision(swipe=messages.DebugSwipeDirection.UP)
+        >>> with client:
+        >>>     client.set_input_flow([[swipe, swipe, yes], [yes]])
+        >>>     some_call(client)
         """
         if not self.in_with_statement:
             raise RuntimeError("Must be called inside 'with' statement")
 
+        if isinstance(input_flow, Sequence):
+            input_flow = _batched_input_flow(self.debug, input_flow)
         if callable(input_flow):
             input_flow = input_flow()
         if not hasattr(input_flow, "send"):
@@ -1,5 +1,10 @@
+import hashlib
 import logging
+import mmap
+import os
+import struct
 import tarfile
+import tempfile
 import typing as t
 from pathlib import Path
 
@@ -16,6 +21,12 @@ LOG = logging.getLogger(__name__)
 FORMAT_MAGIC = b"trzd1"
 DEFS_BASE_URL = "https://data.trezor.io/firmware/eth-definitions/"
 
+INDEX_MAGIC = b"trzdidx1"
+# magic, SHA-256 of the source archive, number of entries
+INDEX_HEADER = struct.Struct("<8s32sI")
+# SHA-256 of the path in the archive, offset and length of the definition blob
+INDEX_ENTRY = struct.Struct("<32sII")
+
 DEFINITIONS_DEV_SIGS_REQUIRED = 1
 DEFINITIONS_DEV_PUBLIC_KEYS = [
     bytes.fromhex(key)
@@ -143,3 +154,122 @@ class TarSource(Source):
         except Exception:
             LOG.info("Requested definition at %s was not found", inner_name)
             return None
+
+
+class IndexedSource(Source):
+    """Definitions from an index file written by `build_index()`.
+
+    The index is memory-mapped and entries are found by binary search, so only the
+    requested definitions are read, regardless of the size of the index.
+    """
+
+    def __init__(self, path: Path, digest: t.Optional[bytes] = None) -> None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < INDEX_HEADER.size:
+                raise ValueError("Invalid definitions index")
+            self.index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.digest, self.count = INDEX_HEADER.unpack_from(self.index)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Invalid definitions index")
+        if digest is not None and digest != self.digest:
+            raise ValueError("Definitions index is out of date")
+
+    def fetch_path(self, *components: str) -> t.Optional[bytes]:
+        inner_name = "/".join(components)
+        key = _index_key(inner_name)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key, offset, length = INDEX_ENTRY.unpack_from(
+                self.index, INDEX_HEADER.size + mid * INDEX_ENTRY.size
+            )
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            else:
+                LOG.info("Reading definition %s from index", inner_name)
+                return self.index[offset : offset + length]
+
+        LOG.info("Requested definition at %s was not found", inner_name)
+        return None
+
+
+def _index_key(inner_name: str) -> bytes:
+    return hashlib.sha256(inner_name.encode()).digest()
+
+
+def file_digest(path: Path) -> bytes:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def build_index(
+    archive: Path, index_path: Path, digest: t.Optional[bytes] = None
+) -> None:
+    """Write an index of all definitions in a tar archive to `index_path`.
+
+    `digest` is the SHA-256 of the archive, computed if not provided. The file is
+    replaced atomically, so that concurrent readers never see a partial index.
+    """
+    if digest is None:
+        digest = file_digest(archive)
+
+    entries: t.Dict[bytes, t.Tuple[int, int]] = {}
+    blobs = bytearray()
+    with tarfile.open(archive) as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            data = tar.extractfile(member).read()  # type: ignore [not a known member]
+            # like tarfile.extractfile(), the last member of a name wins
+            entries[_index_key(member.name)] = len(blobs), len(data)
+            blobs += data
+
+    data_offset = INDEX_HEADER.size + len(entries) * INDEX_ENTRY.size
+    fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, digest, len(entries)))
+            for key in sorted(entries):
+                offset, length = entries[key]
+                f.write(INDEX_ENTRY.pack(key, data_offset + offset, length))
+            f.write(blobs)
+        os.replace(tmp_name, index_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "trezorlib" / "definitions"
+
+
+def cached_tar_source(path: Path, cache_dir: t.Optional[Path] = None) -> Source:
+    """Open a tar archive of definitions through an index stored in `cache_dir`.
+
+    The index is built on first use and rebuilt whenever the content of the archive
+    changes. Falls back to `TarSource` if the cache directory is not writable.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    digest = file_digest(path)
+    path_key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+    index_path = cache_dir / f"{path_key}.idx"
+    try:
+        return IndexedSource(index_path, digest)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        LOG.info("Building definitions index %s", index_path)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        build_index(path, index_path, digest)
+        return IndexedSource(index_path, digest)
+    except OSError as e:
+        LOG.warning("Could not build definitions index: %s", e)
+        return TarSource(path)
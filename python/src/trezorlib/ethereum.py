@@ -15,16 +15,29 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import re
-from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from . import definitions, exceptions, messages
-from .tools import expect, prepare_message_bytes, session, unharden
+from .tools import expect, prepare_message_bytes, session, split_ranges, unharden
 
 if TYPE_CHECKING:
     from .client import TrezorClient
     from .tools import Address
     from .protobuf import MessageType
 
+# Maximum number of addresses in a single EthereumGetAddressBatch request
+MAX_ADDRESS_BATCH = 64
+
 
 def int_to_big_endian(value: int) -> bytes:
     return value.to_bytes((value.bit_length() + 7) // 8, "big")
@@ -177,6 +190,34 @@ def get_address(
     )
 
 
+def get_addresses_batch(
+    client: "TrezorClient",
+    ranges: Sequence[messages.EthereumAddressRange],
+    include_public_keys: bool = False,
+    encoded_network: Optional[bytes] = None,
+    chunk_size: int = MAX_ADDRESS_BATCH,
+) -> Iterator[messages.EthereumAddressBatch]:
+    """Get the addresses of the given ranges without showing them on the device.
+
+    All ranges must belong to the network given by the path of the first one. See
+    `btc.get_addresses_batch` for how the ranges are split into requests.
+    """
+    if not 0 < chunk_size <= MAX_ADDRESS_BATCH:
+        raise ValueError(f"Chunk size must be between 1 and {MAX_ADDRESS_BATCH}")
+
+    for chunk in split_ranges(ranges, chunk_size):
+        res = client.call(
+            messages.EthereumGetAddressBatch(
+                ranges=chunk,
+                encoded_network=encoded_network,
+                include_public_keys=include_public_keys,
+            )
+        )
+        if not isinstance(res, messages.EthereumAddressBatch):
+            raise exceptions.TrezorException("Unexpected message")
+        yield res
+
+
 @expect(messages.EthereumPublicKey)
 def get_public_node(
     client: "TrezorClient", n: "Address", show_display: bool = False
@@ -15,9 +15,22 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from hashlib import blake2s
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import construct as c
 import ecdsa
@@ -275,18 +288,25 @@ class FirmwareFormat(Enum):
 ParsedFirmware = Tuple[FirmwareFormat, c.Container]
 
 
+def _firmware_format(magic: bytes) -> FirmwareFormat:
+    if magic == b"TRZR":
+        return FirmwareFormat.TREZOR_ONE
+    elif magic == b"OKTV":
+        return FirmwareFormat.TREZOR_T
+    elif magic == b"OKTF":
+        return FirmwareFormat.TREZOR_ONE_V2
+    else:
+        raise ValueError("Unrecognized firmware image type")
+
+
 def parse(data: bytes) -> ParsedFirmware:
-    if data[:4] == b"TRZR":
-        version = FirmwareFormat.TREZOR_ONE
+    version = _firmware_format(data[:4])
+    if version == FirmwareFormat.TREZOR_ONE:
         cls = LegacyFirmware
-    elif data[:4] == b"OKTV":
-        version = FirmwareFormat.TREZOR_T
+    elif version == FirmwareFormat.TREZOR_T:
         cls = VendorFirmware
-    elif data[:4] == b"OKTF":
-        version = FirmwareFormat.TREZOR_ONE_V2
-        cls = FirmwareImage
     else:
-        raise ValueError("Unrecognized firmware image type")
+        cls = FirmwareImage
 
     try:
         fw = cls.parse(data)
@@ -295,6 +315,79 @@ def parse(data: bytes) -> ParsedFirmware:
     return version, fw
 
 
+def _parse_image_stream(
+    stream: BinaryIO, data: memoryview
+) -> Tuple[c.Container, memoryview]:
+    """Parse a firmware header from `stream` and take the code from `data`.
+
+    Equivalent to `FirmwareImage.parse_stream`, except that the code is not copied.
+    """
+    header = FirmwareHeader.parse_stream(stream)
+    code_offset = stream.tell()
+    if code_offset + header.code_length != len(data):
+        raise FirmwareIntegrityError("Invalid firmware image")
+    code = data[code_offset:]
+    image = c.Container(header=header, _code_offset=code_offset, code=code)
+    return image, code
+
+
+@contextmanager
+def parse_file(filename: str) -> Generator[ParsedFirmware, None, None]:
+    """Parse a firmware image from a file without loading it into memory.
+
+    Headers are parsed from the file, the code is a `memoryview` of the memory-mapped
+    file, so that code hashes can be computed without copying the image. The code is
+    only valid inside the `with` block:
+
+    >>> with parse_file("firmware.bin") as (version, fw):
+    >>>     validate(version, fw)
+
+    Legacy Trezor One images are small and are parsed from memory with `parse()`.
+    """
+    with open(filename, "rb") as f:
+        version = _firmware_format(f.read(4))
+        f.seek(0)
+        if version == FirmwareFormat.TREZOR_ONE:
+            yield parse(f.read())
+            return
+
+        if os.fstat(f.fileno()).st_size == 0:
+            raise FirmwareIntegrityError("Invalid firmware image")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = memoryview(mapped)
+            code = None
+            try:
+                try:
+                    if version == FirmwareFormat.TREZOR_T:
+                        vendor_header = VendorHeader.parse_stream(f)
+                        image, code = _parse_image_stream(f, data)
+                        fw = c.Container(vendor_header=vendor_header, image=image)
+                    else:
+                        fw, code = _parse_image_stream(f, data)
+                except FirmwareIntegrityError:
+                    raise
+                except Exception as e:
+                    raise FirmwareIntegrityError("Invalid firmware image") from e
+                yield version, fw
+            finally:
+                # the mapping can only be closed once no views of it are left
+                if code is not None:
+                    code.release()
+                data.release()
+
+
+def validate_file(
+    filename: str, allow_unsigned: bool = False
+) -> Tuple[FirmwareFormat, bytes]:
+    """Validate a firmware file and return its format and fingerprint.
+
+    Raises the same exceptions as `parse()` and `validate()`.
+    """
+    with parse_file(filename) as (version, fw):
+        validate(version, fw, allow_unsigned)
+        return version, digest(version, fw)
+
+
 def digest_onev1(fw: c.Container) -> bytes:
     return hashlib.sha256(fw.code).digest()
 
@@ -367,7 +460,7 @@ def calculate_code_hashes(
         chunk = code[start:end]
         # padding for last non-empty chunk
         if padding_byte is not None and start < len(code) and end > len(code):
-            chunk += padding_byte[0:1] * (end - start - len(chunk))
+            chunk = bytes(chunk) + padding_byte[0:1] * (end - start - len(chunk))
 
         if not chunk:
             hashes.append(b"\0" * 32)
@@ -491,6 +584,13 @@ def validate(
 # ====== Client functions ====== #
 
 
+def _firmware_chunk(
+    view: memoryview, offset: int, length: int
+) -> messages.FirmwareUpload:
+    payload = view[offset : offset + length]
+    return messages.FirmwareUpload(payload=payload, hash=blake2s(payload).digest())
+
+
 @session
 def update(
     client: "TrezorClient",
@@ -512,14 +612,34 @@ def update(
             raise RuntimeError(f"Unexpected result {resp}")
 
     # TREZORv2 method
-    while isinstance(resp, messages.FirmwareRequest):
-        assert resp.offset is not None
-        assert resp.length is not None
-        length = resp.length
-        payload = data[resp.offset : resp.offset + length]
-        digest = blake2s(payload).digest()
-        resp = client.call(messages.FirmwareUpload(payload=payload, hash=digest))
-        progress_update(length)
+    # The device asks for chunks one by one. While a chunk is in flight, the next
+    # one is prepared and hashed on a worker thread, on the assumption that the
+    # device will ask for the chunk that follows. If it asks for something else,
+    # the chunk is prepared on the spot.
+    view = memoryview(data)
+    pending: Optional[Tuple[int, int, "Future[messages.FirmwareUpload]"]] = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while isinstance(resp, messages.FirmwareRequest):
+            assert resp.offset is not None
+            assert resp.length is not None
+            offset, length = resp.offset, resp.length
+            if pending is not None and pending[:2] == (offset, length):
+                msg = pending[2].result()
+            else:
+                msg = _firmware_chunk(view, offset, length)
+
+            next_offset = offset + length
+            next_length = min(length, len(data) - next_offset)
+            if next_length > 0:
+                future = executor.submit(
+                    _firmware_chunk, view, next_offset, next_length
+                )
+                pending = (next_offset, next_length, future)
+            else:
+                pending = None
+
+            resp = client.call(msg)
+            progress_update(length)
 
     if isinstance(resp, messages.Success):
         return
@@ -106,6 +106,8 @@ class MessageType(IntEnum):
     AuthorizeCoinJoin = 51
     SignPsbt = 10052
     SignedPsbt = 10053
+    GetAddressBatch = 10054
+    AddressBatch = 10055
     CipherKeyValue = 23
     CipheredKeyValue = 48
     SignIdentity = 53
@@ -182,6 +184,8 @@ class MessageType(IntEnum):
     EthereumGnosisSafeTxAck = 20118
     EthereumGnosisSafeTxRequest = 20119
     EthereumSignTxEIP7702OneKey = 20120
+    EthereumGetAddressBatch = 20121
+    EthereumAddressBatch = 20122
     NEMGetAddress = 67
     NEMAddress = 68
     NEMSignTx = 69
@@ -344,6 +348,8 @@ class MessageType(IntEnum):
     SolanaSignOffChainMessage = 10104
     SolanaMessageSignature = 10105
     SolanaSignUnsafeMessage = 10106
+    SolanaGetAddressBatch = 10107
+    SolanaAddressBatch = 10108
     CosmosGetAddress = 10800
     CosmosAddress = 10801
     CosmosSignTx = 10802
@@ -1898,6 +1904,40 @@ class Address(protobuf.MessageType):
         self.mac = mac
 
 
+class GetAddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10054
+    FIELDS = {
+        1: protobuf.Field("ranges", "AddressRange", repeated=True, required=False),
+        2: protobuf.Field("include_public_keys", "bool", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        ranges: Optional[Sequence["AddressRange"]] = None,
+        include_public_keys: Optional["bool"] = None,
+    ) -> None:
+        self.ranges: Sequence["AddressRange"] = ranges if ranges is not None else []
+        self.include_public_keys = include_public_keys
+
+
+class AddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10055
+    FIELDS = {
+        1: protobuf.Field("addresses", "string", repeated=True, required=False),
+        2: protobuf.Field("public_keys", "bytes", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        addresses: Optional[Sequence["str"]] = None,
+        public_keys: Optional[Sequence["bytes"]] = None,
+    ) -> None:
+        self.addresses: Sequence["str"] = addresses if addresses is not None else []
+        self.public_keys: Sequence["bytes"] = public_keys if public_keys is not None else []
+
+
 class GetOwnershipId(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 43
     FIELDS = {
@@ -2021,6 +2061,7 @@ class SignTx(protobuf.MessageType):
         12: protobuf.Field("decred_staking_ticket", "bool", repeated=False, required=False),
         13: protobuf.Field("serialize", "bool", repeated=False, required=False),
         14: protobuf.Field("coinjoin_request", "CoinJoinRequest", repeated=False, required=False),
+        15: protobuf.Field("batch_size", "uint32", repeated=False, required=False),
     }
 
     def __init__(
@@ -2040,6 +2081,7 @@ class SignTx(protobuf.MessageType):
         decred_staking_ticket: Optional["bool"] = False,
         serialize: Optional["bool"] = True,
         coinjoin_request: Optional["CoinJoinRequest"] = None,
+        batch_size: Optional["int"] = None,
     ) -> None:
         self.outputs_count = outputs_count
         self.inputs_count = inputs_count
@@ -2055,6 +2097,7 @@ class SignTx(protobuf.MessageType):
         self.decred_staking_ticket = decred_staking_ticket
         self.serialize = serialize
         self.coinjoin_request = coinjoin_request
+        self.batch_size = batch_size
 
 
 class TxRequest(protobuf.MessageType):
@@ -2385,6 +2428,62 @@ class TxAckPrevExtraData(protobuf.MessageType):
         self.tx = tx
 
 
+class TxAckInputBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckInputBatchWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckInputBatchWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckOutputBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckOutputBatchWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckOutputBatchWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckPrevInputBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckPrevInputBatchWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckPrevInputBatchWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckPrevOutputBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckPrevOutputBatchWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckPrevOutputBatchWrapper",
+    ) -> None:
+        self.tx = tx
+
+
 class GetOwnershipProof(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 49
     FIELDS = {
@@ -2517,6 +2616,32 @@ class HDNodePathType(protobuf.MessageType):
         self.node = node
 
 
+class AddressRange(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        1: protobuf.Field("address_n", "uint32", repeated=True, required=False),
+        2: protobuf.Field("coin_name", "string", repeated=False, required=False),
+        3: protobuf.Field("script_type", "InputScriptType", repeated=False, required=False),
+        4: protobuf.Field("start", "uint32", repeated=False, required=True),
+        5: protobuf.Field("count", "uint32", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        start: "int",
+        count: "int",
+        address_n: Optional[Sequence["int"]] = None,
+        coin_name: Optional["str"] = 'Bitcoin',
+        script_type: Optional["InputScriptType"] = InputScriptType.SPENDADDRESS,
+    ) -> None:
+        self.address_n: Sequence["int"] = address_n if address_n is not None else []
+        self.start = start
+        self.count = count
+        self.coin_name = coin_name
+        self.script_type = script_type
+
+
 class CoinJoinRequest(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = None
     FIELDS = {
@@ -2550,6 +2675,8 @@ class TxRequestDetailsType(protobuf.MessageType):
         2: protobuf.Field("tx_hash", "bytes", repeated=False, required=False),
         3: protobuf.Field("extra_data_len", "uint32", repeated=False, required=False),
         4: protobuf.Field("extra_data_offset", "uint32", repeated=False, required=False),
+        5: protobuf.Field("request_count", "uint32", repeated=False, required=False),
+        6: protobuf.Field("request_max_size", "uint32", repeated=False, required=False),
     }
 
     def __init__(
@@ -2559,11 +2686,15 @@ class TxRequestDetailsType(protobuf.MessageType):
         tx_hash: Optional["bytes"] = None,
         extra_data_len: Optional["int"] = None,
         extra_data_offset: Optional["int"] = None,
+        request_count: Optional["int"] = None,
+        request_max_size: Optional["int"] = None,
     ) -> None:
         self.request_index = request_index
         self.tx_hash = tx_hash
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
+        self.request_count = request_count
+        self.request_max_size = request_max_size
 
 
 class TxRequestSerializedType(protobuf.MessageType):
@@ -2903,6 +3034,62 @@ class TxAckPrevExtraDataWrapper(protobuf.MessageType):
         self.extra_data_chunk = extra_data_chunk
 
 
+class TxAckInputBatchWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        2: protobuf.Field("inputs", "TxInput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        inputs: Optional[Sequence["TxInput"]] = None,
+    ) -> None:
+        self.inputs: Sequence["TxInput"] = inputs if inputs is not None else []
+
+
+class TxAckOutputBatchWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        5: protobuf.Field("outputs", "TxOutput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        outputs: Optional[Sequence["TxOutput"]] = None,
+    ) -> None:
+        self.outputs: Sequence["TxOutput"] = outputs if outputs is not None else []
+
+
+class TxAckPrevInputBatchWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        2: protobuf.Field("inputs", "PrevInput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        inputs: Optional[Sequence["PrevInput"]] = None,
+    ) -> None:
+        self.inputs: Sequence["PrevInput"] = inputs if inputs is not None else []
+
+
+class TxAckPrevOutputBatchWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        3: protobuf.Field("bin_outputs", "PrevOutput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        bin_outputs: Optional[Sequence["PrevOutput"]] = None,
+    ) -> None:
+        self.bin_outputs: Sequence["PrevOutput"] = bin_outputs if bin_outputs is not None else []
+
+
 class FirmwareErase(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 6
     FIELDS = {
@@ -7555,6 +7742,43 @@ class EthereumAddress(protobuf.MessageType):
         self.address = address
 
 
+class EthereumGetAddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 20121
+    FIELDS = {
+        1: protobuf.Field("ranges", "EthereumAddressRange", repeated=True, required=False),
+        2: protobuf.Field("encoded_network", "bytes", repeated=False, required=False),
+        3: protobuf.Field("include_public_keys", "bool", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        ranges: Optional[Sequence["EthereumAddressRange"]] = None,
+        encoded_network: Optional["bytes"] = None,
+        include_public_keys: Optional["bool"] = None,
+    ) -> None:
+        self.ranges: Sequence["EthereumAddressRange"] = ranges if ranges is not None else []
+        self.encoded_network = encoded_network
+        self.include_public_keys = include_public_keys
+
+
+class EthereumAddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 20122
+    FIELDS = {
+        1: protobuf.Field("addresses", "string", repeated=True, required=False),
+        2: protobuf.Field("public_keys", "bytes", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        addresses: Optional[Sequence["str"]] = None,
+        public_keys: Optional[Sequence["bytes"]] = None,
+    ) -> None:
+        self.addresses: Sequence["str"] = addresses if addresses is not None else []
+        self.public_keys: Sequence["bytes"] = public_keys if public_keys is not None else []
+
+
 class EthereumSignTx(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 58
     FIELDS = {
@@ -7780,6 +8004,26 @@ class EthereumTypedDataSignature(protobuf.MessageType):
         self.address = address
 
 
+class EthereumAddressRange(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        1: protobuf.Field("address_n", "uint32", repeated=True, required=False),
+        2: protobuf.Field("start", "uint32", repeated=False, required=True),
+        3: protobuf.Field("count", "uint32", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        start: "int",
+        count: "int",
+        address_n: Optional[Sequence["int"]] = None,
+    ) -> None:
+        self.address_n: Sequence["int"] = address_n if address_n is not None else []
+        self.start = start
+        self.count = count
+
+
 class EthereumAccessList(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = None
     FIELDS = {
@@ -10209,6 +10453,40 @@ class SolanaAddress(protobuf.MessageType):
         self.address = address
 
 
+class SolanaGetAddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10107
+    FIELDS = {
+        1: protobuf.Field("ranges", "SolanaAddressRange", repeated=True, required=False),
+        2: protobuf.Field("include_public_keys", "bool", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        ranges: Optional[Sequence["SolanaAddressRange"]] = None,
+        include_public_keys: Optional["bool"] = None,
+    ) -> None:
+        self.ranges: Sequence["SolanaAddressRange"] = ranges if ranges is not None else []
+        self.include_public_keys = include_public_keys
+
+
+class SolanaAddressBatch(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10108
+    FIELDS = {
+        1: protobuf.Field("addresses", "string", repeated=True, required=False),
+        2: protobuf.Field("public_keys", "bytes", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        addresses: Optional[Sequence["str"]] = None,
+        public_keys: Optional[Sequence["bytes"]] = None,
+    ) -> None:
+        self.addresses: Sequence["str"] = addresses if addresses is not None else []
+        self.public_keys: Sequence["bytes"] = public_keys if public_keys is not None else []
+
+
 class SolanaSignTx(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 10102
     FIELDS = {
@@ -10300,6 +10578,26 @@ class SolanaMessageSignature(protobuf.MessageType):
         self.public_key = public_key
 
 
+class SolanaAddressRange(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        1: protobuf.Field("address_n", "uint32", repeated=True, required=False),
+        2: protobuf.Field("start", "uint32", repeated=False, required=True),
+        3: protobuf.Field("count", "uint32", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        start: "int",
+        count: "int",
+        address_n: Optional[Sequence["int"]] = None,
+    ) -> None:
+        self.address_n: Sequence["int"] = address_n if address_n is not None else []
+        self.start = start
+        self.count = count
+
+
 class StarcoinGetAddress(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 10300
     FIELDS = {
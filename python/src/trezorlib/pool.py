@@ -0,0 +1,167 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from .client import TrezorClient
+from .exceptions import TrezorException
+from .transport import enumerate_devices, get_transport
+
+if TYPE_CHECKING:
+    from .models import TrezorModel
+    from .ui import TrezorClientUI
+
+    T = TypeVar("T", bound="ClientPool")
+
+LOG = logging.getLogger(__name__)
+
+MAX_CONNECT_WORKERS = 32
+
+ClientFactory = Callable[[Any], TrezorClient]
+
+
+class PoolExhausted(TrezorException):
+    pass
+
+
+class ClientPool:
+    """Pool of warm TrezorClient connections shared between worker threads.
+
+    Clients are created concurrently, and each of them keeps its session open for the
+    lifetime of the pool, so that handing a client to a worker does not pay for
+    `Initialize` again. A client is used by one worker at a time:
+
+    >>> with ClientPool.discover(ui) as pool:
+    >>>     with pool.client() as client:
+    >>>         client.ping("hello")
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[Any],
+        client_factory: ClientFactory,
+    ) -> None:
+        """Connect to all `devices` concurrently.
+
+        `client_factory` turns an item of `devices` (typically a `Transport`) into a
+        `TrezorClient`. Devices that fail to connect are logged and left out.
+        """
+        self.clients: List[TrezorClient] = []
+        self._idle: "queue.Queue[TrezorClient]" = queue.Queue()
+
+        devices = list(devices)
+        if devices:
+            workers = min(len(devices), MAX_CONNECT_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda d: self._connect(d, client_factory), devices
+                )
+                self.clients = [c for c in results if c is not None]
+
+        for client in self.clients:
+            self._idle.put(client)
+
+    @staticmethod
+    def _connect(device: Any, client_factory: ClientFactory) -> Optional[TrezorClient]:
+        try:
+            client = client_factory(device)
+            client.open()
+            return client
+        except Exception as e:
+            excname = e.__class__.__name__
+            LOG.error(f"Failed to connect to {device}. {excname}: {e}")
+            return None
+
+    @classmethod
+    def discover(
+        cls: Type["T"],
+        ui: "TrezorClientUI",
+        models: Optional[Iterable["TrezorModel"]] = None,
+    ) -> "T":
+        """Create a pool of all devices found on all transports.
+
+        UDP ports to probe are taken from `UdpTransport.ENUMERATE_PORTS`.
+        """
+        transports = enumerate_devices(models, parallel=True)
+        return cls(transports, lambda t: TrezorClient(t, ui=ui))
+
+    @classmethod
+    def from_paths(cls: Type["T"], ui: "TrezorClientUI", paths: Sequence[str]) -> "T":
+        """Create a pool of devices at the given paths, e.g. `udp:127.0.0.1:21324`."""
+
+        # paths are resolved by the factory, so that lookups also run concurrently
+        return cls(paths, lambda path: TrezorClient(get_transport(path), ui=ui))
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __enter__(self: "T") -> "T":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def acquire(self, timeout: Optional[float] = None) -> TrezorClient:
+        """Take an idle client out of the pool.
+
+        Blocks until a client is available, or raises `PoolExhausted` after `timeout`
+        seconds.
+        """
+        if not self.clients:
+            raise PoolExhausted("No devices in pool")
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise PoolExhausted("No idle device available") from None
+
+    def release(self, client: TrezorClient) -> None:
+        """Return a client taken by `acquire` to the pool."""
+        self._idle.put(client)
+
+    @contextmanager
+    def client(
+        self, timeout: Optional[float] = None
+    ) -> Generator[TrezorClient, None, None]:
+        client = self.acquire(timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self) -> None:
+        """End the sessions of all clients in the pool."""
+        for client in self.clients:
+            try:
+                client.close()
+            except Exception as e:
+                LOG.error(f"Failed to close {client.transport}: {e}")
+        self.clients = []
+        self._idle = queue.Queue()
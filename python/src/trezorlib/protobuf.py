@@ -26,9 +26,19 @@ import logging
 import warnings
 from dataclasses import dataclass
 from enum import IntEnum
-from io import BytesIO
 from itertools import zip_longest
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Protocol, TypeGuard
 
@@ -244,9 +254,7 @@ class MessageType(metaclass=_MessageTypeMeta):
         return f"<{self.__class__.__name__}: {d}>"
 
     def ByteSize(self) -> int:
-        data = BytesIO()
-        dump_message(data, self)
-        return len(data.getvalue())
+        return len(encode_message(self))
 
 
 class LimitedReader:
@@ -474,7 +482,7 @@ def dump_message(writer: Writer, msg: "MessageType") -> None:
                 dump_uvarint(writer, int(svalue))
 
             elif field.type == "bytes":
-                assert isinstance(svalue, (bytes, bytearray))
+                assert isinstance(svalue, (bytes, bytearray, memoryview))
                 dump_uvarint(writer, len(svalue))
                 writer.write(svalue)
 
@@ -488,6 +496,339 @@ def dump_message(writer: Writer, msg: "MessageType") -> None:
                 raise TypeError
 
 
+# Compiled codec
+#
+# `load_message` and `dump_message` work on arbitrary streams and resolve the type of
+# every field on every call. `encode_message` and `decode_message` work on in-memory
+# buffers instead, and use a plan that is built once per message class: field keys
+# are pre-encoded, type objects are resolved, and every field gets a `kind` that
+# selects the codec branch directly. The two paths produce identical results.
+
+_KIND_UNKNOWN = 0
+_KIND_MESSAGE = 1
+_KIND_ENUM = 2
+_KIND_UINT = 3
+_KIND_SINT = 4
+_KIND_BOOL = 5
+_KIND_BYTES = 6
+_KIND_STRING = 7
+
+_SCALAR_KINDS = {
+    "uint32": _KIND_UINT,
+    "uint64": _KIND_UINT,
+    "sint32": _KIND_SINT,
+    "sint64": _KIND_SINT,
+    "bool": _KIND_BOOL,
+    "bytes": _KIND_BYTES,
+    "string": _KIND_STRING,
+}
+
+_INT_BOUNDS = {
+    "uint32": (0, 2**32),
+    "uint64": (0, 2**64),
+    "sint32": (-(2**31), 2**31),
+    "sint64": (-(2**63), 2**63),
+}
+
+
+class _FieldPlan(NamedTuple):
+    field: Field
+    name: str
+    key: bytes
+    wire_type: int
+    repeated: bool
+    kind: int
+    type_object: Any
+    bounds: Tuple[int, int]
+    enum_values: FrozenSet[int]
+
+
+class _MessagePlan(NamedTuple):
+    fields: Tuple[_FieldPlan, ...]
+    by_tag: Dict[int, _FieldPlan]
+    template: Dict[str, Any]
+    repeated: Tuple[str, ...]
+    required: Tuple[str, ...]
+
+
+_PLANS: Dict[type, _MessagePlan] = {}
+
+
+def _uvarint_bytes(n: int) -> bytes:
+    out = bytearray()
+    _append_uvarint(out, n)
+    return bytes(out)
+
+
+def _append_uvarint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_uvarint(buf: bytes, pos: int, end: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= end:
+            raise IOError("Interrupted UVarint")
+        byte = buf[pos]
+        pos += 1
+        result += (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _build_field_plan(ftag: int, field: Field) -> _FieldPlan:
+    type_object: Any = None
+    enum_values: FrozenSet[int] = frozenset()
+    kind = _SCALAR_KINDS.get(field.type, _KIND_UNKNOWN)
+    if kind == _KIND_UNKNOWN:
+        type_object = get_field_type_object(field)
+        if safe_issubclass(type_object, MessageType):
+            kind = _KIND_MESSAGE
+        elif safe_issubclass(type_object, IntEnum):
+            kind = _KIND_ENUM
+            enum_values = frozenset(type_object.__members__.values())
+
+    if kind == _KIND_UNKNOWN:
+        wire_type = -1
+        key = b""
+    else:
+        wire_type = field.wire_type
+        key = _uvarint_bytes((ftag << 3) | wire_type)
+
+    return _FieldPlan(
+        field=field,
+        name=field.name,
+        key=key,
+        wire_type=wire_type,
+        repeated=field.repeated,
+        kind=kind,
+        type_object=type_object,
+        bounds=_INT_BOUNDS.get(field.type, (0, 0)),
+        enum_values=enum_values,
+    )
+
+
+def _build_plan(msg_type: type) -> _MessagePlan:
+    fields = tuple(
+        _build_field_plan(ftag, field) for ftag, field in msg_type.FIELDS.items()
+    )
+    template: Dict[str, Any] = {}
+    for fplan in fields:
+        # required fields are pre-seeded with the placeholder to keep field order
+        if fplan.field.required and not fplan.repeated:
+            template[fplan.name] = REQUIRED_FIELD_PLACEHOLDER
+        else:
+            template[fplan.name] = fplan.field.default
+    plan = _MessagePlan(
+        fields=fields,
+        by_tag=dict(zip(msg_type.FIELDS.keys(), fields)),
+        template=template,
+        repeated=tuple(f.name for f in fields if f.repeated),
+        required=tuple(f.name for f in fields if f.field.required and not f.repeated),
+    )
+    _PLANS[msg_type] = plan
+    return plan
+
+
+def _encode_into(out: bytearray, msg: "MessageType") -> None:
+    mtype = msg.__class__
+    plan = _PLANS.get(mtype) or _build_plan(mtype)
+
+    for fplan in plan.fields:
+        name = fplan.name
+        fvalue = getattr(msg, name, None)
+
+        if fvalue is REQUIRED_FIELD_PLACEHOLDER:
+            raise ValueError(f"Required value of field {name} was not provided")
+
+        if fvalue is None:
+            # not sending empty values
+            continue
+
+        kind = fplan.kind
+        if kind == _KIND_UNKNOWN:
+            raise ValueError(f"Unrecognized type for field {name}")
+
+        key = fplan.key
+        for svalue in fvalue if fplan.repeated else (fvalue,):
+            out += key
+
+            if kind == _KIND_MESSAGE:
+                if not isinstance(svalue, fplan.type_object):
+                    raise ValueError(
+                        f"Value {svalue} in field {name} is not {fplan.type_object.__name__}"
+                    )
+                # encode in place, then insert the length prefix in front
+                start = len(out)
+                _encode_into(out, svalue)
+                out[start:start] = _uvarint_bytes(len(out) - start)
+
+            elif kind == _KIND_ENUM:
+                if svalue not in fplan.enum_values:
+                    raise ValueError(
+                        f"Value {svalue} in field {name} unknown for {fplan.field.type}"
+                    )
+                _append_uvarint(out, svalue)
+
+            elif kind == _KIND_UINT or kind == _KIND_SINT:
+                low, high = fplan.bounds
+                if not low <= svalue < high:
+                    raise ValueError(
+                        f"Value {svalue} in field {name} does not fit into {fplan.field.type}"
+                    )
+                if kind == _KIND_SINT:
+                    svalue = sint_to_uint(svalue)
+                _append_uvarint(out, svalue)
+
+            elif kind == _KIND_BOOL:
+                _append_uvarint(out, int(svalue))
+
+            elif kind == _KIND_BYTES:
+                assert isinstance(svalue, (bytes, bytearray, memoryview))
+                _append_uvarint(out, len(svalue))
+                out += svalue
+
+            else:  # _KIND_STRING
+                assert isinstance(svalue, str)
+                svalue_bytes = svalue.encode()
+                _append_uvarint(out, len(svalue_bytes))
+                out += svalue_bytes
+
+
+def _decode_varint_value(fplan: _FieldPlan, value: int) -> Any:
+    kind = fplan.kind
+    if kind == _KIND_ENUM:
+        try:
+            return fplan.type_object(value)
+        except ValueError as e:
+            # treat enum errors as warnings
+            LOG.info(f"On field {fplan.name}: {e}")
+            return value
+
+    if kind == _KIND_UINT or kind == _KIND_SINT:
+        if kind == _KIND_SINT:
+            value = uint_to_sint(value)
+        low, high = fplan.bounds
+        if not low <= value < high:
+            LOG.info(
+                f"On field {fplan.name}: value {value} out of range for {fplan.field.type}"
+            )
+        return value
+
+    if kind == _KIND_BOOL:
+        return bool(value)
+
+    raise TypeError  # not a varint field or unknown type
+
+
+def _decode_from(buf: bytes, pos: int, end: int, msg_type: Type[MT]) -> MT:
+    plan = _PLANS.get(msg_type) or _build_plan(msg_type)
+    msg_dict = plan.template.copy()
+    for name in plan.repeated:
+        msg_dict[name] = []
+
+    by_tag = plan.by_tag
+    while pos < end:
+        fkey, pos = _read_uvarint(buf, pos, end)
+        ftag = fkey >> 3
+        wtype = fkey & 7
+
+        fplan = by_tag.get(ftag)
+        if fplan is None:  # unknown field, skip it
+            if wtype == WIRE_TYPE_INT:
+                _, pos = _read_uvarint(buf, pos, end)
+            elif wtype == WIRE_TYPE_LENGTH:
+                ivalue, pos = _read_uvarint(buf, pos, end)
+                pos += ivalue
+                if pos > end:
+                    raise IOError(f"Interrupted value of unknown field {ftag}")
+            else:
+                raise ValueError
+            continue
+
+        kind = fplan.kind
+        if kind == _KIND_UNKNOWN:
+            raise ValueError(f"Unrecognized type for field {fplan.name}")
+
+        if wtype == WIRE_TYPE_LENGTH:
+            length, pos = _read_uvarint(buf, pos, end)
+            field_end = pos + length
+            if field_end > end:
+                raise IOError(f"Interrupted value of field {fplan.name}")
+
+            if fplan.wire_type == WIRE_TYPE_INT and fplan.repeated:
+                # packed array
+                values = msg_dict[fplan.name]
+                while pos < field_end:
+                    value, pos = _read_uvarint(buf, pos, field_end)
+                    values.append(_decode_varint_value(fplan, value))
+                continue
+
+            if fplan.wire_type != WIRE_TYPE_LENGTH:
+                raise ValueError(
+                    f"Field {fplan.name} received value does not match schema"
+                )
+
+            if kind == _KIND_BYTES:
+                fvalue: Any = bytes(buf[pos:field_end])
+            elif kind == _KIND_STRING:
+                fvalue = bytes(buf[pos:field_end]).decode()
+            else:  # _KIND_MESSAGE
+                fvalue = _decode_from(buf, pos, field_end, fplan.type_object)
+            pos = field_end
+
+        elif wtype == WIRE_TYPE_INT:
+            if fplan.wire_type != WIRE_TYPE_INT:
+                raise ValueError(
+                    f"Field {fplan.name} received value does not match schema"
+                )
+            value, pos = _read_uvarint(buf, pos, end)
+            fvalue = _decode_varint_value(fplan, value)
+
+        else:
+            raise ValueError(f"Field {fplan.name} received value does not match schema")
+
+        if fplan.repeated:
+            msg_dict[fplan.name].append(fvalue)
+        else:
+            msg_dict[fplan.name] = fvalue
+
+    for name in plan.required:
+        if msg_dict[name] is REQUIRED_FIELD_PLACEHOLDER:
+            raise ValueError(f"Did not receive value for field {name}")
+
+    # all fields are already in place, so the constructor can be skipped
+    msg = msg_type.__new__(msg_type)
+    msg.__dict__.update(msg_dict)
+    return msg
+
+
+def encode_message(msg: "MessageType") -> bytes:
+    """Serialize a message into bytes.
+
+    Equivalent to `dump_message` into a `BytesIO`, but uses a cached per-class plan
+    and serializes every nested message only once.
+    """
+    out = bytearray()
+    _encode_into(out, msg)
+    return bytes(out)
+
+
+def decode_message(data: bytes, msg_type: Type[MT]) -> MT:
+    """Deserialize a message from a bytes-like object.
+
+    Equivalent to `load_message` from a `BytesIO`, but uses a cached per-class plan.
+    """
+    return _decode_from(data, 0, len(data), msg_type)
+
+
 def format_message(
     pb: "MessageType",
     indent: int = 0,
@@ -1,14 +1,17 @@
 from typing import TYPE_CHECKING
 
-from typing import Optional
+from typing import Iterator, Optional, Sequence
 
-from . import messages
-from .tools import expect
+from . import exceptions, messages
+from .tools import expect, split_ranges
 
 if TYPE_CHECKING:
     from .client import TrezorClient
     from .tools import Address
 
+# Maximum number of addresses in a single SolanaGetAddressBatch request
+MAX_ADDRESS_BATCH = 64
+
 
 @expect(messages.SolanaAddress)
 def get_address(client: "TrezorClient", n: "Address", show_display: bool = False):
@@ -17,6 +20,31 @@ def get_address(client: "TrezorClient", n: "Address", show_display: bool = False
     )
 
 
+def get_addresses_batch(
+    client: "TrezorClient",
+    ranges: Sequence[messages.SolanaAddressRange],
+    include_public_keys: bool = False,
+    chunk_size: int = MAX_ADDRESS_BATCH,
+) -> Iterator[messages.SolanaAddressBatch]:
+    """Get the addresses of the given ranges without showing them on the device.
+
+    Solana paths are hardened, so the ranges usually start at a hardened index.
+    See `btc.get_addresses_batch` for how the ranges are split into requests.
+    """
+    if not 0 < chunk_size <= MAX_ADDRESS_BATCH:
+        raise ValueError(f"Chunk size must be between 1 and {MAX_ADDRESS_BATCH}")
+
+    for chunk in split_ranges(ranges, chunk_size):
+        res = client.call(
+            messages.SolanaGetAddressBatch(
+                ranges=chunk, include_public_keys=include_public_keys
+            )
+        )
+        if not isinstance(res, messages.SolanaAddressBatch):
+            raise exceptions.TrezorException("Unexpected message")
+        yield res
+
+
 @expect(messages.SolanaSignedTx)
 def sign_tx(
     client: "TrezorClient",
@@ -14,10 +14,11 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
-import struct
+import sys
 import zlib
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from functools import lru_cache
+from typing import Callable, Tuple
 
 from typing_extensions import Literal
 
@@ -32,6 +33,13 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 RGBPixel = Tuple[int, int, int]
 
@@ -45,70 +53,131 @@ def _decompress(data: bytes) -> bytes:
     return zlib.decompress(data, wbits=-10)
 
 
-def _from_pil_rgb(pixels: Sequence[RGBPixel], little_endian: bool) -> bytes:
-    data = bytearray()
-    for r, g, b in pixels:
-        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
-        if little_endian:
-            data += struct.pack("<H", c)
-        else:
-            data += struct.pack(">H", c)
-    return bytes(data)
+def _table(fn: Callable[[int], int]) -> bytes:
+    return bytes(fn(i) & 0xFF for i in range(256))
 
 
-def _to_rgb(data: bytes, little_endian: bool) -> bytes:
-    res = bytearray()
-    for i in range(0, len(data), 2):
-        if little_endian:
-            (c,) = struct.unpack("<H", data[i : i + 2])
-        else:
-            (c,) = struct.unpack(">H", data[i : i + 2])
-        r = (c & 0xF800) >> 8
-        g = (c & 0x07E0) >> 3
-        b = (c & 0x001F) << 3
-        res += bytes((r, g, b))
+# Per-byte lookup tables for the pure-Python conversion path. Every output byte is
+# assembled from one or two translated planes of the input, so the work per pixel
+# happens inside `bytes.translate` and slice assignment instead of in a Python loop.
+_R_TO_HI = _table(lambda r: r & 0xF8)
+_G_TO_HI = _table(lambda g: g >> 5)
+_G_TO_LO = _table(lambda g: g << 3 & 0xE0)
+_B_TO_LO = _table(lambda b: b >> 3)
+
+_HI_TO_R = _table(lambda hi: hi & 0xF8)
+_HI_TO_G = _table(lambda hi: (hi & 0x07) << 5)
+_LO_TO_G = _table(lambda lo: (lo & 0xE0) >> 3)
+_LO_TO_B = _table(lambda lo: (lo & 0x1F) << 3)
+
+_HIGH_NIBBLE = _table(lambda p: p & 0xF0)
+_TO_LOW_NIBBLE = _table(lambda p: p >> 4)
+_FROM_LOW_NIBBLE = _table(lambda p: (p & 0x0F) << 4)
+
+
+def _or(a: bytes, b: bytes) -> bytes:
+    """Bitwise OR of two byte strings of equal length."""
+    value = int.from_bytes(a, "little") | int.from_bytes(b, "little")
+    return value.to_bytes(len(a), "little")
+
+
+def _interleave(*planes: bytes) -> bytes:
+    step = len(planes)
+    res = bytearray(len(planes[0]) * step)
+    for i, plane in enumerate(planes):
+        res[i::step] = plane
     return bytes(res)
 
 
-def _from_pil_grayscale(pixels: Sequence[int], right_hi: bool) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left, right = pixels[i], pixels[i + 1]
-        if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
-        else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
-
-
-def _from_pil_grayscale_alpha(
-    pixels: Sequence[Tuple[int, int]], right_hi: bool
-) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left_w_alpha, right_w_alpha = pixels[i], pixels[i + 1]
-        left = int((left_w_alpha[0] * left_w_alpha[1]) / 255)
-        right = int((right_w_alpha[0] * right_w_alpha[1]) / 255)
-        if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
-        else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
+@lru_cache(maxsize=None)
+def _premultiply_table() -> bytes:
+    """Grayscale value for every (gray, alpha) pair read as a native uint16."""
+    table = bytearray(0x10000)
+    for gray in range(256):
+        for alpha in range(256):
+            pair = bytes((gray, alpha))
+            table[int.from_bytes(pair, sys.byteorder)] = gray * alpha // 255
+    return bytes(table)
+
+
+def _from_pil_rgb(pixels: bytes, little_endian: bool) -> bytes:
+    """Convert raw 8-bit RGB pixels to RGB565."""
+    if NUMPY_AVAILABLE:
+        rgb = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, 3).astype(np.uint16)
+        c = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+        return c.astype("<u2" if little_endian else ">u2").tobytes()
+
+    r, g, b = pixels[0::3], pixels[1::3], pixels[2::3]
+    hi = _or(r.translate(_R_TO_HI), g.translate(_G_TO_HI))
+    lo = _or(g.translate(_G_TO_LO), b.translate(_B_TO_LO))
+    if little_endian:
+        return _interleave(lo, hi)
+    else:
+        return _interleave(hi, lo)
+
+
+def _to_rgb(data: bytes, little_endian: bool) -> bytes:
+    """Convert RGB565 data to raw 8-bit RGB pixels."""
+    if NUMPY_AVAILABLE:
+        c = np.frombuffer(data, dtype="<u2" if little_endian else ">u2")
+        rgb = np.empty((len(c), 3), dtype=np.uint8)
+        rgb[:, 0] = (c & 0xF800) >> 8
+        rgb[:, 1] = (c & 0x07E0) >> 3
+        rgb[:, 2] = (c & 0x001F) << 3
+        return rgb.tobytes()
+
+    if little_endian:
+        lo, hi = data[0::2], data[1::2]
+    else:
+        hi, lo = data[0::2], data[1::2]
+    r = hi.translate(_HI_TO_R)
+    g = _or(hi.translate(_HI_TO_G), lo.translate(_LO_TO_G))
+    b = lo.translate(_LO_TO_B)
+    return _interleave(r, g, b)
+
+
+def _from_pil_grayscale(pixels: bytes, right_hi: bool) -> bytes:
+    """Pack raw 8-bit grayscale pixels into 4-bit pairs."""
+    if right_hi:
+        hi, lo = pixels[1::2], pixels[0::2]
+    else:
+        hi, lo = pixels[0::2], pixels[1::2]
+
+    if NUMPY_AVAILABLE:
+        hi_arr = np.frombuffer(hi, dtype=np.uint8)
+        lo_arr = np.frombuffer(lo, dtype=np.uint8)
+        return ((hi_arr & 0xF0) | (lo_arr >> 4)).tobytes()
+
+    return _or(hi.translate(_HIGH_NIBBLE), lo.translate(_TO_LOW_NIBBLE))
+
+
+def _from_pil_grayscale_alpha(pixels: bytes, right_hi: bool) -> bytes:
+    """Pack raw 8-bit grayscale+alpha pixels into 4-bit pairs, blended onto black."""
+    if NUMPY_AVAILABLE:
+        la = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, 2).astype(np.uint16)
+        gray = ((la[:, 0] * la[:, 1]) // 255).astype(np.uint8).tobytes()
+    else:
+        table = _premultiply_table()
+        gray = bytes(map(table.__getitem__, memoryview(pixels).cast("H")))
+    return _from_pil_grayscale(gray, right_hi)
 
 
 def _to_grayscale(data: bytes, right_hi: bool) -> bytes:
-    res = bytearray()
-    for pixel in data:
-        if right_hi:
-            right = pixel & 0xF0
-            left = (pixel & 0x0F) << 4
-        else:
-            left = pixel & 0xF0
-            right = (pixel & 0x0F) << 4
-        res += bytes((left, right))
-    return bytes(res)
+    """Unpack 4-bit grayscale pairs to raw 8-bit grayscale pixels."""
+    if NUMPY_AVAILABLE:
+        packed = np.frombuffer(data, dtype=np.uint8)
+        res = np.empty(len(packed) * 2, dtype=np.uint8)
+        first, second = (1, 0) if right_hi else (0, 1)
+        res[first::2] = packed & 0xF0
+        res[second::2] = (packed & 0x0F) << 4
+        return res.tobytes()
+
+    high = data.translate(_HIGH_NIBBLE)
+    low = data.translate(_FROM_LOW_NIBBLE)
+    if right_hi:
+        return _interleave(low, high)
+    else:
+        return _interleave(high, low)
 
 
 @dataclass
@@ -201,27 +270,27 @@ def from_image(
             raise ValueError("Only even-width grayscale images are supported")
         if not legacy_format:
             toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=True)
+            toif_data = _from_pil_grayscale(image.tobytes(), right_hi=True)
         else:
             toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=False)
+            toif_data = _from_pil_grayscale(image.tobytes(), right_hi=False)
     elif image.mode == "LA":
         toif_mode = firmware.ToifMode.grayscale
         if image.size[0] % 2 != 0:
             raise ValueError("Only even-width grayscale images are supported")
         if not legacy_format:
             toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=True)
+            toif_data = _from_pil_grayscale_alpha(image.tobytes(), right_hi=True)
         else:
             toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=False)
+            toif_data = _from_pil_grayscale_alpha(image.tobytes(), right_hi=False)
     elif image.mode == "RGB":
         if not legacy_format:
             toif_mode = firmware.ToifMode.full_color_le
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=True)
+            toif_data = _from_pil_rgb(image.tobytes(), little_endian=True)
         else:
             toif_mode = firmware.ToifMode.full_color
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=False)
+            toif_data = _from_pil_rgb(image.tobytes(), little_endian=False)
     else:
         raise ValueError(f"Unsupported image mode: {image.mode}")
 
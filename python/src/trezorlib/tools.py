@@ -19,12 +19,15 @@ import hashlib
 import re
 import struct
 import unicodedata
+from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
     AnyStr,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     NewType,
     Optional,
@@ -311,6 +314,34 @@ def session(
     return wrapped_f
 
 
+def split_ranges(ranges: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split address ranges into chunks of at most `chunk_size` addresses.
+
+    The ranges are messages with `start` and `count` fields. A range that does not
+    fit into the current chunk is continued by a copy in the next one. Empty ranges
+    are dropped.
+    """
+    chunk: List[Any] = []
+    space = chunk_size
+    for r in ranges:
+        start, count = r.start, r.count
+        while count > 0:
+            n = min(count, space)
+            part = copy(r)
+            part.start = start
+            part.count = n
+            chunk.append(part)
+            start += n
+            count -= n
+            space -= n
+            if space == 0:
+                yield chunk
+                chunk = []
+                space = chunk_size
+    if chunk:
+        yield chunk
+
+
 # de-camelcasifier
 # https://stackoverflow.com/a/1176023/222189
 
@@ -15,6 +15,7 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Iterable,
@@ -127,21 +128,43 @@ def all_transports() -> Iterable[Type["Transport"]]:
     return set(t for t in transports if t.ENABLED)
 
 
+def _enumerate_transport(
+    transport: Type["Transport"], models: Optional[Iterable["TrezorModel"]]
+) -> List["Transport"]:
+    name = transport.__name__
+    try:
+        found = list(transport.enumerate(models))
+        LOG.info(f"Enumerating {name}: found {len(found)} devices")
+        return found
+    except NotImplementedError:
+        LOG.error(f"{name} does not implement device enumeration")
+    except Exception as e:
+        excname = e.__class__.__name__
+        LOG.error(f"Failed to enumerate {name}. {excname}: {e}")
+    return []
+
+
 def enumerate_devices(
     models: Optional[Iterable["TrezorModel"]] = None,
+    parallel: bool = False,
 ) -> Sequence["Transport"]:
+    """Find devices on all enabled transports.
+
+    With `parallel=True`, all transports are probed at the same time, so the total
+    latency is that of the slowest transport instead of the sum of all of them.
+    """
+    transports = list(all_transports())
+    if parallel and len(transports) > 1:
+        with ThreadPoolExecutor(max_workers=len(transports)) as executor:
+            results = list(
+                executor.map(lambda t: _enumerate_transport(t, models), transports)
+            )
+    else:
+        results = [_enumerate_transport(t, models) for t in transports]
+
     devices: List["Transport"] = []
-    for transport in all_transports():
-        name = transport.__name__
-        try:
-            found = list(transport.enumerate(models))
-            LOG.info(f"Enumerating {name}: found {len(found)} devices")
-            devices.extend(found)
-        except NotImplementedError:
-            LOG.error(f"{name} does not implement device enumeration")
-        except Exception as e:
-            excname = e.__class__.__name__
-            LOG.error(f"Failed to enumerate {name}. {excname}: {e}")
+    for found in results:
+        devices.extend(found)
     return devices
 
 
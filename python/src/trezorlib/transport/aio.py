@@ -0,0 +1,320 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""asyncio counterparts of the UDP and Bridge transports.
+
+The async transports have the same shape as `Transport`, except that all operations
+that touch the network are coroutines. Message framing is shared with the blocking
+implementations: UDP uses `ProtocolV1` to pack and parse reports, Bridge uses the same
+header format as `BridgeTransport`.
+"""
+
+import asyncio
+import json
+import logging
+import struct
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from ..log import DUMP_PACKETS
+from . import DeviceIsBusy, MessagePayload, TransportException
+from .bridge import TREZORD_HOST, TREZORD_ORIGIN_HEADER, BridgeException
+from .protocol import REPLEN, ProtocolV1
+from .udp import SOCKET_TIMEOUT, UdpTransport
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncTransport:
+    """Raw asynchronous connection to a Trezor device.
+
+    See `Transport` for the meaning of individual methods.
+    """
+
+    PATH_PREFIX: str
+
+    def __str__(self) -> str:
+        return self.get_path()
+
+    def get_path(self) -> str:
+        raise NotImplementedError
+
+    async def begin_session(self) -> None:
+        raise NotImplementedError
+
+    async def end_session(self) -> None:
+        raise NotImplementedError
+
+    async def read(self) -> MessagePayload:
+        raise NotImplementedError
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        raise NotImplementedError
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Union[bytes, Exception]]" = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.queue.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.queue.put_nowait(exc)
+
+
+class AsyncUdpTransport(AsyncTransport):
+    """UDP transport to an emulator, driven by the running event loop."""
+
+    PATH_PREFIX = UdpTransport.PATH_PREFIX
+
+    def __init__(self, device: Optional[str] = None) -> None:
+        self.device = UdpTransport(device).device
+        self.session_counter = 0
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._protocol: Optional[_DatagramQueue] = None
+
+    def get_path(self) -> str:
+        return "{}:{}:{}".format(self.PATH_PREFIX, *self.device)
+
+    def find_debug(self) -> "AsyncUdpTransport":
+        host, port = self.device
+        return AsyncUdpTransport(f"{host}:{port + 1}")
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            _DatagramQueue, remote_addr=self.device
+        )
+        self._transport = transport
+        self._protocol = protocol
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+        self._transport = None
+        self._protocol = None
+
+    async def begin_session(self) -> None:
+        if self.session_counter == 0:
+            await self.open()
+        self.session_counter += 1
+
+    async def end_session(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            await self.close()
+
+    async def _recv(self, timeout: Optional[float]) -> bytes:
+        assert self._protocol is not None
+        data = await asyncio.wait_for(self._protocol.queue.get(), timeout)
+        if isinstance(data, Exception):
+            raise TransportException(f"Failed to read from {self}: {data}") from data
+        return data
+
+    async def ping(self, timeout: float = SOCKET_TIMEOUT) -> bool:
+        """Test if the device is listening."""
+        assert self._transport is not None
+        try:
+            self._transport.sendto(b"PINGPING")
+            return await self._recv(timeout) == b"PONGPONG"
+        except (TransportException, asyncio.TimeoutError):
+            return False
+
+    async def wait_until_ready(self, timeout: float = 10) -> None:
+        loop = asyncio.get_running_loop()
+        await self.open()
+        try:
+            deadline = loop.time() + timeout
+            while not await self.ping(timeout=0.05):
+                if loop.time() >= deadline:
+                    raise TransportException("Timed out waiting for connection.")
+        finally:
+            await self.close()
+
+    async def write_chunk(self, chunk: bytes) -> None:
+        assert self._transport is not None
+        if len(chunk) != REPLEN:
+            raise TransportException("Unexpected data length")
+        LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
+        self._transport.sendto(chunk)
+
+    async def read_chunk(self) -> bytes:
+        # unlike the blocking socket, waiting does not occupy a thread,
+        # so we can simply wait until the device answers
+        chunk = await self._recv(None)
+        LOG.log(DUMP_PACKETS, f"received packet: {chunk.hex()}")
+        if len(chunk) != REPLEN:
+            raise TransportException(f"Unexpected chunk size: {len(chunk)}")
+        return chunk
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        reports = ProtocolV1.pack_reports(message_type, message_data)
+        for offset in range(0, len(reports), REPLEN):
+            await self.write_chunk(bytes(reports[offset : offset + REPLEN]))
+
+    async def read(self) -> MessagePayload:
+        msg_type, datalen, first_chunk = ProtocolV1.parse_first(await self.read_chunk())
+
+        buffer = bytearray(datalen)
+        pos = min(len(first_chunk), datalen)
+        buffer[:pos] = first_chunk[:pos]
+
+        while pos < datalen:
+            chunk = ProtocolV1.parse_next(await self.read_chunk())
+            end = min(pos + len(chunk), datalen)
+            buffer[pos:end] = chunk[: end - pos]
+            pos = end
+
+        return msg_type, buffer
+
+    @classmethod
+    async def find_by_path(cls, path: str) -> "AsyncUdpTransport":
+        path = path.replace(f"{cls.PATH_PREFIX}:", "")
+        d = cls(path)
+        await d.open()
+        try:
+            if await d.ping():
+                return d
+            raise TransportException(
+                f"No Trezor device found at address {d.get_path()}"
+            )
+        finally:
+            await d.close()
+
+
+async def call_bridge(path: str, data: Optional[str] = None) -> Tuple[int, bytes]:
+    """POST to trezord and return the status code and body of the response.
+
+    Only the small subset of HTTP/1.1 that trezord speaks is implemented, so that no
+    extra dependency is needed to talk to Bridge from an event loop.
+    """
+    url = urlsplit(TREZORD_HOST)
+    reader, writer = await asyncio.open_connection(url.hostname, url.port)
+    try:
+        body = (data or "").encode()
+        headers = {
+            "Host": f"{url.hostname}:{url.port}",
+            "Content-Length": str(len(body)),
+            "Connection": "close",
+            **TREZORD_ORIGIN_HEADER,
+        }
+        request = f"POST /{path} HTTP/1.1\r\n"
+        request += "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+        writer.write(request.encode() + b"\r\n" + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        status = int(status_line.split()[1])
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).strip()
+            if not line:
+                break
+            key, _, value = line.decode().partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding") == "chunked":
+            parts: List[bytes] = []
+            while True:
+                size = int((await reader.readline()).strip(), 16)
+                if size == 0:
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readline()
+            content = b"".join(parts)
+        elif "content-length" in response_headers:
+            content = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            content = await reader.read()
+        return status, content
+    finally:
+        writer.close()
+
+
+async def call_bridge_json(path: str, data: Optional[str] = None) -> Any:
+    status, content = await call_bridge(path, data)
+    if status != 200:
+        raise BridgeException(path, status, json.loads(content)["error"])
+    return json.loads(content)
+
+
+class AsyncBridgeTransport(AsyncTransport):
+    """Transport through Trezor Bridge, driven by the running event loop.
+
+    Legacy Bridge versions, which only support the `call` endpoint, are not supported.
+    """
+
+    PATH_PREFIX = "bridge"
+
+    def __init__(self, device: Dict[str, Any], debug: bool = False) -> None:
+        self.device = device
+        self.session: Optional[str] = None
+        self.debug = debug
+
+    def get_path(self) -> str:
+        return f"{self.PATH_PREFIX}:{self.device['path']}"
+
+    def find_debug(self) -> "AsyncBridgeTransport":
+        if not self.device.get("debug"):
+            raise TransportException("Debug device not available")
+        return AsyncBridgeTransport(self.device, debug=True)
+
+    async def _call(self, action: str, data: Optional[str] = None) -> bytes:
+        session = self.session or "null"
+        uri = action + "/" + str(session)
+        if self.debug:
+            uri = "debug/" + uri
+        status, content = await call_bridge(uri, data=data)
+        if status != 200:
+            raise BridgeException(uri, status, json.loads(content)["error"])
+        return content
+
+    @classmethod
+    async def enumerate(cls) -> List["AsyncBridgeTransport"]:
+        try:
+            return [cls(dev) for dev in await call_bridge_json("enumerate")]
+        except Exception:
+            return []
+
+    async def begin_session(self) -> None:
+        try:
+            data = await self._call("acquire/" + self.device["path"])
+        except BridgeException as e:
+            if e.message == "wrong previous session":
+                raise DeviceIsBusy(self.device["path"]) from e
+            raise
+        self.session = json.loads(data)["session"]
+
+    async def end_session(self) -> None:
+        if not self.session:
+            return
+        await self._call("release")
+        self.session = None
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        header = struct.pack(">HL", message_type, len(message_data))
+        buf = header + message_data
+        LOG.log(DUMP_PACKETS, f"sending message: {buf.hex()}")
+        await self._call("post", data=buf.hex())
+
+    async def read(self) -> MessagePayload:
+        text = (await self._call("read")).decode()
+        LOG.log(DUMP_PACKETS, f"received message: {text}")
+        data = bytes.fromhex(text)
+        headerlen = struct.calcsize(">HL")
+        msg_type, datalen = struct.unpack(">HL", data[:headerlen])
+        return msg_type, data[headerlen : headerlen + datalen]
@@ -87,6 +87,8 @@ class HidHandle:
 
         if self.hid_version == 2:
             chunk = b"\x00" + chunk
+        else:
+            chunk = bytes(chunk)
 
         LOG.log(DUMP_PACKETS, f"writing packet: {chunk.hex()}")
         self.handle.write(chunk)
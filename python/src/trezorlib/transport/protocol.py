@@ -128,42 +128,82 @@ class ProtocolV1(Protocol):
     HEADER_LEN = struct.calcsize(">HL")
 
     def write(self, message_type: int, message_data: bytes) -> None:
-        header = struct.pack(">HL", message_type, len(message_data))
-        buffer = bytearray(b"##" + header + message_data)
-
-        while buffer:
-            # Report ID, data padded to 63 bytes
-            chunk = b"?" + buffer[: REPLEN - 1]
-            chunk = chunk.ljust(REPLEN, b"\x00")
-            self.handle.write_chunk(chunk)
-            buffer = buffer[63:]
+        reports = self.pack_reports(message_type, message_data)
+        for offset in range(0, len(reports), REPLEN):
+            self.handle.write_chunk(reports[offset : offset + REPLEN])
+
+    @classmethod
+    def pack_reports(cls, message_type: int, message_data: bytes) -> memoryview:
+        """Pack a message into a single buffer of consecutive 64-byte reports.
+
+        The whole message is laid out in one preallocated buffer, so that every report
+        can be handed to the Handle as a slice of it, without copying the remaining
+        data over and over again.
+        """
+        datalen = len(message_data)
+        header_len = 2 + cls.HEADER_LEN
+        count = max(1, -(-(header_len + datalen) // (REPLEN - 1)))
+        # Report ID, data padded to 63 bytes
+        buffer = bytearray(count * REPLEN)
+        view = memoryview(buffer)
+        struct.pack_into(">2sHL", buffer, 1, b"##", message_type, datalen)
+
+        src = memoryview(message_data)
+        pos = 0
+        dst = 1 + header_len
+        for start in range(0, len(buffer), REPLEN):
+            buffer[start] = 0x3F  # "?"
+            end = start + REPLEN
+            n = min(end - dst, datalen - pos)
+            view[dst : dst + n] = src[pos : pos + n]
+            pos += n
+            dst = end + 1
+
+        return view
 
     def read(self) -> MessagePayload:
-        buffer = bytearray()
         # Read header with first part of message data
         msg_type, datalen, first_chunk = self.read_first()
-        buffer.extend(first_chunk)
+
+        # Presize the receive buffer and fill it in place
+        buffer = bytearray(datalen)
+        pos = min(len(first_chunk), datalen)
+        buffer[:pos] = first_chunk[:pos]
 
         # Read the rest of the message
-        while len(buffer) < datalen:
-            buffer.extend(self.read_next())
+        while pos < datalen:
+            chunk = self.read_next()
+            end = pos + len(chunk)
+            if end > datalen:
+                chunk = chunk[: datalen - pos]
+                end = datalen
+            buffer[pos:end] = chunk
+            pos = end
 
-        return msg_type, buffer[:datalen]
+        return msg_type, buffer
 
     def read_first(self) -> Tuple[int, int, bytes]:
-        chunk = self.handle.read_chunk()
+        return self.parse_first(self.handle.read_chunk())
+
+    def read_next(self) -> memoryview:
+        return self.parse_next(self.handle.read_chunk())
+
+    @classmethod
+    def parse_first(cls, chunk: bytes) -> Tuple[int, int, bytes]:
+        """Parse the first report of a message into type, length and first data."""
         if chunk[:3] != b"?##":
             raise RuntimeError("Unexpected magic characters")
         try:
-            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + self.HEADER_LEN])
+            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + cls.HEADER_LEN])
         except Exception:
             raise RuntimeError("Cannot parse header")
 
-        data = chunk[3 + self.HEADER_LEN :]
+        data = chunk[3 + cls.HEADER_LEN :]
         return msg_type, datalen, data
 
-    def read_next(self) -> bytes:
-        chunk = self.handle.read_chunk()
+    @staticmethod
+    def parse_next(chunk: bytes) -> memoryview:
+        """Return data of a continuation report."""
         if chunk[:1] != b"?":
             raise RuntimeError("Unexpected magic characters")
-        return chunk[1:]
+        return memoryview(chunk)[1:]
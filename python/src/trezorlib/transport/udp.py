@@ -17,7 +17,8 @@
 import logging
 import socket
 import time
-from typing import TYPE_CHECKING, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from ..log import DUMP_PACKETS
 from . import TransportException
@@ -27,6 +28,7 @@ if TYPE_CHECKING:
     from ..models import TrezorModel
 
 SOCKET_TIMEOUT = 10
+MAX_PROBE_WORKERS = 32
 
 LOG = logging.getLogger(__name__)
 
@@ -37,6 +39,9 @@ class UdpTransport(ProtocolBasedTransport):
     DEFAULT_PORT = 54935
     PATH_PREFIX = "udp"
     ENABLED = True
+    # Ports probed by `enumerate()`. Set to e.g. `range(21324, 21344, 2)` to find
+    # a rack of emulators (every emulator also uses the next port for debuglink).
+    ENUMERATE_PORTS: Iterable[int] = (DEFAULT_PORT,)
 
     def __init__(self, device: Optional[str] = None) -> None:
         if not device:
@@ -73,14 +78,31 @@ class UdpTransport(ProtocolBasedTransport):
             d.close()
 
     @classmethod
-    def enumerate(
-        cls, _models: Optional[Iterable["TrezorModel"]] = None
-    ) -> Iterable["UdpTransport"]:
-        default_path = f"{cls.DEFAULT_HOST}:{cls.DEFAULT_PORT}"
+    def _probe_path(cls, path: str) -> Optional["UdpTransport"]:
         try:
-            return [cls._try_path(default_path)]
+            return cls._try_path(path)
         except TransportException:
-            return []
+            return None
+
+    @classmethod
+    def enumerate(
+        cls,
+        _models: Optional[Iterable["TrezorModel"]] = None,
+        ports: Optional[Iterable[int]] = None,
+    ) -> Iterable["UdpTransport"]:
+        if ports is None:
+            ports = cls.ENUMERATE_PORTS
+        paths = [f"{cls.DEFAULT_HOST}:{port}" for port in ports]
+        if len(paths) <= 1:
+            found = [cls._probe_path(path) for path in paths]
+        else:
+            # probe all ports at once, so that silent ports do not add up
+            workers = min(len(paths), MAX_PROBE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                found = list(executor.map(cls._probe_path, paths))
+
+        devices: List["UdpTransport"] = [d for d in found if d is not None]
+        return devices
 
     @classmethod
     def find_by_path(cls, path: str, prefix_search: bool = False) -> "UdpTransport":
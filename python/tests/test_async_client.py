@@ -0,0 +1,168 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+
+from trezorlib import exceptions, mapping, messages
+from trezorlib.async_client import AsyncTrezorClient
+from trezorlib.transport.aio import AsyncUdpTransport
+from trezorlib.transport.protocol import REPLEN, ProtocolV1
+
+Handler = Callable[["FakeDevice", "messages.MessageType"], "messages.MessageType"]
+
+
+def features() -> messages.Features:
+    return messages.Features(
+        vendor="trezor.io",
+        model="T",
+        major_version=2,
+        minor_version=5,
+        patch_version=1,
+        session_id=b"\x01" * 32,
+        capabilities=[messages.Capability.PassphraseEntry],
+    )
+
+
+def handle_ping(
+    device: "FakeDevice", msg: messages.MessageType
+) -> messages.MessageType:
+    if isinstance(msg, messages.Initialize):
+        return features()
+    if isinstance(msg, messages.Ping):
+        if msg.button_protection:
+            device.pending = messages.Success(message=msg.message)
+            return messages.ButtonRequest(code=messages.ButtonRequestType.ProtectCall)
+        return messages.Success(message=msg.message)
+    if isinstance(msg, messages.ButtonAck):
+        assert device.pending is not None
+        return device.pending
+    return messages.Failure(code=messages.FailureType.UnexpectedMessage)
+
+
+class FakeDevice(asyncio.DatagramProtocol):
+    """Emulator-like UDP endpoint that answers messages with `handler`."""
+
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.reports: List[bytes] = []
+        self.received: List[messages.MessageType] = []
+        self.pending: Optional[messages.MessageType] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore [assignment]
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        assert self.transport is not None
+        if data == b"PINGPING":
+            self.transport.sendto(b"PONGPONG", addr)
+            return
+
+        self.reports.append(data)
+        msg_type, datalen, payload = ProtocolV1.parse_first(self.reports[0])
+        for report in self.reports[1:]:
+            payload += ProtocolV1.parse_next(report)
+        if len(payload) < datalen:
+            return
+        self.reports = []
+
+        msg = mapping.DEFAULT_MAPPING.decode(msg_type, payload[:datalen])
+        self.received.append(msg)
+        resp_type, resp_data = mapping.DEFAULT_MAPPING.encode(self.handler(self, msg))
+        reports = ProtocolV1.pack_reports(resp_type, resp_data)
+        for offset in range(0, len(reports), REPLEN):
+            self.transport.sendto(bytes(reports[offset : offset + REPLEN]), addr)
+
+
+async def start_device(handler: Handler) -> Tuple[FakeDevice, str]:
+    loop = asyncio.get_running_loop()
+    transport, device = await loop.create_datagram_endpoint(
+        lambda: FakeDevice(handler), local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info("sockname")[1]
+    return device, f"127.0.0.1:{port}"
+
+
+class AsyncUI:
+    def __init__(self) -> None:
+        self.buttons: List[messages.ButtonRequest] = []
+
+    async def button_request(self, br: messages.ButtonRequest) -> None:
+        self.buttons.append(br)
+
+    async def get_pin(self, code: Optional[messages.PinMatrixRequestType]) -> str:
+        raise exceptions.Cancelled
+
+    async def get_passphrase(self, available_on_device: bool) -> str:
+        raise exceptions.Cancelled
+
+
+def test_async_udp_ping():
+    async def run() -> None:
+        device, path = await start_device(handle_ping)
+        found = await AsyncUdpTransport.find_by_path(f"udp:{path}")
+        ui = AsyncUI()
+        client = await AsyncTrezorClient.create(found, ui)
+        assert client.features.model == "T"
+        assert client.session_id == b"\x01" * 32
+
+        async with client:
+            assert await client.ping("hello") == "hello"
+            assert await client.ping("x" * 200, button_protection=True) == "x" * 200
+        assert len(ui.buttons) == 1
+        assert isinstance(device.received[-1], messages.ButtonAck)
+        assert device.transport is not None
+        device.transport.close()
+
+    asyncio.run(run())
+
+
+def test_async_concurrent_devices():
+    async def run() -> None:
+        devices = [await start_device(handle_ping) for _ in range(4)]
+        clients = [
+            await AsyncTrezorClient.create(AsyncUdpTransport(path), AsyncUI())
+            for _, path in devices
+        ]
+        results = await asyncio.gather(
+            *(client.ping(f"device {i}") for i, client in enumerate(clients))
+        )
+        assert results == [f"device {i}" for i in range(len(clients))]
+        for device, _ in devices:
+            assert device.transport is not None
+            device.transport.close()
+
+    asyncio.run(run())
+
+
+def test_async_failure():
+    def handler(device: FakeDevice, msg: messages.MessageType) -> messages.MessageType:
+        if isinstance(msg, messages.Initialize):
+            return features()
+        return messages.Failure(code=messages.FailureType.ActionCancelled)
+
+    async def run() -> None:
+        device, path = await start_device(handler)
+        client = await AsyncTrezorClient.create(AsyncUdpTransport(path), AsyncUI())
+        with pytest.raises(exceptions.Cancelled):
+            await client.call(messages.GetAddress(address_n=[]))
+        assert device.transport is not None
+        device.transport.close()
+
+    asyncio.run(run())
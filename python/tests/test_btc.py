@@ -16,8 +16,9 @@
 
 import json
 from decimal import Decimal
+from typing import Optional
 
-from trezorlib import btc
+from trezorlib import btc, messages
 
 
 # https://btc1.trezor.io/api/tx-specific/f5e735549daeb480d4348f2574b8967a4f149715edb220a742d8bb654d668348
@@ -235,3 +236,126 @@ def test_coinbase_from_json():
     assert coinbase.prev_hash == b"\x00" * 32
     assert coinbase.prev_index == 2 ** 32 - 1
     assert coinbase.script_sig.hex() == tx_dict["vin"][0]["coinbase"]
+
+
+class BatchingDevice:
+    """Requests all inputs and outputs in batches of two, then finishes."""
+
+    def __init__(
+        self, inputs_count: int, outputs_count: int, max_size: Optional[int] = None
+    ) -> None:
+        self.max_size = max_size
+        self.requests = [
+            (messages.RequestType.TXINPUT, i, min(2, inputs_count - i))
+            for i in range(0, inputs_count, 2)
+        ] + [
+            (messages.RequestType.TXOUTPUT, i, min(2, outputs_count - i))
+            for i in range(0, outputs_count, 2)
+        ]
+        self.acks = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def call(self, msg):
+        if isinstance(msg, messages.TxAck):
+            self.acks.append(msg.tx)
+        else:
+            assert msg.batch_size == 2
+        if not self.requests:
+            return messages.TxRequest(request_type=messages.RequestType.TXFINISHED)
+        request_type, index, count = self.requests.pop(0)
+        return messages.TxRequest(
+            request_type=request_type,
+            details=messages.TxRequestDetailsType(
+                request_index=index,
+                request_count=count,
+                request_max_size=self.max_size,
+            ),
+        )
+
+
+def test_sign_tx_batched():
+    inputs = [
+        messages.TxInputType(
+            prev_hash=bytes([i]) * 32,
+            prev_index=i,
+            amount=i,
+            script_type=messages.InputScriptType.EXTERNAL,
+        )
+        for i in range(5)
+    ]
+    outputs = [
+        messages.TxOutputType(address="x", amount=i, script_type=0) for i in range(2)
+    ]
+    device = BatchingDevice(len(inputs), len(outputs))
+    btc.sign_tx(device, "Bitcoin", inputs, outputs, batch_size=2)
+
+    assert [ack.inputs for ack in device.acks[:3]] == [
+        inputs[0:2],
+        inputs[2:4],
+        inputs[4:5],
+    ]
+    assert device.acks[3].outputs == outputs
+
+
+def test_sign_tx_batched_max_size():
+    inputs = [
+        messages.TxInputType(
+            prev_hash=bytes([i]) * 32,
+            prev_index=i,
+            amount=i,
+            script_type=messages.InputScriptType.EXTERNAL,
+            script_sig=bytes(600),
+        )
+        for i in range(3)
+    ]
+    outputs = [messages.TxOutputType(address="x", amount=1, script_type=0)]
+    device = BatchingDevice(len(inputs), len(outputs), max_size=1000)
+    btc.sign_tx(device, "Bitcoin", inputs, outputs, batch_size=2)
+
+    # two inputs don't fit into 1000 bytes, so each batch is cut to one input
+    assert [ack.inputs for ack in device.acks[:2]] == [inputs[0:1], inputs[2:3]]
+    assert all(messages.TxAck(tx=ack).ByteSize() <= 1000 for ack in device.acks)
+
+
+class AddressDevice:
+    """Answers every GetAddressBatch with "coin:start+i" for every address."""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def call(self, msg):
+        self.requests.append(msg)
+        return messages.AddressBatch(
+            addresses=[
+                f"{r.coin_name}:{i}"
+                for r in msg.ranges
+                for i in range(r.start, r.start + r.count)
+            ]
+        )
+
+
+def test_get_addresses_batch():
+    ranges = [
+        messages.AddressRange(address_n=[1], coin_name="Bitcoin", start=0, count=5),
+        messages.AddressRange(address_n=[2], coin_name="Testnet", start=3, count=4),
+    ]
+    device = AddressDevice()
+    batches = btc.get_addresses_batch(device, ranges, chunk_size=4)
+    assert [b.addresses for b in batches] == [
+        ["Bitcoin:0", "Bitcoin:1", "Bitcoin:2", "Bitcoin:3"],
+        ["Bitcoin:4", "Testnet:3", "Testnet:4", "Testnet:5"],
+        ["Testnet:6"],
+    ]
+    assert [
+        [(r.address_n, r.start, r.count) for r in req.ranges]
+        for req in device.requests
+    ] == [
+        [([1], 0, 4)],
+        [([1], 4, 1), ([2], 3, 3)],
+        [([2], 6, 1)],
+    ]
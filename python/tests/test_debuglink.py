@@ -0,0 +1,81 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from trezorlib import mapping, messages
+from trezorlib.debuglink import DebugLink, DebugUI, _batched_input_flow
+
+YES = messages.DebugLinkDecision(button=messages.DebugButton.YES)
+SWIPE = messages.DebugLinkDecision(swipe=messages.DebugSwipeDirection.UP)
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+        self.reads = 0
+
+    def write(self, msg_type, msg_bytes):
+        self.sent.append(mapping.DEFAULT_MAPPING.decode(msg_type, msg_bytes))
+
+    def read(self):
+        self.reads += 1
+        return mapping.DEFAULT_MAPPING.encode(messages.DebugLinkLayout(lines=["a"]))
+
+
+@pytest.fixture
+def debug():
+    return DebugLink(FakeTransport())
+
+
+def test_input_batch(debug):
+    layout = debug.input_batch([SWIPE, SWIPE, YES], wait=True)
+    assert layout.lines == ["a"]
+    assert debug.transport.reads == 1
+    assert [d.wait for d in debug.transport.sent] == [None, None, True]
+    assert debug.transport.sent[0].swipe == messages.DebugSwipeDirection.UP
+    # the passed decisions are not modified
+    assert YES.wait is None
+
+
+def test_batch_context(debug):
+    with debug.batch() as decisions:
+        debug.swipe_up()
+        debug.press_yes()
+        assert debug.transport.sent == []
+        assert len(decisions) == 2
+        with pytest.raises(ValueError):
+            debug.swipe_up(wait=True)
+
+    assert debug.transport.reads == 0
+    assert [d.button for d in debug.transport.sent] == [
+        None,
+        messages.DebugButton.YES,
+    ]
+
+
+def test_batched_input_flow(debug):
+    ui = DebugUI(debug)
+    ui.input_flow = _batched_input_flow(debug, [[SWIPE, YES], [YES]])
+    ui.input_flow.send(None)
+
+    br = messages.ButtonRequest(code=messages.ButtonRequestType.Other)
+    ui.button_request(br)
+    assert len(debug.transport.sent) == 2
+    ui.button_request(br)
+    assert len(debug.transport.sent) == 3
+    assert ui.input_flow is DebugUI.INPUT_FLOW_DONE
+    assert debug.transport.reads == 0
@@ -0,0 +1,66 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import io
+import tarfile
+
+from trezorlib import definitions
+
+TOKEN = "0x" + "ab" * 20
+
+
+def write_archive(path, files):
+    with tarfile.open(path, "w:xz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def test_cached_tar_source(tmp_path):
+    archive = tmp_path / "definitions.tar.xz"
+    cache_dir = tmp_path / "cache"
+    write_archive(
+        archive,
+        {
+            "chain-id/1/network.dat": b"network 1",
+            "slip44/60/network.dat": b"network 60",
+            f"chain-id/1/token-{'ab' * 20}.dat": b"token",
+        },
+    )
+
+    tar_source = definitions.TarSource(archive)
+    source = definitions.cached_tar_source(archive, cache_dir)
+    assert isinstance(source, definitions.IndexedSource)
+    for s in (tar_source, source):
+        assert s.get_network(1) == b"network 1"
+        assert s.get_network_by_slip44(60) == b"network 60"
+        assert s.get_token(1, TOKEN) == b"token"
+        assert s.get_token(1, TOKEN.upper()[2:]) == b"token"
+        assert s.get_network(2) is None
+        assert s.get_token(2, TOKEN) is None
+
+    # the index is reused while the archive does not change
+    (index_path,) = cache_dir.iterdir()
+    mtime = index_path.stat().st_mtime_ns
+    assert definitions.cached_tar_source(archive, cache_dir).get_network(1)
+    assert index_path.stat().st_mtime_ns == mtime
+
+    write_archive(archive, {"chain-id/1/network.dat": b"changed"})
+    source = definitions.cached_tar_source(archive, cache_dir)
+    assert source.get_network(1) == b"changed"
+    assert source.get_network_by_slip44(60) is None
+    assert list(cache_dir.iterdir()) == [index_path]
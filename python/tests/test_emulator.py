@@ -0,0 +1,147 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import socket
+import sys
+import time
+
+import pytest
+
+from trezorlib._internal import emulator as emulator_module
+from trezorlib._internal.emulator import CoreEmulator
+
+# Answers pings like the unix port, but only after `BOOT_DELAY` seconds.
+# With NOTIFY set, it sends the ready notification once the port is bound.
+FAKE_EMULATOR = f"""#!{sys.executable}
+import os, socket, time
+
+time.sleep(float(os.environ["BOOT_DELAY"]))
+sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+sock.bind(("127.0.0.1", int(os.environ["TREZOR_UDP_PORT"])))
+if os.environ.get("NOTIFY") and "TREZOR_UDP_READY_PORT" in os.environ:
+    ready_port = int(os.environ["TREZOR_UDP_READY_PORT"])
+    sock.sendto(b"READY", ("127.0.0.1", ready_port))
+while True:
+    data, addr = sock.recvfrom(64)
+    if data == b"PINGPING":
+        sock.sendto(b"PONGPONG", addr)
+"""
+
+
+class FakeClient:
+    def __init__(self, transport, auto_interact=True):
+        self.transport = transport
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def emulator(tmp_path, monkeypatch):
+    monkeypatch.setenv("BOOT_DELAY", "0.3")
+    # the fake does not speak the wire protocol
+    monkeypatch.setattr(emulator_module, "TrezorClientDebugLink", FakeClient)
+
+    executable = tmp_path / "fake-emu"
+    executable.write_text(FAKE_EMULATOR)
+    executable.chmod(0o755)
+    emu = CoreEmulator(
+        executable, str(tmp_path / "profile"), storage=b"first", port=free_port()
+    )
+    yield emu
+    emu.stop()
+
+
+def test_restore_same_storage(emulator):
+    emulator.start()
+    process = emulator.process
+
+    # RAM state must not survive, so the emulator restarts even with the same image
+    emulator.restore_storage(b"first")
+    assert emulator.process is not process
+    assert process.poll() is not None
+    assert emulator.get_storage() == b"first"
+
+
+def test_restore_other_storage(emulator):
+    emulator.start()
+    process = emulator.process
+
+    emulator.restore_storage(b"second")
+    assert emulator.process is not process
+    assert process.poll() is not None
+    assert emulator.get_storage() == b"second"
+
+
+def test_restore_stopped(emulator):
+    emulator.restore_storage(b"first")
+    assert emulator.process is not None
+    assert emulator.client is not None
+
+
+def test_boot_latency(emulator, caplog):
+    with caplog.at_level("INFO", logger=emulator_module.__name__):
+        emulator.start()
+    assert emulator.boot_latency >= 0.3
+    assert f"booted in {emulator.boot_latency:.3f} seconds" in caplog.text
+    assert emulator.ready_socket is None
+    assert (emulator.profile_dir / "onekey.port").read_text() == f"{emulator.port}\n"
+
+
+def test_ready_notification(emulator, monkeypatch):
+    monkeypatch.setenv("NOTIFY", "1")
+    # without the notification, the emulator would be pinged only after 5 seconds
+    monkeypatch.setattr(emulator_module, "PING_INTERVAL", 5)
+    emulator.start()
+    assert emulator.boot_latency < 2
+
+
+def test_wait_for_notification(emulator):
+    emulator.ready_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    emulator.ready_socket.bind(("127.0.0.1", 0))
+    try:
+        emulator.ready_socket.sendto(b"READY", emulator.ready_socket.getsockname())
+        emulator._wait_for_notification(5)
+        # the notification was consumed, the next wait times out
+        start = time.monotonic()
+        emulator._wait_for_notification(0.1)
+        assert time.monotonic() - start >= 0.05
+    finally:
+        emulator.ready_socket.close()
+        emulator.ready_socket = None
+
+
+def test_wait_until_ready_timeout(emulator, monkeypatch):
+    monkeypatch.setenv("BOOT_DELAY", "10")
+    emulator.process = emulator.launch_process()
+    with pytest.raises(TimeoutError):
+        emulator.wait_until_ready(timeout=0.3)
+
+
+def test_wait_until_ready_died(emulator, monkeypatch):
+    monkeypatch.setenv("BOOT_DELAY", "invalid")
+    emulator.process = emulator.launch_process()
+    with pytest.raises(RuntimeError):
+        emulator.wait_until_ready()
@@ -0,0 +1,131 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+from click.testing import CliRunner
+
+from trezorlib import firmware
+from trezorlib.cli import trezorctl
+
+VERSION = dict(major=0, minor=0, patch=0, build=0)
+
+
+def build_firmware(code: bytes) -> bytes:
+    vendor_header = firmware.VendorHeader.build(
+        dict(
+            header_len=512,
+            expiry=0,
+            version=dict(major=1, minor=0),
+            sig_m=1,
+            pubkeys=[b"\x00" * 32],
+            trust=dict(
+                show_vendor_string=False,
+                require_user_click=False,
+                red_background=False,
+                delay=0,
+            ),
+            text="test",
+            image=dict(
+                format=firmware.ToifMode.full_color,
+                width=1,
+                height=1,
+                data=b"\x03\x00",
+            ),
+            sigmask=0,
+            signature=b"\x00" * 64,
+        )
+    )
+    header = dict(
+        magic=firmware.HeaderType.FIRMWARE,
+        header_len=0,
+        expiry=0,
+        code_length=len(code),
+        version=dict(VERSION, major=2),
+        fix_version=VERSION,
+        onekey_version=VERSION,
+        hash_block=0,
+        hashes=[b"\x00" * 32] * 16,
+        purpose=0,
+        se_minimum_version=VERSION,
+        build_id=b"\x00" * 16,
+        sigmask=0,
+        signature=b"\x00" * 64,
+    )
+    code_offset = len(vendor_header) + len(firmware.FirmwareHeader.build(header))
+    header["hashes"], _ = firmware.calculate_code_hashes(code, code_offset)
+    return vendor_header + firmware.FirmwareImage.build(dict(header=header, code=code))
+
+
+@pytest.fixture
+def firmware_file(tmp_path):
+    path = tmp_path / "firmware.bin"
+    path.write_bytes(build_firmware(bytes(range(256)) * 3000))
+    return path
+
+
+def test_parse_file(firmware_file):
+    version, fw = firmware.parse(firmware_file.read_bytes())
+    with firmware.parse_file(str(firmware_file)) as (file_version, file_fw):
+        assert file_version == version
+        assert file_fw.vendor_header == fw.vendor_header
+        assert file_fw.image.header == fw.image.header
+        assert file_fw.image._code_offset == fw.image._code_offset
+        assert bytes(file_fw.image.code) == fw.image.code
+        assert firmware.digest(file_version, file_fw) == firmware.digest(version, fw)
+        firmware.validate_code_hashes(file_fw, file_version)
+
+
+def test_parse_file_corrupted(firmware_file):
+    data = bytearray(firmware_file.read_bytes())
+    data[-1] ^= 1
+    firmware_file.write_bytes(data)
+    with firmware.parse_file(str(firmware_file)) as (version, fw):
+        with pytest.raises(firmware.FirmwareIntegrityError):
+            firmware.validate_code_hashes(fw, version)
+
+    # truncated image
+    firmware_file.write_bytes(data[:-1])
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        firmware.parse(bytes(data[:-1]))
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        with firmware.parse_file(str(firmware_file)):
+            pass
+
+    firmware_file.write_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        with firmware.parse_file(str(firmware_file)):
+            pass
+
+
+def test_verify_jobs(firmware_file, tmp_path):
+    # the test vendor header is not signed by the bootloader keys
+    bad_code = tmp_path / "bad.bin"
+    data = bytearray(firmware_file.read_bytes())
+    data[-1] ^= 1
+    bad_code.write_bytes(data)
+    bad_magic = tmp_path / "bad_magic.bin"
+    bad_magic.write_bytes(b"XXXX" + data[4:])
+
+    runner = CliRunner()
+    files = [str(firmware_file), str(bad_code), str(bad_magic)]
+    result = runner.invoke(trezorctl.cli, ["firmware", "verify", "-j", "2", *files])
+    assert result.exit_code == 4
+    assert result.output.splitlines() == [
+        f"{firmware_file}: FAILED: Invalid vendor header signature.",
+        f"{bad_code}: FAILED: Invalid vendor header signature.",
+        f"{bad_magic}: FAILED: Unrecognized firmware image type",
+        "Validation failed for 3 of 3 files.",
+    ]
@@ -0,0 +1,74 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+from hashlib import blake2s
+
+from trezorlib import firmware, messages
+
+CHUNK_SIZE = 1000
+
+
+class FakeBootloader:
+    def __init__(self, requests):
+        self.features = messages.Features(
+            major_version=2, minor_version=0, patch_version=0, bootloader_mode=True
+        )
+        self.requests = requests
+        self.expected = None
+        self.received = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def call(self, msg):
+        if isinstance(msg, messages.FirmwareUpload):
+            payload = bytes(msg.payload)
+            assert msg.hash == blake2s(payload).digest()
+            self.received.append((self.expected, payload))
+        if not self.requests:
+            return messages.Success()
+        self.expected = self.requests.pop(0)
+        offset, length = self.expected
+        return messages.FirmwareRequest(offset=offset, length=length)
+
+
+def test_update_sequential():
+    data = bytes(i & 0xFF for i in range(4500))
+    requests = [(i, min(CHUNK_SIZE, len(data) - i)) for i in range(0, 4500, 1000)]
+    client = FakeBootloader(list(requests))
+    progress = []
+
+    firmware.update(client, data, progress.append)
+
+    assert [request for request, _ in client.received] == requests
+    assert b"".join(payload for _, payload in client.received) == data
+    assert progress == [length for _, length in requests]
+
+
+def test_update_out_of_order():
+    data = bytes(i & 0xFF for i in range(3000))
+    # first chunk is re-requested with a different length, last chunk skipped ahead
+    requests = [(0, 500), (0, 1000), (2000, 1000), (1000, 1000)]
+    client = FakeBootloader(list(requests))
+
+    firmware.update(client, data)
+
+    assert [request for request, _ in client.received] == requests
+    for (offset, length), payload in client.received:
+        assert payload == data[offset : offset + length]
@@ -0,0 +1,85 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import threading
+
+import pytest
+
+from trezorlib.pool import ClientPool, PoolExhausted
+
+
+class FakeClient:
+    def __init__(self, path):
+        if path == "broken":
+            raise RuntimeError("cannot connect")
+        self.transport = path
+        self.sessions = 0
+        self.lock = threading.Lock()
+
+    def open(self):
+        self.sessions += 1
+
+    def close(self):
+        self.sessions -= 1
+
+
+def test_pool_connects_and_skips_broken():
+    pool = ClientPool(["a", "broken", "b"], FakeClient)
+    assert len(pool) == 2
+    assert all(client.sessions == 1 for client in pool.clients)
+
+    clients = list(pool.clients)
+    pool.close()
+    assert len(pool) == 0
+    assert all(client.sessions == 0 for client in clients)
+
+
+def test_pool_exclusive_use():
+    with ClientPool(["a", "b"], FakeClient) as pool:
+        first = pool.acquire()
+        second = pool.acquire()
+        assert first is not second
+        with pytest.raises(PoolExhausted):
+            pool.acquire(timeout=0.01)
+        pool.release(first)
+        with pool.client(timeout=0.01) as client:
+            assert client is first
+
+
+def test_pool_worker_threads():
+    used = []
+
+    def worker(pool):
+        for _ in range(20):
+            with pool.client() as client:
+                # every client is used by one worker at a time
+                assert client.lock.acquire(blocking=False)
+                used.append(client.transport)
+                client.lock.release()
+
+    with ClientPool(["a", "b", "c"], FakeClient) as pool:
+        threads = [threading.Thread(target=worker, args=(pool,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(used) == 120
+
+
+def test_empty_pool():
+    with pytest.raises(PoolExhausted):
+        ClientPool([], FakeClient).acquire()
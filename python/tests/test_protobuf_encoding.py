@@ -330,3 +330,102 @@ def test_recursive():
     assert retr.recursivefield.uvarint == 2
     assert type(retr.recursivefield.recursivefield) == RecursiveMessage
     assert retr.recursivefield.recursivefield.uvarint == 3
+
+
+CODEC_MESSAGES = [
+    PrimitiveMessage(
+        uvarint=12345678910,
+        svarint=-12345678910,
+        bool=True,
+        bytes=b"\xDE\xAD\xCA\xFE",
+        unicode="Příliš žluťoučký kůň úpěl ďábelské ódy 😊",
+        enum=SomeEnum.Five,
+    ),
+    PrimitiveMessage(),
+    RepeatedFields(uintlist=[1, 2, 3], enumlist=[0, 5, 0, 5], strlist=["a", "b"]),
+    RequiredFields(uvarint=3, nested=PrimitiveMessage(bytes=b"x" * 300)),
+    DefaultFields(uvarint=0),
+    RecursiveMessage(
+        uvarint=1,
+        recursivefield=RecursiveMessage(
+            uvarint=2, recursivefield=RecursiveMessage(uvarint=3)
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("msg", CODEC_MESSAGES)
+def test_codec_matches_stream(msg):
+    buf = dump_message(msg)
+    assert protobuf.encode_message(msg) == buf
+
+    retr = protobuf.decode_message(buf, msg.__class__)
+    assert retr == load_message(buf, msg.__class__)
+    assert retr == msg
+    assert repr(retr) == repr(load_message(buf, msg.__class__))
+
+
+def test_codec_packed_and_unknown_fields():
+    packed_values = b"".join(dump_uvarint(v) for v in [4, 44, 444])
+    message_bytes = (
+        dump_uvarint(1 << 3 | 2)
+        + dump_uvarint(len(packed_values))
+        + packed_values
+        # unknown varint and length-delimited fields
+        + dump_uvarint(9 << 3 | 0)
+        + dump_uvarint(12345)
+        + dump_uvarint(10 << 3 | 2)
+        + dump_uvarint(3)
+        + b"abc"
+    )
+    msg = protobuf.decode_message(message_bytes, RepeatedFields)
+    assert msg == load_message(message_bytes, RepeatedFields)
+    assert msg.uintlist == [4, 44, 444]
+
+
+def test_codec_interrupted_unknown_field():
+    unknown = dump_uvarint(20 << 3 | 2) + dump_uvarint(5) + b"a"
+    with pytest.raises(IOError, match="Interrupted value of unknown field 20"):
+        protobuf.decode_message(unknown, PrimitiveMessage)
+
+    # the value would fit into the outer message, but not into the submessage
+    message_bytes = (
+        dump_uvarint(1 << 3 | 0)
+        + dump_uvarint(1)
+        + dump_uvarint(2 << 3 | 2)
+        + dump_uvarint(len(unknown))
+        + unknown
+        + dump_uvarint(1 << 3 | 0)
+        + dump_uvarint(2)
+    )
+    with pytest.raises(IOError, match="Interrupted value of unknown field 20"):
+        protobuf.decode_message(message_bytes, RequiredFields)
+
+
+def test_codec_errors(caplog):
+    caplog.set_level(logging.INFO)
+    msg = EnumMessageMoreValues(enum=WiderEnum.Three)
+    buf = protobuf.encode_message(msg)
+    retr = protobuf.decode_message(buf, EnumMessageLessValues)
+    assert retr.enum == 3
+    assert caplog.records[0].getMessage() == "On field enum: 3 is not a valid NarrowerEnum"
+
+    msg.enum = 19
+    with pytest.raises(ValueError, match="Value 19 in field enum unknown for WiderEnum"):
+        protobuf.encode_message(msg)
+
+    with pytest.raises(ValueError, match="does not fit into uint64"):
+        protobuf.encode_message(PrimitiveMessage(uvarint=-1))
+
+    with pytest.raises(ValueError, match="is not PrimitiveMessage"):
+        protobuf.encode_message(RequiredFields(uvarint=1, nested=RepeatedFields()))
+
+    with pytest.raises(ValueError):
+        buf = protobuf.encode_message(RequiredFields(uvarint=3, nested=None))
+        protobuf.decode_message(buf, RequiredFields)
+
+    with pytest.raises(ValueError, match="does not match schema"):
+        protobuf.decode_message(dump_uvarint(1 << 3 | 2) + b"\x00", PrimitiveMessage)
+
+    with pytest.raises(IOError):
+        protobuf.decode_message(b"\x08\x80", PrimitiveMessage)
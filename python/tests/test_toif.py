@@ -0,0 +1,110 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import random
+import struct
+
+import pytest
+
+from trezorlib import toif
+
+# every possible value appears in each channel
+PIXELS = bytes(range(256)) * 6 + bytes(
+    random.Random(0).getrandbits(8) for _ in range(1536)
+)
+
+BACKENDS = [pytest.param(False, id="bytes")]
+if toif.NUMPY_AVAILABLE:
+    BACKENDS.append(pytest.param(True, id="numpy"))
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(toif, "NUMPY_AVAILABLE", request.param)
+
+
+def legacy_from_rgb(pixels: bytes, little_endian: bool) -> bytes:
+    data = bytearray()
+    for i in range(0, len(pixels), 3):
+        r, g, b = pixels[i : i + 3]
+        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+        data += struct.pack("<H" if little_endian else ">H", c)
+    return bytes(data)
+
+
+def legacy_to_rgb(data: bytes, little_endian: bool) -> bytes:
+    res = bytearray()
+    for i in range(0, len(data), 2):
+        (c,) = struct.unpack("<H" if little_endian else ">H", data[i : i + 2])
+        res += bytes(((c & 0xF800) >> 8, (c & 0x07E0) >> 3, (c & 0x001F) << 3))
+    return bytes(res)
+
+
+def legacy_from_grayscale(pixels: bytes, right_hi: bool) -> bytes:
+    data = bytearray()
+    for left, right in zip(pixels[0::2], pixels[1::2]):
+        if right_hi:
+            data.append((right & 0xF0) | ((left & 0xF0) >> 4))
+        else:
+            data.append((left & 0xF0) | ((right & 0xF0) >> 4))
+    return bytes(data)
+
+
+def legacy_to_grayscale(data: bytes, right_hi: bool) -> bytes:
+    res = bytearray()
+    for pixel in data:
+        if right_hi:
+            res += bytes(((pixel & 0x0F) << 4, pixel & 0xF0))
+        else:
+            res += bytes((pixel & 0xF0, (pixel & 0x0F) << 4))
+    return bytes(res)
+
+
+@pytest.mark.parametrize("little_endian", (True, False))
+def test_rgb565(backend, little_endian):
+    encoded = toif._from_pil_rgb(PIXELS, little_endian)
+    assert encoded == legacy_from_rgb(PIXELS, little_endian)
+    decoded = toif._to_rgb(encoded, little_endian)
+    assert decoded == legacy_to_rgb(encoded, little_endian)
+
+
+@pytest.mark.parametrize("right_hi", (True, False))
+def test_grayscale(backend, right_hi):
+    encoded = toif._from_pil_grayscale(PIXELS, right_hi)
+    assert encoded == legacy_from_grayscale(PIXELS, right_hi)
+    decoded = toif._to_grayscale(encoded, right_hi)
+    assert decoded == legacy_to_grayscale(encoded, right_hi)
+
+
+@pytest.mark.parametrize("right_hi", (True, False))
+def test_grayscale_alpha(backend, right_hi):
+    blended = bytes(
+        int((gray * alpha) / 255) for gray, alpha in zip(PIXELS[0::2], PIXELS[1::2])
+    )
+    encoded = toif._from_pil_grayscale_alpha(PIXELS, right_hi)
+    assert encoded == legacy_from_grayscale(blended, right_hi)
+
+
+@pytest.mark.skipif(not toif.PIL_AVAILABLE, reason="Pillow not installed")
+def test_image_roundtrip(backend):
+    from PIL import Image
+
+    image = Image.frombytes("RGB", (32, 32), PIXELS)
+    toi = toif.from_image(image)
+    assert toi.mode is toif.firmware.ToifMode.full_color_le
+    assert toi.to_image().tobytes() == legacy_to_rgb(
+        legacy_from_rgb(PIXELS, True), True
+    )
@@ -14,7 +14,7 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
-from trezorlib import tools
+from trezorlib import messages, tools
 
 
 def test_descriptor_checksum():
@@ -28,3 +28,21 @@ def test_descriptor_checksum():
     ]
     for d, c in VECTOR:
         assert tools.descriptor_checksum(d) == c
+
+
+def test_split_ranges():
+    r1 = messages.AddressRange(address_n=[0], coin_name="Bitcoin", start=10, count=5)
+    r2 = messages.AddressRange(address_n=[1], coin_name="Bitcoin", start=0, count=0)
+    r3 = messages.AddressRange(address_n=[2], coin_name="Bitcoin", start=0, count=4)
+
+    chunks = list(tools.split_ranges([r1, r2, r3], 3))
+    assert [[(r.address_n, r.start, r.count) for r in c] for c in chunks] == [
+        [([0], 10, 3)],
+        [([0], 13, 2), ([2], 0, 1)],
+        [([2], 1, 3)],
+    ]
+    assert chunks[1][1].coin_name == "Bitcoin"
+    # the original ranges are left intact
+    assert (r1.start, r1.count) == (10, 5)
+
+    assert list(tools.split_ranges([r2], 3)) == []
@@ -15,10 +15,18 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import importlib
+import socket
+import struct
+import threading
 from unittest import mock
 
+import pytest
+
+from trezorlib import transport
 from trezorlib.transport import all_transports
 from trezorlib.transport.bridge import BridgeTransport
+from trezorlib.transport.protocol import ProtocolV1
+from trezorlib.transport.udp import UdpTransport
 
 
 def test_disabled_transport():
@@ -53,3 +61,114 @@ def test_transport_dependencies():
     with mock.patch.dict("sys.modules", {"hid": mock.Mock()}):
         importlib.reload(hid_transport)
         assert hid_transport.HidTransport.ENABLED
+
+
+class FakeHandle:
+    def __init__(self) -> None:
+        self.chunks = []
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write_chunk(self, chunk: bytes) -> None:
+        assert len(chunk) == 64
+        self.chunks.append(bytes(chunk))
+
+    def read_chunk(self) -> bytes:
+        return self.chunks.pop(0)
+
+
+def legacy_chunks(message_type: int, message_data: bytes) -> list:
+    header = struct.pack(">HL", message_type, len(message_data))
+    buffer = b"##" + header + message_data
+    chunks = []
+    while buffer:
+        chunks.append((b"?" + buffer[:63]).ljust(64, b"\x00"))
+        buffer = buffer[63:]
+    return chunks
+
+
+@pytest.mark.parametrize("length", [0, 1, 54, 55, 56, 117, 118, 119, 1000, 65536])
+def test_protocol_v1_roundtrip(length):
+    data = bytes(i & 0xFF for i in range(length))
+    handle = FakeHandle()
+    protocol = ProtocolV1(handle)
+
+    protocol.write(0x1234, data)
+    assert handle.chunks == legacy_chunks(0x1234, data)
+
+    msg_type, received = protocol.read()
+    assert msg_type == 0x1234
+    assert received == data
+    assert not handle.chunks
+
+
+class PingResponder(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+
+    def run(self) -> None:
+        while True:
+            try:
+                data, addr = self.socket.recvfrom(64)
+            except OSError:
+                return
+            if data == b"PINGPING":
+                self.socket.sendto(b"PONGPONG", addr)
+
+    def stop(self) -> None:
+        self.socket.close()
+
+
+def test_udp_enumerate_ports():
+    responders = [PingResponder() for _ in range(3)]
+    for responder in responders:
+        responder.start()
+
+    # a port that nobody listens on
+    silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    silent.bind(("127.0.0.1", 0))
+    silent_port = silent.getsockname()[1]
+    silent.close()
+
+    try:
+        ports = [r.port for r in responders] + [silent_port]
+        found = UdpTransport.enumerate(ports=ports)
+        assert sorted(t.device[1] for t in found) == sorted(r.port for r in responders)
+    finally:
+        for responder in responders:
+            responder.stop()
+
+
+def test_enumerate_devices_parallel():
+    class FakeTransport:
+        def __init__(self, name):
+            self.name = name
+
+    class GoodTransport:
+        __name__ = "GoodTransport"
+
+        @staticmethod
+        def enumerate(models):
+            return [FakeTransport("a"), FakeTransport("b")]
+
+    class BrokenTransport:
+        __name__ = "BrokenTransport"
+
+        @staticmethod
+        def enumerate(models):
+            raise RuntimeError("broken")
+
+    transports = {GoodTransport, BrokenTransport}
+    with mock.patch("trezorlib.transport.all_transports", return_value=transports):
+        serial = transport.enumerate_devices()
+        parallel = transport.enumerate_devices(parallel=True)
+
+    assert sorted(t.name for t in serial) == ["a", "b"]
+    assert sorted(t.name for t in parallel) == ["a", "b"]
@@ -0,0 +1,53 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import click
+import pytest
+
+from trezorlib.cli import trezorctl
+
+
+def test_lazy_commands_listed():
+    ctx = click.Context(trezorctl.cli)
+    commands = trezorctl.cli.list_commands(ctx)
+    assert set(trezorctl.LAZY_COMMANDS) <= set(commands)
+    assert commands == sorted(commands)
+
+
+@pytest.mark.parametrize(
+    "name, group",
+    [
+        ("binance", "binance"),
+        ("bnb", "binance"),
+        ("ada", "cardano"),
+        ("xmr", "monero"),
+        ("tezos", "tezos"),
+    ],
+)
+def test_lazy_command_lookup(name, group):
+    ctx = click.Context(trezorctl.cli)
+    cmd = trezorctl.cli.get_command(ctx, name)
+    assert cmd is not None
+    assert cmd.name == group
+
+
+def test_old_style_command_lookup():
+    ctx = click.Context(trezorctl.cli)
+    cmd = trezorctl.cli.get_command(ctx, "binance-get-address")
+    assert cmd is not None
+    assert cmd.name == "get-address"
+
+    assert trezorctl.cli.get_command(ctx, "no-such-command") is None
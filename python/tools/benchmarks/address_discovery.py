@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+
+"""Time wallet discovery, i.e. exporting many addresses of several accounts.
+
+Runs against an emulator with debuglink, e.g. `--path udp:127.0.0.1:21324`. The
+emulator is loaded with the test seed if it is not initialized. In the "single" mode
+every address is requested by a separate GetAddress message, so the firmware derives
+the account node once per message unless it is cached across messages. Compare the
+output of two firmware builds to see the effect of such a cache. The "batch" mode
+requests the same addresses by GetAddressBatch messages.
+"""
+
+import time
+from typing import List, Tuple
+
+import click
+
+from trezorlib import btc, debuglink, messages, tools
+from trezorlib.debuglink import TrezorClientDebugLink
+from trezorlib.transport import get_transport
+
+COIN = "Bitcoin"
+ACCOUNT_TYPES = (
+    ("m/44h/0h/{}h", messages.InputScriptType.SPENDADDRESS),
+    ("m/49h/0h/{}h", messages.InputScriptType.SPENDP2SHWITNESS),
+    ("m/84h/0h/{}h", messages.InputScriptType.SPENDWITNESS),
+)
+
+
+def discover_single(
+    client: TrezorClientDebugLink, ranges: List[messages.AddressRange]
+) -> None:
+    for r in ranges:
+        for i in range(r.start, r.start + r.count):
+            btc.get_address(client, COIN, r.address_n + [i], script_type=r.script_type)
+
+
+def discover_batch(
+    client: TrezorClientDebugLink, ranges: List[messages.AddressRange]
+) -> None:
+    for _ in btc.get_addresses_batch(client, ranges):
+        pass
+
+
+@click.command()
+@click.option("-p", "--path", default="udp:127.0.0.1:21324", show_default=True)
+@click.option("-a", "--accounts", type=int, default=2, show_default=True)
+@click.option(
+    "-n",
+    "--addresses",
+    "address_counts",
+    type=int,
+    multiple=True,
+    default=[20, 100],
+    show_default=True,
+    help="Addresses per account",
+)
+def cli(path: str, accounts: int, address_counts: Tuple[int, ...]) -> None:
+    """Print the wall time of discovering the given number of addresses."""
+    client = TrezorClientDebugLink(get_transport(path))
+    if not client.features.initialized:
+        debuglink.load_device(
+            client,
+            mnemonic=" ".join(["all"] * 12),
+            pin=None,
+            passphrase_protection=False,
+            label="benchmark",
+        )
+
+    click.echo(f"{'mode':>6} {'addresses':>10} {'time s':>9} {'ms/address':>11}")
+    for count in address_counts:
+        ranges = [
+            messages.AddressRange(
+                address_n=tools.parse_path(pattern.format(account)) + [0],
+                coin_name=COIN,
+                script_type=script_type,
+                start=0,
+                count=count,
+            )
+            for account in range(accounts)
+            for pattern, script_type in ACCOUNT_TYPES
+        ]
+        total = count * len(ranges)
+        for mode, discover in (("single", discover_single), ("batch", discover_batch)):
+            start = time.perf_counter()
+            discover(client, ranges)
+            elapsed = time.perf_counter() - start
+            click.echo(
+                f"{mode:>6} {total:10} {elapsed:9.1f} {elapsed / total * 1000:11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    cli()
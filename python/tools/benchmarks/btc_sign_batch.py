@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Count messages and time of signing legacy transactions with and without batching.
+
+Runs against an emulator with debuglink, e.g. `--path udp:127.0.0.1:21324`. The
+emulator is loaded with the test seed if it is not initialized. Every input is a
+P2PKH input spending a synthetic previous transaction, so every signed input streams
+the whole transaction again.
+"""
+
+import struct
+import time
+from typing import Any, Dict, List, Tuple
+
+import click
+
+from trezorlib import btc, debuglink, messages, tools
+from trezorlib.debuglink import TrezorClientDebugLink
+from trezorlib.transport import get_transport
+
+COIN = "Testnet"
+PATH = tools.parse_path("m/44h/1h/0h/0/0")
+AMOUNT = 100_000
+FEE_PER_INPUT = 200
+
+
+def varint(n: int) -> bytes:
+    if n < 0xFD:
+        return bytes([n])
+    return b"\xfd" + struct.pack("<H", n)
+
+
+def make_prev_tx(i: int, script_pubkey: bytes) -> messages.TransactionType:
+    prev_hash = tools.btc_hash(struct.pack("<I", i))
+    return messages.TransactionType(
+        version=1,
+        lock_time=0,
+        inputs=[
+            messages.TxInputType(
+                prev_hash=prev_hash, prev_index=0, script_sig=b"", sequence=0xFFFFFFFF
+            )
+        ],
+        bin_outputs=[
+            messages.TxOutputBinType(amount=AMOUNT, script_pubkey=script_pubkey)
+        ],
+    )
+
+
+def serialize_prev_tx(tx: messages.TransactionType) -> bytes:
+    data = struct.pack("<I", tx.version) + varint(len(tx.inputs))
+    for txi in tx.inputs:
+        data += txi.prev_hash[::-1] + struct.pack("<I", txi.prev_index)
+        data += varint(len(txi.script_sig)) + txi.script_sig
+        data += struct.pack("<I", txi.sequence)
+    data += varint(len(tx.bin_outputs))
+    for txo in tx.bin_outputs:
+        data += struct.pack("<Q", txo.amount)
+        data += varint(len(txo.script_pubkey)) + txo.script_pubkey
+    return data + struct.pack("<I", tx.lock_time)
+
+
+def make_transaction(
+    count: int, address: str
+) -> Tuple[List[messages.TxInputType], Dict[bytes, messages.TransactionType]]:
+    pubkey_hash = tools.b58check_decode(address)[1:]
+    script_pubkey = b"\x76\xa9\x14" + pubkey_hash + b"\x88\xac"
+    inputs = []
+    prev_txes = {}
+    for i in range(count):
+        prev_tx = make_prev_tx(i, script_pubkey)
+        prev_hash = tools.tx_hash(serialize_prev_tx(prev_tx))
+        prev_txes[prev_hash] = prev_tx
+        inputs.append(
+            messages.TxInputType(
+                address_n=PATH,
+                prev_hash=prev_hash,
+                prev_index=0,
+                amount=AMOUNT,
+                script_type=messages.InputScriptType.SPENDADDRESS,
+            )
+        )
+    return inputs, prev_txes
+
+
+class CountingClient:
+    def __init__(self, client: TrezorClientDebugLink) -> None:
+        self.client = client
+        self.messages = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def call(self, msg: Any) -> Any:
+        self.messages += 1
+        return self.client.call(msg)
+
+
+@click.command()
+@click.option("-p", "--path", default="udp:127.0.0.1:21324", show_default=True)
+@click.option(
+    "-n",
+    "--inputs",
+    "input_counts",
+    type=int,
+    multiple=True,
+    default=[10, 100, 500],
+    show_default=True,
+)
+@click.option("-b", "--batch-size", type=int, default=8, show_default=True)
+def cli(path: str, input_counts: Tuple[int, ...], batch_size: int) -> None:
+    """Print the number of messages and wall time of every signing."""
+    client = TrezorClientDebugLink(get_transport(path))
+    if not client.features.initialized:
+        debuglink.load_device(
+            client,
+            mnemonic=" ".join(["all"] * 12),
+            pin=None,
+            passphrase_protection=False,
+            label="benchmark",
+        )
+    address = btc.get_address(client, COIN, PATH)
+
+    click.echo(f"{'inputs':>7} {'batch':>6} {'messages':>9} {'time s':>9}")
+    for count in input_counts:
+        inputs, prev_txes = make_transaction(count, address)
+        output = messages.TxOutputType(
+            address=address,
+            amount=count * (AMOUNT - FEE_PER_INPUT),
+            script_type=messages.OutputScriptType.PAYTOADDRESS,
+        )
+        for batch in (1, batch_size):
+            counting = CountingClient(client)
+            start = time.perf_counter()
+            btc.sign_tx(
+                counting,  # type: ignore [wrapper of the client]
+                COIN,
+                inputs,
+                [output],
+                prev_txes=prev_txes,
+                batch_size=batch,
+            )
+            elapsed = time.perf_counter() - start
+            click.echo(f"{count:7} {batch:6} {counting.messages:9} {elapsed:9.1f}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure enumeration latency and request throughput across N emulators.
+
+Start the emulators first, each on its own port, e.g. for four of them:
+
+    for i in 0 1 2 3; do ./emu.py --port $((21324 + 2 * i)) --temporary-profile & done
+
+and run this script with `--port 21324 --count 4`.
+"""
+
+import threading
+import time
+from typing import List
+
+import click
+
+from trezorlib.pool import ClientPool
+from trezorlib.transport.udp import UdpTransport
+from trezorlib.ui import ClickUI
+
+
+@click.command()
+@click.option(
+    "-p", "--port", type=int, default=21324, help="Port of the first emulator"
+)
+@click.option("-n", "--count", type=int, default=4, help="Number of emulators")
+@click.option("-w", "--workers", type=int, default=0, help="Worker threads (default N)")
+@click.option("-r", "--requests", "per_worker", type=int, default=50)
+def cli(port: int, count: int, workers: int, per_worker: int) -> None:
+    """Print enumeration latency and pings/sec across N emulators."""
+    ports = list(range(port, port + 2 * count, 2))
+
+    start = time.perf_counter()
+    found: List[UdpTransport] = []
+    for p in ports:
+        found.extend(UdpTransport.enumerate(ports=[p]))
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = list(UdpTransport.enumerate(ports=ports))
+    parallel = time.perf_counter() - start
+    click.echo(
+        f"enumerate {len(found)}/{count}: serial {serial * 1000:.1f} ms, "
+        f"parallel {parallel * 1000:.1f} ms"
+    )
+
+    start = time.perf_counter()
+    paths = [f"udp:127.0.0.1:{p}" for p in ports]
+    pool = ClientPool.from_paths(ClickUI(), paths)
+    click.echo(
+        f"pool of {len(pool)} clients ready in {time.perf_counter() - start:.3f} s"
+    )
+    if not len(pool):
+        raise click.ClickException("No emulators found")
+
+    def worker() -> None:
+        for _ in range(per_worker):
+            with pool.client() as client:
+                client.ping("benchmark")
+
+    threads = [threading.Thread(target=worker) for _ in range(workers or len(pool))]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    pool.close()
+
+    total = len(threads) * per_worker
+    click.echo(f"{total} pings in {elapsed:.2f} s: {total / elapsed:.1f} requests/s")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Compare definition lookups from a tar archive and from its cached index.
+
+Every iteration opens the source and looks up one network and one token, as a
+single `trezorctl ethereum ...` invocation does. Without ARCHIVE, a synthetic
+archive with the layout and blob sizes of the published definitions is used.
+"""
+
+import io
+import os
+import random
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import click
+
+from trezorlib import definitions
+
+# (chain id, token address) looked up in every iteration
+Query = Tuple[int, Optional[str]]
+
+
+def write_archive(path: Path, chains: int, tokens: int) -> List[Query]:
+    rng = random.Random(0)
+    queries: List[Query] = []
+    with tarfile.open(path, "w:xz") as tar:
+
+        def add(name: str, size: int) -> None:
+            info = tarfile.TarInfo(name)
+            info.size = size
+            tar.addfile(info, io.BytesIO(os.urandom(size)))
+
+        for chain_id in range(1, chains + 1):
+            add(f"chain-id/{chain_id}/network.dat", 180)
+            add(f"slip44/{chain_id}/network.dat", 180)
+        for _ in range(tokens):
+            chain_id = rng.randint(1, chains)
+            address = "%040x" % rng.getrandbits(160)
+            add(f"chain-id/{chain_id}/token-{address}.dat", 210)
+            queries.append((chain_id, address))
+    return queries
+
+
+def lookup(
+    open_source: Callable[[], definitions.Source], queries: List[Query]
+) -> float:
+    start = time.perf_counter()
+    for chain_id, address in queries:
+        source = open_source()
+        assert source.get_network(chain_id) is not None
+        if address is not None:
+            assert source.get_token(chain_id, address) is not None
+    return (time.perf_counter() - start) / len(queries)
+
+
+@click.command()
+@click.argument("archive", required=False, type=click.Path(exists=True, dir_okay=False))
+@click.option("-c", "--chains", default=500, show_default=True)
+@click.option("-t", "--tokens", default=10000, show_default=True)
+@click.option("-n", "--iterations", default=20, show_default=True)
+def cli(archive: Optional[str], chains: int, tokens: int, iterations: int) -> None:
+    """Print time per invocation of the tar source and of the cached index."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_dir = Path(tmpdir) / "cache"
+        if archive is None:
+            path = Path(tmpdir) / "definitions.tar.xz"
+            queries = write_archive(path, chains, tokens)
+        else:
+            path = Path(archive)
+            queries = [(1, None)]
+        queries = (queries * iterations)[:iterations]
+        click.echo(f"{path.stat().st_size >> 10} KiB archive")
+
+        start = time.perf_counter()
+        definitions.cached_tar_source(path, cache_dir)
+        build_time = time.perf_counter() - start
+
+        tar_time = lookup(lambda: definitions.TarSource(path), queries)
+        cached_time = lookup(
+            lambda: definitions.cached_tar_source(path, cache_dir), queries
+        )
+        click.echo(f"{'tar':>8} {tar_time * 1000:10.2f} ms")
+        click.echo(f"{'index':>8} {cached_time * 1000:10.2f} ms")
+        click.echo(f"{'build':>8} {build_time * 1000:10.2f} ms (first use only)")
+
+
+if __name__ == "__main__":
+    cli()
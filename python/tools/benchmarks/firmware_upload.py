@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure firmware upload throughput and per-chunk latency.
+
+With `--path`, the image is uploaded to a real device or emulator that is in
+bootloader mode, e.g. `--path udp:127.0.0.1:21324`. Without it, a simulated
+bootloader is used that spends `--latency` milliseconds writing every chunk, and
+the pipelined `firmware.update` is compared with a strictly sequential upload.
+
+Throughput is derived from `progress_update` callbacks only.
+"""
+
+import os
+import statistics
+import time
+from hashlib import blake2s
+from typing import Any, Callable, List, Optional
+
+import click
+
+from trezorlib import firmware, messages
+from trezorlib.client import TrezorClient
+from trezorlib.tools import session
+from trezorlib.transport import get_transport
+from trezorlib.ui import ClickUI
+
+CHUNK_SIZE = 128 * 1024
+
+
+class SimulatedBootloader:
+    def __init__(self, size: int, latency: float) -> None:
+        self.features = messages.Features(
+            major_version=2, minor_version=0, patch_version=0, bootloader_mode=True
+        )
+        self.size = size
+        self.latency = latency
+        self.offset = 0
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def call(self, msg: Any) -> Any:
+        if isinstance(msg, messages.FirmwareUpload):
+            # the real codec work that happens on the host for every chunk
+            msg.ByteSize()
+            time.sleep(self.latency)
+            self.offset += len(msg.payload)
+        if self.offset >= self.size:
+            return messages.Success()
+        length = min(CHUNK_SIZE, self.size - self.offset)
+        return messages.FirmwareRequest(offset=self.offset, length=length)
+
+
+@session
+def sequential_update(
+    client: Any, data: bytes, progress_update: Callable[[int], Any]
+) -> None:
+    """The upload loop without pipelining, for comparison."""
+    resp = client.call(messages.FirmwareErase(length=len(data)))
+    while isinstance(resp, messages.FirmwareRequest):
+        payload = data[resp.offset : resp.offset + resp.length]
+        digest = blake2s(payload).digest()
+        resp = client.call(messages.FirmwareUpload(payload=payload, hash=digest))
+        progress_update(len(payload))
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.stamps: List[float] = [self.start]
+        self.total = 0
+
+    def __call__(self, length: int) -> None:
+        self.stamps.append(time.perf_counter())
+        self.total += length
+
+    def report(self, label: str) -> None:
+        elapsed = self.stamps[-1] - self.start
+        latencies = [b - a for a, b in zip(self.stamps, self.stamps[1:])]
+        click.echo(
+            f"{label:<12} {self.total / elapsed / 1024:10.1f} KiB/s  "
+            f"chunk median {statistics.median(latencies) * 1000:7.2f} ms  "
+            f"max {max(latencies) * 1000:7.2f} ms"
+        )
+
+
+@click.command()
+@click.option("-p", "--path", help="Upload to a device in bootloader mode")
+@click.option("-f", "--file", "filename", type=click.Path(exists=True))
+@click.option("-s", "--size", type=int, default=4, help="Size of random image in MiB")
+@click.option("-l", "--latency", type=float, default=20, help="Simulated ms per chunk")
+def cli(
+    path: Optional[str], filename: Optional[str], size: int, latency: float
+) -> None:
+    """Print firmware upload throughput and per-chunk latency."""
+    if filename:
+        with open(filename, "rb") as f:
+            data = f.read()
+    else:
+        data = os.urandom(size * 1024 * 1024)
+
+    if path:
+        client = TrezorClient(get_transport(path), ui=ClickUI())
+        recorder = Recorder()
+        firmware.update(client, data, recorder)
+        recorder.report("device")
+        return
+
+    recorder = Recorder()
+    sequential_update(SimulatedBootloader(len(data), latency / 1000), data, recorder)
+    recorder.report("sequential")
+
+    recorder = Recorder()
+    firmware.update(SimulatedBootloader(len(data), latency / 1000), data, recorder)
+    recorder.report("pipelined")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Compare in-memory and memory-mapped parsing and code hash validation.
+
+Signatures are not checked, so that unsigned development builds can be measured too.
+"""
+
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import click
+
+from trezorlib import firmware
+
+
+def from_memory(filename: str) -> None:
+    with open(filename, "rb") as f:
+        version, fw = firmware.parse(f.read())
+    firmware.validate_code_hashes(fw, version)
+
+
+def from_file(filename: str) -> None:
+    with firmware.parse_file(filename) as (version, fw):
+        firmware.validate_code_hashes(fw, version)
+
+
+def measure(func: Callable[[str], None], filename: str) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(filename)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+@click.command()
+@click.argument("filenames", nargs=-1, required=True, type=click.Path(exists=True))
+def cli(filenames: Tuple[str, ...]) -> None:
+    """Print time and peak Python memory of validating each firmware file."""
+    click.echo(f"{'method':>8} {'time ms':>10} {'peak KiB':>10}  file")
+    for filename in filenames:
+        for name, func in (("memory", from_memory), ("mmap", from_file)):
+            elapsed, peak = measure(func, filename)
+            click.echo(f"{name:>8} {elapsed * 1000:10.1f} {peak >> 10:10}  {filename}")
+
+
+if __name__ == "__main__":
+    cli()
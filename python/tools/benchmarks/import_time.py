@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Track import time of trezorlib and trezorctl with `python -X importtime`.
+
+Every module is imported in a fresh interpreter a couple of times, and the median
+cumulative import time is reported, together with the slowest imported modules.
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import click
+
+MODULES = [
+    "trezorlib.messages",
+    "trezorlib.client",
+    "trezorlib.cli.trezorctl",
+]
+
+
+def importtime(module: str) -> Dict[str, int]:
+    """Return cumulative import times in microseconds, keyed by module name."""
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def slowest(times: Dict[str, int], count: int) -> List[Tuple[str, int]]:
+    return sorted(times.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+@click.command()
+@click.option(
+    "-r", "--rounds", type=int, default=5, help="Interpreter starts per module"
+)
+@click.option("-t", "--top", type=int, default=10, help="Show N slowest imports")
+@click.argument("modules", nargs=-1)
+def cli(rounds: int, top: int, modules: Tuple[str, ...]) -> None:
+    """Print median import times of trezorlib modules."""
+    for module in modules or MODULES:
+        runs = [importtime(module) for _ in range(rounds)]
+        total = statistics.median(run[module] for run in runs)
+        click.echo(f"{module}: {total / 1000:.1f} ms")
+        for name, value in slowest(runs[-1], top + 1)[1:]:
+            click.echo(f"    {value / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    cli()
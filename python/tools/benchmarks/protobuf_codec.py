@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Compare the streaming protobuf codec with the compiled per-class codec.
+
+Encodes and decodes a set of representative `messages.py` types with
+`dump_message`/`load_message` and with `encode_message`/`decode_message`.
+"""
+
+import time
+from io import BytesIO
+from typing import Callable, Dict
+
+import click
+
+from trezorlib import messages, protobuf
+
+HARDENED = 0x8000_0000
+
+
+def sample_messages() -> Dict[str, protobuf.MessageType]:
+    inputs = [
+        messages.TxInputType(
+            address_n=[84 | HARDENED, HARDENED, HARDENED, 0, i],
+            prev_hash=bytes([i & 0xFF]) * 32,
+            prev_index=i,
+            amount=100_000 + i,
+            script_type=messages.InputScriptType.SPENDWITNESS,
+            sequence=0xFFFF_FFFD,
+        )
+        for i in range(100)
+    ]
+    outputs = [
+        messages.TxOutputType(
+            address="bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4",
+            amount=50_000,
+            script_type=messages.OutputScriptType.PAYTOADDRESS,
+        )
+        for _ in range(20)
+    ]
+    return {
+        "Features": messages.Features(
+            vendor="onekey.so",
+            major_version=4,
+            minor_version=0,
+            patch_version=0,
+            device_id="0123456789ABCDEF",
+            label="bench",
+            initialized=True,
+            capabilities=list(messages.Capability),
+        ),
+        "TxAck(input)": messages.TxAck(tx=messages.TransactionType(inputs=inputs[:1])),
+        "TransactionType(100 in, 20 out)": messages.TransactionType(
+            version=2, lock_time=0, inputs=inputs, outputs=outputs
+        ),
+        "EthereumSignTxOneKey": messages.EthereumSignTxOneKey(
+            address_n=[44 | HARDENED, 60 | HARDENED, HARDENED, 0, 0],
+            nonce=b"\x01",
+            gas_price=b"\x04\xa8\x17\xc8\x00",
+            gas_limit=b"\x52\x08",
+            to="0x1d1c328764a41bda0492b66baa30c4a339ff85ef",
+            value=b"\x0d\xe0\xb6\xb3\xa7\x64\x00\x00",
+            data_initial_chunk=bytes(1024),
+            data_length=1024,
+            chain_id=1,
+        ),
+    }
+
+
+def timeit(func: Callable[[], object], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def dump_stream(msg: protobuf.MessageType) -> bytes:
+    buf = BytesIO()
+    protobuf.dump_message(buf, msg)
+    return buf.getvalue()
+
+
+@click.command()
+@click.option("-r", "--rounds", type=int, default=200, help="Repetitions per message")
+def cli(rounds: int) -> None:
+    """Print encode/decode times of the streaming and compiled codecs."""
+    click.echo(
+        f"{'message':<34} {'dump us':>9} {'encode us':>10} {'load us':>9} {'decode us':>10}"
+    )
+    for name, msg in sample_messages().items():
+        msg_type = msg.__class__
+        data = protobuf.encode_message(msg)
+        assert data == dump_stream(msg)
+
+        dump = timeit(lambda: dump_stream(msg), rounds)
+        encode = timeit(lambda: protobuf.encode_message(msg), rounds)
+        load = timeit(lambda: protobuf.load_message(BytesIO(data), msg_type), rounds)
+        decode = timeit(lambda: protobuf.decode_message(data, msg_type), rounds)
+        click.echo(
+            f"{name:<34} {dump * 1e6:9.1f} {encode * 1e6:10.1f} "
+            f"{load * 1e6:9.1f} {decode * 1e6:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure ProtocolV1 chunking throughput over an in-memory Handle.
+
+No device is involved: the fake Handle only stores the written reports and hands
+them back on read, so the numbers reflect the host-side packing cost only.
+"""
+
+import time
+from collections import deque
+from typing import Deque, List
+
+import click
+
+from trezorlib.transport.protocol import ProtocolV1
+
+SIZES = [1 << 10, 1 << 14, 1 << 16, 1 << 18, 1 << 20, 1 << 22]
+
+
+class FakeHandle:
+    def __init__(self) -> None:
+        self.chunks: Deque[bytes] = deque()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write_chunk(self, chunk: bytes) -> None:
+        # a real Handle hands the report over to the OS, which copies it
+        self.chunks.append(bytes(chunk))
+
+    def read_chunk(self) -> bytes:
+        return self.chunks.popleft()
+
+
+def measure(protocol: ProtocolV1, data: bytes, rounds: int) -> List[float]:
+    write_time = read_time = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        protocol.write(0, data)
+        mid = time.perf_counter()
+        _, received = protocol.read()
+        end = time.perf_counter()
+        assert len(received) == len(data)
+        write_time += mid - start
+        read_time += end - mid
+    return [write_time / rounds, read_time / rounds]
+
+
+def format_size(size: int) -> str:
+    if size >= 1 << 20:
+        return f"{size >> 20} MiB"
+    return f"{size >> 10} KiB"
+
+
+@click.command()
+@click.option("-r", "--rounds", type=int, default=5, help="Repetitions per size")
+def cli(rounds: int) -> None:
+    """Print ProtocolV1 write/read throughput for 1 KiB to 4 MiB messages."""
+    protocol = ProtocolV1(FakeHandle())
+    click.echo(f"{'size':>8} {'write MiB/s':>12} {'read MiB/s':>12}")
+    for size in SIZES:
+        data = bytes(size)
+        write_time, read_time = measure(protocol, data, rounds)
+        mib = size / (1 << 20)
+        click.echo(
+            f"{format_size(size):>8} {mib / write_time:12.1f} {mib / read_time:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
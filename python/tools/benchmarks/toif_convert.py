@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure TOIF pixel conversion over the TOIF and PNG assets in core/.
+
+Only the pixel packing is timed, zlib (de)compression is the same for all backends.
+"legacy" is the per-pixel struct loop that trezorlib used before, "bytes" and
+"numpy" are the two paths of the current implementation.
+"""
+
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import click
+from PIL import Image
+
+from trezorlib import toif
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# (raw pixels, mode) as fed to the conversion functions
+Sample = Tuple[bytes, str]
+
+
+def legacy_from_rgb(pixels: bytes, little_endian: bool) -> bytes:
+    data = bytearray()
+    for i in range(0, len(pixels), 3):
+        r, g, b = pixels[i : i + 3]
+        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+        data += struct.pack("<H" if little_endian else ">H", c)
+    return bytes(data)
+
+
+def legacy_to_rgb(data: bytes, little_endian: bool) -> bytes:
+    res = bytearray()
+    for i in range(0, len(data), 2):
+        (c,) = struct.unpack("<H" if little_endian else ">H", data[i : i + 2])
+        res += bytes(((c & 0xF800) >> 8, (c & 0x07E0) >> 3, (c & 0x001F) << 3))
+    return bytes(res)
+
+
+def legacy_from_grayscale(pixels: bytes, right_hi: bool) -> bytes:
+    data = bytearray()
+    for i in range(0, len(pixels), 2):
+        left, right = pixels[i], pixels[i + 1]
+        if right_hi:
+            c = (right & 0xF0) | ((left & 0xF0) >> 4)
+        else:
+            c = (left & 0xF0) | ((right & 0xF0) >> 4)
+        data += struct.pack(">B", c)
+    return bytes(data)
+
+
+def legacy_to_grayscale(data: bytes, right_hi: bool) -> bytes:
+    res = bytearray()
+    for pixel in data:
+        if right_hi:
+            res += bytes(((pixel & 0x0F) << 4, pixel & 0xF0))
+        else:
+            res += bytes((pixel & 0xF0, (pixel & 0x0F) << 4))
+    return bytes(res)
+
+
+LEGACY = {
+    "from_rgb": legacy_from_rgb,
+    "to_rgb": legacy_to_rgb,
+    "from_grayscale": legacy_from_grayscale,
+    "to_grayscale": legacy_to_grayscale,
+}
+
+CURRENT = {
+    "from_rgb": toif._from_pil_rgb,
+    "to_rgb": toif._to_rgb,
+    "from_grayscale": toif._from_pil_grayscale,
+    "to_grayscale": toif._to_grayscale,
+}
+
+
+def load_samples() -> List[Sample]:
+    samples: List[Sample] = []
+    for path in sorted(ROOT.glob("core/**/*.toif")):
+        try:
+            image = toif.load(str(path)).to_image()
+        except Exception:
+            continue
+        samples.append((image.tobytes(), image.mode))
+    for path in sorted(ROOT.glob("core/**/*.png")):
+        image = Image.open(path)
+        image = image.convert("L" if image.mode in ("1", "L", "LA") else "RGB")
+        if image.mode == "L" and image.size[0] % 2:
+            continue
+        samples.append((image.tobytes(), image.mode))
+    return samples
+
+
+def measure(samples: List[Sample], funcs: Dict[str, Callable]) -> Tuple[float, float]:
+    encode_time = decode_time = 0.0
+    for pixels, mode in samples:
+        start = time.perf_counter()
+        if mode == "RGB":
+            data = funcs["from_rgb"](pixels, True)
+            mid = time.perf_counter()
+            funcs["to_rgb"](data, True)
+        else:
+            data = funcs["from_grayscale"](pixels, True)
+            mid = time.perf_counter()
+            funcs["to_grayscale"](data, True)
+        end = time.perf_counter()
+        encode_time += mid - start
+        decode_time += end - mid
+    return encode_time, decode_time
+
+
+@click.command()
+@click.option("--legacy/--no-legacy", default=True, help="Include the legacy loop")
+def cli(legacy: bool) -> None:
+    """Print total conversion time of all assets for each backend."""
+    samples = load_samples()
+    mpix = sum(len(p) // (3 if m == "RGB" else 1) for p, m in samples) / 1e6
+    click.echo(f"{len(samples)} images, {mpix:.1f} Mpx")
+
+    backends = []
+    if legacy:
+        backends.append(("legacy", LEGACY, False))
+    backends.append(("bytes", CURRENT, False))
+    if toif.NUMPY_AVAILABLE:
+        backends.append(("numpy", CURRENT, True))
+
+    click.echo(f"{'backend':>8} {'encode s':>10} {'decode s':>10}")
+    for name, funcs, use_numpy in backends:
+        toif.NUMPY_AVAILABLE = use_numpy
+        encode_time, decode_time = measure(samples, funcs)
+        click.echo(f"{name:>8} {encode_time:10.3f} {decode_time:10.3f}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,11 @@
+import pytest
+
+from python.src import crypto
+
+
+@pytest.fixture(autouse=True, scope="session")
+def kek_cache():
+    # PIN tests derive the KEK for the same salt and PIN over and over
+    crypto.set_kek_cache()
+    yield
+    crypto.set_kek_cache(0)
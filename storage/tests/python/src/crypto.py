@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
@@ -6,8 +8,37 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from . import consts, prng
 
+# Memoized derive_kek_keiv, see set_kek_cache()
+_derive_kek_keiv_cached = None
+
+
+def set_kek_cache(maxsize: int = 128):
+    """
+    Enables memoization of KEK and KEIV derivation for the last `maxsize`
+    (salt, PIN) pairs, or disables it if `maxsize` is 0.
+    The derivation is deterministic, so this only saves the PBKDF2 rounds
+    when the same PIN is checked against the same salt repeatedly.
+    """
+    global _derive_kek_keiv_cached
+    if maxsize:
+        _derive_kek_keiv_cached = lru_cache(maxsize=maxsize)(_derive_kek_keiv)
+    else:
+        _derive_kek_keiv_cached = None
+
+
+def kek_cache_info():
+    if _derive_kek_keiv_cached is None:
+        return None
+    return _derive_kek_keiv_cached.cache_info()
+
 
 def derive_kek_keiv(salt: bytes, pin: str) -> (bytes, bytes):
+    if _derive_kek_keiv_cached is not None:
+        return _derive_kek_keiv_cached(bytes(salt), pin)
+    return _derive_kek_keiv(salt, pin)
+
+
+def _derive_kek_keiv(salt: bytes, pin: str) -> (bytes, bytes):
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=consts.KEK_SIZE + consts.KEIV_SIZE,
@@ -1,5 +1,7 @@
 import sys
+from dataclasses import dataclass, field
 from struct import pack
+from typing import Dict, List
 
 from . import consts
 
@@ -12,17 +14,38 @@ def align4_data(data):
     return data + b"\x00" * align4_int(len(data))
 
 
+@dataclass
+class NorcowStats:
+    """
+    Flash wear and compaction counters of a Norcow instance.
+    """
+
+    # items written, including in-place updates and deletions
+    writes: int = 0
+    bytes_written: int = 0
+    # erase count of each sector
+    erases: List[int] = field(default_factory=lambda: [0] * consts.NORCOW_SECTOR_COUNT)
+    compactions: int = 0
+    # bytes of deleted items dropped by compactions
+    bytes_reclaimed: int = 0
+
+
 class Norcow:
     def __init__(self):
         self.sectors = None
         self.active_sector = 0
+        self.stats = NorcowStats()
+        # offset of the live item of each key in the active sector
+        self._index: Dict[int, int] = {}
+        # number of deleted items (key 0x0000) in the active sector
+        self._deleted = 0
 
     def init(self):
         if self.sectors:
             for sector in range(consts.NORCOW_SECTOR_COUNT):
                 if self.sectors[sector][:8] == consts.NORCOW_MAGIC_AND_VERSION:
                     self.active_sector = sector
-                    self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+                    self._build_index()
                     break
         else:
             self.wipe()
@@ -35,9 +58,36 @@ class Norcow:
             bytearray([0xFF] * consts.NORCOW_SECTOR_SIZE)
             for _ in range(consts.NORCOW_SECTOR_COUNT)
         ]
+        for i in range(consts.NORCOW_SECTOR_COUNT):
+            self.stats.erases[i] += 1
         self.sectors[sector][:8] = consts.NORCOW_MAGIC_AND_VERSION
         self.active_sector = sector
         self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+        self._index = {}
+        self._deleted = 0
+
+    def _build_index(self):
+        """
+        Scans the active sector and rebuilds the key index.
+        Only needed when the sectors were loaded from outside.
+        """
+        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+        self._index = {}
+        self._deleted = 0
+        while True:
+            try:
+                k, v = self._read_item(offset)
+            except ValueError:
+                break
+            if k == 0x0000:
+                self._deleted += 1
+            else:
+                self._index[k] = offset
+            offset = offset + self._norcow_item_length(v)
+        self.active_offset = offset
+
+    def free_space(self) -> int:
+        return consts.NORCOW_SECTOR_SIZE - self.active_offset
 
     def get(self, key: int) -> bytes:
         value, _ = self._find_item(key)
@@ -106,34 +156,35 @@ class Norcow:
         data = pack("<HH", key, len(new_value)) + align4_data(new_value)
         if pos + len(data) > consts.NORCOW_SECTOR_SIZE:
             raise RuntimeError("Norcow: item too big")
-        self.sectors[self.active_sector][pos : pos + len(data)] = data
+
+        sector = self.sectors[self.active_sector]
+        old_key = int.from_bytes(sector[pos : pos + 2], sys.byteorder)
+        if old_key != key:
+            if old_key == 0x0000:
+                self._deleted -= 1
+            elif self._index.get(old_key) == pos:
+                del self._index[old_key]
+            if key == 0x0000:
+                self._deleted += 1
+            else:
+                self._index[key] = pos
+
+        sector[pos : pos + len(data)] = data
+        self.stats.writes += 1
+        self.stats.bytes_written += len(data)
         return len(data)
 
     def _find_item(self, key: int) -> (bytes, int):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        value = False
-        pos = offset
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                if k == key:
-                    value = v
-                    pos = offset
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        pos = self._index.get(key)
+        if pos is None:
+            return False, len(consts.NORCOW_MAGIC_AND_VERSION)
+        _, value = self._read_item(pos)
         return value, pos
 
     def _get_all_keys(self) -> (bytes, int):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        keys = set()
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                keys.add(k)
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        keys = set(self._index)
+        if self._deleted:
+            keys.add(0x0000)
         return keys
 
     def _norcow_item_length(self, data: bytes) -> int:
@@ -151,20 +202,16 @@ class Norcow:
         return key, value
 
     def _compact(self):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        data = list()
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                if k != 0x00:
-                    data.append((k, v))
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        # live items are copied in the order they are stored
+        offsets = sorted(self._index.values())
+        data = [self._read_item(offset) for offset in offsets]
+        used = self.active_offset
         sector = self.active_sector
         self.wipe((sector + 1) % consts.NORCOW_SECTOR_COUNT)
         for key, value in data:
             self._append(key, value)
+        self.stats.compactions += 1
+        self.stats.bytes_reclaimed += used - self.active_offset
 
     def _set_sectors(self, data):
         if list(map(len, data)) != [
@@ -173,6 +220,8 @@ class Norcow:
         ]:
             raise RuntimeError("Norcow: set_sectors called with invalid data length")
         self.sectors = [bytearray(sector) for sector in data]
+        self._index = {}
+        self._deleted = 0
 
     def _dump(self):
         return [bytes(sector) for sector in self.sectors]
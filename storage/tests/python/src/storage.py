@@ -1,5 +1,8 @@
 import hashlib
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence, Tuple
 
 from . import consts, crypto, helpers, prng
 from .norcow import Norcow
@@ -256,3 +259,28 @@ class Storage:
 
     def _dump(self) -> bytes:
         return self.nc._dump()
+
+
+def _unlock_attempt(storage: Storage, seed: int, pin: str) -> Tuple[bool, Storage]:
+    prng.random_reseed(seed)
+    return storage.unlock(pin), storage
+
+
+def unlock_attempts(
+    storage: Storage, pins: Sequence[str], max_workers: Optional[int] = None
+) -> List[Tuple[bool, Storage]]:
+    """
+    Tries to unlock a snapshot of `storage` with each of `pins` in a process pool.
+    Every attempt starts from the current state of `storage` and of the PRNG,
+    which are left untouched. Returns the result of each attempt together with
+    the storage as the attempt left it.
+    """
+    cache = crypto.kek_cache_info()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=crypto.set_kek_cache,
+        initargs=(cache.maxsize if cache else 0,),
+    ) as executor:
+        return list(
+            executor.map(_unlock_attempt, repeat(storage), repeat(prng.seed), pins)
+        )
@@ -157,3 +157,45 @@ def test_norcow_compact():
 
     assert n.get(0x0101) == b"hello"
     assert n.get(0x0103) == b"123456789x"
+
+
+def test_norcow_index():
+    n = norcow.Norcow()
+    n.init()
+    n.set(0x0101, b"ahoj")
+    n.set(0x0102, b"123")
+    n.set(0x0101, b"hello")
+    n.delete(0x0102)
+    n.set(0x0103, b"")
+    assert n._get_all_keys() == {0x0000, 0x0101, 0x0103}
+
+    # the index of a loaded storage matches the incrementally built one
+    m = norcow.Norcow()
+    m._set_sectors(n._dump())
+    m.init()
+    assert m._index == n._index
+    assert m.active_offset == n.active_offset
+    assert m.get(0x0101) == b"hello"
+    assert m.get(0x0102) is False
+
+    m.set(0x0104, b"world")
+    n.set(0x0104, b"world")
+    assert m._dump() == n._dump()
+
+
+def test_norcow_stats():
+    n = norcow.Norcow()
+    n.init()
+    assert n.stats.erases == [1, 1]
+    n.set(0x0101, b"a" * (consts.NORCOW_SECTOR_SIZE - 100))
+    n.set(0x0102, b"123")
+    n.delete(0x0101)
+    assert n.stats.writes == 3
+    assert n.stats.compactions == 0
+
+    n.set(0x0103, b"b" * 200)
+    assert n.stats.compactions == 1
+    assert n.stats.erases == [2, 2]
+    assert n.stats.bytes_reclaimed == consts.NORCOW_SECTOR_SIZE - 100 + 4
+    assert n._get_all_keys() == {0x0102, 0x0103}
+    assert n.free_space() == consts.NORCOW_SECTOR_SIZE - 8 - 8 - 204
@@ -1,4 +1,7 @@
-from ..src.storage import Storage
+import copy
+
+from ..src import prng
+from ..src.storage import Storage, unlock_attempts
 
 
 def test_set_pin_success():
@@ -26,3 +29,24 @@ def test_set_pin_failure():
     s.init(hw_salt)
     s._set_pin("229922")
     assert not s.unlock("1122992211")
+
+
+def test_unlock_attempts():
+    s = Storage()
+    hw_salt = b"\x00\x00\x00\x00\x00\x00"
+    s.init(hw_salt)
+    s._set_pin("229922")
+    before = s._dump()
+
+    pins = ["1234", "229922", "", "2299221"]
+    results = unlock_attempts(s, pins, max_workers=2)
+    assert s._dump() == before
+
+    for pin, (unlocked, after) in zip(pins, results):
+        expected = copy.deepcopy(s)
+        seed = prng.seed
+        assert expected.unlock(pin) == unlocked
+        prng.random_reseed(seed)
+        assert after._dump() == expected._dump()
+        assert after.get_pin_rem() == expected.get_pin_rem()
+    assert [unlocked for unlocked, _ in results] == [False, True, False, False]
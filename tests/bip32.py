@@ -18,7 +18,8 @@ import hashlib
 import hmac
 import struct
 from copy import copy
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Iterable, List, Tuple
 
 import ecdsa
 from ecdsa.curves import SECP256k1
@@ -27,6 +28,16 @@ from ecdsa.util import number_to_string, string_to_number
 
 from trezorlib import messages, tools
 
+try:
+    import coincurve
+
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+# Number of derived child keys and encoded xpubs kept in memory.
+CACHE_SIZE = 4096
+
 
 def point_to_pubkey(point: Point) -> bytes:
     order = SECP256k1.order
@@ -57,6 +68,7 @@ def sec_to_public_pair(pubkey: bytes) -> Tuple[int, Any]:
     )
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def fingerprint(pubkey: bytes) -> int:
     return string_to_number(tools.hash_160(pubkey)[:4])
 
@@ -77,38 +89,77 @@ def public_ckd(public_node: messages.HDNodeType, n: List[int]):
     return node
 
 
-def get_subnode(node: messages.HDNodeType, i: int) -> messages.HDNodeType:
-    # Public Child key derivation (CKD) algorithm of BIP32
-    i_as_bytes = struct.pack(">L", i)
+def public_ckd_batch(
+    public_node: messages.HDNodeType, prefix: List[int], indexes: Iterable[int]
+) -> List[messages.HDNodeType]:
+    """Derive the nodes `prefix + [i]` for every `i` in `indexes`.
 
-    if i & tools.HARDENED_FLAG:
-        raise ValueError("Prime derivation not supported")
+    The common prefix is derived only once.
+    """
+    parent = public_ckd(public_node, prefix)
+    return [get_subnode(parent, i) for i in indexes]
 
-    # Public derivation
-    data = node.public_key + i_as_bytes
 
-    I64 = hmac.HMAC(key=node.chain_code, msg=data, digestmod=hashlib.sha512).digest()
-    I_left_as_exponent = string_to_number(I64[:32])
+def _add_tweak(public_key: bytes, tweak: bytes) -> bytes:
+    """Compute `public_key + tweak * G` as a compressed public key."""
+    if COINCURVE_AVAILABLE:
+        # raises ValueError for point at infinity
+        return coincurve.PublicKey(public_key).add(tweak).format()
 
     # BIP32 magic converts old public key to new public point
-    x, y = sec_to_public_pair(node.public_key)
-    point = I_left_as_exponent * SECP256k1.generator + Point(
+    x, y = sec_to_public_pair(public_key)
+    point = string_to_number(tweak) * SECP256k1.generator + Point(
         SECP256k1.curve, x, y, SECP256k1.order
     )
 
     if point == INFINITY:
         raise ValueError("Point cannot be INFINITY")
 
+    # Convert public point to compressed public key
+    return point_to_pubkey(point)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _derive_child(chain_code: bytes, public_key: bytes, i: int) -> Tuple[bytes, bytes]:
+    """Return chain code and public key of the i-th child.
+
+    Memoized, so that deriving sibling and descendant nodes reuses common parents.
+    """
+    data = public_key + struct.pack(">L", i)
+    I64 = hmac.HMAC(key=chain_code, msg=data, digestmod=hashlib.sha512).digest()
+    return I64[32:], _add_tweak(public_key, I64[:32])
+
+
+def get_subnode(node: messages.HDNodeType, i: int) -> messages.HDNodeType:
+    # Public Child key derivation (CKD) algorithm of BIP32
+    if i & tools.HARDENED_FLAG:
+        raise ValueError("Prime derivation not supported")
+
+    chain_code, public_key = _derive_child(node.chain_code, node.public_key, i)
     return messages.HDNodeType(
         depth=node.depth + 1,
         child_num=i,
-        chain_code=I64[32:],
+        chain_code=chain_code,
         fingerprint=fingerprint(node.public_key),
-        # Convert public point to compressed public key
-        public_key=point_to_pubkey(point),
+        public_key=public_key,
     )
 
 
+@lru_cache(maxsize=CACHE_SIZE)
+def _b58check_encode(data: bytes) -> str:
+    return tools.b58encode(data + tools.btc_hash(data)[:4])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _b58check_decode(xpub: str) -> bytes:
+    data = tools.b58decode(xpub, None)
+
+    if tools.btc_hash(data[:-4])[:4] != data[-4:]:
+        raise ValueError("Checksum failed")
+
+    return data[:-4]
+
+
 def serialize(node: messages.HDNodeType, version: int = 0x0488B21E) -> str:
     s = b""
     s += struct.pack(">I", version)
@@ -120,15 +171,11 @@ def serialize(node: messages.HDNodeType, version: int = 0x0488B21E) -> str:
         s += b"\x00" + node.private_key
     else:
         s += node.public_key
-    s += tools.btc_hash(s)[:4]
-    return tools.b58encode(s)
+    return _b58check_encode(s)
 
 
 def deserialize(xpub: str) -> messages.HDNodeType:
-    data = tools.b58decode(xpub, None)
-
-    if tools.btc_hash(data[:-4])[:4] != data[-4:]:
-        raise ValueError("Checksum failed")
+    data = _b58check_decode(xpub)
 
     node = messages.HDNodeType(
         depth=struct.unpack(">B", data[4:5])[0],
@@ -138,7 +185,7 @@ def deserialize(xpub: str) -> messages.HDNodeType:
         public_key=None,
     )
 
-    key = data[45:-4]
+    key = data[45:]
     if key[0] == 0:
         node.private_key = key[1:]
     else:
@@ -16,8 +16,10 @@
 
 from __future__ import annotations
 
+import json
 import os
-from typing import TYPE_CHECKING, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
 
 import pytest
 
@@ -40,6 +42,21 @@ if TYPE_CHECKING:
 # So that we see details of failed asserts from this module
 pytest.register_assert_rewrite("tests.common")
 
+# Storage images of freshly set up devices, keyed by the client configuration.
+# Filled and used only with `--flash-snapshots`, separately in every worker process.
+FLASH_SNAPSHOTS: Dict[Tuple[Any, ...], bytes] = {}
+SNAPSHOT_STATS = {"created": 0, "restored": 0}
+# Launch-to-ready time of every emulator boot in this process, in seconds.
+BOOT_LATENCIES: List[float] = []
+
+# Setup, call and teardown time of every test, see `--record-durations`.
+TEST_DURATIONS: Dict[str, float] = {}
+
+
+def _record_boot(emulator: "Emulator") -> None:
+    if emulator.boot_latency is not None:
+        BOOT_LATENCIES.append(emulator.boot_latency)
+
 
 @pytest.fixture(scope="session")
 def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None]:
@@ -87,6 +104,7 @@ def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None
     with EmulatorWrapper(
         model, port=_get_port(), headless=True, auto_interact=not interact
     ) as emu:
+        _record_boot(emu)
         yield emu
 
 
@@ -155,6 +173,10 @@ def client(
     To enable experimental features:
 
     @pytest.mark.experimental
+
+    With `--flash-snapshots`, the storage of the emulator is saved after the first
+    setup of every configuration, and later tests with the same configuration
+    restart the emulator from that image instead of wiping and loading the device.
     """
     if request.node.get_closest_marker("skip_t2") and _raw_client.features.model == "T":
         pytest.skip("Test excluded on Trezor T")
@@ -176,24 +198,6 @@ def client(
 
     test_ui = request.config.getoption("ui")
 
-    _raw_client.reset_debug_features()
-    _raw_client.open()
-    try:
-        _raw_client.init_device()
-    except Exception:
-        request.session.shouldstop = "Failed to communicate with Trezor"
-        pytest.fail("Failed to communicate with Trezor")
-
-    if test_ui:
-        # we need to reseed before the wipe
-        _raw_client.debug.reseed(0)
-
-    if sd_marker:
-        should_format = sd_marker.kwargs.get("formatted", True)
-        _raw_client.debug.erase_sd_card(format=should_format)
-
-    wipe_device(_raw_client)
-
     setup_params = dict(
         uninitialized=False,
         mnemonic=" ".join(["all"] * 12),
@@ -210,8 +214,41 @@ def client(
     use_passphrase = setup_params["passphrase"] is True or isinstance(
         setup_params["passphrase"], str
     )
+    experimental = request.node.get_closest_marker("experimental") is not None
+
+    snapshot_key = _snapshot_key(request, setup_params, experimental)
+    restored = snapshot_key in FLASH_SNAPSHOTS
+    emulator: Optional["Emulator"] = None
+    if request.config.getoption("flash_snapshots"):
+        emulator = request.getfixturevalue("emulator")
+        if restored:
+            emulator.restore_storage(FLASH_SNAPSHOTS[snapshot_key])
+            SNAPSHOT_STATS["restored"] += 1
+            _record_boot(emulator)
+        # restarting replaces the client, the session-wide one may be closed
+        assert emulator.client is not None
+        _raw_client = emulator.client
 
-    if not setup_params["uninitialized"]:
+    _raw_client.reset_debug_features()
+    _raw_client.open()
+    try:
+        _raw_client.init_device()
+    except Exception:
+        request.session.shouldstop = "Failed to communicate with Trezor"
+        pytest.fail("Failed to communicate with Trezor")
+
+    if test_ui:
+        # we need to reseed before the wipe
+        _raw_client.debug.reseed(0)
+
+    if sd_marker:
+        should_format = sd_marker.kwargs.get("formatted", True)
+        _raw_client.debug.erase_sd_card(format=should_format)
+
+    if not restored:
+        wipe_device(_raw_client)
+
+    if not setup_params["uninitialized"] and not restored:
         debuglink.load_device(
             _raw_client,
             mnemonic=setup_params["mnemonic"],
@@ -223,9 +260,14 @@ def client(
             no_backup=setup_params["no_backup"],
         )
 
-        if request.node.get_closest_marker("experimental"):
+        if experimental:
             apply_settings(_raw_client, experimental_features=True)
 
+    if emulator is not None and snapshot_key is not None and not restored:
+        FLASH_SNAPSHOTS[snapshot_key] = emulator.get_storage()
+        SNAPSHOT_STATS["created"] += 1
+
+    if not setup_params["uninitialized"]:
         if use_passphrase and isinstance(setup_params["passphrase"], str):
             _raw_client.use_passphrase(setup_params["passphrase"])
 
@@ -240,9 +282,36 @@ def client(
     _raw_client.close()
 
 
+def _snapshot_key(
+    request: pytest.FixtureRequest,
+    setup_params: Dict[str, Any],
+    experimental: bool,
+) -> Optional[Tuple[Any, ...]]:
+    """Get the flash snapshot key of a client configuration, or None if not cached.
+
+    PIN-protected configurations are not cached: a restarted emulator comes up locked,
+    while a freshly loaded device is unlocked. Tests touching the SD card are not
+    cached either, as its contents live outside of the flash image. UI tests are not
+    cached, as skipping the wipe after the reseed changes the screens they record.
+    """
+    if not request.config.getoption("flash_snapshots"):
+        return None
+    if request.config.getoption("ui"):
+        return None
+    if setup_params["pin"] is not None:
+        return None
+    if request.node.get_closest_marker("sd_card"):
+        return None
+    params = dict(setup_params)
+    if not isinstance(params["mnemonic"], str):
+        params["mnemonic"] = tuple(params["mnemonic"])
+    return tuple(sorted(params.items())) + (("experimental", experimental),)
+
+
 def pytest_sessionstart(session: pytest.Session) -> None:
     ui_tests.read_fixtures()
-    if session.config.getoption("ui"):
+    # a sharded session shares the report directory with the other shards
+    if session.config.getoption("ui") and not session.config.getoption("ui_results"):
         testreport.clear_dir()
 
 
@@ -254,9 +323,19 @@ def _should_write_ui_report(exitstatus: pytest.ExitCode) -> bool:
 
 
 def pytest_sessionfinish(session: pytest.Session, exitstatus: pytest.ExitCode) -> None:
+    durations_file = session.config.getoption("record_durations")
+    if durations_file:
+        _write_durations(Path(durations_file))
+
     if not _should_write_ui_report(exitstatus):
         return
 
+    ui_results = session.config.getoption("ui_results")
+    if ui_results:
+        # fixtures are written by the runner once all shards are finished
+        ui_tests.write_results(Path(ui_results))
+        return
+
     missing = session.config.getoption("ui_check_missing")
     test_ui = session.config.getoption("ui")
 
@@ -273,12 +352,37 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: pytest.ExitCode) -
         testreport.index()
 
 
+def _write_durations(path: Path) -> None:
+    durations = json.loads(path.read_text()) if path.exists() else {}
+    durations.update(TEST_DURATIONS)
+    path.write_text(json.dumps(durations, indent=0, sort_keys=True) + "\n")
+
+
 def pytest_terminal_summary(
     terminalreporter: "TerminalReporter", exitstatus: pytest.ExitCode, config: "Config"
 ) -> None:
     println = terminalreporter.write_line
     println("")
 
+    if config.getoption("flash_snapshots"):
+        println(
+            f"Flash snapshots: {SNAPSHOT_STATS['created']} created, "
+            f"{SNAPSHOT_STATS['restored']} restored."
+        )
+        println("")
+
+    if BOOT_LATENCIES:
+        mean = sum(BOOT_LATENCIES) / len(BOOT_LATENCIES)
+        println(
+            f"Emulator boots: {len(BOOT_LATENCIES)}, "
+            f"mean boot-to-ready {mean:.3f} s, max {max(BOOT_LATENCIES):.3f} s."
+        )
+        println("")
+
+    if config.getoption("ui_results"):
+        # missing tests and fixture suggestions only make sense for the whole suite
+        return
+
     ui_option = config.getoption("ui")
     missing_tests = ui_tests.list_missing()
     if ui_option and _should_write_ui_report(exitstatus) and missing_tests:
@@ -340,6 +444,27 @@ def pytest_addoption(parser: "Parser") -> None:
         help="Which emulator to use: 'core' or 'legacy'. "
         "Only valid in connection with `--control-emulators`",
     )
+    parser.addoption(
+        "--flash-snapshots",
+        action="store_true",
+        default=False,
+        help="Restore the emulator storage from a snapshot instead of wiping and "
+        "loading the device for every test. Only valid with `--control-emulators`.",
+    )
+    parser.addoption(
+        "--record-durations",
+        action="store",
+        metavar="PATH",
+        help="Store duration of every test into a JSON file, updating previous "
+        "contents. Used for balancing of tests/run_sharded.py.",
+    )
+    parser.addoption(
+        "--ui-results",
+        action="store",
+        metavar="PATH",
+        help="Store UI test results into a JSON file instead of writing fixtures. "
+        "Used by tests/run_sharded.py to merge the results of all shards.",
+    )
 
 
 def pytest_configure(config: "Config") -> None:
@@ -347,6 +472,11 @@ def pytest_configure(config: "Config") -> None:
 
     Registers known markers, enables verbose output if requested.
     """
+    if config.getoption("flash_snapshots") and not config.getoption(
+        "control_emulators"
+    ):
+        raise pytest.UsageError("--flash-snapshots requires --control-emulators")
+
     # register known markers
     config.addinivalue_line("markers", "skip_t1: skip the test on Trezor One")
     config.addinivalue_line("markers", "skip_t2: skip the test on Trezor T")
@@ -381,6 +511,12 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
         pytest.skip("Skipping altcoin test")
 
 
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    TEST_DURATIONS[report.nodeid] = (
+        TEST_DURATIONS.get(report.nodeid, 0.0) + report.duration
+    )
+
+
 def pytest_runtest_teardown(item: pytest.Item) -> None:
     """Called after a test item finishes.
 
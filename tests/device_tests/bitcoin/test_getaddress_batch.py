@@ -0,0 +1,169 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from trezorlib import btc, device, messages
+from trezorlib.debuglink import TrezorClientDebugLink as Client
+from trezorlib.exceptions import TrezorFailure
+from trezorlib.messages import SafetyCheckLevel
+from trezorlib.tools import parse_path
+
+S = messages.InputScriptType
+
+VECTORS = (  # coin, parent path, script type
+    ("Bitcoin", "m/44h/0h/0h/0", S.SPENDADDRESS),
+    ("Bitcoin", "m/49h/0h/0h/1", S.SPENDP2SHWITNESS),
+    ("Bitcoin", "m/84h/0h/0h/0", S.SPENDWITNESS),
+    ("Bitcoin", "m/86h/0h/0h/0", S.SPENDTAPROOT),
+    ("Testnet", "m/44h/1h/0h/0", S.SPENDADDRESS),
+    ("Testnet", "m/84h/1h/1h/1", S.SPENDWITNESS),
+)
+
+
+def get_addresses(client: Client, ranges, include_public_keys=False):
+    batches = btc.get_addresses_batch(client, ranges, include_public_keys)
+    addresses, public_keys = [], []
+    for batch in batches:
+        addresses += batch.addresses
+        public_keys += batch.public_keys
+    return addresses, public_keys
+
+
+def get_address(client: Client, coin, parent, i, script_type):
+    path = parse_path(parent) + [i]
+    return btc.get_address(client, coin, path, script_type=script_type)
+
+
+@pytest.mark.parametrize("coin, parent, script_type", VECTORS)
+def test_matches_get_address(client: Client, coin, parent, script_type):
+    r = messages.AddressRange(
+        address_n=parse_path(parent),
+        coin_name=coin,
+        script_type=script_type,
+        start=3,
+        count=4,
+    )
+    addresses, public_keys = get_addresses(client, [r])
+    assert addresses == [
+        get_address(client, coin, parent, i, script_type) for i in range(3, 7)
+    ]
+    assert public_keys == []
+
+
+def test_mixed_coins(client: Client):
+    ranges = [
+        messages.AddressRange(
+            address_n=parse_path(parent),
+            coin_name=coin,
+            script_type=script_type,
+            start=0,
+            count=2,
+        )
+        for coin, parent, script_type in VECTORS
+    ]
+    with client:
+        # all ranges are answered by a single request
+        client.set_expected_responses([messages.AddressBatch])
+        addresses, _ = get_addresses(client, ranges)
+
+    assert addresses == [
+        get_address(client, coin, parent, i, script_type)
+        for coin, parent, script_type in VECTORS
+        for i in range(2)
+    ]
+    assert addresses[0] == "1JAd7XCBzGudGpJQSDSfpmJhiygtLQWaGL"
+    assert addresses[1] == "1GWFxtwWmNVqotUPXLcKVL2mUKpshuJYo"
+    assert addresses[8] == "mvbu1Gdy8SUjTenqerxUaZyYjmveZvt33q"
+    assert addresses[9] == "mopZWqZZyQc3F2Sy33cvDtJchSAMsnLi7b"
+
+
+def test_public_keys(client: Client):
+    r = messages.AddressRange(
+        address_n=parse_path("m/84h/1h/0h/0"),
+        coin_name="Testnet",
+        script_type=S.SPENDWITNESS,
+        start=0,
+        count=3,
+    )
+    addresses, public_keys = get_addresses(client, [r], include_public_keys=True)
+    assert len(addresses) == len(public_keys) == 3
+    for i, public_key in enumerate(public_keys):
+        path = parse_path(f"m/84h/1h/0h/0/{i}")
+        node = btc.get_public_node(client, path, coin_name="Testnet").node
+        assert public_key == node.public_key
+
+
+def test_limit(client: Client):
+    r = messages.AddressRange(
+        address_n=parse_path("m/44h/1h/0h/0"), coin_name="Testnet", start=0, count=65
+    )
+    with pytest.raises(TrezorFailure, match="At most 64 addresses"):
+        client.call(messages.GetAddressBatch(ranges=[r]))
+
+    # the limit applies to all ranges together
+    r.count = 32
+    r2 = messages.AddressRange(
+        address_n=parse_path("m/44h/1h/0h/1"), coin_name="Testnet", start=0, count=33
+    )
+    with pytest.raises(TrezorFailure, match="At most 64 addresses"):
+        client.call(messages.GetAddressBatch(ranges=[r, r2]))
+
+    # trezorlib splits larger ranges into several requests
+    r.count = 65
+    with client:
+        client.set_expected_responses([messages.AddressBatch] * 2)
+        addresses, _ = get_addresses(client, [r])
+    assert len(addresses) == 65
+    assert addresses[64] == get_address(
+        client, "Testnet", "m/44h/1h/0h/0", 64, S.SPENDADDRESS
+    )
+
+
+def test_empty(client: Client):
+    with pytest.raises(TrezorFailure, match="No address ranges"):
+        client.call(messages.GetAddressBatch(ranges=[]))
+
+    r = messages.AddressRange(
+        address_n=parse_path("m/44h/0h/0h/0"), coin_name="Bitcoin", start=0, count=0
+    )
+    res = client.call(messages.GetAddressBatch(ranges=[r], include_public_keys=True))
+    assert res.addresses == []
+    assert res.public_keys == []
+
+
+@pytest.mark.parametrize(
+    "parent, start",
+    (
+        # slip44 id mismatch
+        ("m/44h/1h/0h/0", 0),
+        # unknown coin type
+        ("m/44h/9h/0h/0", 0),
+        # hardened address index
+        ("m/44h/0h/0h/0", 0x8000_0000),
+    ),
+)
+def test_forbidden_path(client: Client, parent, start):
+    r = messages.AddressRange(
+        address_n=parse_path(parent), coin_name="Bitcoin", start=start, count=1
+    )
+    with pytest.raises(TrezorFailure, match="Forbidden key path"):
+        client.call(messages.GetAddressBatch(ranges=[r]))
+
+    # addresses are never shown, so unknown paths are not allowed with a warning
+    device.apply_settings(client, safety_checks=SafetyCheckLevel.PromptTemporarily)
+    with pytest.raises(TrezorFailure, match="Forbidden key path"):
+        client.call(messages.GetAddressBatch(ranges=[r]))
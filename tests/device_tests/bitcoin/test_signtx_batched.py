@@ -0,0 +1,228 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Batched signing (SignTx.batch_size) must not change the signed transaction."""
+
+import pytest
+
+from trezorlib import btc, messages
+from trezorlib.debuglink import TrezorClientDebugLink as Client
+from trezorlib.tools import parse_path
+
+from ...tx_cache import TxCache
+
+TX_CACHE_TESTNET = TxCache("Testnet")
+TX_CACHE_MAINNET = TxCache("Bitcoin")
+
+TXHASH_ac4ca0 = bytes.fromhex(
+    "ac4ca0e7827a1228f44449cb57b4b9a809a667ca044dc43bb124627fed4bc10a"
+)
+TXHASH_301948 = bytes.fromhex(
+    "3019487f064329247daad245aed7a75349d09c14b1d24f170947690e030f5b20"
+)
+TXHASH_65047a = bytes.fromhex(
+    "65047a2b107d6301d72d4a1e49e7aea9cf06903fdc4ae74a4a9bba9bc1a414d2"
+)
+TXHASH_d159fd = bytes.fromhex(
+    "d159fd2fcb5854a7c8b275d598765a446f1e2ff510bf077545a404a0c9db65f7"
+)
+TXHASH_beafc7 = bytes.fromhex(
+    "beafc7cbd873d06dbee88a7002768ad5864228639db514c81cfb29f108bb1e7a"
+)
+TXHASH_50f6f1 = bytes.fromhex(
+    "50f6f1209ca92d7359564be803cb2c932cde7d370f7cee50fd1fad6790f6206d"
+)
+TXHASH_6b07c1 = bytes.fromhex(
+    "6b07c1321b52d9c85743f9695e13eb431b41708cdf4e1585258d51208e5b93fc"
+)
+
+
+def sign_tx(client: Client, batch_size, *args, **kwargs):
+    """Sign and return the signatures, serialized tx and number of TxRequests."""
+    tx_requests = 0
+    call = client.call
+
+    def counting_call(msg):
+        nonlocal tx_requests
+        resp = call(msg)
+        if isinstance(resp, messages.TxRequest):
+            tx_requests += 1
+        return resp
+
+    client.call = counting_call
+    try:
+        signatures, serialized_tx = btc.sign_tx(
+            client, *args, batch_size=batch_size, **kwargs
+        )
+    finally:
+        del client.call
+    return signatures, serialized_tx, tx_requests
+
+
+def assert_batched_matches(client: Client, *args, **kwargs):
+    """Check that batched signing gives the same result with fewer TxRequests.
+
+    Returns the number of TxRequests without batching and with the largest batch.
+    """
+    signatures, serialized_tx, tx_requests = sign_tx(client, None, *args, **kwargs)
+    batched_requests = tx_requests
+    for batch_size in (2, 8):
+        batched = sign_tx(client, batch_size, *args, **kwargs)
+        assert batched[0] == signatures
+        assert batched[1] == serialized_tx
+        assert batched[2] <= batched_requests
+        batched_requests = batched[2]
+    return tx_requests, batched_requests
+
+
+def test_legacy(client: Client):
+    inp1 = messages.TxInputType(
+        address_n=parse_path("m/44h/0h/0h/0/55"),
+        amount=10_000,
+        prev_hash=TXHASH_ac4ca0,
+        prev_index=1,
+    )
+    inp2 = messages.TxInputType(
+        address_n=parse_path("m/44h/0h/0h/1/7"),
+        amount=83_130,
+        prev_hash=TXHASH_ac4ca0,
+        prev_index=0,
+    )
+    out1 = messages.TxOutputType(
+        address_n=parse_path("m/44h/0h/0h/1/8"),
+        amount=71_790,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+    out2 = messages.TxOutputType(
+        address="1ByqmhXkC6U5GuUNnAhJsuEVjHt5GhEuJL",
+        amount=10_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+    tx_requests, batched_requests = assert_batched_matches(
+        client, "Bitcoin", [inp1, inp2], [out1, out2], prev_txes=TX_CACHE_MAINNET
+    )
+    assert batched_requests < tx_requests
+
+
+@pytest.mark.slow
+def test_legacy_many_inputs(client: Client):
+    # more inputs than the largest batch, and a previous tx with many outputs
+    inputs = [
+        messages.TxInputType(
+            address_n=parse_path(f"m/44h/1h/1h/0/{i}"),
+            amount=14_598,
+            prev_hash=TXHASH_301948,
+            prev_index=i,
+        )
+        for i in range(20)
+    ]
+    out = messages.TxOutputType(
+        address="mnY26FLTzfC94mDoUcyDJh1GVE3LuAUMbs",
+        amount=20 * 14_598 - 20_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+    tx_requests, batched_requests = assert_batched_matches(
+        client, "Testnet", inputs, [out], prev_txes=TX_CACHE_TESTNET
+    )
+    # every input is requested in every phase, so batches of 8 save most requests
+    assert batched_requests < tx_requests / 2
+
+
+def test_segwit(client: Client):
+    inp1 = messages.TxInputType(
+        address_n=parse_path("m/49h/1h/0h/0/0"),
+        amount=40_000,
+        prev_hash=TXHASH_65047a,
+        prev_index=0,
+        script_type=messages.InputScriptType.SPENDP2SHWITNESS,
+    )
+    inp2 = messages.TxInputType(
+        address_n=parse_path("m/84h/1h/0h/0/87"),
+        amount=100_000,
+        prev_hash=TXHASH_d159fd,
+        prev_index=0,
+        script_type=messages.InputScriptType.SPENDWITNESS,
+    )
+    out1 = messages.TxOutputType(
+        address="tb1q54un3q39sf7e7tlfq99d6ezys7qgc62a6rxllc",
+        amount=25_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+    out2 = messages.TxOutputType(
+        address_n=parse_path("m/84h/1h/0h/1/0"),
+        amount=100_000 + 40_000 - 25_000 - 10_000,
+        script_type=messages.OutputScriptType.PAYTOWITNESS,
+    )
+    assert_batched_matches(
+        client, "Testnet", [inp1, inp2], [out1, out2], prev_txes=TX_CACHE_TESTNET
+    )
+
+
+def test_replacement(client: Client):
+    inp1 = messages.TxInputType(
+        address_n=parse_path("m/44h/0h/0h/0/4"),
+        amount=174_998,
+        prev_hash=TXHASH_beafc7,
+        prev_index=0,
+        orig_hash=TXHASH_50f6f1,
+        orig_index=0,
+    )
+    out1 = messages.TxOutputType(
+        address_n=parse_path("m/44h/0h/0h/1/2"),
+        amount=174_998 - 50_000 - 15_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+        orig_hash=TXHASH_50f6f1,
+        orig_index=0,
+    )
+    out2 = messages.TxOutputType(
+        address="1GA9u9TfCG7SWmKCveBumdA1TZpfom6ZdJ",
+        amount=50_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+        orig_hash=TXHASH_50f6f1,
+        orig_index=1,
+    )
+    assert_batched_matches(
+        client, "Bitcoin", [inp1], [out1, out2], prev_txes=TX_CACHE_MAINNET
+    )
+
+
+@pytest.mark.multisig
+def test_multisig(client: Client):
+    nodes = [
+        btc.get_public_node(
+            client, parse_path(f"m/48h/1h/{index}h/0h"), coin_name="Testnet"
+        ).node
+        for index in range(1, 4)
+    ]
+    multisig = messages.MultisigRedeemScriptType(
+        nodes=nodes, address_n=[0, 0], signatures=[b"", b"", b""], m=2
+    )
+    inp1 = messages.TxInputType(
+        address_n=parse_path("m/48h/1h/1h/0h/0/0"),
+        amount=1_496_278,
+        prev_hash=TXHASH_6b07c1,
+        prev_index=0,
+        script_type=messages.InputScriptType.SPENDMULTISIG,
+        multisig=multisig,
+    )
+    out1 = messages.TxOutputType(
+        address="mnY26FLTzfC94mDoUcyDJh1GVE3LuAUMbs",
+        amount=1_496_278 - 10_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+    assert_batched_matches(
+        client, "Testnet", [inp1], [out1], prev_txes=TX_CACHE_TESTNET
+    )
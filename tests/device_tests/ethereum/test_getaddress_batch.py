@@ -0,0 +1,134 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from trezorlib import ethereum, messages
+from trezorlib.debuglink import TrezorClientDebugLink as Client
+from trezorlib.exceptions import TrezorFailure
+from trezorlib.tools import H_, parse_path
+
+pytestmark = [pytest.mark.altcoin, pytest.mark.ethereum]
+
+
+def get_addresses(client: Client, ranges, include_public_keys=False):
+    batches = ethereum.get_addresses_batch(client, ranges, include_public_keys)
+    addresses, public_keys = [], []
+    for batch in batches:
+        addresses += batch.addresses
+        public_keys += batch.public_keys
+    return addresses, public_keys
+
+
+def test_matches_get_address(client: Client):
+    r = messages.EthereumAddressRange(
+        address_n=parse_path("m/44h/60h/0h/0"), start=98, count=4
+    )
+    addresses, public_keys = get_addresses(client, [r])
+    assert addresses == [
+        ethereum.get_address(client, parse_path(f"m/44h/60h/0h/0/{i}"))
+        for i in range(98, 102)
+    ]
+    assert addresses[2] == "0x1e6E3708a059aEa1241a81c7aAe84b6CDbC54d59"
+    assert public_keys == []
+
+
+def test_accounts(client: Client):
+    # Ledger Live style discovery iterates the hardened account index
+    ranges = [
+        messages.EthereumAddressRange(
+            address_n=parse_path("m/44h/60h"), start=H_(0), count=2
+        ),
+        messages.EthereumAddressRange(
+            address_n=parse_path("m/44h/60h"), start=H_(100), count=1
+        ),
+        messages.EthereumAddressRange(
+            address_n=parse_path("m/44h/60h/0h/0"), start=0, count=1
+        ),
+    ]
+    with client:
+        client.set_expected_responses([messages.EthereumAddressBatch])
+        addresses, _ = get_addresses(client, ranges)
+
+    assert addresses[0] == "0xdA0b608bdb1a4A154325C854607c68950b4F1a34"
+    assert addresses[1] == ethereum.get_address(client, parse_path("m/44h/60h/1h"))
+    assert addresses[2] == "0x93Fb0Ff84F5BB6E7b6a9835C7AA6dE7a76794266"
+    assert addresses[3] == "0x73d0385F4d8E00C5e6504C6030F47BF6212736A8"
+
+
+def test_public_keys(client: Client):
+    r = messages.EthereumAddressRange(
+        address_n=parse_path("m/44h/60h/0h/0"), start=0, count=3
+    )
+    addresses, public_keys = get_addresses(client, [r], include_public_keys=True)
+    assert len(addresses) == len(public_keys) == 3
+    for i, public_key in enumerate(public_keys):
+        path = parse_path(f"m/44h/60h/0h/0/{i}")
+        node = ethereum.get_public_node(client, path).node
+        assert public_key == node.public_key
+
+
+def test_limit(client: Client):
+    r = messages.EthereumAddressRange(
+        address_n=parse_path("m/44h/60h/0h/0"), start=0, count=65
+    )
+    with pytest.raises(TrezorFailure, match="At most 64 addresses"):
+        client.call(messages.EthereumGetAddressBatch(ranges=[r]))
+
+    # trezorlib splits larger ranges into several requests
+    with client:
+        client.set_expected_responses([messages.EthereumAddressBatch] * 2)
+        addresses, _ = get_addresses(client, [r])
+    assert len(addresses) == 65
+    assert addresses[64] == ethereum.get_address(
+        client, parse_path("m/44h/60h/0h/0/64")
+    )
+
+
+def test_empty(client: Client):
+    with pytest.raises(TrezorFailure, match="No address ranges"):
+        client.call(messages.EthereumGetAddressBatch(ranges=[]))
+
+    r = messages.EthereumAddressRange(
+        address_n=parse_path("m/44h/60h/0h/0"), start=0, count=0
+    )
+    res = client.call(
+        messages.EthereumGetAddressBatch(ranges=[r], include_public_keys=True)
+    )
+    assert res.addresses == []
+    assert res.public_keys == []
+
+
+@pytest.mark.parametrize(
+    "parent, start",
+    (
+        # the network is given by the first range, testnet paths are not allowed
+        ("m/44h/1h/0h/0", 0),
+        # hardened address index
+        ("m/44h/60h/0h/0", H_(0)),
+    ),
+)
+def test_forbidden_path(client: Client, parent, start):
+    ranges = [
+        messages.EthereumAddressRange(
+            address_n=parse_path("m/44h/60h/0h/0"), start=0, count=1
+        ),
+        messages.EthereumAddressRange(
+            address_n=parse_path(parent), start=start, count=1
+        ),
+    ]
+    with pytest.raises(TrezorFailure, match="Forbidden key path"):
+        client.call(messages.EthereumGetAddressBatch(ranges=ranges))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Run device tests in shards, each against its own core emulator.
+
+Test modules are distributed over the shards so that their total historical
+duration is balanced. Durations of every run are stored, so the next run is
+balanced better. UI results of all shards are merged into a single fixtures.json.
+
+PYTEST_ARGS are passed to every shard as well as to the collection of tests.
+
+\b
+Examples:
+  tests/run_sharded.py -n 8
+  tests/run_sharded.py -n 8 --ui record -- -k bitcoin
+  tests/run_sharded.py -t tests/device_tests/ethereum -- -m "not sd_card"
+"""
+
+import heapq
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import click
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tests import ui_tests  # noqa: E402
+from tests.emulators import EmulatorWrapper  # noqa: E402
+from tests.ui_tests.reporting import testreport  # noqa: E402
+
+DURATIONS_FILE = ROOT / "tests" / ".durations.json"
+# Estimate for tests that have not been run yet.
+DEFAULT_DURATION = 1.0
+# One emulator instance occupies 3 consecutive ports, see conftest.py
+BASE_PORT = 21000
+
+
+def collect(args: Sequence[str]) -> List[str]:
+    """Get node ids of all tests pytest would run with the given arguments."""
+    res = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *args],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if res.returncode != 0:
+        raise click.ClickException("Collection of tests failed:\n" + res.stdout)
+    return [line for line in res.stdout.splitlines() if "::" in line]
+
+
+def plan_shards(
+    node_ids: Sequence[str], durations: Dict[str, float], shards: int
+) -> List[Tuple[float, List[str]]]:
+    """Distribute test modules into shards of similar total duration.
+
+    Modules are assigned longest first, each to the shard with the lowest total
+    so far. Returns the estimated duration and the list of modules of every shard.
+    """
+    modules: Dict[str, float] = defaultdict(float)
+    for node_id in node_ids:
+        module = node_id.split("::", 1)[0]
+        modules[module] += durations.get(node_id, DEFAULT_DURATION)
+
+    heap: List[Tuple[float, int, List[str]]] = [(0.0, i, []) for i in range(shards)]
+    for module, duration in sorted(modules.items(), key=lambda m: (-m[1], m[0])):
+        total, i, assigned = heapq.heappop(heap)
+        assigned.append(module)
+        heapq.heappush(heap, (total + duration, i, assigned))
+
+    return [
+        (total, assigned) for total, _, assigned in sorted(heap, key=lambda s: s[1])
+    ]
+
+
+def load_durations(path: Path) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def merge_durations(path: Path, shard_files: Sequence[Path]) -> None:
+    durations = load_durations(path)
+    for shard_file in shard_files:
+        durations.update(load_durations(shard_file))
+    path.write_text(json.dumps(durations, indent=0, sort_keys=True) + "\n")
+
+
+def finish_ui(
+    ui: str, results: Sequence[Path], check_missing: bool, all_passed: bool
+) -> bool:
+    """Write fixtures and report for the whole run. Returns False if UI test failed."""
+    ui_tests.read_fixtures()
+    ui_tests.merge_results([r for r in results if r.exists()], ui == "record")
+
+    missing = ui_tests.list_missing()
+    if missing:
+        click.echo(f"{len(missing)} expected UI tests did not run.")
+
+    ok = True
+    if ui == "test":
+        if check_missing and missing:
+            ok = False
+        ui_tests.write_fixtures_suggestion(check_missing)
+    elif all_passed:
+        ui_tests.write_fixtures(check_missing)
+    else:
+        click.echo(f"Recording to {ui_tests.HASH_FILE.name} was disabled.")
+        ui_tests.write_fixtures_suggestion(check_missing, only_passed_tests=True)
+    testreport.index()
+    return ok
+
+
+@click.command(help=__doc__)
+@click.option("-n", "--shards", type=int, default=os.cpu_count(), show_default=True)
+@click.option("--ui", type=click.Choice(["test", "record"]))
+@click.option("--ui-check-missing", is_flag=True)
+@click.option(
+    "--durations",
+    "durations_file",
+    type=click.Path(dir_okay=False),
+    default=str(DURATIONS_FILE),
+    show_default=True,
+    help="Historical test durations, updated after the run",
+)
+@click.option("--tag", help="Emulator tag from tests/emulators, local build if unset")
+@click.option(
+    "-t",
+    "--tests",
+    "test_paths",
+    multiple=True,
+    default=["tests/device_tests"],
+    show_default=True,
+    help="Directories or modules to run",
+)
+@click.argument("pytest_args", nargs=-1, type=click.UNPROCESSED)
+def cli(
+    shards: int,
+    ui: Optional[str],
+    ui_check_missing: bool,
+    durations_file: str,
+    tag: Optional[str],
+    test_paths: Tuple[str, ...],
+    pytest_args: Tuple[str, ...],
+) -> None:
+    durations_path = Path(durations_file)
+
+    node_ids = collect([*test_paths, *pytest_args])
+    plan = plan_shards(node_ids, load_durations(durations_path), shards)
+    plan = [(total, modules) for total, modules in plan if modules]
+    estimated_serial = sum(total for total, _ in plan)
+    click.echo(
+        f"{len(node_ids)} tests in {sum(len(m) for _, m in plan)} modules, "
+        f"{len(plan)} shards, estimated {estimated_serial:.0f} s serially"
+    )
+
+    if ui:
+        testreport.clear_dir()
+
+    start = time.monotonic()
+    with tempfile.TemporaryDirectory() as tmpdir, ExitStack() as stack:
+        workdir = Path(tmpdir)
+        processes = []
+        for i, (total, modules) in enumerate(plan):
+            emu = stack.enter_context(
+                EmulatorWrapper("core", tag=tag, port=BASE_PORT + i * 3)
+            )
+            shard_args = [
+                "--record-durations",
+                str(workdir / f"durations-{i}.json"),
+                *pytest_args,
+                *modules,
+            ]
+            if ui:
+                shard_args += [
+                    "--ui",
+                    ui,
+                    "--ui-results",
+                    str(workdir / f"ui-{i}.json"),
+                ]
+            env = dict(os.environ, TREZOR_PATH=f"udp:127.0.0.1:{emu.port}")
+            log = (workdir / f"shard-{i}.log").open("w")
+            stack.callback(log.close)
+            click.echo(f"shard {i}: {len(modules)} modules, estimated {total:.0f} s")
+            processes.append(
+                subprocess.Popen(
+                    [sys.executable, "-m", "pytest", *shard_args],
+                    cwd=ROOT,
+                    env=env,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            )
+
+        failed = []
+        for i, process in enumerate(processes):
+            if process.wait() != 0:
+                failed.append(i)
+        elapsed = time.monotonic() - start
+
+        for i in failed:
+            click.echo(f"-------- shard {i} failed: --------")
+            click.echo((workdir / f"shard-{i}.log").read_text())
+
+        merge_durations(
+            durations_path, [workdir / f"durations-{i}.json" for i in range(len(plan))]
+        )
+        serial = sum(load_durations(durations_path).get(n, 0) for n in node_ids)
+        click.echo(
+            f"Finished in {elapsed:.0f} s, tests took {serial:.0f} s in total "
+            f"({serial / elapsed:.1f}x speedup over a serial run)"
+        )
+
+        ui_ok = True
+        if ui:
+            ui_ok = finish_ui(
+                ui,
+                [workdir / f"ui-{i}.json" for i in range(len(plan))],
+                ui_check_missing,
+                not failed,
+            )
+
+    if failed or not ui_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
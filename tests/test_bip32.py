@@ -0,0 +1,67 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from . import bip32
+
+# BIP32 test vector 1
+XPUB_0H = "xpub68Gmy5EdvgibQVfPdqkBBCHxA5htiqg55crXYuXoQRKfDBFA1WEjWgP6LHhwBZeNK1VTsfTFUHCdrfp1bgwQ9xv5ski8PX9rL2dZXvgGDnw"
+XPUB_0H_1 = "xpub6ASuArnXKPbfEwhqN6e3mwBcDTgzisQN1wXN9BJcM47sSikHjJf3UFHKkNAWbWMiGj7Wf5uMash7SyYq527Hqck2AxYysAA7xmALppuCkwQ"
+XPUB_0H_1_2H_2 = "xpub6FHa3pjLCk84BayeJxFW2SP4XRrFd1JYnxeLeU8EqN3vDfZmbqBqaGJAyiLjTAwm6ZLRQUMv1ZACTj37sR62cfN7fe5JnJ7dh8zL4fiyLHV"
+XPUB_0H_1_2H_2_1000000000 = "xpub6H1LXWLaKsWFhvm6RVpEL9P4KfRZSW7abD2ttkWP3SSQvnyA8FSVqNTEcYFgJS2UaFcxupHiYkro49S8yGasTvXEYBVPamhGW6cFJodrTHy"
+
+
+@pytest.fixture(params=[True, False], ids=["coincurve", "ecdsa"])
+def backend(request, monkeypatch):
+    if request.param and not bip32.COINCURVE_AVAILABLE:
+        pytest.skip("coincurve not installed")
+    monkeypatch.setattr(bip32, "COINCURVE_AVAILABLE", request.param)
+    # derived children are memoized regardless of the backend
+    bip32._derive_child.cache_clear()
+    yield
+    bip32._derive_child.cache_clear()
+
+
+def test_serialize_roundtrip():
+    for xpub in (XPUB_0H, XPUB_0H_1, XPUB_0H_1_2H_2):
+        assert bip32.serialize(bip32.deserialize(xpub)) == xpub
+
+
+def test_public_ckd(backend):
+    node = bip32.deserialize(XPUB_0H)
+    assert bip32.serialize(bip32.public_ckd(node, [1])) == XPUB_0H_1
+
+    node = bip32.deserialize(XPUB_0H_1_2H_2)
+    child = bip32.public_ckd(node, [1000000000])
+    assert bip32.serialize(child) == XPUB_0H_1_2H_2_1000000000
+
+
+def test_public_ckd_hardened(backend):
+    node = bip32.deserialize(XPUB_0H)
+    with pytest.raises(ValueError):
+        bip32.public_ckd(node, [0x8000_0000])
+
+
+def test_public_ckd_batch(backend):
+    node = bip32.deserialize(XPUB_0H_1_2H_2)
+    expected = [bip32.public_ckd(node, [0, i]) for i in range(5)]
+    bip32._derive_child.cache_clear()
+    assert bip32.public_ckd_batch(node, [0], range(5)) == expected
+
+    node = bip32.deserialize(XPUB_0H)
+    batch = bip32.public_ckd_batch(node, [], [1])
+    assert [bip32.serialize(n) for n in batch] == [XPUB_0H_1]
@@ -15,10 +15,15 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import copy
+import hashlib
 import json
+import pickle
 import sys
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict
 
 import click
 import requests
@@ -28,6 +33,8 @@ from trezorlib import btc, messages, protobuf
 REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
 TOOLS_PATH = REPOSITORY_ROOT / "common" / "tools"
 CACHE_PATH = Path(__file__).resolve().parent / "txcache"
+# Number of decoded transactions kept in memory, in addition to pack files.
+TX_MEMO_SIZE = 1024
 
 sys.path.insert(0, str(TOOLS_PATH))
 from coin_info import coin_info  # isort:skip
@@ -51,41 +58,105 @@ def _get_blockbooks():
 BLOCKBOOKS = _get_blockbooks()
 
 
+def _slug(coin_name: str) -> str:
+    """Name of the cache directory and pack file of a coin."""
+    return coin_name.lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=None)
+def _index(slug: str) -> Dict[str, Path]:
+    """Map hashes of all cached transactions of a coin to their JSON files.
+
+    Built once per process, transactions added later are not seen.
+    """
+    return {path.stem: path for path in (CACHE_PATH / slug).glob("*.json")}
+
+
+def _pack_path(slug: str) -> Path:
+    return CACHE_PATH / f"{slug}.pack"
+
+
+def _fingerprint(slug: str) -> Dict[str, Any]:
+    """Modification time and size of every JSON file of a coin.
+
+    Also includes a digest of the trezorlib messages, as the pack stores pickled
+    message objects.
+    """
+    files = {}
+    for txhash, path in _index(slug).items():
+        stat = path.stat()
+        files[txhash] = (stat.st_mtime_ns, stat.st_size)
+    messages_digest = hashlib.sha256(Path(messages.__file__).read_bytes()).hexdigest()
+    return {"files": files, "messages": messages_digest}
+
+
+def _load_json(path: Path) -> messages.TransactionType:
+    txdict = json.loads(path.read_text())
+    return protobuf.dict_to_proto(messages.TransactionType, txdict)
+
+
+@lru_cache(maxsize=None)
+def _load_pack(slug: str) -> Dict[str, messages.TransactionType]:
+    """Load all transactions of a coin from its pack file.
+
+    The JSON files are the source of truth. If any of them or the trezorlib messages
+    changed since the pack was written, or the pack cannot be loaded at all, the pack
+    is ignored.
+    """
+    try:
+        pack: Dict[str, Any] = pickle.loads(_pack_path(slug).read_bytes())
+        if pack["fingerprint"] != _fingerprint(slug):
+            return {}
+        return pack["txes"]
+    except Exception:
+        # missing, or written by a different version of trezorlib
+        return {}
+
+
+def write_pack(slug: str) -> int:
+    """Write the pack file of a coin. Returns the number of packed transactions."""
+    txes = {txhash: _load_json(path) for txhash, path in _index(slug).items()}
+    if not txes:
+        raise ValueError(f"No cached transactions in {CACHE_PATH / slug}")
+    pack = {"fingerprint": _fingerprint(slug), "txes": txes}
+    _pack_path(slug).write_bytes(pickle.dumps(pack, pickle.HIGHEST_PROTOCOL))
+    return len(txes)
+
+
+@lru_cache(maxsize=TX_MEMO_SIZE)
+def _load_tx(slug: str, txhash: str) -> messages.TransactionType:
+    tx = _load_pack(slug).get(txhash)
+    if tx is None:
+        tx = _load_json(_index(slug)[txhash])
+    return tx
+
+
 class TxCache:
     def __init__(self, coin_name: str) -> None:
-        self.slug = coin_name.lower().replace(" ", "_")
+        self.slug = _slug(coin_name)
 
     def get_tx(self, txhash: str) -> messages.TransactionType:
-        try:
-            (CACHE_PATH / self.slug).mkdir()
-        except Exception:
-            pass
-
-        cache_file = CACHE_PATH / self.slug / f"{txhash}.json"
-        if not cache_file.exists():
+        if txhash not in _index(self.slug):
             raise RuntimeError(
                 f"cache miss for {self.slug} tx {txhash}.\n"
                 "To fix, refer to ./tests/tx_cache.py --help"
             )
 
-        txdict = json.loads(cache_file.read_text())
-        return protobuf.dict_to_proto(messages.TransactionType, txdict)
+        # tests are free to modify the returned transaction
+        return copy.deepcopy(_load_tx(self.slug, txhash))
 
     def __getitem__(self, key: bytes) -> messages.TransactionType:
         return self.get_tx(key.hex())
 
     def __contains__(self, key: bytes) -> bool:
-        try:
-            self.get_tx(key.hex())
-            return True
-        except Exception:
-            return False
+        return key.hex() in _index(self.slug)
 
 
 @click.command()
+@click.option("--pack", is_flag=True, help="Only write the pack file of COIN_NAME.")
 @click.argument("coin_name")
-@click.argument("tx", metavar="TXHASH_OR_URL")
-def cli(tx, coin_name):
+@click.argument("tx", metavar="TXHASH_OR_URL", required=False)
+def cli(tx, coin_name, pack):
     """Add a transaction to the cache.
 
     \b
@@ -98,7 +169,25 @@ def cli(tx, coin_name):
     tests/txcache/<COIN_NAME>/<TXHASH>.json. Note that only Bitcoin-compatible fields
     will be filled out. If you are adding a coin with special fields (Dash, Zcash...),
     it is your responsibility to fill out the missing fields properly.
+
+    \b
+    All transactions of a coin can be packed into tests/txcache/<COIN_NAME>.pack,
+    which is loaded in one go instead of decoding the JSON files one by one:
+    ./tests/tx_cache.py --pack bitcoin
+    The pack is ignored once any of the JSON files or the trezorlib messages change.
     """
+    if pack:
+        slug = _slug(coin_name)
+        try:
+            count = write_pack(slug)
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
+        click.echo(f"Packed {count} transactions into {_pack_path(slug)}")
+        return
+
+    if tx is None:
+        raise click.ClickException("Missing argument TXHASH_OR_URL.")
+
     if tx.startswith("http"):
         tx_url = tx
         tx_hash = tx.split("/")[-1].lower()
@@ -1,11 +1,14 @@
 import hashlib
+import io
 import json
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Generator, Optional, Set
+from typing import Dict, Generator, Iterable, Optional, Set
 
 import pytest
 from _pytest.outcomes import Failed
@@ -55,25 +58,40 @@ def _process_recorded(screen_path: Path, test_name: str) -> None:
 def _rename_records(screen_path: Path) -> None:
     # rename screenshots
     for index, record in enumerate(sorted(screen_path.iterdir())):
-        record.replace(screen_path / f"{index:08}.png")
+        name = f"{index:08}.png"
+        if record.name != name:
+            record.replace(screen_path / name)
+
+
+@lru_cache(maxsize=None)
+def _decode_pool() -> ThreadPoolExecutor:
+    # Pillow releases the GIL while decoding, so threads are enough
+    return ThreadPoolExecutor()
 
 
 def _hash_files(path: Path) -> str:
-    files = path.iterdir()
+    files = sorted(path.iterdir())
     hasher = hashlib.sha256()
-    for file in sorted(files):
-        hasher.update(_get_bytes_from_png(str(file)))
+    for pixels in _decode_pool().map(_get_bytes_from_png, files):
+        hasher.update(pixels)
 
     return hasher.digest().hex()
 
 
-def _get_bytes_from_png(png_file: str) -> bytes:
+def _get_bytes_from_png(png_file: Path) -> bytes:
     """Decode a PNG file into bytes representing all the pixels.
 
     Is necessary because Linux and Mac are using different PNG encoding libraries,
     and we need the file hashes to be the same on both platforms.
     """
-    return Image.open(png_file).tobytes()
+    return _decode_png(png_file.read_bytes())
+
+
+# A test usually records the same screen several times (the homescreen, for one),
+# and the emulator encodes the same screen into the same PNG file.
+@lru_cache(maxsize=16)
+def _decode_png(png_data: bytes) -> bytes:
+    return Image.open(io.BytesIO(png_data)).tobytes()
 
 
 def _process_tested(fixture_test_path: Path, test_name: str) -> None:
@@ -189,6 +207,34 @@ def write_fixtures_suggestion(
     )
 
 
+def write_results(path: Path) -> None:
+    """Dump the results of this session, to be merged with other shards later."""
+    results = {
+        "model": MODEL,
+        "actual": ACTUAL_HASHES,
+        "processed": sorted(PROCESSED),
+        "failed": sorted(FAILED_TESTS),
+    }
+    path.write_text(json.dumps(results, indent="", sort_keys=True) + "\n")
+
+
+def merge_results(paths: Iterable[Path], record: bool) -> None:
+    """Load results of sharded sessions as if they came from a single one.
+
+    Fixtures have to be read beforehand. When recording, the actual hashes of the
+    processed tests replace the expected ones, same as in `_process_recorded`.
+    """
+    global MODEL
+    for path in paths:
+        results = json.loads(path.read_text())
+        MODEL = results["model"] or MODEL
+        ACTUAL_HASHES.update(results["actual"])
+        PROCESSED.update(results["processed"])
+        FAILED_TESTS.update(results["failed"])
+        if record:
+            FILE_HASHES.update(results["actual"])
+
+
 def _get_fixtures_content(
     fixtures: Dict[str, str], remove_missing: bool, only_passed_tests: bool = False
 ) -> str: